@@ -0,0 +1,71 @@
+"""Benchmark of the parallel check runner: serial vs. threads vs. processes on the standard I-profile catalogue.
+
+Every profile is checked for compression, tension and bending around both axes at several load levels.
+All checks of one profile share the same profile instance, so with threads the section properties of a profile are
+calculated only once, while every worker process has to calculate them again.
+
+Run from the repository root:
+
+    python benchmarks/check_runner_threads_vs_processes.py --families HEA HEB --workers 8
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+
+from blueprints.checks import CheckStrengthBendingClass12, CheckStrengthCompressionClass123, CheckStrengthTensionClass1234
+from blueprints.checks.check_protocol import CheckProtocol
+from blueprints.checks.check_runner import is_free_threaded, run_checks
+from blueprints.materials.steel import SteelMaterial, SteelStrengthClass
+from blueprints.structural_sections.steel.standard_profiles import HEA, HEB, HEM, IPE
+from blueprints.structural_sections.steel.steel_cross_section import SteelCrossSection
+
+CATALOGUE = {"HEA": HEA, "HEB": HEB, "HEM": HEM, "IPE": IPE}
+LOAD_LEVELS = (10.0, 100.0, 1000.0)
+
+
+def build_checks(families: list[str]) -> list[CheckProtocol]:
+    """Build a fresh set of checks (with empty caches) for the given profile families."""
+    material = SteelMaterial(steel_class=SteelStrengthClass.S355)
+    checks: list[CheckProtocol] = []
+    for family in families:
+        for profile in CATALOGUE[family]:
+            cross_section = SteelCrossSection(profile=profile, material=material)
+            for load in LOAD_LEVELS:
+                checks.append(CheckStrengthCompressionClass123(cross_section, n=-load))
+                checks.append(CheckStrengthTensionClass1234(cross_section, n=load))
+                checks.append(CheckStrengthBendingClass12(cross_section, m=load / 10, axis="My"))
+                checks.append(CheckStrengthBendingClass12(cross_section, m=load / 10, axis="Mz"))
+    return checks
+
+
+def time_run(label: str, run: Callable[[], object]) -> float:
+    """Time a single run and print the result."""
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} {elapsed:8.2f} s")
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--families", nargs="+", default=list(CATALOGUE), choices=list(CATALOGUE))
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    print(f"Python {sys.version.split()[0]}, free-threaded: {is_free_threaded()}")
+    print(f"{len(build_checks(args.families))} checks on {', '.join(args.families)}")
+
+    serial = time_run("serial", lambda: run_checks(build_checks(args.families), executor="serial"))
+    threads = time_run("threads", lambda: run_checks(build_checks(args.families), max_workers=args.workers, executor="thread"))
+    processes = time_run("processes", lambda: run_checks(build_checks(args.families), max_workers=args.workers, executor="process"))
+
+    print(f"speed-up threads:   {serial / threads:.2f}x")
+    print(f"speed-up processes: {serial / processes:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
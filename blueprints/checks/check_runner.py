@@ -0,0 +1,92 @@
+"""Parallel execution of Blueprints checks.
+
+Checks that share a profile also share its (thread-safe) section property cache. Running them in a thread pool
+therefore computes the finite element analysis of every profile only once. On free-threaded (no-GIL) builds of
+CPython the checks also run truly in parallel. A process pool is available as an alternative for regular builds,
+at the cost of pickling the checks and recomputing the section properties in every worker process.
+"""
+
+import os
+import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+from typing import Literal
+
+from blueprints.checks.check_protocol import CheckProtocol
+from blueprints.checks.check_result import CheckResult
+
+
+def is_free_threaded() -> bool:
+    """Check whether the Python interpreter is running without the global interpreter lock (GIL).
+
+    Returns
+    -------
+    bool
+        True for a free-threaded build of CPython (3.13+) with the GIL disabled, False otherwise.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _check_result(check: CheckProtocol) -> CheckResult:
+    """Return the result of a single check."""
+    return check.result()
+
+
+def _picklable_check_result(check: CheckProtocol) -> CheckResult:
+    """Return the result of a single check with plain floats, so it can be sent back from a worker process.
+
+    The provided and required values of a result may be `Formula` instances, which cannot be unpickled.
+    """
+    result = check.result()
+    return replace(
+        result,
+        provided=None if result.provided is None else float(result.provided),
+        required=None if result.required is None else float(result.required),
+    )
+
+
+def run_checks(
+    checks: Iterable[CheckProtocol],
+    max_workers: int | None = None,
+    executor: Literal["thread", "process", "serial"] = "thread",
+) -> list[CheckResult]:
+    """Run a batch of checks in parallel and return their results.
+
+    Parameters
+    ----------
+    checks : Iterable[CheckProtocol]
+        The checks to run.
+    max_workers : int | None, optional
+        Maximum number of worker threads or processes. Defaults to the number of CPUs.
+    executor : Literal["thread", "process", "serial"], optional
+        Type of parallelism (default is "thread"):
+        - "thread": thread pool, sharing the caches of the profiles between the checks.
+          Scales with the number of cores on free-threaded builds, see `is_free_threaded()`.
+        - "process": process pool. Every check is pickled to a worker, caches are not shared.
+        - "serial": run the checks one by one in the calling thread.
+
+    Returns
+    -------
+    list[CheckResult]
+        The results of the checks, in the same order as the given checks.
+
+    Raises
+    ------
+    ValueError
+        If an unknown executor type is given.
+    """
+    checks = list(checks)
+    if executor == "serial":
+        return [_check_result(check) for check in checks]
+
+    match executor:
+        case "thread":
+            with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+                return list(pool.map(_check_result, checks))
+        case "process":
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                return list(pool.map(_picklable_check_result, checks))
+        case _:
+            raise ValueError(f"Unknown executor '{executor}'. Choose from 'thread', 'process' or 'serial'.")
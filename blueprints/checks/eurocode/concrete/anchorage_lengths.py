@@ -0,0 +1,346 @@
+r"""Module for vectorised anchorage and lap lengths of reinforcement bars, according to EN 1992-1-1:2004, art. 8.4 - 8.7 and 8.9.
+
+The tables of an `AnchorageLengths` object are precomputed once over all combinations of bar diameters, concrete strength
+classes, reinforcement steel qualities and bond conditions:
+
+- the design value of the ultimate bond stress, formula (8.2),
+- the basic required anchorage length for a design stress equal to $f_{yd}$, formula (8.3).
+
+The design anchorage lengths, formulas (8.4) - (8.7), and the design lap lengths, formulas (8.10) and (8.11), follow from
+these tables for any combination of the $\alpha$-factors. All lookups accept arrays, so that the lengths of every bar of a
+rebar schedule are found at once. Diameters that are not part of the tables, such as the equivalent diameters of bundled
+bars of formula (8.14), are evaluated directly with the same closed form expressions.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import cache
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.codes.eurocode.en_1992_1_1_2004 import EN_1992_1_1_2004
+from blueprints.materials.concrete import ConcreteStrengthClass, concrete_property_array
+from blueprints.materials.reinforcement_steel import ReinforcementSteelQuality, reinforcement_steel_property_array
+from blueprints.type_alias import DIMENSIONLESS, MM
+
+type FloatArray = npt.NDArray[np.float64]
+type IntArray = npt.NDArray[np.intp]
+type Bonds = BondCondition | str | Sequence[BondCondition | str]
+type ConcreteClasses = ConcreteStrengthClass | Sequence[ConcreteStrengthClass]
+type SteelQualities = ReinforcementSteelQuality | Sequence[ReinforcementSteelQuality]
+
+STANDARD_DIAMETERS: tuple[MM, ...] = (6.0, 8.0, 10.0, 12.0, 16.0, 20.0, 25.0, 32.0, 40.0)
+"""Commonly used diameters of reinforcement bars [mm]."""
+
+MAXIMUM_EQUIVALENT_DIAMETER: MM = 55.0
+r"""[$Ø_{n}$] Maximum equivalent diameter of bundled bars, art. 8.9.1 (2) [mm]."""
+
+_F_CTK_0_05_LIMIT = concrete_property_array([ConcreteStrengthClass.C60_75], "f_ctk_0_05")[0]
+
+
+class BondCondition(Enum):
+    """Bond conditions of reinforcement bars according to art. 8.4.2 (2), with the values used by formula (8.2)."""
+
+    GOOD = "good"
+    OTHER = "other"
+
+
+_ETA_1 = np.array([1.0, 0.7])
+
+
+def _bond_stress(f_ctd: npt.ArrayLike, diameter: npt.ArrayLike, bond: IntArray) -> FloatArray:
+    r"""Design values of the ultimate bond stress $f_{bd}$, formula (8.2), for bond condition indices into `BondCondition` [MPa]."""
+    diameter = np.asarray(diameter, dtype=float)
+    eta_2 = np.where(diameter <= 32, 1.0, (132 - diameter) / 100)
+    return 2.25 * _ETA_1[bond] * eta_2 * np.asarray(f_ctd, dtype=float)
+
+
+def _indices(values: Enum | str | Sequence[Enum | str], options: Sequence[Enum], name: str) -> IntArray:
+    """Return the positions of one or more values in the options of a table, as an array with the shape of the values."""
+    single = isinstance(values, Enum | str)
+    lookup = {option: index for index, option in enumerate(options)}
+    try:
+        indices = [lookup[BondCondition(value) if isinstance(value, str) else value] for value in ([values] if single else values)]
+    except (KeyError, ValueError) as error:
+        raise ValueError(f"Invalid {name}: {error} is not part of the table.") from error
+    return np.array(indices[0] if single else indices, dtype=np.intp)
+
+
+@dataclass(frozen=True)
+class AnchorageLengths:
+    r"""Precomputed tables of the bond stresses and basic required anchorage lengths of straight ribbed bars.
+
+    Parameters
+    ----------
+    diameters : tuple[MM, ...], optional
+        Diameters of the bars of the tables [mm] (default is `STANDARD_DIAMETERS`).
+    concrete_classes : tuple[ConcreteStrengthClass, ...], optional
+        Concrete strength classes of the tables (default is all classes).
+    steel_qualities : tuple[ReinforcementSteelQuality, ...], optional
+        Reinforcement steel qualities of the tables (default is all qualities).
+    gamma_c : DIMENSIONLESS, optional
+        [$\gamma_c$] Partial factor for concrete (default is 1.5).
+    gamma_s : DIMENSIONLESS, optional
+        [$\gamma_s$] Partial factor for reinforcement steel (default is 1.15).
+    name : str, optional
+        Name of the tables (default is "Anchorage lengths").
+
+    Notes
+    -----
+    Following art. 8.4.2 (2), the tensile strength $f_{ctd}$ of concrete classes above C60/75 is limited to the value of
+    C60/75. The tables have the axes (diameter, concrete class, bond condition) for `f_bd` and (diameter, concrete class,
+    steel quality, bond condition) for `l_b_rqd`, with the bond conditions in the order of `BondCondition`.
+    """
+
+    diameters: tuple[MM, ...] = STANDARD_DIAMETERS
+    concrete_classes: tuple[ConcreteStrengthClass, ...] = tuple(ConcreteStrengthClass)
+    steel_qualities: tuple[ReinforcementSteelQuality, ...] = tuple(ReinforcementSteelQuality)
+    gamma_c: DIMENSIONLESS = 1.5
+    gamma_s: DIMENSIONLESS = 1.15
+    name: str = "Anchorage lengths"
+    f_ctd: FloatArray = field(init=False, repr=False)
+    f_yd: FloatArray = field(init=False, repr=False)
+    f_bd: FloatArray = field(init=False, repr=False)
+    l_b_rqd: FloatArray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Validate the axes and precompute the tables."""
+        if not self.diameters or not self.concrete_classes or not self.steel_qualities:
+            raise ValueError("Invalid tables: diameters, concrete_classes and steel_qualities must not be empty.")
+        if min(self.diameters) <= 0 or any(b <= a for a, b in zip(self.diameters, self.diameters[1:])):
+            raise ValueError(f"Invalid diameters: {self.diameters}, values must be positive and strictly increasing.")
+        if self.gamma_c <= 0 or self.gamma_s <= 0:
+            raise ValueError(f"Invalid gamma_c or gamma_s: {self.gamma_c}, {self.gamma_s}, values must be positive.")
+        f_ctk_0_05 = np.minimum(concrete_property_array(self.concrete_classes, "f_ctk_0_05"), _F_CTK_0_05_LIMIT)
+        f_ctd = f_ctk_0_05 / self.gamma_c
+        f_yd = reinforcement_steel_property_array(self.steel_qualities, "f_yk") / self.gamma_s
+        diameters = np.asarray(self.diameters, dtype=float)
+        f_bd = _bond_stress(f_ctd[None, :, None], diameters[:, None, None], np.arange(len(BondCondition))[None, None, :])
+        object.__setattr__(self, "f_ctd", f_ctd)
+        object.__setattr__(self, "f_yd", f_yd)
+        object.__setattr__(self, "f_bd", f_bd)
+        object.__setattr__(self, "l_b_rqd", diameters[:, None, None, None] / 4 * f_yd[None, None, :, None] / f_bd[:, :, None, :])
+
+    @staticmethod
+    def source_docs() -> list[str]:
+        """List of source document identifiers used for this check.
+
+        Returns
+        -------
+        list[str]
+            List of source document identifiers.
+        """
+        return [EN_1992_1_1_2004]
+
+    def _lookup(
+        self,
+        diameter: npt.ArrayLike,
+        concrete_class: ConcreteClasses,
+        steel_quality: SteelQualities,
+        bond: Bonds,
+        n_b: npt.ArrayLike,
+    ) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
+        """Return the (equivalent) diameters, bond stresses, basic required anchorage lengths and design yield strengths, broadcast
+        against each other. Tabulated diameters are looked up, other diameters are evaluated directly.
+        """
+        diameter, n_b = np.asarray(diameter, dtype=float), np.asarray(n_b, dtype=float)
+        if np.any(diameter <= 0) or np.any(n_b < 1):
+            raise ValueError("Invalid diameter or n_b: diameters must be positive and bundles must have at least one bar.")
+        diameter = np.where(n_b > 1, np.minimum(diameter * np.sqrt(n_b), MAXIMUM_EQUIVALENT_DIAMETER), diameter)
+        concrete = _indices(concrete_class, self.concrete_classes, "concrete_class")
+        steel = _indices(steel_quality, self.steel_qualities, "steel_quality")
+        bond_index = _indices(bond, list(BondCondition), "bond")
+        diameter, concrete, steel, bond_index = np.broadcast_arrays(diameter, concrete, steel, bond_index)
+
+        grid = np.asarray(self.diameters, dtype=float)
+        position = np.minimum(np.searchsorted(grid, diameter), len(grid) - 1)
+        tabulated = grid[position] == diameter
+        f_bd = np.where(tabulated, self.f_bd[position, concrete, bond_index], _bond_stress(self.f_ctd[concrete], diameter, bond_index))
+        f_yd = self.f_yd[steel]
+        l_b_rqd = np.where(tabulated, self.l_b_rqd[position, concrete, steel, bond_index], diameter / 4 * f_yd / f_bd)
+        return diameter, f_bd, l_b_rqd, f_yd
+
+    def bond_stress(
+        self, diameter: npt.ArrayLike, concrete_class: ConcreteClasses, bond: Bonds = BondCondition.GOOD, n_b: npt.ArrayLike = 1
+    ) -> FloatArray:
+        r"""Design values of the ultimate bond stress $f_{bd}$, formula (8.2) [MPa].
+
+        Parameters
+        ----------
+        diameter : npt.ArrayLike
+            [$Ø$] Diameters of the bars [mm].
+        concrete_class : ConcreteStrengthClass | Sequence[ConcreteStrengthClass]
+            Concrete strength class of every bar.
+        bond : BondCondition | str | Sequence[BondCondition | str], optional
+            Bond condition of every bar, "good" or "other" (default is BondCondition.GOOD).
+        n_b : npt.ArrayLike, optional
+            [$n_b$] Number of bars in a bundle, replaced by the equivalent diameter of formula (8.14) (default is 1).
+
+        Returns
+        -------
+        FloatArray
+            The bond stresses, broadcast against the parameters.
+        """
+        return self._lookup(diameter, concrete_class, self.steel_qualities[0], bond, n_b)[1]
+
+    def basic_anchorage_length(
+        self,
+        diameter: npt.ArrayLike,
+        concrete_class: ConcreteClasses,
+        steel_quality: SteelQualities,
+        bond: Bonds = BondCondition.GOOD,
+        sigma_sd: npt.ArrayLike | None = None,
+        n_b: npt.ArrayLike = 1,
+    ) -> FloatArray:
+        r"""Basic required anchorage lengths $l_{b,rqd}$, formula (8.3) [mm].
+
+        Parameters
+        ----------
+        diameter : npt.ArrayLike
+            [$Ø$] Diameters of the bars [mm].
+        concrete_class : ConcreteStrengthClass | Sequence[ConcreteStrengthClass]
+            Concrete strength class of every bar.
+        steel_quality : ReinforcementSteelQuality | Sequence[ReinforcementSteelQuality]
+            Reinforcement steel quality of every bar.
+        bond : BondCondition | str | Sequence[BondCondition | str], optional
+            Bond condition of every bar, "good" or "other" (default is BondCondition.GOOD).
+        sigma_sd : npt.ArrayLike | None, optional
+            [$\sigma_{sd}$] Design stresses of the bars at the position from where the anchorage is measured, the design
+            yield strength $f_{yd}$ of the steel when None [MPa] (default is None).
+        n_b : npt.ArrayLike, optional
+            [$n_b$] Number of bars in a bundle, replaced by the equivalent diameter of formula (8.14) (default is 1).
+
+        Returns
+        -------
+        FloatArray
+            The basic required anchorage lengths, broadcast against the parameters.
+        """
+        return self._basic_anchorage_length(diameter, concrete_class, steel_quality, bond, sigma_sd, n_b)[1]
+
+    def _basic_anchorage_length(
+        self,
+        diameter: npt.ArrayLike,
+        concrete_class: ConcreteClasses,
+        steel_quality: SteelQualities,
+        bond: Bonds,
+        sigma_sd: npt.ArrayLike | None,
+        n_b: npt.ArrayLike,
+    ) -> tuple[FloatArray, FloatArray]:
+        """Return the (equivalent) diameters and the basic required anchorage lengths at the design stresses."""
+        diameter, _, l_b_rqd, f_yd = self._lookup(diameter, concrete_class, steel_quality, bond, n_b)
+        if sigma_sd is None:
+            return diameter, l_b_rqd
+        sigma_sd = np.asarray(sigma_sd, dtype=float)
+        if np.any(sigma_sd < 0):
+            raise ValueError("Invalid sigma_sd: values must be non-negative.")
+        return diameter, l_b_rqd * sigma_sd / f_yd
+
+    def design_anchorage_length(  # noqa: PLR0913
+        self,
+        diameter: npt.ArrayLike,
+        concrete_class: ConcreteClasses,
+        steel_quality: SteelQualities,
+        bond: Bonds = BondCondition.GOOD,
+        sigma_sd: npt.ArrayLike | None = None,
+        n_b: npt.ArrayLike = 1,
+        *,
+        alpha_1: npt.ArrayLike = 1.0,
+        alpha_2: npt.ArrayLike = 1.0,
+        alpha_3: npt.ArrayLike = 1.0,
+        alpha_4: npt.ArrayLike = 1.0,
+        alpha_5: npt.ArrayLike = 1.0,
+        compression: npt.ArrayLike = False,
+    ) -> FloatArray:
+        r"""Design anchorage lengths $l_{bd}$, formula (8.4) with the product of formula (8.5) and the minimum anchorage
+        lengths of formulas (8.6) and (8.7) [mm].
+
+        Parameters
+        ----------
+        diameter, concrete_class, steel_quality, bond, sigma_sd, n_b
+            See `basic_anchorage_length`.
+        alpha_1, alpha_2, alpha_3, alpha_4, alpha_5 : npt.ArrayLike, optional
+            [$\alpha_1$ - $\alpha_5$] Coefficients of table 8.2 of every bar (default is 1.0).
+        compression : npt.ArrayLike, optional
+            True for anchorages in compression, which have the minimum anchorage length of formula (8.7) instead of
+            formula (8.6) (default is False).
+
+        Returns
+        -------
+        FloatArray
+            The design anchorage lengths, broadcast against the parameters.
+        """
+        alpha_1, alpha_2, alpha_3, alpha_4, alpha_5 = _alphas(alpha_1, alpha_2, alpha_3, alpha_4, alpha_5)
+        diameter, l_b_rqd = self._basic_anchorage_length(diameter, concrete_class, steel_quality, bond, sigma_sd, n_b)
+        l_b_min = np.maximum(np.maximum(np.where(compression, 0.6, 0.3) * l_b_rqd, 10 * diameter), 100)
+        return np.maximum(alpha_1 * alpha_4 * np.maximum(alpha_2 * alpha_3 * alpha_5, 0.7) * l_b_rqd, l_b_min)
+
+    def lap_length(  # noqa: PLR0913
+        self,
+        diameter: npt.ArrayLike,
+        concrete_class: ConcreteClasses,
+        steel_quality: SteelQualities,
+        bond: Bonds = BondCondition.GOOD,
+        sigma_sd: npt.ArrayLike | None = None,
+        n_b: npt.ArrayLike = 1,
+        *,
+        alpha_1: npt.ArrayLike = 1.0,
+        alpha_2: npt.ArrayLike = 1.0,
+        alpha_3: npt.ArrayLike = 1.0,
+        alpha_5: npt.ArrayLike = 1.0,
+        rho_1: npt.ArrayLike = 100.0,
+    ) -> FloatArray:
+        r"""Design lap lengths $l_0$, formula (8.10) with $\alpha_6$ of table 8.3 and the minimum lap length of formula (8.11) [mm].
+
+        Parameters
+        ----------
+        diameter, concrete_class, steel_quality, bond, sigma_sd, n_b
+            See `basic_anchorage_length`.
+        alpha_1, alpha_2, alpha_3, alpha_5 : npt.ArrayLike, optional
+            [$\alpha_1$, $\alpha_2$, $\alpha_3$, $\alpha_5$] Coefficients of table 8.2 of every bar (default is 1.0).
+        rho_1 : npt.ArrayLike, optional
+            [$\rho_1$] Percentage of the reinforcement lapped within $0.65 l_0$ from the centre of the lap [%]
+            (default is 100.0).
+
+        Returns
+        -------
+        FloatArray
+            The design lap lengths, broadcast against the parameters.
+        """
+        alpha_1, alpha_2, alpha_3, alpha_5, rho_1 = _alphas(alpha_1, alpha_2, alpha_3, alpha_5, rho_1)
+        alpha_6 = np.clip(np.sqrt(rho_1 / 25), 1.0, 1.5)
+        diameter, l_b_rqd = self._basic_anchorage_length(diameter, concrete_class, steel_quality, bond, sigma_sd, n_b)
+        l_0_min = np.maximum(np.maximum(0.3 * alpha_6 * l_b_rqd, 15 * diameter), 200)
+        return np.maximum(alpha_1 * alpha_2 * alpha_3 * alpha_5 * alpha_6 * l_b_rqd, l_0_min)
+
+
+def _alphas(*values: npt.ArrayLike) -> tuple[FloatArray, ...]:
+    """Return the coefficients as arrays, validating that they are non-negative."""
+    arrays = tuple(np.asarray(value, dtype=float) for value in values)
+    if any(np.any(array < 0) for array in arrays):
+        raise ValueError("Invalid alpha or rho_1: values must be non-negative.")
+    return arrays
+
+
+@cache
+def anchorage_lengths(
+    diameters: tuple[MM, ...] = STANDARD_DIAMETERS,
+    concrete_classes: tuple[ConcreteStrengthClass, ...] = tuple(ConcreteStrengthClass),
+    steel_qualities: tuple[ReinforcementSteelQuality, ...] = tuple(ReinforcementSteelQuality),
+    gamma_c: DIMENSIONLESS = 1.5,
+    gamma_s: DIMENSIONLESS = 1.15,
+) -> AnchorageLengths:
+    """Return the anchorage length tables for the given axes and partial factors, shared between all callers with equal arguments.
+
+    Parameters
+    ----------
+    diameters, concrete_classes, steel_qualities, gamma_c, gamma_s
+        See `AnchorageLengths`.
+
+    Returns
+    -------
+    AnchorageLengths
+        The cached tables.
+    """
+    return AnchorageLengths(diameters, concrete_classes, steel_qualities, gamma_c, gamma_s)
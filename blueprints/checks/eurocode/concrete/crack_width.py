@@ -0,0 +1,283 @@
+r"""Module for the vectorised calculation of crack widths in reinforced concrete cross-sections,
+according to EN 1992-1-1:2004, chapter 7.3.4, formulas (7.8) - (7.14).
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.checks.check_result import CheckResult
+from blueprints.codes.eurocode.en_1992_1_1_2004 import EN_1992_1_1_2004
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+from blueprints.type_alias import DIMENSIONLESS, MM, MM2, MPA
+
+type FloatArray = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class _TensionFaceTerms:
+    """Section dependent terms of the reinforcement near one face of the cross-section, computed once per cross-section."""
+
+    rebars: npt.NDArray[np.bool_]
+    """Mask of the rebars in the half of the cross-section at the face, the tension reinforcement when the face is in tension."""
+    a_s: MM2
+    """Area of the tension reinforcement [mm²]."""
+    diam_eq: MM
+    """Equivalent diameter of the tension reinforcement, formula (7.12) for any number of diameters [mm]."""
+    c: MM
+    """Cover of the tension reinforcement [mm]."""
+    d: MM
+    """Effective depth of the tension reinforcement [mm]."""
+    wide_spacing: bool
+    """True if the spacing of the outer layer exceeds 5(c + ⌀/2), in which case formula (7.14) is used for the crack spacing."""
+
+
+@dataclass(frozen=True)
+class CrackWidthResults:
+    """Crack widths for an array of load combinations, all arrays have one value per combination.
+
+    Parameters
+    ----------
+    sigma_s : FloatArray
+        Stress in the tension reinforcement of the cracked cross-section [MPa].
+    x : FloatArray
+        Depth of the neutral axis [mm].
+    rho_p_eff : FloatArray
+        Effective reinforcement ratio, formula (7.10) [-].
+    s_r_max : FloatArray
+        Maximum crack spacing, formula (7.11) or (7.14) [mm].
+    epsilon_sm_minus_epsilon_cm : FloatArray
+        Difference between the mean strain in the reinforcement and in the concrete, formula (7.9) [-].
+    w_k : FloatArray
+        Crack width, formula (7.8), zero for combinations without tension in the reinforcement [mm].
+    w_max : MM
+        Recommended limiting crack width [mm].
+    """
+
+    sigma_s: FloatArray
+    x: FloatArray
+    rho_p_eff: FloatArray
+    s_r_max: FloatArray
+    epsilon_sm_minus_epsilon_cm: FloatArray
+    w_k: FloatArray
+    w_max: MM
+
+    @property
+    def unity_check(self) -> FloatArray:
+        """Crack width divided by the limiting crack width of each combination [-]."""
+        return self.w_k / self.w_max
+
+    @property
+    def governing_combination(self) -> int:
+        """Index of the combination with the largest crack width."""
+        return int(np.argmax(self.w_k))
+
+    def result(self) -> CheckResult:
+        """Result of the governing combination.
+
+        Returns
+        -------
+        CheckResult
+            Result based on the largest crack width of all combinations.
+        """
+        return CheckResult.from_comparison(provided=float(self.w_k[self.governing_combination]), required=self.w_max)
+
+
+@dataclass(frozen=True)
+class CrackWidth:
+    r"""Crack widths of a rectangular reinforced concrete cross-section under axial force and bending about the x-axis,
+    based on EN 1992-1-1:2004 art. 7.3.4.
+
+    The steel stresses and the depth of the neutral axis follow from the cracked cross-section, solved with the fibre model
+    of the cross-section for all combinations at once. The terms that only depend on the reinforcement (the area, cover,
+    effective depth and equivalent diameter (7.12) of the tension reinforcement near the top and the bottom face) are computed
+    once, after which `evaluate` calculates the crack widths of arrays of load combinations:
+
+    - [$\rho_{p,eff}$] with formula (7.10), with [$h_{c,ef} = \min(2.5(h - d), (h - x)/3, h/2)$] per combination.
+    - [$s_{r,max}$] with formula (7.11), with [$k_2$] from formula (7.13) when the whole cross-section is in tension, or with
+      formula (7.14) when the spacing of the tension reinforcement exceeds [$5(c + ⌀/2)$].
+    - [$\epsilon_{sm} - \epsilon_{cm}$] with formula (7.9) and [$w_k$] with formula (7.8).
+
+    Parameters
+    ----------
+    cross_section : RectangularReinforcedCrossSection
+        The reinforced concrete cross-section to check.
+    k_t : DIMENSIONLESS, optional
+        Factor dependent on the duration of the load, 0.6 for short term loading, 0.4 for long term loading (default is 0.4).
+    creep_coefficient : DIMENSIONLESS, optional
+        Final creep coefficient for the stresses in the cracked cross-section, 0.0 for short term loading (default is 0.0).
+    f_ct_eff : MPA | None, optional
+        Effective tensile strength of the concrete at the time of cracking [MPa]. Default is [$f_{ctm}$].
+    k_1 : DIMENSIONLESS, optional
+        Coefficient for the bond properties of the reinforcement, 0.8 for high bond bars (default is 0.8).
+    k_3 : DIMENSIONLESS, optional
+        Coefficient, the recommended value is 3.4 (default is 3.4).
+    k_4 : DIMENSIONLESS, optional
+        Coefficient, the recommended value is 0.425 (default is 0.425).
+    w_max : MM, optional
+        Recommended limiting crack width, table 7.1N (default is 0.3 mm).
+
+    Example
+    -------
+    ```python
+    import numpy as np
+
+    from blueprints.checks.eurocode.concrete.crack_width import CrackWidth
+
+    results = CrackWidth(cross_section).evaluate(n=np.array([0.0, -100.0]), m_x=np.array([120.0, 150.0]))
+    print(results.w_k, results.governing_combination)
+    ```
+    """
+
+    cross_section: RectangularReinforcedCrossSection
+    k_t: DIMENSIONLESS = 0.4
+    creep_coefficient: DIMENSIONLESS = 0.0
+    f_ct_eff: MPA | None = None
+    k_1: DIMENSIONLESS = 0.8
+    k_3: DIMENSIONLESS = 3.4
+    k_4: DIMENSIONLESS = 0.425
+    w_max: MM = 0.3
+    name: str = "Crack width check for reinforced concrete cross-sections"
+    _faces: dict[str, _TensionFaceTerms | None] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute the terms of the reinforcement near the bottom and the top face."""
+        _, y_min, _, y_max = self.cross_section.profile.polygon.bounds
+        rebars = self.cross_section.longitudinal_rebar_set
+        faces = {
+            "bottom": self._face_terms(rebars.y < (y_min + y_max) / 2, distance=rebars.y - y_min),
+            "top": self._face_terms(rebars.y > (y_min + y_max) / 2, distance=y_max - rebars.y),
+        }
+        object.__setattr__(self, "_faces", faces)
+
+    def _face_terms(self, mask: npt.NDArray[np.bool_], distance: FloatArray) -> _TensionFaceTerms | None:
+        """Section dependent terms of the rebars near a face, None without rebars near the face.
+
+        Parameters
+        ----------
+        mask : npt.NDArray[np.bool_]
+            Mask of the rebars in the half of the cross-section at the face.
+        distance : FloatArray
+            Distance of the centres of all rebars to the face [mm].
+        """
+        if not mask.any():
+            return None
+        rebars = self.cross_section.longitudinal_rebar_set
+        areas, diameters, distance = rebars.areas[mask], rebars.diameter[mask], distance[mask]
+        c = float((distance - diameters / 2).min())
+        diam_eq = float((diameters**2).sum() / diameters.sum())
+
+        # largest spacing of the outer layer (the rebars closest to the face) compared to 5(c + ⌀/2), art. 7.3.4(3)
+        outer_layer = distance <= distance.min() + diameters.min() / 2
+        spacing = np.diff(np.sort(rebars.x[mask][outer_layer])).max(initial=0.0)
+
+        return _TensionFaceTerms(
+            rebars=mask,
+            a_s=float(areas.sum()),
+            diam_eq=diam_eq,
+            c=c,
+            d=float(self.cross_section.height - (areas * distance).sum() / areas.sum()),
+            wide_spacing=bool(spacing > 5 * (c + diam_eq / 2)),
+        )
+
+    @staticmethod
+    def source_docs() -> list[str]:
+        """List of source document identifiers used for this check.
+
+        Returns
+        -------
+        list[str]
+        """
+        return [EN_1992_1_1_2004]
+
+    def evaluate(self, n: npt.ArrayLike = 0.0, m_x: npt.ArrayLike = 0.0) -> CrackWidthResults:
+        """Calculate the crack widths of an array of load combinations.
+
+        The arguments are broadcast against each other, so a scalar can be combined with arrays.
+
+        Parameters
+        ----------
+        n : npt.ArrayLike, optional
+            Axial forces, negative for compression [kN].
+        m_x : npt.ArrayLike, optional
+            Bending moments about the x-axis, positive for compression at the top [kNm].
+
+        Returns
+        -------
+        CrackWidthResults
+            Crack widths and intermediate results of all combinations.
+
+        Raises
+        ------
+        ValueError
+            If a combination has no equilibrium in the cracked cross-section, or causes tension at a face without reinforcement
+            near that face.
+        """
+        concrete = self.cross_section.concrete_material
+        rebars = self.cross_section.longitudinal_rebar_set
+        state = self.cross_section.sls_state(n=n, m_x=m_x, creep_coefficient=self.creep_coefficient)
+        h, b = self.cross_section.height, self.cross_section.width
+        f_ct_eff = concrete.f_ctm if self.f_ct_eff is None else self.f_ct_eff
+        e_s = rebars.materials[0].e_s if len(rebars) else 0.0
+
+        if not state.converged.all():
+            msg = f"Combination {int(np.argmin(state.converged))} has no equilibrium in the cracked cross-section."
+            raise ValueError(msg)
+
+        # the bottom is in tension for a positive curvature, also for uniform tension
+        bottom_in_tension = state.kappa_x >= 0
+        rebar_stresses = state.rebar_stresses
+        x = np.minimum(state.compression_zone_depth, h)
+        rho_p_eff, s_r_max, sigma_s = (np.zeros(len(state)) for _ in range(3))
+
+        for face_name, in_tension in (("bottom", bottom_in_tension), ("top", ~bottom_in_tension)):
+            face = self._faces[face_name]
+            cracked = in_tension & (rebar_stresses.max(axis=1) > 0)
+            if face is None:
+                if cracked.any():
+                    msg = f"Combination {int(np.argmax(cracked))} causes tension at the {face_name} face, which has no reinforcement."
+                    raise ValueError(msg)
+                continue
+
+            cracked &= (rebar_stresses[:, face.rebars] > 0).any(axis=1)
+            face_x = x[cracked]
+            sigma_s[cracked] = rebar_stresses[np.ix_(cracked, face.rebars)].max(axis=1)
+
+            # formula (7.10) with the effective tension area of figure 7.1, without the term (h - x)/3 for members in tension
+            in_bending = face_x > 0
+            h_c_ef = np.minimum(min(2.5 * (h - face.d), h / 2), np.where(in_bending, (h - face_x) / 3, np.inf))
+            rho_p_eff[cracked] = face.a_s / (b * h_c_ef)
+
+            if face.wide_spacing:
+                s_r_max[cracked] = 1.3 * (h - face_x)  # formula (7.14)
+            else:
+                # formula (7.13) for a cross-section in tension over its full height, 0.5 for bending
+                eps_1, eps_2 = self._face_strains(state.eps_0[cracked], state.kappa_x[cracked], bottom=face_name == "bottom")
+                k_2 = np.full(len(face_x), 0.5)
+                k_2[~in_bending] = (eps_1[~in_bending] + eps_2[~in_bending]) / (2 * eps_1[~in_bending])
+                s_r_max[cracked] = self.k_3 * face.c + self.k_1 * k_2 * self.k_4 * face.diam_eq / rho_p_eff[cracked]  # formula (7.11)
+
+        # difference of the mean strains with formula (7.9)
+        alpha_e = e_s / concrete.e_cm
+        cracked = sigma_s > 0
+        epsilon_sm_minus_epsilon_cm = np.zeros(len(state))
+        mean_strain = (sigma_s[cracked] - self.k_t * f_ct_eff / rho_p_eff[cracked] * (1 + alpha_e * rho_p_eff[cracked])) / e_s
+        epsilon_sm_minus_epsilon_cm[cracked] = np.maximum(mean_strain, 0.6 * sigma_s[cracked] / e_s)
+
+        return CrackWidthResults(
+            sigma_s=sigma_s,
+            x=x,
+            rho_p_eff=rho_p_eff,
+            s_r_max=s_r_max,
+            epsilon_sm_minus_epsilon_cm=epsilon_sm_minus_epsilon_cm,
+            w_k=s_r_max * epsilon_sm_minus_epsilon_cm,  # formula (7.8)
+            w_max=self.w_max,
+        )
+
+    def _face_strains(self, eps_0: FloatArray, kappa_x: FloatArray, bottom: bool) -> tuple[FloatArray, FloatArray]:
+        """Strains at the tension face and at the opposite face of the cross-section."""
+        fibre_section = self.cross_section.fibre_section()
+        _, y_min, _, y_max = self.cross_section.profile.polygon.bounds
+        y_tension, y_opposite = (y_min, y_max) if bottom else (y_max, y_min)
+        return eps_0 - kappa_x * (y_tension - fibre_section.y_ref), eps_0 - kappa_x * (y_opposite - fibre_section.y_ref)
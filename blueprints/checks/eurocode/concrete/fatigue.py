@@ -0,0 +1,296 @@
+r"""Module for the vectorised fatigue verification of concrete, according to EN 1992-1-1:2004, art.6.8.4 and 6.8.7, formulas
+(6.70) and (6.72) - (6.79).
+
+The design fatigue strength [$f_{cd,fat}$] of formula (6.76) only depends on the material and the age at the start of the cyclic
+loading, it is calculated once when the check is created. The methods evaluate arrays of stresses at once, for example one row
+per location and one column per cycle band of a load spectrum, and return the unity checks per location:
+
+- `damage` evaluates the Palmgren-Miner sum (6.70) of cycle bands with the stress levels of formulas (6.73) - (6.75).
+- `damage_from_histories` counts the cycles of raw stress histories with rainflow counting first.
+- `equivalent_check` verifies the damage equivalent stresses with formula (6.72).
+- `simplified_check` verifies the stresses under the frequent load combination with formula (6.77).
+- `shear_check` verifies members without shear reinforcement with formulas (6.78) and (6.79).
+
+Compressive stresses are positive, as in the formulas of art.6.8.7. Tensile stresses are taken as zero.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.checks.check_result import CheckResult
+from blueprints.checks.eurocode.steel.fatigue_damage import rainflow_cycles, turning_points
+from blueprints.codes.eurocode.en_1992_1_1_2004 import EN_1992_1_1_2004
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_3_materials.formula_3_2 import (
+    Form3Dot2CoefficientDependentOfConcreteAge,
+    SubForm3Dot2CoefficientTypeOfCementS,
+)
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_76 import Form6Dot76DesignFatigueStrengthConcrete
+from blueprints.materials.concrete import ConcreteMaterial
+from blueprints.type_alias import DAYS, DIMENSIONLESS, MPA
+
+type FloatArray = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class ConcreteFatigueResults:
+    """Unity checks of the fatigue verification for an array of locations.
+
+    Parameters
+    ----------
+    unity_check : FloatArray
+        Unity check of every location [-].
+    """
+
+    unity_check: FloatArray
+
+    @property
+    def governing_location(self) -> int:
+        """Index of the location with the largest unity check, in the flattened array of locations."""
+        return int(np.argmax(self.unity_check))
+
+    def result(self) -> CheckResult:
+        """Result of the governing location.
+
+        Returns
+        -------
+        CheckResult
+            Result based on the largest unity check of all locations.
+        """
+        return CheckResult.from_comparison(provided=float(self.unity_check.flat[self.governing_location]), required=1.0)
+
+
+@dataclass(frozen=True)
+class ConcreteFatigue:
+    r"""Fatigue verification of concrete under compression and of members without shear reinforcement,
+    based on EN 1992-1-1:2004 art.6.8.7.
+
+    The number of cycles to failure of a cycle band follows from the stress levels [$E_{cd,max,i}$] and [$R_i$] with
+    [$N_i = 10^{14 (1 - E_{cd,max,i}) / \sqrt{1 - R_i}}$] (EN 1992-2 art.6.8.7 (101)), which gives formula (6.72) for
+    [$N = 10^6$] cycles.
+
+    Parameters
+    ----------
+    material : ConcreteMaterial
+        The concrete material, with the cement class for [$\beta_{cc}(t_0)$] and the partial factor for [$f_{cd}$].
+    t_0 : DAYS, optional
+        [$t_0$] Age of the concrete at the start of the cyclic loading (default is 28 days).
+    k_1 : DIMENSIONLESS, optional
+        [$k_1$] Factor of formula (6.76), the recommended value for [$N = 10^6$] cycles is 0.85 (default is 0.85).
+    """
+
+    material: ConcreteMaterial
+    t_0: DAYS = 28.0
+    k_1: DIMENSIONLESS = 0.85
+    name: str = "Fatigue verification of concrete according to EN 1992-1-1:2004"
+    f_cd_fat: MPA = field(init=False)
+    r"""[$f_{cd,fat}$] Design fatigue strength of concrete, formula (6.76) [MPa]."""
+
+    def __post_init__(self) -> None:
+        """Calculate the design fatigue strength of the material at the start of the cyclic loading."""
+        if self.t_0 <= 0:
+            raise ValueError(f"Invalid t_0: {self.t_0}. The age at the start of the cyclic loading must be positive.")
+        s = SubForm3Dot2CoefficientTypeOfCementS(cement_class=self.material.cement_class.value)
+        f_cd_fat = Form6Dot76DesignFatigueStrengthConcrete(
+            k_1=self.k_1,
+            beta_cc_t0=Form3Dot2CoefficientDependentOfConcreteAge(s=s, t=self.t_0),
+            f_cd=self.material.f_cd,
+            f_ck=self.material.f_ck,
+        )
+        object.__setattr__(self, "f_cd_fat", float(f_cd_fat))
+
+    @staticmethod
+    def source_docs() -> list[str]:
+        """List of source document identifiers used for this check.
+
+        Returns
+        -------
+        list[str]
+        """
+        return [EN_1992_1_1_2004]
+
+    @property
+    def _stress_level_limit(self) -> DIMENSIONLESS:
+        """Upper limit of the maximum stress level of formulas (6.77) and (6.78), 0.9 up to C50/60 and 0.8 above."""
+        return 0.9 if self.material.f_ck <= 50 else 0.8
+
+    def stress_levels(self, sigma_c_max: npt.ArrayLike, sigma_c_min: npt.ArrayLike) -> tuple[FloatArray, FloatArray, FloatArray]:
+        r"""Stress levels [$E_{cd,max}$] and [$E_{cd,min}$] and stress ratio [$R$], formulas (6.75), (6.74) and (6.73).
+
+        Parameters
+        ----------
+        sigma_c_max : npt.ArrayLike
+            [$\sigma_{cd,max}$] Upper compressive stresses of the cycles [MPa].
+        sigma_c_min : npt.ArrayLike
+            [$\sigma_{cd,min}$] Lower compressive stresses of the cycles [MPa].
+
+        Returns
+        -------
+        tuple[FloatArray, FloatArray, FloatArray]
+            The maximum and minimum stress levels and the stress ratios, broadcast against each other [-].
+
+        Raises
+        ------
+        ValueError
+            If a lower stress exceeds the upper stress of the same cycle.
+        """
+        sigma_max, sigma_min = np.broadcast_arrays(np.maximum(sigma_c_max, 0.0), np.maximum(sigma_c_min, 0.0))
+        if np.any(sigma_min > sigma_max):
+            raise ValueError("Invalid sigma_c_min: the lower stress of a cycle cannot exceed the upper stress.")
+        e_cd_max = sigma_max / self.f_cd_fat
+        e_cd_min = sigma_min / self.f_cd_fat
+        # a cycle without compression has no stress ratio, it does not cause damage
+        r = np.divide(e_cd_min, e_cd_max, out=np.ones_like(e_cd_max), where=e_cd_max > 0)
+        return e_cd_max, e_cd_min, r
+
+    def endurance(self, sigma_c_max: npt.ArrayLike, sigma_c_min: npt.ArrayLike) -> FloatArray:
+        r"""[$N_i$] Number of cycles to failure of cycles between two compressive stresses [-].
+
+        Parameters
+        ----------
+        sigma_c_max : npt.ArrayLike
+            [$\sigma_{cd,max,i}$] Upper compressive stresses of the cycles [MPa].
+        sigma_c_min : npt.ArrayLike
+            [$\sigma_{cd,min,i}$] Lower compressive stresses of the cycles [MPa].
+
+        Returns
+        -------
+        FloatArray
+            Numbers of cycles to failure. Cycles with a constant stress (R = 1) have an infinite endurance below
+            [$f_{cd,fat}$] and an endurance of zero at or above it.
+        """
+        e_cd_max, _, r = self.stress_levels(sigma_c_max, sigma_c_min)
+        constant = r >= 1
+        # cycles with a small amplitude have an endurance beyond the range of floats, which is infinite as well
+        with np.errstate(over="ignore"):
+            endurance = 10.0 ** (14 * (1 - e_cd_max) / np.sqrt(1 - np.where(constant, 0.0, r)))
+        return np.where(constant, np.where(e_cd_max < 1, np.inf, 0.0), endurance)
+
+    def damage(self, sigma_c_max: npt.ArrayLike, sigma_c_min: npt.ArrayLike, n: npt.ArrayLike, axis: int = -1) -> ConcreteFatigueResults:
+        r"""Damage [$D_{Ed}$] of cycle bands, the Palmgren-Miner sum of formula (6.70).
+
+        Parameters
+        ----------
+        sigma_c_max : npt.ArrayLike
+            [$\sigma_{cd,max,i}$] Upper compressive stresses of the cycle bands, for example one row per location [MPa].
+        sigma_c_min : npt.ArrayLike
+            [$\sigma_{cd,min,i}$] Lower compressive stresses of the cycle bands [MPa].
+        n : npt.ArrayLike
+            [$n_i$] Numbers of cycles of the cycle bands, broadcast against the stresses [-].
+        axis : int, optional
+            Axis of the cycle bands that is summed (default is the last axis).
+
+        Returns
+        -------
+        ConcreteFatigueResults
+            The damage of every location as unity check.
+
+        Raises
+        ------
+        ValueError
+            If a number of cycles is negative.
+        """
+        n_i = np.asarray(n, dtype=float)
+        if np.any(n_i < 0):
+            raise ValueError("Invalid n: the numbers of cycles cannot be negative.")
+        n_i, endurance = np.broadcast_arrays(n_i, self.endurance(sigma_c_max, sigma_c_min))
+        # bands without cycles do no damage, cycles with an endurance of zero an infinite damage
+        with np.errstate(divide="ignore"):
+            damage = np.divide(n_i, endurance, out=np.zeros(n_i.shape), where=n_i > 0)
+        return ConcreteFatigueResults(unity_check=np.sum(damage, axis=axis))
+
+    def damage_from_histories(self, stresses: npt.ArrayLike, repetitions: float = 1.0) -> ConcreteFatigueResults:
+        r"""Damage [$D_{Ed}$] of compressive stress histories, with the cycles counted by rainflow counting.
+
+        The cycles that do not close within a history are counted as half cycles.
+
+        Parameters
+        ----------
+        stresses : npt.ArrayLike
+            Compressive stress histories [$\sigma_c$], one row per location and the time along the last axis [MPa].
+        repetitions : float, optional
+            Number of times the histories occur during the design life (default is 1.0).
+
+        Returns
+        -------
+        ConcreteFatigueResults
+            The damage of every location as unity check, with the shape of the stresses without the last axis.
+        """
+        stresses = np.asarray(stresses, dtype=float)
+        histories = stresses.reshape(-1, stresses.shape[-1])
+        damage = np.empty(len(histories))
+        for index, history in enumerate(histories):
+            upper, lower, residue = rainflow_cycles(turning_points(np.maximum(history, 0.0)))
+            closed = np.sum(1 / self.endurance(upper, lower))
+            half = 0.5 * np.sum(1 / self.endurance(np.maximum(residue[:-1], residue[1:]), np.minimum(residue[:-1], residue[1:])))
+            damage[index] = repetitions * (closed + half)
+        return ConcreteFatigueResults(unity_check=damage.reshape(stresses.shape[:-1]))
+
+    def equivalent_check(self, sigma_cd_max_equ: npt.ArrayLike, sigma_cd_min_equ: npt.ArrayLike) -> ConcreteFatigueResults:
+        r"""Verification of the damage equivalent stresses for [$N = 10^6$] cycles, formula (6.72).
+
+        Parameters
+        ----------
+        sigma_cd_max_equ : npt.ArrayLike
+            [$\sigma_{cd,max,equ}$] Upper stresses of the damage equivalent amplitudes [MPa].
+        sigma_cd_min_equ : npt.ArrayLike
+            [$\sigma_{cd,min,equ}$] Lower stresses of the damage equivalent amplitudes [MPa].
+
+        Returns
+        -------
+        ConcreteFatigueResults
+            The unity checks [$E_{cd,max,equ} + 0.43 \sqrt{1 - R_{equ}}$] of every location.
+        """
+        e_cd_max_equ, _, r_equ = self.stress_levels(sigma_cd_max_equ, sigma_cd_min_equ)
+        return ConcreteFatigueResults(unity_check=e_cd_max_equ + 0.43 * np.sqrt(1 - r_equ))
+
+    def simplified_check(self, sigma_c_max: npt.ArrayLike, sigma_c_min: npt.ArrayLike) -> ConcreteFatigueResults:
+        r"""Simplified verification of the stresses under the frequent load combination, formula (6.77).
+
+        Parameters
+        ----------
+        sigma_c_max : npt.ArrayLike
+            [$\sigma_{c,max}$] Maximum compressive stresses under the frequent load combination [MPa].
+        sigma_c_min : npt.ArrayLike
+            [$\sigma_{c,min}$] Minimum compressive stresses at the same fibres [MPa].
+
+        Returns
+        -------
+        ConcreteFatigueResults
+            The maximum stress levels divided by their limits for every location.
+        """
+        e_cd_max, e_cd_min, _ = self.stress_levels(sigma_c_max, sigma_c_min)
+        return ConcreteFatigueResults(unity_check=e_cd_max / np.minimum(0.5 + 0.45 * e_cd_min, self._stress_level_limit))
+
+    def shear_check(self, v_ed_max: npt.ArrayLike, v_ed_min: npt.ArrayLike, v_rd_c: npt.ArrayLike) -> ConcreteFatigueResults:
+        r"""Verification of members without shear reinforcement under the frequent load combination, formulas (6.78) and (6.79).
+
+        Parameters
+        ----------
+        v_ed_max : npt.ArrayLike
+            [$V_{Ed,max}$] Maximum applied shear forces [kN].
+        v_ed_min : npt.ArrayLike
+            [$V_{Ed,min}$] Minimum applied shear forces in the cross-sections where [$V_{Ed,max}$] occurs [kN].
+        v_rd_c : npt.ArrayLike
+            [$V_{Rd,c}$] Design shear resistances according to formula (6.2.a) [kN].
+
+        Returns
+        -------
+        ConcreteFatigueResults
+            The ratios [$|V_{Ed,max}| / |V_{Rd,c}|$] divided by their limits for every location, infinite if the limit of
+            formula (6.79) is not positive.
+
+        Raises
+        ------
+        ValueError
+            If a shear resistance is not positive.
+        """
+        v_max, v_min, v_rd = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (v_ed_max, v_ed_min, v_rd_c)))
+        if np.any(v_rd <= 0):
+            raise ValueError("Invalid v_rd_c: the shear resistances must be positive.")
+        ratio_max, ratio_min = np.abs(v_max) / v_rd, np.abs(v_min) / v_rd
+        same_sign = v_max * v_min >= 0
+        limit = np.where(same_sign, np.minimum(0.5 + 0.45 * ratio_min, self._stress_level_limit), 0.5 - ratio_min)
+        unity_check = np.divide(ratio_max, limit, out=np.full_like(ratio_max, np.inf), where=limit > 0)
+        return ConcreteFatigueResults(unity_check=unity_check)
@@ -1,11 +1,18 @@
 r"""Calculation of nominal concrete cover from EN 1992-1-1: Chapter 4 - Durability and cover to reinforcement."""
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from enum import Enum
+from itertools import product
 from typing import Literal, cast
 
+import numpy as np
+import numpy.typing as npt
+
 from blueprints.checks.check_protocol import CheckProtocol
 from blueprints.checks.check_result import CheckResult
 from blueprints.codes.eurocode.en_1992_1_1_2004 import EN_1992_1_1_2004
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_4_durability_and_cover._base_classes.exposure_classes import Exposure, ExposureClassesBase
 from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_4_durability_and_cover._base_classes.nominal_cover_constants import (
     AbrasionClass,
     CastingSurface,
@@ -14,6 +21,7 @@ from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_4_durability_and_cover._
     NominalConcreteCoverConstantsBase as ConstantsBase,
 )
 from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_4_durability_and_cover._base_classes.structural_class import ConcreteStructuralClassBase
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_4_durability_and_cover.constants import NominalConcreteCoverConstants
 from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_4_durability_and_cover.formula_4_1 import Form4Dot1NominalConcreteCover
 from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_4_durability_and_cover.formula_4_2 import Form4Dot2MinimumConcreteCover
 from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_4_durability_and_cover.table_4_1 import (
@@ -28,10 +36,20 @@ from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_4_durability_and_cover.t
 from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_4_durability_and_cover.table_4_4n import (
     Table4Dot4nMinimumCoverDurabilityReinforcementSteel,
 )
+from blueprints.codes.eurocode.national_annex.nl.nen_en_1992_1_1_a1_2020.chapter_4_durability_and_cover import table_4_1 as nl_table_4_1
+from blueprints.codes.eurocode.national_annex.nl.nen_en_1992_1_1_a1_2020.chapter_4_durability_and_cover import table_4_4n as nl_table_4_4n
+from blueprints.codes.eurocode.national_annex.nl.nen_en_1992_1_1_a1_2020.chapter_4_durability_and_cover.constants import (
+    NominalConcreteCoverConstants as NLNominalConcreteCoverConstants,
+)
+from blueprints.codes.formula import Formula
 from blueprints.codes.latex_formula import latex_max_curly_brackets
 from blueprints.type_alias import MM
+from blueprints.utils.cache import ComputeOnceCache
 from blueprints.utils.report import Report
 
+type FloatArray = npt.NDArray[np.float64]
+type IntArray = npt.NDArray[np.int64]
+
 
 @dataclass(frozen=True)
 class NominalConcreteCover(CheckProtocol):
@@ -280,3 +298,212 @@ class NominalConcreteCover(CheckProtocol):
         )
 
         return report
+
+
+@dataclass(frozen=True)
+class _DurabilityTables:
+    """Exposure classes of table 4.1 and the durability requirements of table 4.4N of one code."""
+
+    exposure_classes: Callable[..., ExposureClassesBase]
+    carbonation: type[Exposure]
+    chloride: type[Exposure]
+    chloride_seawater: type[Exposure]
+    c_min_dur: Callable[..., Formula]
+
+
+_EN_DURABILITY_TABLES = _DurabilityTables(
+    Table4Dot1ExposureClasses, Carbonation, Chloride, ChlorideSeawater, Table4Dot4nMinimumCoverDurabilityReinforcementSteel
+)
+_DURABILITY_TABLES: dict[type[ConstantsBase], _DurabilityTables] = {
+    NominalConcreteCoverConstants: _EN_DURABILITY_TABLES,
+    NLNominalConcreteCoverConstants: _DurabilityTables(
+        nl_table_4_1.Table4Dot1ExposureClasses,
+        nl_table_4_1.Carbonation,
+        nl_table_4_1.Chloride,
+        nl_table_4_1.ChlorideSeawater,
+        nl_table_4_4n.Table4Dot4nMinimumCoverDurabilityReinforcementSteel,
+    ),
+}
+
+
+def _durability_tables(constants: ConstantsBase) -> _DurabilityTables:
+    """Durability tables of the code of the constants, also for subclasses of the constants, or those of EN 1992-1-1."""
+    return next((tables for code, tables in _DURABILITY_TABLES.items() if isinstance(constants, code)), _EN_DURABILITY_TABLES)
+
+
+STRUCTURAL_CLASSES = (1, 2, 3, 4, 5, 6)
+"""Structural classes of table 4.3N."""
+
+
+def _indices(values: object, enum: type[Enum], name: str) -> IntArray:
+    """Positions of exposure or abrasion classes, given as members or names, in the members of their enum."""
+    names = [member.name for member in enum]
+    array = np.asarray(values, dtype=object)
+    try:
+        flat = [names.index(value.upper() if isinstance(value, str) else value.name) for value in array.ravel()]
+    except (ValueError, AttributeError) as error:
+        raise ValueError(f"Invalid {name}: {values}. Expected members or names of {enum.__name__}.") from error
+    return np.array(flat, dtype=np.int64).reshape(array.shape)
+
+
+@dataclass(frozen=True)
+class NominalConcreteCoverTable:
+    r"""Precomputed nominal concrete cover [$c_{nom}$] [$mm$] for many elements, according to art. 4.4.1.
+
+    Table 4.4N and the minimum cover with regard to the casting surface (art. 4.4.1.3 (4)) are evaluated once for all
+    combinations of exposure classes and structural classes. The nominal cover of an element then only depends on its
+    exposure classes, structural class, bar diameter, [$\Delta c_{dev}$] and abrasion class. `values` calculates the cover of
+    arrays of elements at once, `value` caches the cover of single elements. The results equal
+    `NominalConcreteCover.value()` for the same input.
+
+    The tables of EN 1992-1-1:2004 are used, or those of NEN-EN 1992-1-1:2005+A1:2015+NB:2016+A1:2020 for the constants of the
+    Dutch national annex.
+
+    Parameters
+    ----------
+    constants: ConstantsBase
+        The constants for the calculation of the nominal concrete cover.
+    nominal_max_aggregate_size: MM
+        The nominal maximum aggregate size [$mm$].
+    delta_c_dur_gamma: MM
+        [$\Delta c_{dur,\gamma}$] An additional safety requirement based on art. 4.4.1.2 (6) [$mm$]. The default is 0 mm.
+    delta_c_dur_st: MM
+        [$\Delta c_{dur,st}$] A reduction of minimum concrete cover when using stainless steel based on art. 4.4.1.2 (7) [$mm$].
+        The default is 0 mm.
+    delta_c_dur_add: MM
+        [$\Delta c_{dur,add}$] A reduction of minimum concrete cover when using additional protection based on art. 4.4.1.2 (8)
+        [$mm$]. The default is 0 mm.
+    casting_surface: CastingSurface
+        The casting surface of the concrete according to art. 4.4.1.3 (4). The default value is "Permanently exposed".
+    uneven_surface: bool
+        Is the surface uneven according to art. 4.4.1.2 (11)? The default value is False.
+
+    Example
+    -------
+    ```python
+    from blueprints.checks.eurocode.concrete.nominal_concrete_cover import NominalConcreteCoverTable
+
+    table = NominalConcreteCoverTable(NominalConcreteCoverConstants(), nominal_max_aggregate_size=32)
+    covers = table.values(diameter=[12, 16, 25], structural_class=4, carbonation=["XC1", "XC3", "XC4"], chloride="XD1")
+    ```
+    """
+
+    constants: ConstantsBase
+    nominal_max_aggregate_size: MM
+    delta_c_dur_gamma: MM = 0
+    delta_c_dur_st: MM = 0
+    delta_c_dur_add: MM = 0
+    casting_surface: CastingSurface = CastingSurface.PERMANENTLY_EXPOSED
+    uneven_surface: bool = False
+    c_min_dur: FloatArray = field(init=False, repr=False, compare=False)
+    """Table 4.4N for all carbonation, chloride, chloride seawater and structural classes, in the order of their enums [mm]."""
+    casting_surface_cover: FloatArray = field(init=False, repr=False, compare=False)
+    """Minimum cover with regard to the casting surface for the values of `c_min_dur` [mm]."""
+    abrasion_cover: FloatArray = field(init=False, repr=False, compare=False)
+    """Increase of the cover for the abrasion classes, in the order of `AbrasionClass` [mm]."""
+    _tables: _DurabilityTables = field(init=False, repr=False, compare=False)
+    _cache: ComputeOnceCache[tuple, MM] = field(default_factory=ComputeOnceCache, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Evaluate the durability tables for all combinations of exposure classes and structural classes."""
+        tables = _durability_tables(self.constants)
+        object.__setattr__(self, "_tables", tables)
+        classes = (tables.carbonation, tables.chloride, tables.chloride_seawater)
+        c_min_dur = np.array(
+            [
+                float(tables.c_min_dur(tables.exposure_classes(carbonation, chloride, chloride_seawater), structural_class))
+                for carbonation, chloride, chloride_seawater, structural_class in product(*classes, STRUCTURAL_CLASSES)
+            ]
+        ).reshape(*(len(exposure) for exposure in classes), len(STRUCTURAL_CLASSES))
+        casting_surface_cover = np.vectorize(lambda cover: self.constants.minimum_cover_with_regard_to_casting_surface(cover, self.casting_surface))
+        object.__setattr__(self, "c_min_dur", c_min_dur)
+        object.__setattr__(self, "casting_surface_cover", casting_surface_cover(c_min_dur).astype(float))
+        object.__setattr__(
+            self, "abrasion_cover", np.array([self.constants.COVER_INCREASE_FOR_ABRASION_CLASS[abrasion] for abrasion in AbrasionClass], dtype=float)
+        )
+
+    def values(
+        self,
+        diameter: npt.ArrayLike,
+        structural_class: npt.ArrayLike,
+        carbonation: object = "NA",
+        chloride: object = "NA",
+        chloride_seawater: object = "NA",
+        delta_c_dev: npt.ArrayLike | None = None,
+        abrasion_class: object = AbrasionClass.NA,
+    ) -> FloatArray:
+        r"""Nominal concrete cover of arrays of elements, the maximum of formula 4.1 and the minimum cover with regard to the
+        casting surface [$mm$].
+
+        Parameters
+        ----------
+        diameter: npt.ArrayLike
+            The (equivalent) diameters of the reinforcement [$mm$].
+        structural_class: npt.ArrayLike
+            The structural classes, integers from 1 to 6.
+        carbonation: object
+            Carbonation exposure classes, as members or names such as "XC3", of table 4.1 of the code of the constants. Default
+            is "Not applicable".
+        chloride: object
+            Chloride exposure classes, as members or names. Default is "Not applicable".
+        chloride_seawater: object
+            Chloride seawater exposure classes, as members or names. Default is "Not applicable".
+        delta_c_dev: npt.ArrayLike | None
+            [$\Delta c_{dev}$] Allowances in design for deviation [$mm$]. Default is the value of the constants.
+        abrasion_class: object
+            Abrasion classes, as members of AbrasionClass or names. Default is "Not applicable".
+
+        Returns
+        -------
+        FloatArray
+            The nominal concrete covers, broadcast over all arguments [$mm$].
+        """
+        diameter = np.asarray(diameter, dtype=float)
+        structural_class = np.asarray(structural_class)
+        if np.any(diameter <= 0):
+            raise ValueError(f"Invalid diameter: {diameter}. Diameters must be positive.")
+        if not np.all(np.isin(structural_class, STRUCTURAL_CLASSES)):
+            raise ValueError(f"Invalid structural_class: {structural_class}. Structural classes must be integers from 1 to 6.")
+        delta_c_dev = np.asarray(self.constants.DEFAULT_DELTA_C_DEV if delta_c_dev is None else delta_c_dev, dtype=float)
+        if np.any(delta_c_dev < 0):
+            raise ValueError(f"Invalid delta_c_dev: {delta_c_dev}. Values must be non-negative.")
+
+        index = (
+            _indices(carbonation, self._tables.carbonation, "carbonation"),
+            _indices(chloride, self._tables.chloride, "chloride"),
+            _indices(chloride_seawater, self._tables.chloride_seawater, "chloride_seawater"),
+            structural_class.astype(np.int64) - 1,
+        )
+        c_min_dur = self.c_min_dur[index]
+        # According to table 4.2, formula 4.2 and art. 4.4.1.2 (11) and (13)
+        c_min_b = diameter + 5 * (self.nominal_max_aggregate_size > 32)
+        c_min_dur_total = c_min_dur + self.delta_c_dur_gamma - self.delta_c_dur_st - self.delta_c_dur_add
+        c_min = np.maximum(np.maximum(c_min_b, c_min_dur_total), 10)
+        c_min = c_min + self.constants.COVER_INCREASE_FOR_UNEVEN_SURFACE * self.uneven_surface
+        c_min = c_min + self.abrasion_cover[_indices(abrasion_class, AbrasionClass, "abrasion_class")]
+        return np.maximum(c_min + delta_c_dev, self.casting_surface_cover[index])
+
+    def value(
+        self,
+        diameter: MM,
+        structural_class: ConcreteStructuralClassBase | int,
+        carbonation: Carbonation | str = "NA",
+        chloride: Chloride | str = "NA",
+        chloride_seawater: ChlorideSeawater | str = "NA",
+        delta_c_dev: MM | None = None,
+        abrasion_class: AbrasionClass = AbrasionClass.NA,
+    ) -> MM:
+        r"""Cached nominal concrete cover of a single element [$mm$], see `values` for the parameters.
+
+        Returns
+        -------
+        MM
+            The nominal concrete cover [$mm$].
+        """
+        key = tuple(
+            value.name if isinstance(value, Enum) else value.upper() if isinstance(value, str) else value
+            for value in (diameter, int(structural_class), carbonation, chloride, chloride_seawater, delta_c_dev, abrasion_class)
+        )
+        return self._cache.get_or_compute(
+            key, lambda: float(self.values(diameter, structural_class, carbonation, chloride, chloride_seawater, delta_c_dev, abrasion_class))
+        )
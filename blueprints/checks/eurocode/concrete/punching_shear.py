@@ -0,0 +1,492 @@
+r"""Module for the vectorised punching shear verification of flat slabs, according to EN 1992-1-1:2004, art.6.4,
+formulas (6.32) - (6.54).
+
+The geometry of the basic control perimeter [$u_1$] of a column, at [$2d$] from the column, is built with shapely:
+
+- Internal columns use the full perimeter around the column, edge and corner columns only the part inside the slab. The columns
+  of edge and corner columns are at the free edges of the slab.
+- Openings closer than [$6d$] to the column make the part of the perimeter between the two tangents from the centre of the
+  column to the opening ineffective, figure 6.14.
+- [$W_1$] of formula (6.40) is integrated along the perimeter for both axes of the column, which gives formulas (6.41) and (6.45)
+  for rectangular columns without openings.
+
+`control_perimeter` caches the perimeters by column type, size and effective depth, so equal columns share their geometry.
+`PunchingShear.evaluate` then calculates [$\beta$] and the shear stresses of all load combinations and columns at once. For
+column bases the support reactions are reduced by the net upward force within the control perimeter, formulas (6.48),
+(6.49) and (6.51), at the basic control perimeter at [$2d$].
+
+The axes of a column are the local axes 1 and 2 along the dimensions [$c_1$] and [$c_2$], with the origin at the centre of the
+column. Axis 1 of edge and corner columns points from the free edge into the slab, axis 2 of corner columns as well.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+
+import numpy as np
+import numpy.typing as npt
+import shapely
+from shapely.affinity import scale
+from shapely.geometry import MultiPoint, Point, Polygon, box
+from shapely.geometry.base import BaseGeometry
+from shapely.ops import unary_union
+
+from blueprints.checks.check_result import CheckResult
+from blueprints.codes.eurocode.en_1992_1_1_2004 import EN_1992_1_1_2004
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_6n import Form6Dot6nStrengthReductionFactor
+from blueprints.materials.concrete import ConcreteMaterial
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.type_alias import DIMENSIONLESS, MM, MM2, MPA
+from blueprints.unit_conversion import KN_TO_N, KNM_TO_NMM
+
+type FloatArray = npt.NDArray[np.float64]
+
+_K_RATIOS = np.array([0.5, 1.0, 2.0, 3.0])
+_K_VALUES = np.array([0.45, 0.60, 0.70, 0.80])
+
+OPENING_DISTANCE_FACTOR = 6.0
+"""Openings closer than this factor times the effective depth to the column reduce the control perimeter, art.6.4.2 (3)."""
+
+CONTROL_PERIMETER_CACHE_SIZE = 1024
+"""Maximum number of control perimeters kept by `control_perimeter`, the least recently used perimeters are discarded first."""
+
+
+class ColumnType(Enum):
+    """Position of a column in the slab, art.6.4.2 and figure 6.15."""
+
+    INTERNAL = "internal"
+    EDGE = "edge"
+    CORNER = "corner"
+
+
+def k_factor(c_1: npt.ArrayLike, c_2: npt.ArrayLike) -> FloatArray:
+    r"""[$k$] Coefficient for the part of the unbalanced moment transferred by shear of rectangular columns, table 6.1 [-].
+
+    Parameters
+    ----------
+    c_1 : npt.ArrayLike
+        [$c_1$] Column dimension parallel to the eccentricity of the load [mm].
+    c_2 : npt.ArrayLike
+        [$c_2$] Column dimension perpendicular to the eccentricity of the load [mm].
+
+    Returns
+    -------
+    FloatArray
+        The coefficients, linearly interpolated between the values of table 6.1.
+    """
+    return np.interp(np.asarray(c_1, dtype=float) / np.asarray(c_2, dtype=float), _K_RATIOS, _K_VALUES)
+
+
+def effective_depth(d_y: npt.ArrayLike, d_z: npt.ArrayLike) -> FloatArray:
+    r"""[$d_{eff}$] Effective depth of the slab, formula (6.32) [mm].
+
+    Parameters
+    ----------
+    d_y : npt.ArrayLike
+        [$d_y$] Effective depths of the reinforcement in the y-direction [mm].
+    d_z : npt.ArrayLike
+        [$d_z$] Effective depths of the reinforcement in the z-direction [mm].
+
+    Returns
+    -------
+    FloatArray
+        The mean effective depths, broadcast against each other.
+
+    Raises
+    ------
+    ValueError
+        If an effective depth is not positive.
+    """
+    d_y, d_z = np.asarray(d_y, dtype=float), np.asarray(d_z, dtype=float)
+    if np.any(d_y <= 0) or np.any(d_z <= 0):
+        raise ValueError("Invalid d_y or d_z: effective depths must be positive.")
+    return (d_y + d_z) / 2
+
+
+def _segments(lines: BaseGeometry) -> tuple[FloatArray, FloatArray]:
+    """Start and end points of the straight segments of (multi)line geometry, as arrays of shape (n, 2)."""
+    starts, ends = [np.empty((0, 2))], [np.empty((0, 2))]
+    for part in shapely.get_parts(lines):
+        if isinstance(part, shapely.LineString | shapely.LinearRing):
+            coordinates = shapely.get_coordinates(part)
+            starts.append(coordinates[:-1])
+            ends.append(coordinates[1:])
+    return np.concatenate(starts), np.concatenate(ends)
+
+
+def _integral_of_distance(starts: FloatArray, ends: FloatArray) -> FloatArray:
+    r"""[$\int |e| dl$] of straight segments for the distances to both axes through the origin, formula (6.40) [mm²]."""
+    lengths = np.linalg.norm(ends - starts, axis=1)[:, np.newaxis]
+    a, b = np.abs(starts), np.abs(ends)
+    same_side = starts * ends >= 0
+    # a segment crossing an axis consists of two triangles on both sides of the axis
+    crossing = np.divide(a**2 + b**2, a + b, out=np.zeros_like(a), where=~same_side)
+    return np.sum(lengths * np.where(same_side, a + b, crossing) / 2, axis=0)
+
+
+@dataclass(frozen=True)
+class ControlPerimeter:
+    r"""Basic control perimeter [$u_1$] of a column at [$2d$] from the column, EN 1992-1-1:2004 art.6.4.2.
+
+    Parameters
+    ----------
+    c_1 : MM
+        [$c_1$] Column dimension along axis 1, perpendicular to the free edge for edge columns, or the diameter of circular
+        columns [mm].
+    c_2 : MM
+        [$c_2$] Column dimension along axis 2, equal to [$c_1$] for circular columns [mm].
+    d : MM
+        [$d_{eff}$] Effective depth of the slab, formula (6.32), see `effective_depth` [mm].
+    column_type : ColumnType, optional
+        Position of the column in the slab (default is ColumnType.INTERNAL).
+    circular : bool, optional
+        True for circular internal columns (default is False).
+    openings : tuple[Polygon, ...], optional
+        Openings in the slab in the local coordinates of the column (default is no openings).
+    """
+
+    c_1: MM
+    c_2: MM
+    d: MM
+    column_type: ColumnType = ColumnType.INTERNAL
+    circular: bool = False
+    openings: tuple[Polygon, ...] = ()
+    lines: BaseGeometry = field(init=False, repr=False, compare=False)
+    """Effective parts of the control perimeter in the local coordinates of the column."""
+    u_1: MM = field(init=False, repr=False)
+    r"""[$u_1$] Length of the basic control perimeter [mm]."""
+    u_1_star: MM = field(init=False, repr=False)
+    r"""[$u_1^*$] Length of the reduced basic control perimeter of edge and corner columns, figure 6.20 [mm]."""
+    u_0: MM = field(init=False, repr=False)
+    r"""[$u_0$] Length of the perimeter of the column for formula (6.53), art.6.4.5 (3) [mm]."""
+    w_1: MM2 = field(init=False, repr=False)
+    r"""[$W_1$] Distribution of the shear for an eccentricity along axis 1, formula (6.40) [mm²]."""
+    w_2: MM2 = field(init=False, repr=False)
+    r"""[$W_1$] Distribution of the shear for an eccentricity along axis 2, formula (6.40) [mm²]."""
+
+    def __post_init__(self) -> None:
+        """Validate the column and build the geometry of the control perimeter."""
+        if min(self.c_1, self.c_2, self.d) <= 0:
+            raise ValueError(f"Invalid column: c_1={self.c_1}, c_2={self.c_2} and d={self.d} must be positive.")
+        if self.circular and self.c_1 != self.c_2:
+            raise ValueError(f"Invalid circular column: c_1={self.c_1} and c_2={self.c_2} must both equal the diameter.")
+        if self.circular and self.column_type != ColumnType.INTERNAL:
+            raise NotImplementedError("Circular edge and corner columns have not been implemented yet.")
+
+        half_1, half_2, two_d = self.c_1 / 2, self.c_2 / 2, 2 * self.d
+        column = Point(0, 0).buffer(half_1, quad_segs=64) if self.circular else box(-half_1, -half_2, half_1, half_2)
+        far = 10 * (self.c_1 + self.c_2 + self.d)
+        lines = column.buffer(two_d, quad_segs=64).exterior
+
+        # the slab is on the positive side of axis 1 of edge columns and of both axes of corner columns
+        a_1, a_2 = min(1.5 * self.d, 0.5 * self.c_1), min(1.5 * self.d, 0.5 * self.c_2)
+        if self.column_type == ColumnType.EDGE:
+            lines = lines.intersection(box(-half_1, -far, far, far))
+            reduced_region = box(half_1 - a_1, -far, far, far)
+            u_0 = min(self.c_2 + 3 * self.d, self.c_2 + 2 * self.c_1)
+        elif self.column_type == ColumnType.CORNER:
+            lines = lines.intersection(box(-half_1, -half_2, far, far))
+            reduced_region = box(half_1 - a_1, half_2 - a_2, far, far)
+            u_0 = min(3 * self.d, self.c_1 + self.c_2)
+        else:
+            reduced_region = None
+            u_0 = np.pi * self.c_1 if self.circular else 2 * (self.c_1 + self.c_2)
+
+        shadows = [self._shadow(opening, column, far) for opening in self.openings if opening.distance(column) <= OPENING_DISTANCE_FACTOR * self.d]
+        if shadows:
+            lines = lines.difference(unary_union(shadows))
+        if lines.length <= 0:
+            raise ValueError("Invalid openings: the openings make the whole control perimeter ineffective.")
+        w_1, w_2 = _integral_of_distance(*_segments(lines))
+
+        object.__setattr__(self, "lines", lines)
+        object.__setattr__(self, "u_1", float(lines.length))
+        object.__setattr__(self, "u_1_star", float(lines.length if reduced_region is None else lines.intersection(reduced_region).length))
+        object.__setattr__(self, "u_0", float(u_0))
+        object.__setattr__(self, "w_1", float(w_1))
+        object.__setattr__(self, "w_2", float(w_2))
+
+    @staticmethod
+    def _shadow(opening: Polygon, column: Polygon, far: MM) -> BaseGeometry:
+        """Region between the tangents from the centre of the column to the opening, beyond the column, figure 6.14."""
+        distance = max(Point(0, 0).distance(opening), 1e-9)
+        cone = MultiPoint([(0.0, 0.0), *scale(opening, far / distance, far / distance, origin=(0, 0)).exterior.coords]).convex_hull
+        return cone.union(opening).difference(column)
+
+    @property
+    def b_1(self) -> MM:
+        """Dimension of the control perimeter of internal columns along axis 1, for formula (6.43) [mm]."""
+        return self.c_1 + 4 * self.d
+
+    @property
+    def b_2(self) -> MM:
+        """Dimension of the control perimeter of internal columns along axis 2, for formula (6.43) [mm]."""
+        return self.c_2 + 4 * self.d
+
+
+@lru_cache(maxsize=CONTROL_PERIMETER_CACHE_SIZE)
+def control_perimeter(
+    c_1: MM,
+    c_2: MM,
+    d: MM,
+    column_type: ColumnType = ColumnType.INTERNAL,
+    circular: bool = False,
+    openings: tuple[Polygon, ...] = (),
+) -> ControlPerimeter:
+    """Cached basic control perimeter, equal columns share the same geometry.
+
+    At most `CONTROL_PERIMETER_CACHE_SIZE` perimeters are kept, so that long running sessions with many different columns do
+    not grow the cache without bound.
+
+    Parameters
+    ----------
+    c_1 : MM
+        Column dimension along axis 1, or the diameter of circular columns [mm].
+    c_2 : MM
+        Column dimension along axis 2 [mm].
+    d : MM
+        Effective depth of the slab [mm].
+    column_type : ColumnType, optional
+        Position of the column in the slab (default is ColumnType.INTERNAL).
+    circular : bool, optional
+        True for circular internal columns (default is False).
+    openings : tuple[Polygon, ...], optional
+        Openings in the slab in the local coordinates of the column (default is no openings).
+
+    Returns
+    -------
+    ControlPerimeter
+        The control perimeter of the column.
+    """
+    return ControlPerimeter(c_1=c_1, c_2=c_2, d=d, column_type=column_type, circular=circular, openings=openings)
+
+
+@dataclass(frozen=True)
+class PunchingShearResults:
+    r"""Punching shear stresses for all load combinations and columns, the arrays have one row per combination and one column per
+    column of the slab.
+
+    Parameters
+    ----------
+    beta : FloatArray
+        [$\beta$] Factor for the eccentricity of the load, formulas (6.39) and (6.42) - (6.46) [-].
+    v_ed : FloatArray
+        [$v_{Ed}$] Shear stress at the basic control perimeter, formula (6.38), or (6.49) and (6.51) for column bases [MPa].
+    v_ed_0 : FloatArray
+        [$v_{Ed,0}$] Shear stress at the perimeter of the column, formula (6.53) [MPa].
+    v_rd_c : FloatArray
+        [$v_{Rd,c}$] Punching shear resistance without punching shear reinforcement per column, formula (6.47) [MPa].
+    v_rd_max : MPA
+        [$v_{Rd,max}$] Maximum punching shear stress, [$0.4 \nu f_{cd}$] (art.6.4.5 (3)) [MPa].
+    a_sw_s_r : FloatArray
+        [$A_{sw}/s_r$] Required vertical punching shear reinforcement per perimeter per unit of radial spacing, formula (6.52),
+        zero if no reinforcement is required [mm²/mm].
+    u_out_ef : FloatArray
+        [$u_{out,ef}$] Perimeter at which no punching shear reinforcement is required, formula (6.54) [mm].
+    """
+
+    beta: FloatArray
+    v_ed: FloatArray
+    v_ed_0: FloatArray
+    v_rd_c: FloatArray
+    v_rd_max: MPA
+    a_sw_s_r: FloatArray
+    u_out_ef: FloatArray
+
+    @property
+    def unity_check(self) -> FloatArray:
+        """Shear stress at the basic control perimeter divided by the resistance without punching shear reinforcement [-]."""
+        return self.v_ed / self.v_rd_c
+
+    @property
+    def unity_check_max(self) -> FloatArray:
+        """Shear stress at the perimeter of the column divided by the maximum punching shear stress [-]."""
+        return self.v_ed_0 / self.v_rd_max
+
+    @property
+    def governing(self) -> tuple[int, int]:
+        """Indices of the combination and the column with the largest unity check without punching shear reinforcement."""
+        combination, column = np.unravel_index(np.argmax(self.unity_check), self.unity_check.shape)
+        return int(combination), int(column)
+
+    def result(self) -> CheckResult:
+        """Result of the governing combination and column, without punching shear reinforcement.
+
+        Returns
+        -------
+        CheckResult
+            Result based on the largest unity check of all combinations and columns.
+        """
+        combination, column = self.governing
+        return CheckResult.from_comparison(provided=float(self.v_ed[combination, column]), required=float(self.v_rd_c[column]))
+
+
+@dataclass(frozen=True)
+class PunchingShear:
+    r"""Punching shear verification of the columns of a flat slab, based on EN 1992-1-1:2004 art. 6.4.
+
+    Parameters
+    ----------
+    concrete_material : ConcreteMaterial
+        The concrete material of the slab.
+    steel_material : ReinforcementSteelMaterial, optional
+        The reinforcement steel of the punching shear reinforcement (default is B500B).
+    k_1 : DIMENSIONLESS, optional
+        [$k_1$] Coefficient for the axial stress in formula (6.47), the recommended value is 0.1 (default is 0.1).
+
+    Example
+    -------
+    ```python
+    import numpy as np
+
+    from blueprints.checks.eurocode.concrete.punching_shear import ColumnType, PunchingShear, control_perimeter
+
+    perimeters = [control_perimeter(400, 400, 220), control_perimeter(300, 400, 220, ColumnType.EDGE)]
+    results = PunchingShear(concrete_material).evaluate(perimeters, rho_l=[0.008, 0.006], v_ed=v_ed, m_ed_2=m_ed_2)
+    print(results.unity_check.max(axis=0))
+    ```
+    """
+
+    concrete_material: ConcreteMaterial
+    steel_material: ReinforcementSteelMaterial = field(default_factory=ReinforcementSteelMaterial)
+    k_1: DIMENSIONLESS = 0.1
+    name: str = "Punching shear verification of flat slabs according to EN 1992-1-1:2004"
+    c_rd_c: DIMENSIONLESS = field(init=False, repr=False)
+    r"""[$C_{Rd,c}$] Coefficient of formula (6.47), [$0.18 / \gamma_c$] [-]."""
+    v_rd_max: MPA = field(init=False, repr=False)
+    r"""[$v_{Rd,max}$] Maximum punching shear stress, [$0.4 \nu f_{cd}$] [MPa]."""
+
+    def __post_init__(self) -> None:
+        """Calculate the material dependent terms."""
+        nu = float(Form6Dot6nStrengthReductionFactor(f_ck=self.concrete_material.f_ck))
+        object.__setattr__(self, "c_rd_c", 0.18 / self.concrete_material.material_factor)
+        object.__setattr__(self, "v_rd_max", 0.4 * nu * self.concrete_material.f_cd)
+
+    @staticmethod
+    def source_docs() -> list[str]:
+        """List of source document identifiers used for this check.
+
+        Returns
+        -------
+        list[str]
+        """
+        return [EN_1992_1_1_2004]
+
+    def v_rd_c(self, d: npt.ArrayLike, rho_l: npt.ArrayLike, sigma_cp: npt.ArrayLike = 0.0) -> FloatArray:
+        r"""[$v_{Rd,c}$] Punching shear resistance without punching shear reinforcement, formula (6.47) with (6.3N) [MPa].
+
+        Parameters
+        ----------
+        d : npt.ArrayLike
+            [$d$] Effective depths [mm].
+        rho_l : npt.ArrayLike
+            [$\rho_l$] Reinforcement ratios [$\sqrt{\rho_{ly} \rho_{lz}}$], limited to 0.02 [-].
+        sigma_cp : npt.ArrayLike, optional
+            [$\sigma_{cp}$] Mean normal stresses in the slab, positive for compression [MPa].
+
+        Returns
+        -------
+        FloatArray
+            The resistances, broadcast against each other.
+        """
+        d = np.asarray(d, dtype=float)
+        f_ck = self.concrete_material.f_ck
+        k = np.minimum(1 + np.sqrt(200 / d), 2.0)
+        v_min = 0.035 * k**1.5 * np.sqrt(f_ck)
+        resistance = np.maximum(self.c_rd_c * k * np.cbrt(100 * np.minimum(rho_l, 0.02) * f_ck), v_min) + self.k_1 * np.asarray(sigma_cp)
+        return np.maximum(resistance, 0.0)
+
+    def evaluate(
+        self,
+        perimeters: Sequence[ControlPerimeter],
+        rho_l: npt.ArrayLike,
+        v_ed: npt.ArrayLike,
+        m_ed_1: npt.ArrayLike = 0.0,
+        m_ed_2: npt.ArrayLike = 0.0,
+        sigma_cp: npt.ArrayLike = 0.0,
+        delta_v_ed: npt.ArrayLike = 0.0,
+    ) -> PunchingShearResults:
+        r"""Calculate the punching shear stresses of all load combinations and columns.
+
+        The loads are broadcast to arrays with one row per combination and one column per column of the slab. For column bases
+        the net applied punching force [$V_{Ed,red} = V_{Ed} - \Delta V_{Ed}$] of formula (6.48) replaces [$V_{Ed}$] at the
+        basic control perimeter, and the eccentricity [$M_{Ed}/V_{Ed,red}$] gives formula (6.51). The shear stress at the
+        perimeter of the column uses the unreduced [$V_{Ed}$] with the same [$\beta$].
+
+        Parameters
+        ----------
+        perimeters : Sequence[ControlPerimeter]
+            The basic control perimeters of the columns.
+        rho_l : npt.ArrayLike
+            [$\rho_l$] Reinforcement ratio of the slab at every column [-].
+        v_ed : npt.ArrayLike
+            [$V_{Ed}$] Support reactions [kN].
+        m_ed_1 : npt.ArrayLike, optional
+            [$M_{Ed}$] Unbalanced moments for an eccentricity [$M_{Ed}/V_{Ed}$] along axis 1 of the column, positive into the slab
+            for edge and corner columns [kNm].
+        m_ed_2 : npt.ArrayLike, optional
+            [$M_{Ed}$] Unbalanced moments for an eccentricity along axis 2 of the column, positive into the slab for corner
+            columns [kNm].
+        sigma_cp : npt.ArrayLike, optional
+            [$\sigma_{cp}$] Mean normal stress in the slab at every column, positive for compression [MPa].
+        delta_v_ed : npt.ArrayLike, optional
+            [$\Delta V_{Ed}$] Net upward force within the basic control perimeter of column bases, the soil pressure minus the
+            self weight of the base, formula (6.48) (default is 0.0 for slabs) [kN].
+
+        Returns
+        -------
+        PunchingShearResults
+            The punching shear stresses and resistances.
+
+        Raises
+        ------
+        ValueError
+            If a net upward force is negative or larger than the support reaction.
+        NotImplementedError
+            If the eccentricity of an edge or corner column points out of the slab.
+        """
+        per_column = {
+            name: np.array([getattr(perimeter, name) for perimeter in perimeters])
+            for name in ("c_1", "c_2", "d", "u_1", "u_1_star", "u_0", "w_1", "w_2", "b_1", "b_2")
+        }
+        column_types = np.array([perimeter.column_type.value for perimeter in perimeters])
+        circular = np.array([perimeter.circular for perimeter in perimeters])
+        c_1, c_2, d, u_1 = per_column["c_1"], per_column["c_2"], per_column["d"], per_column["u_1"]
+
+        loads = np.broadcast_arrays(*(np.atleast_2d(np.asarray(value, dtype=float)) for value in (v_ed, m_ed_1, m_ed_2, delta_v_ed)))
+        v_ed_kn, m_1, m_2, delta_kn = (np.broadcast_to(value, (value.shape[0], len(perimeters))) for value in loads)
+        if np.any(delta_kn < 0) or np.any(delta_kn > np.abs(v_ed_kn)):
+            raise ValueError("Invalid delta_v_ed: net upward forces must be between zero and the support reactions.")
+        # formula (6.48), the net applied punching force of column bases
+        force = (np.abs(v_ed_kn) - delta_kn) * KN_TO_N
+        e_1 = np.divide(m_1 * KNM_TO_NMM, force, out=np.zeros_like(force), where=force > 0)
+        e_2 = np.divide(m_2 * KNM_TO_NMM, force, out=np.zeros_like(force), where=force > 0)
+
+        edge, corner = column_types == ColumnType.EDGE.value, column_types == ColumnType.CORNER.value
+        if np.any((e_1 < 0) & (edge | corner)) or np.any((e_2 < 0) & corner):
+            raise NotImplementedError("Eccentricities out of the slab at edge and corner columns have not been implemented yet.")
+
+        # internal columns: formula (6.39) for one eccentricity or a circular column (k = 0.6, formula (6.42)), (6.43) for two
+        uniaxial = 1 + k_factor(c_1, c_2) * np.abs(e_1) * u_1 / per_column["w_1"] + k_factor(c_2, c_1) * np.abs(e_2) * u_1 / per_column["w_2"]
+        biaxial = 1 + 1.8 * np.hypot(e_1 / per_column["b_1"], e_2 / per_column["b_2"])
+        circular_beta = 1 + 0.6 * np.hypot(e_1, e_2) * u_1 / per_column["w_1"]
+        internal_beta = np.where(circular, circular_beta, np.where((e_1 != 0) & (e_2 != 0), biaxial, uniaxial))
+
+        # edge columns with the eccentricity perpendicular to the edge into the slab, formula (6.44), and corner columns, (6.46)
+        u_ratio = u_1 / per_column["u_1_star"]
+        edge_beta = u_ratio + k_factor(c_1, 2 * c_2) * u_1 / per_column["w_2"] * np.abs(e_2)
+        beta = np.select([edge, corner], [edge_beta, np.broadcast_to(u_ratio, force.shape)], internal_beta)
+
+        v_ed_u_1 = beta * force / (u_1 * d)
+        v_rd_c = self.v_rd_c(d, rho_l, sigma_cp) * np.ones(len(perimeters))
+        f_ywd_ef = np.minimum(250 + 0.25 * d, self.steel_material.f_yd)
+        return PunchingShearResults(
+            beta=beta,
+            v_ed=v_ed_u_1,
+            v_ed_0=beta * np.abs(v_ed_kn) * KN_TO_N / (per_column["u_0"] * d),
+            v_rd_c=v_rd_c,
+            v_rd_max=self.v_rd_max,
+            a_sw_s_r=np.maximum(v_ed_u_1 - 0.75 * v_rd_c, 0.0) * u_1 / (1.5 * f_ywd_ef),
+            u_out_ef=beta * force / (v_rd_c * d),
+        )
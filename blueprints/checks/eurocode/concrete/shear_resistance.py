@@ -0,0 +1,263 @@
+r"""Module for the vectorised shear resistance along reinforced concrete members,
+according to EN 1992-1-1:2004, art.6.2.2 and 6.2.3, formulas (6.2) - (6.11).
+
+The material dependent terms are calculated once, when the check is created. `evaluate` calculates the shear resistances of
+all stations of a member at once, from arrays of the effective depth [$d$], the longitudinal reinforcement ratio [$\rho_l$], the
+axial stress [$\sigma_{cp}$], the shear reinforcement [$A_{sw}/s$] and the design shear force [$V_{Ed}$]:
+
+- [$V_{Rd,c}$] with formulas (6.2.a), (6.2.b) and (6.3N), for members without shear reinforcement.
+- [$V_{Rd,s}$] with formula (6.8) and [$V_{Rd,max}$] with formula (6.9), for vertical shear reinforcement.
+
+Without a given strut inclination, the inclination of every station is the one for which the shear reinforcement and the
+concrete struts fail at the same time, limited to [$1 \leq \cot\theta \leq 2.5$] (6.7N).
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.checks.check_result import CheckResult
+from blueprints.codes.eurocode.en_1992_1_1_2004 import EN_1992_1_1_2004
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_6n import Form6Dot6nStrengthReductionFactor
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_10abn import Form6Dot10abnStrengthReductionFactor
+from blueprints.materials.concrete import ConcreteMaterial
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.type_alias import DIMENSIONLESS, MM, MPA
+from blueprints.unit_conversion import N_TO_KN
+
+type FloatArray = npt.NDArray[np.float64]
+
+MIN_COT_THETA = 1.0
+"""Lower limit of the cotangent of the strut inclination, formula (6.7N) [-]."""
+MAX_COT_THETA = 2.5
+"""Upper limit of the cotangent of the strut inclination, formula (6.7N) [-]."""
+
+
+@dataclass(frozen=True)
+class ShearResistanceResults:
+    """Shear resistances along a member, all arrays have one value per station.
+
+    Parameters
+    ----------
+    x : FloatArray
+        Positions of the stations along the member [mm].
+    v_ed : FloatArray
+        Design shear forces [kN].
+    v_rd_c : FloatArray
+        Design shear resistance without shear reinforcement, formula (6.2) [kN].
+    v_rd_s : FloatArray
+        Design shear resistance of the shear reinforcement, formula (6.8), zero without shear reinforcement [kN].
+    v_rd_max : FloatArray
+        Design shear resistance of the concrete struts, formula (6.9) [kN].
+    cot_theta : FloatArray
+        Cotangent of the strut inclination of formulas (6.8) and (6.9) [-].
+    v_rd : FloatArray
+        Design shear resistance, [$V_{Rd,c}$] without shear reinforcement and the smallest of [$V_{Rd,s}$] and [$V_{Rd,max}$]
+        with shear reinforcement [kN].
+    """
+
+    x: FloatArray
+    v_ed: FloatArray
+    v_rd_c: FloatArray
+    v_rd_s: FloatArray
+    v_rd_max: FloatArray
+    cot_theta: FloatArray
+    v_rd: FloatArray
+
+    @property
+    def unity_check(self) -> FloatArray:
+        """Absolute design shear force divided by the design shear resistance of each station [-]."""
+        return np.divide(np.abs(self.v_ed), self.v_rd, out=np.full_like(self.v_rd, np.inf), where=self.v_rd > 0)
+
+    @property
+    def governing_station(self) -> int:
+        """Index of the station with the largest unity check."""
+        return int(np.argmax(self.unity_check))
+
+    def result(self) -> CheckResult:
+        """Result of the governing station.
+
+        Returns
+        -------
+        CheckResult
+            Result based on the station with the largest unity check.
+        """
+        station = self.governing_station
+        return CheckResult.from_comparison(provided=float(np.abs(self.v_ed[station])), required=float(self.v_rd[station]))
+
+
+@dataclass(frozen=True)
+class ShearResistance:
+    r"""Shear resistance along a reinforced concrete member with a constant web width and vertical shear reinforcement,
+    based on EN 1992-1-1:2004 art. 6.2.
+
+    Parameters
+    ----------
+    concrete_material : ConcreteMaterial
+        The concrete material of the member.
+    steel_material : ReinforcementSteelMaterial
+        The reinforcement steel of the shear reinforcement.
+    b_w : MM
+        [$b_w$] Smallest width of the cross-section in the tensile area [mm].
+    cot_theta : DIMENSIONLESS | None, optional
+        [$\cot\theta$] Cotangent of the strut inclination for all stations, between 1.0 and 2.5. Default is the inclination for
+        which [$V_{Rd,s} = V_{Rd,max}$], per station.
+    prestressed : bool, optional
+        True for prestressed members, with [$\alpha_{cw}$] from formula (6.11) instead of 1.0 (default is False).
+    reduced_stirrup_stress : bool, optional
+        True to limit the design stress of the shear reinforcement to [$0.8 f_{yk}$], with [$\nu_1$] from formula (6.10)
+        instead of [$\nu$] from formula (6.6N) (default is False).
+    k_1 : DIMENSIONLESS, optional
+        [$k_1$] Coefficient for the axial stress in formula (6.2), the recommended value is 0.15 (default is 0.15).
+
+    Example
+    -------
+    ```python
+    import numpy as np
+
+    from blueprints.checks.eurocode.concrete.shear_resistance import ShearResistance
+
+    x = np.linspace(0, 6000, 301)
+    shear = ShearResistance(concrete_material, steel_material, b_w=300)
+    results = shear.evaluate(x=x, d=450, rho_l=0.01, v_ed=200 * (1 - x / 3000), a_sw_s=np.where(x < 1500, 0.5, 0.25))
+    print(results.unity_check.max(), results.result().is_ok)
+    ```
+    """
+
+    concrete_material: ConcreteMaterial
+    steel_material: ReinforcementSteelMaterial
+    b_w: MM
+    cot_theta: DIMENSIONLESS | None = None
+    prestressed: bool = False
+    reduced_stirrup_stress: bool = False
+    k_1: DIMENSIONLESS = 0.15
+    name: str = "Shear resistance of reinforced concrete members according to EN 1992-1-1:2004"
+    c_rd_c: DIMENSIONLESS = field(init=False, repr=False)
+    r"""[$C_{Rd,c}$] Coefficient of formula (6.2.a), [$0.18 / \gamma_c$] [-]."""
+    nu_1: DIMENSIONLESS = field(init=False, repr=False)
+    r"""[$\nu_1$] Strength reduction factor of formula (6.9), formula (6.6N) or (6.10) [-]."""
+    f_ywd: MPA = field(init=False, repr=False)
+    r"""[$f_{ywd}$] Design yield strength of the shear reinforcement [MPa]."""
+
+    def __post_init__(self) -> None:
+        """Validate the parameters and calculate the material dependent terms."""
+        if self.b_w <= 0:
+            raise ValueError(f"Invalid b_w: {self.b_w}. The web width must be positive.")
+        if self.cot_theta is not None and not MIN_COT_THETA <= self.cot_theta <= MAX_COT_THETA:
+            raise ValueError(f"Invalid cot_theta: {self.cot_theta}. It must be between {MIN_COT_THETA} and {MAX_COT_THETA}, formula (6.7N).")
+        f_ck = self.concrete_material.f_ck
+        object.__setattr__(self, "c_rd_c", 0.18 / self.concrete_material.material_factor)
+        if self.reduced_stirrup_stress:
+            object.__setattr__(self, "nu_1", float(Form6Dot10abnStrengthReductionFactor(f_ck=f_ck)))
+            object.__setattr__(self, "f_ywd", 0.8 * self.steel_material.f_yk)
+        else:
+            object.__setattr__(self, "nu_1", float(Form6Dot6nStrengthReductionFactor(f_ck=f_ck)))
+            object.__setattr__(self, "f_ywd", self.steel_material.f_yd)
+
+    @staticmethod
+    def source_docs() -> list[str]:
+        """List of source document identifiers used for this check.
+
+        Returns
+        -------
+        list[str]
+        """
+        return [EN_1992_1_1_2004]
+
+    def alpha_cw(self, sigma_cp: npt.ArrayLike) -> FloatArray:
+        r"""[$\alpha_{cw}$] Coefficient for the state of stress in the compression chord, formula (6.11) for prestressed members [-].
+
+        Parameters
+        ----------
+        sigma_cp : npt.ArrayLike
+            [$\sigma_{cp}$] Mean compressive stresses in the concrete due to the axial force, positive for compression [MPa].
+
+        Returns
+        -------
+        FloatArray
+            Coefficients of the stations, 1.0 for members that are not prestressed.
+        """
+        sigma_cp = np.asarray(sigma_cp, dtype=float)
+        if not self.prestressed:
+            return np.ones_like(sigma_cp)
+        ratio = sigma_cp / self.concrete_material.f_cd
+        return np.select(
+            [ratio <= 0, ratio <= 0.25, ratio <= 0.5],
+            [np.ones_like(ratio), 1 + ratio, np.full_like(ratio, 1.25)],
+            np.maximum(2.5 * (1 - ratio), 0.0),
+        )
+
+    def evaluate(
+        self,
+        x: npt.ArrayLike,
+        d: npt.ArrayLike,
+        rho_l: npt.ArrayLike,
+        v_ed: npt.ArrayLike,
+        a_sw_s: npt.ArrayLike = 0.0,
+        sigma_cp: npt.ArrayLike = 0.0,
+    ) -> ShearResistanceResults:
+        r"""Calculate the shear resistances of all stations of the member.
+
+        The arguments are broadcast against each other, so constant values can be given as scalars.
+
+        Parameters
+        ----------
+        x : npt.ArrayLike
+            Positions of the stations along the member [mm].
+        d : npt.ArrayLike
+            [$d$] Effective depths [mm].
+        rho_l : npt.ArrayLike
+            [$\rho_l$] Ratios of the anchored tensile reinforcement, [$A_{sl} / (b_w d)$], limited to 0.02 [-].
+        v_ed : npt.ArrayLike
+            [$V_{Ed}$] Design shear forces [kN].
+        a_sw_s : npt.ArrayLike, optional
+            [$A_{sw}/s$] Cross-sectional area of the vertical shear reinforcement per unit length, zero without shear
+            reinforcement [mm²/mm].
+        sigma_cp : npt.ArrayLike, optional
+            [$\sigma_{cp}$] Mean axial stresses [$N_{Ed}/A_c$], positive for compression, limited to [$0.2 f_{cd}$] [MPa].
+
+        Returns
+        -------
+        ShearResistanceResults
+            The shear resistances of all stations.
+
+        Raises
+        ------
+        ValueError
+            If an effective depth is not positive, or a reinforcement ratio or shear reinforcement is negative.
+        """
+        arrays = np.broadcast_arrays(*(np.atleast_1d(np.asarray(value, dtype=float)) for value in (x, d, rho_l, v_ed, a_sw_s, sigma_cp)))
+        x, d, rho_l, v_ed, a_sw_s, sigma_cp = arrays
+        if np.any(d <= 0):
+            raise ValueError("Invalid d: the effective depths must be positive.")
+        if np.any(rho_l < 0):
+            raise ValueError("Invalid rho_l: the reinforcement ratios cannot be negative.")
+        if np.any(a_sw_s < 0):
+            raise ValueError("Invalid a_sw_s: the shear reinforcement cannot be negative.")
+
+        f_ck, f_cd = self.concrete_material.f_ck, self.concrete_material.f_cd
+
+        # formula (6.2) with k of (6.2.a) and v_min of (6.3N)
+        k = np.minimum(1 + np.sqrt(200 / d), 2.0)
+        axial_term = self.k_1 * np.minimum(sigma_cp, 0.2 * f_cd)
+        v_min = 0.035 * k**1.5 * np.sqrt(f_ck)
+        v_rd_c_stress = np.maximum(self.c_rd_c * k * np.cbrt(100 * np.minimum(rho_l, 0.02) * f_ck), v_min) + axial_term
+        v_rd_c = np.maximum(v_rd_c_stress, 0.0) * self.b_w * d * N_TO_KN
+
+        # formulas (6.8) and (6.9) with z = 0.9 d, the inclination is the one with V_Rd,s = V_Rd,max if not given
+        z = 0.9 * d
+        alpha_cw = self.alpha_cw(sigma_cp)
+        strut_capacity = alpha_cw * self.b_w * self.nu_1 * f_cd
+        if self.cot_theta is None:
+            omega = np.divide(a_sw_s * self.f_ywd, strut_capacity, out=np.zeros_like(a_sw_s), where=strut_capacity > 0)
+            balanced = np.sqrt(np.maximum(np.divide(1, omega, out=np.full_like(omega, np.inf), where=omega > 0) - 1, 0.0))
+            cot_theta = np.clip(balanced, MIN_COT_THETA, MAX_COT_THETA)
+        else:
+            cot_theta = np.full_like(d, self.cot_theta)
+        v_rd_s = a_sw_s * z * self.f_ywd * cot_theta * N_TO_KN
+        v_rd_max = strut_capacity * z / (cot_theta + 1 / cot_theta) * N_TO_KN
+
+        v_rd = np.where(a_sw_s > 0, np.minimum(v_rd_s, v_rd_max), v_rd_c)
+
+        return ShearResistanceResults(x=x, v_ed=v_ed, v_rd_c=v_rd_c, v_rd_s=v_rd_s, v_rd_max=v_rd_max, cot_theta=cot_theta, v_rd=v_rd)
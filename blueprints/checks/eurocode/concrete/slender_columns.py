@@ -0,0 +1,462 @@
+r"""Module for the vectorised second order analysis of schedules of isolated columns, according to EN 1992-1-1:2004, art. 5.8.
+
+The columns of a schedule are checked for one direction of bending at a time, for all load combinations at once. The
+slenderness criterion (5.13N) is evaluated first, the second order moments are only calculated for the columns and
+combinations where the slenderness exceeds the limit. The second order effects follow from either:
+
+- the method based on nominal stiffness, art. 5.8.7, formulas (5.21) - (5.29), or
+- the method based on nominal curvature, art. 5.8.8, formulas (5.31) - (5.37).
+
+The columns of a schedule are rectangular with symmetrical reinforcement in two layers at the faces perpendicular to the
+direction of bending. Forces are in kN and moments in kNm, with the axial force positive for compression.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.codes.eurocode.en_1992_1_1_2004 import EN_1992_1_1_2004
+from blueprints.materials.concrete import ConcreteMaterial
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.type_alias import DIMENSIONLESS
+from blueprints.unit_conversion import KN_TO_N, NMM_TO_KNM
+
+type FloatArray = npt.NDArray[np.float64]
+type BoolArray = npt.NDArray[np.bool_]
+
+N_BAL = 0.4
+"""[$n_{bal}$] Value of the relative axial force at maximum moment resistance, art. 5.8.8.3 (3) [-]."""
+
+GAMMA_CE = 1.2
+r"""[$\gamma_{cE}$] Partial factor for the design value of the modulus of elasticity of concrete, art. 5.8.6 (3) [-]."""
+
+_EXPONENT_AXIAL_RATIOS = np.array([0.1, 0.7, 1.0])
+_EXPONENT_VALUES = np.array([1.0, 1.5, 2.0])
+
+
+def effective_length(height: npt.ArrayLike, k_1: npt.ArrayLike, k_2: npt.ArrayLike, braced: npt.ArrayLike = True) -> FloatArray:
+    """Effective lengths of braced members, formula (5.15), and unbraced members, formula (5.16) [mm].
+
+    Parameters
+    ----------
+    height : npt.ArrayLike
+        [$l$] Clear heights of the members between the end restraints [mm].
+    k_1 : npt.ArrayLike
+        [$k_1$] Relative flexibilities of the rotational restraints at end 1 [-].
+    k_2 : npt.ArrayLike
+        [$k_2$] Relative flexibilities of the rotational restraints at end 2 [-].
+    braced : npt.ArrayLike, optional
+        True for braced members (default is True).
+
+    Returns
+    -------
+    FloatArray
+        The effective lengths, broadcast against each other.
+    """
+    height, k_1, k_2 = (np.asarray(value, dtype=float) for value in (height, k_1, k_2))
+    if np.any(height < 0) or np.any(k_1 < 0) or np.any(k_2 < 0):
+        raise ValueError("Invalid height, k_1 or k_2: values must be non-negative.")
+    braced_length = 0.5 * height * np.sqrt((1 + k_1 / (0.45 + k_1)) * (1 + k_2 / (0.45 + k_2)))
+    k_sum = k_1 + k_2
+    stiff = np.sqrt(1 + 10 * np.divide(k_1 * k_2, k_sum, out=np.zeros_like(k_sum), where=k_sum > 0))
+    unbraced_length = height * np.maximum(stiff, (1 + k_1 / (1 + k_1)) * (1 + k_2 / (1 + k_2)))
+    return np.where(braced, braced_length, unbraced_length)
+
+
+@dataclass(frozen=True, init=False)
+class ColumnSchedule:
+    r"""Schedule of rectangular columns for the second order analysis in one direction of bending.
+
+    All parameters are arrays with one value per column, scalars are broadcast to all columns. The attributes hold the
+    broadcast arrays.
+
+    Parameters
+    ----------
+    b : npt.ArrayLike
+        [$b$] Widths of the columns perpendicular to the direction of bending [mm].
+    h : npt.ArrayLike
+        [$h$] Depths of the columns in the direction of bending [mm].
+    d : npt.ArrayLike
+        [$d$] Effective depths, the reinforcement is at [$h - d$] from both faces [mm].
+    rho : npt.ArrayLike
+        [$\rho$] Total reinforcement ratios [$A_s / A_c$] [-].
+    l_0 : npt.ArrayLike
+        [$l_0$] Effective lengths, see `effective_length` [mm].
+    phi_ef : npt.ArrayLike, optional
+        [$\varphi_{ef}$] Effective creep ratios, formula (5.19) (default is 0.0).
+    braced : npt.ArrayLike, optional
+        True for braced columns, for unbraced columns [$C = 0.7$] and the end moments are not equivalized (default is True).
+    """
+
+    b: FloatArray
+    h: FloatArray
+    d: FloatArray
+    rho: FloatArray
+    l_0: FloatArray
+    phi_ef: FloatArray
+    braced: BoolArray
+
+    def __init__(
+        self,
+        b: npt.ArrayLike,
+        h: npt.ArrayLike,
+        d: npt.ArrayLike,
+        rho: npt.ArrayLike,
+        l_0: npt.ArrayLike,
+        phi_ef: npt.ArrayLike = 0.0,
+        braced: npt.ArrayLike = True,
+    ) -> None:
+        """Broadcast the properties to arrays of equal length and validate them."""
+        names = ("b", "h", "d", "rho", "l_0", "phi_ef")
+        *values, braced_array = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(value, dtype=float)) for value in (b, h, d, rho, l_0, phi_ef)),
+            np.atleast_1d(np.asarray(braced, dtype=bool)),
+        )
+        for name, value in zip(names, values, strict=True):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "braced", braced_array)
+
+        if np.any(self.b <= 0) or np.any(self.h <= 0) or np.any(self.l_0 <= 0):
+            raise ValueError("Invalid b, h or l_0: values must be positive.")
+        if np.any(self.d <= self.h / 2) or np.any(self.d > self.h):
+            raise ValueError("Invalid d: the effective depth must be between h/2 and h.")
+        if np.any(self.rho < 0) or np.any(self.phi_ef < 0):
+            raise ValueError("Invalid rho or phi_ef: values must be non-negative.")
+
+    @property
+    def n_columns(self) -> int:
+        """Number of columns in the schedule."""
+        return len(self.b)
+
+    @property
+    def a_c(self) -> FloatArray:
+        """[$A_c$] Areas of the concrete cross-sections [mm²]."""
+        return self.b * self.h
+
+    @property
+    def slenderness(self) -> FloatArray:
+        r"""[$\lambda$] Slenderness ratios, formula (5.14) with [$i = h / \sqrt{12}$] [-]."""
+        return self.l_0 / (self.h / np.sqrt(12))
+
+
+@dataclass(frozen=True)
+class SecondOrderResults:
+    r"""Design moments of a column schedule, the arrays have one row per combination and one column per column.
+
+    Parameters
+    ----------
+    slenderness : FloatArray
+        [$\lambda$] Slenderness ratio per column, formula (5.14) [-].
+    slenderness_limit : FloatArray
+        [$\lambda_{lim}$] Slenderness limit, formula (5.13N), infinite without compression [-].
+    m_0ed : FloatArray
+        [$M_{0Ed}$] First order moment including imperfections, the equivalent moment of formula (5.32) for braced columns [kNm].
+    m_2 : FloatArray
+        [$M_2$] Second order moment, zero where the slenderness does not exceed the limit [kNm].
+    m_ed : FloatArray
+        [$M_{Ed}$] Design moment, at least the largest first order end moment and [$N_{Ed} e_0$] of art. 6.1 (4) [kNm].
+    """
+
+    slenderness: FloatArray
+    slenderness_limit: FloatArray
+    m_0ed: FloatArray
+    m_2: FloatArray
+    m_ed: FloatArray
+
+    @property
+    def slender(self) -> BoolArray:
+        """Mask of the combinations and columns for which second order effects are considered, art. 5.8.3.1 (1)."""
+        return self.slenderness > self.slenderness_limit
+
+    @property
+    def m_ed_envelope(self) -> FloatArray:
+        """Largest design moment of each column over all combinations [kNm]."""
+        return self.m_ed.max(axis=0)
+
+
+@dataclass(frozen=True)
+class _FirstOrder:
+    """Terms of the first order analysis of a schedule for an array of load combinations, all arrays of shape (n_comb, n_col)."""
+
+    n_ed: FloatArray
+    """Axial forces, zero for tension [N]."""
+    n: FloatArray
+    """Relative axial forces [$N_{Ed} / (A_c f_{cd})$] [-]."""
+    omega: FloatArray
+    """Mechanical reinforcement ratios [$A_s f_{yd} / (A_c f_{cd})$] [-]."""
+    slenderness_limit: FloatArray
+    m_01: FloatArray
+    """Smallest end moments including imperfections, positive for tension at the same side as the largest end moment [kNm]."""
+    m_02: FloatArray
+    """Largest end moments including imperfections [kNm]."""
+    m_0ed: FloatArray
+    m_min: FloatArray
+    """Moments due to the minimum eccentricity of art. 6.1 (4) [kNm]."""
+
+
+@dataclass(frozen=True)
+class SlenderColumns:
+    r"""Second order analysis of isolated columns, based on EN 1992-1-1:2004 art. 5.8.
+
+    The first order end moments [$M_{01}$] and [$M_{02}$] are increased by the imperfection [$e_i = l_0 / 400$] (art. 5.2 (7)).
+    For braced columns the equivalent first order moment of formula (5.32) is used, for unbraced columns [$M_{02}$]. The design
+    moments are at least [$M_{02}$] and the moment due to the minimum eccentricity [$e_0 = \max(h / 30, 20)$] of art. 6.1 (4).
+
+    Parameters
+    ----------
+    concrete_material : ConcreteMaterial
+        The concrete material of the columns.
+    steel_material : ReinforcementSteelMaterial
+        The reinforcement steel of the columns.
+    c : DIMENSIONLESS, optional
+        [$c$] Factor for the distribution of the curvature, formula (5.33), 10 for a constant cross-section (default is 10.0).
+    c_0 : DIMENSIONLESS, optional
+        [$c_0$] Coefficient for the distribution of the first order moment, formula (5.29), 8 for the constant equivalent moment
+        (default is 8.0).
+
+    Example
+    -------
+    ```python
+    import numpy as np
+
+    from blueprints.checks.eurocode.concrete.slender_columns import ColumnSchedule, SlenderColumns, effective_length
+
+    schedule = ColumnSchedule(b=300, h=[300, 400], d=[250, 350], rho=0.01, l_0=effective_length(4000, 0.3, 0.3))
+    results = SlenderColumns(concrete_material, steel_material).nominal_curvature(schedule, n_ed=n_ed, m_01=m_01, m_02=m_02)
+    print(results.m_ed_envelope)
+    ```
+    """
+
+    concrete_material: ConcreteMaterial
+    steel_material: ReinforcementSteelMaterial
+    c: DIMENSIONLESS = 10.0
+    c_0: DIMENSIONLESS = 8.0
+    name: str = "Second order effects of isolated columns according to EN 1992-1-1:2004"
+
+    def __post_init__(self) -> None:
+        """Validate the coefficients."""
+        if self.c <= 0 or self.c_0 <= 0:
+            raise ValueError(f"Invalid c or c_0: {self.c}, {self.c_0}. The coefficients must be positive.")
+
+    @staticmethod
+    def source_docs() -> list[str]:
+        """List of source document identifiers used for this check.
+
+        Returns
+        -------
+        list[str]
+        """
+        return [EN_1992_1_1_2004]
+
+    def _first_order(self, schedule: ColumnSchedule, n_ed: npt.ArrayLike, m_01: npt.ArrayLike, m_02: npt.ArrayLike) -> _FirstOrder:
+        """Broadcast the loads to (n_comb, n_col) and calculate the first order terms and the slenderness limits."""
+        shape_columns = (schedule.n_columns,)
+        n_ed, m_01, m_02 = (np.atleast_2d(np.asarray(value, dtype=float)) for value in (n_ed, m_01, m_02))
+        n_ed, m_01, m_02 = np.broadcast_arrays(n_ed, m_01, m_02, np.empty((1, *shape_columns)))[:3]
+        force = np.maximum(n_ed, 0.0) * KN_TO_N
+
+        # the largest end moment is M_02, M_01 is positive when both end moments give tension at the same side
+        swap = np.abs(m_01) > np.abs(m_02)
+        end_1, end_2 = np.where(swap, m_02, m_01), np.where(swap, m_01, m_02)
+        r_m = np.divide(end_1, end_2, out=np.ones_like(end_2), where=end_2 != 0)
+        m_imperfection = force * schedule.l_0 / 400 * NMM_TO_KNM
+        m_02_total = np.abs(end_2) + m_imperfection
+        m_01_total = r_m * np.abs(end_2) + m_imperfection
+        braced = schedule.braced
+        m_0ed = np.where(braced, np.maximum(0.6 * m_02_total + 0.4 * m_01_total, 0.4 * m_02_total), m_02_total)
+
+        f_cd = self.concrete_material.f_cd
+        n = force / (schedule.a_c * f_cd)
+        omega = schedule.rho * self.steel_material.f_yd / f_cd
+        a = 1 / (1 + 0.2 * schedule.phi_ef)
+        b = np.sqrt(1 + 2 * omega)
+        c = np.where(braced, 1.7 - r_m, 0.7)
+        slenderness_limit = np.divide(20 * a * b * c, np.sqrt(n), out=np.full_like(n, np.inf), where=n > 0)
+
+        e_0 = np.maximum(schedule.h / 30, 20.0)
+        return _FirstOrder(
+            n_ed=force,
+            n=n,
+            omega=np.broadcast_to(omega, n.shape),
+            slenderness_limit=slenderness_limit,
+            m_01=m_01_total,
+            m_02=m_02_total,
+            m_0ed=m_0ed,
+            m_min=force * e_0 * NMM_TO_KNM,
+        )
+
+    @staticmethod
+    def _results(schedule: ColumnSchedule, first_order: _FirstOrder, m_2: FloatArray, m_ed: FloatArray) -> SecondOrderResults:
+        """Combine the first and second order moments into the design moments."""
+        return SecondOrderResults(
+            slenderness=schedule.slenderness,
+            slenderness_limit=first_order.slenderness_limit,
+            m_0ed=first_order.m_0ed,
+            m_2=m_2,
+            m_ed=np.maximum.reduce([m_ed, first_order.m_02, first_order.m_min]),
+        )
+
+    def nominal_curvature(self, schedule: ColumnSchedule, n_ed: npt.ArrayLike, m_01: npt.ArrayLike, m_02: npt.ArrayLike) -> SecondOrderResults:
+        r"""Design moments with the method based on nominal curvature, art. 5.8.8.
+
+        The curvature follows from formula (5.34) with the corrections [$K_r$] of formula (5.36) and [$K_\varphi$] of formula
+        (5.37), and [$d$] of the schedule for formula (5.35). For braced columns the design moment is at least
+        [$M_{01} + 0.5 M_2$], art. 5.8.8.2 (3).
+
+        Parameters
+        ----------
+        schedule : ColumnSchedule
+            The columns to analyse.
+        n_ed : npt.ArrayLike
+            [$N_{Ed}$] Axial forces per combination and column, positive for compression [kN].
+        m_01 : npt.ArrayLike
+            [$M_{01}$] First order moments at one end of the columns [kNm].
+        m_02 : npt.ArrayLike
+            [$M_{02}$] First order moments at the other end of the columns, with the same sign as [$M_{01}$] for tension at the
+            same side [kNm].
+
+        Returns
+        -------
+        SecondOrderResults
+            The design moments per combination and column.
+        """
+        first_order = self._first_order(schedule, n_ed, m_01, m_02)
+        slender = schedule.slenderness > first_order.slenderness_limit
+        per_column = np.broadcast_to(np.arange(schedule.n_columns), slender.shape)[slender]
+
+        n, omega = first_order.n[slender], first_order.omega[slender]
+        slenderness, phi_ef = schedule.slenderness[per_column], schedule.phi_ef[per_column]
+        k_r = np.clip((1 + omega - n) / (1 + omega - N_BAL), 0.0, 1.0)
+        k_phi = np.maximum(1 + (0.35 + self.concrete_material.f_ck / 200 - slenderness / 150) * phi_ef, 1.0)
+        curvature = k_r * k_phi * (self.steel_material.f_yd / self.steel_material.e_s) / (0.45 * schedule.d[per_column])
+        e_2 = curvature * schedule.l_0[per_column] ** 2 / self.c
+
+        m_2 = np.zeros_like(first_order.n)
+        m_2[slender] = first_order.n_ed[slender] * e_2 * NMM_TO_KNM
+        m_ed = first_order.m_0ed + m_2
+        m_ed = np.where(schedule.braced, np.maximum(m_ed, first_order.m_01 + 0.5 * m_2), m_ed)
+        return self._results(schedule, first_order, m_2, m_ed)
+
+    def nominal_stiffness(self, schedule: ColumnSchedule, n_ed: npt.ArrayLike, m_01: npt.ArrayLike, m_02: npt.ArrayLike) -> SecondOrderResults:
+        r"""Design moments with the method based on nominal stiffness, art. 5.8.7.
+
+        The nominal stiffness follows from formula (5.21) with [$K_s = 1$] and [$K_c$] of formula (5.22), with [$k_1$] of formula
+        (5.23) and [$k_2$] of formula (5.24). The design moment follows from the buckling load [$N_B = \pi^2 EI / l_0^2$] with
+        formulas (5.28) and (5.29), and is infinite where the axial force reaches the buckling load.
+
+        Parameters
+        ----------
+        schedule : ColumnSchedule
+            The columns to analyse, with reinforcement ratios of at least 0.002.
+        n_ed : npt.ArrayLike
+            [$N_{Ed}$] Axial forces per combination and column, positive for compression [kN].
+        m_01 : npt.ArrayLike
+            [$M_{01}$] First order moments at one end of the columns [kNm].
+        m_02 : npt.ArrayLike
+            [$M_{02}$] First order moments at the other end of the columns [kNm].
+
+        Returns
+        -------
+        SecondOrderResults
+            The design moments per combination and column.
+        """
+        if np.any(schedule.rho < 0.002):
+            raise ValueError("Invalid rho: the method based on nominal stiffness requires reinforcement ratios of at least 0.002.")
+        first_order = self._first_order(schedule, n_ed, m_01, m_02)
+        slender = schedule.slenderness > first_order.slenderness_limit
+        per_column = np.broadcast_to(np.arange(schedule.n_columns), slender.shape)[slender]
+
+        b, h, d = schedule.b[per_column], schedule.h[per_column], schedule.d[per_column]
+        k_1 = np.sqrt(self.concrete_material.f_ck / 20)
+        k_2 = np.minimum(first_order.n[slender] * schedule.slenderness[per_column] / 170, 0.20)
+        k_c = k_1 * k_2 / (1 + schedule.phi_ef[per_column])
+        i_c = b * h**3 / 12
+        i_s = schedule.rho[per_column] * b * h * (d - h / 2) ** 2
+        ei = k_c * self.concrete_material.e_cm / GAMMA_CE * i_c + self.steel_material.e_s * i_s
+        n_b = np.pi**2 * ei / schedule.l_0[per_column] ** 2
+
+        force, m_0ed = first_order.n_ed[slender], first_order.m_0ed[slender]
+        beta = np.pi**2 / self.c_0
+        with np.errstate(divide="ignore"):
+            magnified = np.where(force < n_b, m_0ed * (1 + beta / (n_b / force - 1)), np.inf)
+        m_ed = first_order.m_0ed.copy()
+        m_ed[slender] = magnified
+        return self._results(schedule, first_order, m_ed - first_order.m_0ed, m_ed)
+
+
+def separate_directions_allowed(
+    slenderness_y: npt.ArrayLike,
+    slenderness_z: npt.ArrayLike,
+    e_y: npt.ArrayLike,
+    e_z: npt.ArrayLike,
+    b_eq: npt.ArrayLike,
+    h_eq: npt.ArrayLike,
+) -> BoolArray:
+    r"""Mask of the columns that may be checked separately in both directions of bending, formulas (5.38a) and (5.38b).
+
+    Parameters
+    ----------
+    slenderness_y : npt.ArrayLike
+        [$\lambda_y$] Slenderness ratios with respect to the y-axis [-].
+    slenderness_z : npt.ArrayLike
+        [$\lambda_z$] Slenderness ratios with respect to the z-axis [-].
+    e_y : npt.ArrayLike
+        [$e_y$] Eccentricities [$M_{Edz} / N_{Ed}$] along the y-axis [mm].
+    e_z : npt.ArrayLike
+        [$e_z$] Eccentricities [$M_{Edy} / N_{Ed}$] along the z-axis [mm].
+    b_eq : npt.ArrayLike
+        [$b_{eq}$] Widths of the cross-sections along the y-axis [mm].
+    h_eq : npt.ArrayLike
+        [$h_{eq}$] Depths of the cross-sections along the z-axis [mm].
+
+    Returns
+    -------
+    BoolArray
+        True where both the slenderness ratios and the relative eccentricities satisfy the criteria.
+    """
+    slenderness_y, slenderness_z = np.asarray(slenderness_y, dtype=float), np.asarray(slenderness_z, dtype=float)
+    relative_y = np.abs(np.asarray(e_y, dtype=float)) / np.asarray(h_eq, dtype=float)
+    relative_z = np.abs(np.asarray(e_z, dtype=float)) / np.asarray(b_eq, dtype=float)
+    slenderness_ok = (slenderness_y <= 2 * slenderness_z) & (slenderness_z <= 2 * slenderness_y)
+    eccentricity_ok = (relative_y <= 0.2 * relative_z) | (relative_z <= 0.2 * relative_y)
+    return slenderness_ok & eccentricity_ok
+
+
+def biaxial_unity_check(
+    m_edz: npt.ArrayLike,
+    m_rdz: npt.ArrayLike,
+    m_edy: npt.ArrayLike,
+    m_rdy: npt.ArrayLike,
+    n_ed: npt.ArrayLike,
+    n_rd: npt.ArrayLike,
+) -> FloatArray:
+    r"""Left hand side of the simplified criterion for biaxial bending of rectangular cross-sections, formula (5.39) [-].
+
+    The exponent [$a$] is interpolated between 1.0, 1.5 and 2.0 for [$N_{Ed}/N_{Rd}$] of 0.1, 0.7 and 1.0, art. 5.8.9 (4).
+
+    Parameters
+    ----------
+    m_edz : npt.ArrayLike
+        [$M_{Edz}$] Design moments about the z-axis, including second order effects [kNm].
+    m_rdz : npt.ArrayLike
+        [$M_{Rdz}$] Moment resistances about the z-axis [kNm].
+    m_edy : npt.ArrayLike
+        [$M_{Edy}$] Design moments about the y-axis, including second order effects [kNm].
+    m_rdy : npt.ArrayLike
+        [$M_{Rdy}$] Moment resistances about the y-axis [kNm].
+    n_ed : npt.ArrayLike
+        [$N_{Ed}$] Axial forces, positive for compression [kN].
+    n_rd : npt.ArrayLike
+        [$N_{Rd}$] Design axial resistances [$A_c f_{cd} + A_s f_{yd}$] [kN].
+
+    Returns
+    -------
+    FloatArray
+        The unity checks, broadcast against each other.
+    """
+    m_rdz, m_rdy, n_rd = (np.asarray(value, dtype=float) for value in (m_rdz, m_rdy, n_rd))
+    if np.any(m_rdz <= 0) or np.any(m_rdy <= 0) or np.any(n_rd <= 0):
+        raise ValueError("Invalid m_rdz, m_rdy or n_rd: resistances must be positive.")
+    a = np.interp(np.asarray(n_ed, dtype=float) / n_rd, _EXPONENT_AXIAL_RATIOS, _EXPONENT_VALUES)
+    return (np.abs(m_edz) / m_rdz) ** a + (np.abs(m_edy) / m_rdy) ** a
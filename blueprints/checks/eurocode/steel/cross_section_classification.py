@@ -0,0 +1,338 @@
+"""Classification of steel cross-sections according to EN 1993-1-1:2005 art. 5.5 and Table 5.2.
+
+The classification is vectorised: the width-to-thickness ratios of all given profiles are collected in one array and
+compared to the limits of Table 5.2 for all given steel grades at once. This makes it cheap to classify complete
+profile catalogues, for example ``classify_profiles(HEB, materials)``. The classes of single cross-sections are cached per
+(profile, material, stress distribution) in a bounded cache, so that the strength checks of a batch run can be selected
+without classifying the same cross-section twice.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.checks.eurocode.steel.strength_bending import CheckStrengthBendingClass3, CheckStrengthBendingClass12
+from blueprints.checks.eurocode.steel.strength_shear import CheckStrengthShearClass12, CheckStrengthShearClass34
+from blueprints.materials.steel import SteelMaterial
+from blueprints.structural_sections._profile import Profile
+from blueprints.structural_sections.steel.profile_definitions.chs_profile import CHSProfile
+from blueprints.structural_sections.steel.profile_definitions.i_profile import IProfile
+from blueprints.structural_sections.steel.profile_definitions.lnp_profile import LNPProfile
+from blueprints.structural_sections.steel.profile_definitions.rhs_profile import RHSProfile
+from blueprints.structural_sections.steel.profile_definitions.unp_profile import UNPProfile
+from blueprints.structural_sections.steel.steel_cross_section import SteelCrossSection
+from blueprints.type_alias import DIMENSIONLESS, KN, KNM
+
+# Columns of the element ratio array, one per type of compression part in Table 5.2.
+_INTERNAL = 0  # internal part subject to the given stress distribution (webs)
+_INTERNAL_COMPRESSION = 1  # internal part in compression (flanges of hollow sections)
+_OUTSTAND = 2  # outstand flange in compression
+_TUBE = 3  # tubular section, limits in epsilon squared
+_ANGLE_LEG = 4  # angle, h / t (class 3 only)
+_ANGLE_MEAN = 5  # angle, (b + h) / 2t (class 3 only)
+_N_ELEMENTS = 6
+
+# Limits of Table 5.2 divided by epsilon (or epsilon squared for tubes) for class 1, 2 and 3.
+_FIXED_LIMITS = {
+    _INTERNAL_COMPRESSION: (33.0, 38.0, 42.0),
+    _OUTSTAND: (9.0, 10.0, 14.0),
+    _TUBE: (50.0, 70.0, 90.0),
+    _ANGLE_LEG: (15.0, 15.0, 15.0),
+    _ANGLE_MEAN: (11.5, 11.5, 11.5),
+}
+
+
+@dataclass(frozen=True)
+class StressDistribution:
+    r"""Stress distribution in the internal compression parts (webs) of a cross-section, see Table 5.2 sheet 1.
+
+    The distribution refers to bending about the y-axis (strong axis) combined with an axial compression force.
+    Flanges are always assumed to be in uniform compression, which is correct for bending about the y-axis and
+    conservative otherwise.
+
+    Parameters
+    ----------
+    alpha : DIMENSIONLESS
+        Compressed fraction [$\alpha$] of the part for the plastic stress distribution (class 1 and 2), between 0 and 1.
+    psi : DIMENSIONLESS
+        Stress ratio [$\psi$] of the part for the elastic stress distribution (class 3), at most 1.
+        A value of 1 means uniform compression, -1 means pure bending.
+
+    Examples
+    --------
+    >>> StressDistribution.from_psi(-0.5)
+    StressDistribution(alpha=0.6666666666666666, psi=-0.5)
+    """
+
+    alpha: DIMENSIONLESS
+    psi: DIMENSIONLESS
+
+    def __post_init__(self) -> None:
+        """Validate the stress distribution."""
+        if not 0 < self.alpha <= 1:
+            raise ValueError(f"alpha must be between 0 (exclusive) and 1 (inclusive). You provided {self.alpha}.")
+        if self.psi > 1:
+            raise ValueError(f"psi must be at most 1. You provided {self.psi}.")
+
+    @classmethod
+    def compression(cls) -> "StressDistribution":
+        """Uniform compression of the part."""
+        return cls(alpha=1.0, psi=1.0)
+
+    @classmethod
+    def bending(cls) -> "StressDistribution":
+        """Pure bending of the part."""
+        return cls(alpha=0.5, psi=-1.0)
+
+    @classmethod
+    def from_psi(cls, psi: DIMENSIONLESS) -> "StressDistribution":
+        r"""Stress distribution from a given stress ratio [$\psi$].
+
+        [$\alpha$] is taken as the compressed fraction of the elastic stress distribution, $1 / (1 - \psi)$ for $\psi < 0$.
+        """
+        return cls(alpha=1.0 if psi >= 0 else 1 / (1 - psi), psi=psi)
+
+    @classmethod
+    def from_alpha(cls, alpha: DIMENSIONLESS) -> "StressDistribution":
+        r"""Stress distribution from a given compressed fraction [$\alpha$].
+
+        [$\psi$] follows from an elastic distribution with the same compressed fraction, $1 - 1 / \alpha$.
+        A fully compressed part ($\alpha = 1$) is taken as uniform compression ($\psi = 1$).
+        """
+        return cls(alpha=alpha, psi=1.0 if alpha == 1 else 1 - 1 / alpha)
+
+    def internal_part_limits(self) -> tuple[float, float, float]:
+        """Limits of c/t divided by epsilon for internal compression parts for class 1, 2 and 3 (Table 5.2 sheet 1)."""
+        if self.alpha > 0.5:
+            class_1, class_2 = 396 / (13 * self.alpha - 1), 456 / (13 * self.alpha - 1)
+        else:
+            class_1, class_2 = 36 / self.alpha, 41.5 / self.alpha
+        class_3 = 42 / (0.67 + 0.33 * self.psi) if self.psi > -1 else 62 * (1 - self.psi) * np.sqrt(-self.psi)
+        return class_1, class_2, float(class_3)
+
+
+CLASSIFICATION_CACHE_SIZE = 4096
+"""Maximum number of classes kept by `cross_section_class`, the least recently used classes are discarded first."""
+
+
+def _element_ratios(profile: Profile) -> list[float]:
+    """Width-to-thickness ratios of the compression parts of a profile, NaN for parts that do not exist."""
+    ratios = [np.nan] * _N_ELEMENTS
+    match profile:
+        case IProfile():
+            ratios[_INTERNAL] = profile.web_height / profile.web_thickness
+            ratios[_OUTSTAND] = max(
+                profile.width_outstand_top_flange / profile.top_flange_thickness,
+                profile.width_outstand_bottom_flange / profile.bottom_flange_thickness,
+            )
+        case RHSProfile():
+            ratios[_INTERNAL] = max(
+                profile.left_wall_inner_height / profile.left_wall_thickness,
+                profile.right_wall_inner_height / profile.right_wall_thickness,
+            )
+            ratios[_INTERNAL_COMPRESSION] = max(
+                profile.top_wall_inner_width / profile.top_wall_thickness,
+                profile.bottom_wall_inner_width / profile.bottom_wall_thickness,
+            )
+        case CHSProfile():
+            ratios[_TUBE] = profile.outer_diameter / profile.wall_thickness
+        case UNPProfile():
+            web_height = (
+                profile.total_height
+                - profile.top_flange_thickness
+                - profile.bottom_flange_thickness
+                - profile.top_root_fillet_radius
+                - profile.bottom_root_fillet_radius
+            )
+            ratios[_INTERNAL] = web_height / profile.web_thickness
+            ratios[_OUTSTAND] = max(
+                (profile.top_flange_total_width - profile.web_thickness - profile.top_root_fillet_radius) / profile.top_flange_thickness,
+                (profile.bottom_flange_total_width - profile.web_thickness - profile.bottom_root_fillet_radius) / profile.bottom_flange_thickness,
+            )
+        case LNPProfile():
+            thickness = min(profile.web_thickness, profile.base_thickness)
+            ratios[_OUTSTAND] = max(
+                (profile.total_height - profile.base_thickness - profile.root_radius) / profile.web_thickness,
+                (profile.total_width - profile.web_thickness - profile.root_radius) / profile.base_thickness,
+            )
+            ratios[_ANGLE_LEG] = max(profile.total_height, profile.total_width) / thickness
+            ratios[_ANGLE_MEAN] = (profile.total_height + profile.total_width) / (2 * thickness)
+        case _:
+            raise NotImplementedError(f"The provided profile shape {type(profile).__name__} has not been implemented yet.")
+    return ratios
+
+
+def _yield_strengths(profiles: list[Profile], materials: list[SteelMaterial]) -> npt.NDArray[np.float64]:
+    """Yield strength of every material for the (maximum) thickness of every profile, shape (materials, profiles)."""
+    thicknesses = np.array([profile.max_thickness for profile in profiles], dtype=float)
+    return np.array([material.yield_strength_array(thicknesses) for material in materials], dtype=float).reshape(len(materials), len(profiles))
+
+
+def classify_profiles(
+    profiles: Iterable[Profile],
+    materials: Iterable[SteelMaterial],
+    stress_distribution: StressDistribution | None = None,
+) -> npt.NDArray[np.int_]:
+    r"""Classify the cross-sections of all combinations of profiles and steel materials (EN 1993-1-1:2005 Table 5.2).
+
+    The c/t ratios of all profiles are compared with the limits for all materials in one vectorised step, with
+    $\varepsilon = \sqrt{235 / f_y}$ and [$f_y$] from Table 3.1 for the maximum element thickness of each profile.
+
+    Parameters
+    ----------
+    profiles : Iterable[Profile]
+        Profiles to classify, for example a complete catalogue like `HEB` or `[IPE.IPE200, IPE.IPE300]`.
+        Supported types are I-, RHS-, CHS-, UNP- and LNP-profiles.
+    materials : Iterable[SteelMaterial]
+        Steel materials (grades) to classify the profiles for.
+    stress_distribution : StressDistribution | None, optional
+        Stress distribution in the webs, default is uniform compression.
+
+    Returns
+    -------
+    npt.NDArray[np.int_]
+        Cross-section class (1, 2, 3 or 4) with shape (number of materials, number of profiles).
+
+    Raises
+    ------
+    NotImplementedError
+        If a profile type is not supported.
+    ValueError
+        If Table 3.1 gives no yield strength for a material and thickness.
+
+    Examples
+    --------
+    ```python
+    from blueprints.materials.steel import SteelMaterial, SteelStrengthClass
+    from blueprints.structural_sections.steel.standard_profiles.heb import HEB
+
+    materials = [SteelMaterial(steel_class=SteelStrengthClass.S235), SteelMaterial(steel_class=SteelStrengthClass.S355)]
+    classes = classify_profiles(HEB, materials, StressDistribution.bending())  # shape (2, number of HEB profiles)
+    ```
+    """
+    profiles = list(profiles)
+    materials = list(materials)
+    stress_distribution = stress_distribution or StressDistribution.compression()
+    return _classify(profiles, materials, stress_distribution)
+
+
+def _classify(profiles: list[Profile], materials: list[SteelMaterial], stress_distribution: StressDistribution) -> npt.NDArray[np.int_]:
+    """Vectorised classification without caching, see `classify_profiles`."""
+    ratios = np.array([_element_ratios(profile) for profile in profiles], dtype=float).reshape(len(profiles), _N_ELEMENTS)
+    epsilon = np.sqrt(235 / _yield_strengths(profiles, materials))
+
+    limit_factors = np.empty((_N_ELEMENTS, 3))
+    limit_factors[_INTERNAL] = stress_distribution.internal_part_limits()
+    for element, factors in _FIXED_LIMITS.items():
+        limit_factors[element] = factors
+    element_epsilon = np.where(np.arange(_N_ELEMENTS) == _TUBE, epsilon[..., None] ** 2, epsilon[..., None])
+
+    # limits with shape (materials, profiles, elements, classes)
+    limits = element_epsilon[..., None] * limit_factors
+    with np.errstate(invalid="ignore"):
+        exceeded = ratios[None, :, :, None] > limits
+    return 1 + np.max(np.sum(exceeded, axis=-1), axis=-1, initial=0)
+
+
+def cross_section_class(steel_cross_section: SteelCrossSection, stress_distribution: StressDistribution | None = None) -> int:
+    """Cross-section class of a steel cross-section (EN 1993-1-1:2005 Table 5.2), cached per profile and material.
+
+    At most `CLASSIFICATION_CACHE_SIZE` classes are kept, so that classifying many cross-sections in a long session does not
+    grow the cache without bound.
+
+    Parameters
+    ----------
+    steel_cross_section : SteelCrossSection
+        The steel cross-section to classify.
+    stress_distribution : StressDistribution | None, optional
+        Stress distribution in the webs, default is uniform compression.
+
+    Returns
+    -------
+    int
+        The cross-section class: 1, 2, 3 or 4.
+    """
+    stress_distribution = stress_distribution or StressDistribution.compression()
+    return _cached_class(steel_cross_section.profile, steel_cross_section.material, stress_distribution)
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _cached_class(profile: Profile, material: SteelMaterial, stress_distribution: StressDistribution) -> int:
+    """Cached class of a single profile and material, see `cross_section_class`."""
+    return int(_classify([profile], [material], stress_distribution)[0, 0])
+
+
+def select_bending_check(
+    steel_cross_section: SteelCrossSection,
+    m: KNM = 0,
+    axis: Literal["My", "Mz"] = "My",
+    gamma_m0: DIMENSIONLESS = 1.0,
+) -> CheckStrengthBendingClass12 | CheckStrengthBendingClass3:
+    """Select the bending moment resistance check (EN 1993-1-1:2005 art. 6.2.5) that matches the cross-section class.
+
+    The cross-section is classified for pure bending about the y-axis. For bending about the z-axis the webs are
+    classified for uniform compression, which is conservative.
+
+    Parameters
+    ----------
+    steel_cross_section : SteelCrossSection
+        The steel cross-section to check.
+    m : KNM, optional
+        The applied bending moment, in kNm (default is 0 kNm).
+    axis : Literal["My", "Mz"], optional
+        Axis of bending, default is 'My'.
+    gamma_m0 : DIMENSIONLESS, optional
+        Partial safety factor for resistance of cross-sections, default is 1.0.
+
+    Returns
+    -------
+    CheckStrengthBendingClass12 | CheckStrengthBendingClass3
+        The bending check for class 1 and 2 or for class 3 cross-sections.
+
+    Raises
+    ------
+    NotImplementedError
+        If the cross-section is class 4.
+    """
+    stress_distribution = StressDistribution.bending() if axis == "My" else StressDistribution.compression()
+    section_class = cross_section_class(steel_cross_section, stress_distribution)
+    if section_class <= 2:
+        return CheckStrengthBendingClass12(steel_cross_section, m, axis=axis, gamma_m0=gamma_m0)
+    if section_class == 3:
+        return CheckStrengthBendingClass3(steel_cross_section, m, axis=axis, gamma_m0=gamma_m0)
+    raise NotImplementedError(f"Profile {steel_cross_section.profile.name} is cross-section class 4, which has not been implemented yet.")
+
+
+def select_shear_check(
+    steel_cross_section: SteelCrossSection,
+    v: KN = 0,
+    axis: Literal["Vz", "Vy"] = "Vz",
+    gamma_m0: DIMENSIONLESS = 1.0,
+) -> CheckStrengthShearClass12 | CheckStrengthShearClass34:
+    """Select the shear force resistance check (EN 1993-1-1:2005 art. 6.2.6) that matches the cross-section class.
+
+    The cross-section is classified for pure bending about the y-axis.
+
+    Parameters
+    ----------
+    steel_cross_section : SteelCrossSection
+        The steel cross-section to check.
+    v : KN, optional
+        The applied shear force, in kN (default is 0 kN).
+    axis : Literal["Vz", "Vy"], optional
+        Axis along which the shear force is applied, default is 'Vz'.
+    gamma_m0 : DIMENSIONLESS, optional
+        Partial safety factor for resistance of cross-sections, default is 1.0.
+
+    Returns
+    -------
+    CheckStrengthShearClass12 | CheckStrengthShearClass34
+        The plastic shear check for class 1 and 2 or the elastic shear check for class 3 and 4 cross-sections.
+    """
+    if cross_section_class(steel_cross_section, StressDistribution.bending()) <= 2:
+        return CheckStrengthShearClass12(steel_cross_section, v, axis=axis, gamma_m0=gamma_m0)
+    return CheckStrengthShearClass34(steel_cross_section, v, axis=axis, gamma_m0=gamma_m0)
@@ -0,0 +1,365 @@
+r"""Module for the fatigue damage of long stress histories with rainflow counting and the Palmgren-Miner rule,
+according to EN 1993-1-9:2005, chapter 7 and Annex A.
+
+The stress history is processed in chunks, so records that do not fit in memory can be counted from an iterator:
+
+1. The turning points (peaks and valleys) of every chunk are found with array operations.
+2. Closed cycles are removed with the four-point rainflow criterion: the range between the points 2 and 3 of four consecutive
+   turning points is a closed cycle if it is not larger than the ranges 1-2 and 3-4. All closed cycles of the sequence are
+   removed at once, which is repeated while this removes a substantial part of the turning points. The remaining turning points
+   are processed one by one with a stack, so every turning point is handled a bounded number of times.
+3. The turning points that do not close a cycle, the residue, are kept and prepended to the next chunk. At the end, the ranges
+   of the residue are counted as half cycles.
+
+The cycles are binned by their stress range, the endurance of every bin follows from the fatigue strength curve of the detail
+category and the damage [$D_d$] from formula (A.1).
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Self
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.checks.check_result import CheckResult
+from blueprints.codes.eurocode.en_1993_1_9_2005 import EN_1993_1_9_2005
+from blueprints.codes.eurocode.en_1993_1_9_2005.annex_a_determination_of_fatigue_load_parameters_and_verification_formats.formula_a_1 import (
+    FormADot1DamageDuringDesignLife,
+)
+from blueprints.type_alias import DIMENSIONLESS, MPA
+
+type FloatArray = npt.NDArray[np.float64]
+
+DETAIL_CATEGORIES: tuple[MPA, ...] = (160.0, 140.0, 125.0, 112.0, 100.0, 90.0, 80.0, 71.0, 63.0, 56.0, 50.0, 45.0, 40.0, 36.0)
+"""Detail categories [$\\Delta\\sigma_C$] for direct stress ranges, figure 7.1 [MPa]."""
+
+SHEAR_DETAIL_CATEGORIES: tuple[MPA, ...] = (100.0, 80.0)
+"""Detail categories [$\\Delta\\tau_C$] for shear stress ranges, the only categories of the curves of figure 7.2 [MPa]."""
+
+N_C = 2e6
+"""Number of cycles at the detail category [$\\Delta\\sigma_C$] [-]."""
+N_D = 5e6
+"""Number of cycles at the constant amplitude fatigue limit [$\\Delta\\sigma_D$] [-]."""
+N_L = 1e8
+"""Number of cycles at the cut-off limit [$\\Delta\\sigma_L$] [-]."""
+
+MIN_PEEL_FRACTION = 0.05
+"""Smallest fraction of turning points closed by one pass over the whole sequence, below which the stack takes over."""
+
+
+@dataclass(frozen=True)
+class FatigueStrengthCurve:
+    r"""Fatigue strength curve of a detail category, EN 1993-1-9:2005 art.7.1, formulas (7.1) and (7.2) and figures 7.1 and 7.2.
+
+    Parameters
+    ----------
+    delta_sigma_c : MPA
+        [$\Delta\sigma_C$] or [$\Delta\tau_C$] Detail category, the reference value of the fatigue strength at 2 million cycles [MPa].
+    gamma_mf : DIMENSIONLESS, optional
+        [$\gamma_{Mf}$] Partial factor for fatigue strength, table 3.1 (default is 1.0).
+    shear : bool, optional
+        True for shear stress ranges, with a single slope m = 5 up to the cut-off limit (default is False). The detail category
+        must then be one of `SHEAR_DETAIL_CATEGORIES`.
+    """
+
+    delta_sigma_c: MPA
+    gamma_mf: DIMENSIONLESS = 1.0
+    shear: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate the detail category and the partial factor."""
+        if self.delta_sigma_c <= 0:
+            raise ValueError(f"Invalid delta_sigma_c: {self.delta_sigma_c}. The detail category must be positive.")
+        if self.shear and self.delta_sigma_c not in SHEAR_DETAIL_CATEGORIES:
+            raise ValueError(f"Invalid delta_sigma_c: {self.delta_sigma_c}. Shear detail categories are {SHEAR_DETAIL_CATEGORIES}.")
+        if self.gamma_mf <= 0:
+            raise ValueError(f"Invalid gamma_mf: {self.gamma_mf}. The partial factor must be positive.")
+
+    @property
+    def design_delta_sigma_c(self) -> MPA:
+        r"""[$\Delta\sigma_C / \gamma_{Mf}$] Design value of the detail category [MPa]."""
+        return self.delta_sigma_c / self.gamma_mf
+
+    @property
+    def delta_sigma_d(self) -> MPA:
+        r"""[$\Delta\sigma_D / \gamma_{Mf}$] Design constant amplitude fatigue limit at 5 million cycles, not defined for shear [MPa]."""
+        return (N_C / N_D) ** (1 / 3) * self.design_delta_sigma_c
+
+    @property
+    def delta_sigma_l(self) -> MPA:
+        r"""[$\Delta\sigma_L / \gamma_{Mf}$] Design cut-off limit at 100 million cycles [MPa]."""
+        if self.shear:
+            return (N_C / N_L) ** (1 / 5) * self.design_delta_sigma_c
+        return (N_D / N_L) ** (1 / 5) * self.delta_sigma_d
+
+    def endurance(self, stress_range: npt.ArrayLike) -> FloatArray:
+        r"""[$N_R$] Endurance for an array of design stress ranges [$\gamma_{Ff} \Delta\sigma$] [-].
+
+        Parameters
+        ----------
+        stress_range : npt.ArrayLike
+            Design stress ranges [MPa].
+
+        Returns
+        -------
+        FloatArray
+            Numbers of cycles to failure, infinite below the cut-off limit.
+        """
+        stress_range = np.asarray(stress_range, dtype=float)
+        # ranges below the cut-off limit are replaced to avoid a division by zero, their endurance is infinite anyway
+        damaging = stress_range >= self.delta_sigma_l
+        safe_range = np.where(damaging, stress_range, self.delta_sigma_l)
+        if self.shear:
+            endurance = N_C * (self.design_delta_sigma_c / safe_range) ** 5
+        else:
+            high = N_C * (self.design_delta_sigma_c / safe_range) ** 3
+            low = N_D * (self.delta_sigma_d / safe_range) ** 5
+            endurance = np.where(safe_range >= self.delta_sigma_d, high, low)
+        return np.where(damaging, endurance, np.inf)
+
+
+def turning_points(stresses: npt.ArrayLike) -> FloatArray:
+    """Peaks and valleys of a stress history, the first and last stress are always kept.
+
+    Parameters
+    ----------
+    stresses : npt.ArrayLike
+        Stress history [MPa].
+
+    Returns
+    -------
+    FloatArray
+        Alternating peaks and valleys, without repeated values [MPa].
+    """
+    stresses = np.asarray(stresses, dtype=float).ravel()
+    if len(stresses) == 0:
+        return stresses
+    stresses = stresses[np.concatenate(([True], np.diff(stresses) != 0))]
+    if len(stresses) < 3:
+        return stresses
+    rising = np.diff(stresses) > 0
+    return stresses[np.concatenate(([True], rising[1:] != rising[:-1], [True]))]
+
+
+def rainflow(points: npt.ArrayLike) -> tuple[FloatArray, FloatArray]:
+    """Closed cycles of a sequence of turning points with the four-point rainflow criterion.
+
+    Parameters
+    ----------
+    points : npt.ArrayLike
+        Alternating peaks and valleys, for example from `turning_points` [MPa].
+
+    Returns
+    -------
+    tuple[FloatArray, FloatArray]
+        The stress ranges of the closed cycles and the residue, the turning points that do not close a cycle [MPa].
+    """
+    upper, lower, residue = rainflow_cycles(points)
+    return upper - lower, residue
+
+
+def rainflow_cycles(points: npt.ArrayLike) -> tuple[FloatArray, FloatArray, FloatArray]:
+    """Closed cycles of a sequence of turning points with their extremes, for checks that depend on the mean stress.
+
+    Parameters
+    ----------
+    points : npt.ArrayLike
+        Alternating peaks and valleys, for example from `turning_points` [MPa].
+
+    Returns
+    -------
+    tuple[FloatArray, FloatArray, FloatArray]
+        The largest and the smallest stress of the closed cycles and the residue, the turning points that do not close a
+        cycle [MPa].
+    """
+    points = np.asarray(points, dtype=float)
+    cycle_starts, cycle_ends = [], []
+    while len(points) >= 4:
+        spans = np.abs(np.diff(points))
+        inner = spans[1:-1]
+        closed = (inner <= spans[:-2]) & (inner <= spans[2:])
+        # cycles sharing a turning point have equal ranges, the second one is closed in the next pass
+        closed[1:] &= ~closed[:-1]
+        n_closed = int(closed.sum())
+        if n_closed == 0:
+            return *_extremes(cycle_starts, cycle_ends), points
+        if 2 * n_closed < MIN_PEEL_FRACTION * len(points):
+            break
+        first = np.flatnonzero(closed) + 1
+        cycle_starts.append(points[first])
+        cycle_ends.append(points[first + 1])
+        keep = np.ones(len(points), dtype=bool)
+        keep[first] = keep[first + 1] = False
+        points = points[keep]
+
+    stack: list[float] = []
+    stack_starts: list[float] = []
+    stack_ends: list[float] = []
+    for point in points.tolist():
+        stack.append(point)
+        while len(stack) >= 4:
+            inner_range = abs(stack[-2] - stack[-3])
+            if inner_range > abs(stack[-3] - stack[-4]) or inner_range > abs(stack[-1] - stack[-2]):
+                break
+            stack_starts.append(stack[-3])
+            stack_ends.append(stack[-2])
+            del stack[-3:-1]
+    cycle_starts.append(np.array(stack_starts))
+    cycle_ends.append(np.array(stack_ends))
+    return *_extremes(cycle_starts, cycle_ends), np.array(stack)
+
+
+def _extremes(starts: list[FloatArray], ends: list[FloatArray]) -> tuple[FloatArray, FloatArray]:
+    """Largest and smallest stress of the cycles from possibly empty lists of their start and end points."""
+    if not starts:
+        return np.empty(0), np.empty(0)
+    start, end = np.concatenate(starts), np.concatenate(ends)
+    return np.maximum(start, end), np.minimum(start, end)
+
+
+@dataclass(eq=False)
+class FatigueDamage:
+    r"""Fatigue damage [$D_d$] of a stress history, EN 1993-1-9:2005 Annex A, counted chunk by chunk.
+
+    The stress ranges are multiplied by [$\gamma_{Ff}$] and binned in bins of `bin_width`, every bin is represented by its upper
+    edge. The full cycles are accumulated while the chunks are added, the ranges of the residue count as half cycles.
+
+    Parameters
+    ----------
+    curve : FatigueStrengthCurve
+        Fatigue strength curve of the detail category.
+    gamma_ff : DIMENSIONLESS, optional
+        [$\gamma_{Ff}$] Partial factor for the equivalent constant amplitude stress ranges (default is 1.0).
+    bin_width : MPA, optional
+        Width of the bins of the design stress ranges (default is 1.0 MPa).
+    name : str, optional
+        Name of the check (default is "Fatigue damage according to EN 1993-1-9:2005").
+
+    Example
+    -------
+    ```python
+    from blueprints.checks.eurocode.steel.fatigue_damage import FatigueDamage, FatigueStrengthCurve
+
+    fatigue = FatigueDamage(FatigueStrengthCurve(delta_sigma_c=71.0, gamma_mf=1.35)).add_chunks(monitoring_record_chunks)
+    print(fatigue.damage, fatigue.result().is_ok)
+    ```
+    """
+
+    curve: FatigueStrengthCurve
+    gamma_ff: DIMENSIONLESS = 1.0
+    bin_width: MPA = 1.0
+    name: str = "Fatigue damage according to EN 1993-1-9:2005"
+    n_samples: int = field(default=0, init=False)
+    """Number of stresses added."""
+    _counts: FloatArray = field(default_factory=lambda: np.zeros(0), init=False, repr=False)
+    _residue: FloatArray = field(default_factory=lambda: np.empty(0), init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Validate the partial factor and the bin width."""
+        if self.gamma_ff <= 0:
+            raise ValueError(f"Invalid gamma_ff: {self.gamma_ff}. The partial factor must be positive.")
+        if self.bin_width <= 0:
+            raise ValueError(f"Invalid bin_width: {self.bin_width}. The bin width must be positive.")
+
+    @staticmethod
+    def source_docs() -> list[str]:
+        """List of source document identifiers used for this check.
+
+        Returns
+        -------
+        list[str]
+            List of source document identifiers.
+        """
+        return [EN_1993_1_9_2005]
+
+    def _bin(self, stress_ranges: FloatArray, cycles: float) -> FloatArray:
+        """Numbers of cycles per bin of the given ranges."""
+        # rounding first keeps ranges on a bin edge, such as 1.1 * 100 MPa, out of the next bin
+        indices = np.ceil(np.round(stress_ranges / self.bin_width, 9)).astype(np.intp)
+        return cycles * np.bincount(indices, minlength=len(self._counts)).astype(float)
+
+    def add(self, stresses: npt.ArrayLike) -> Self:
+        """Count the cycles of the next chunk of the stress history.
+
+        Parameters
+        ----------
+        stresses : npt.ArrayLike
+            Consecutive stresses, directly following the previously added stresses [MPa].
+
+        Returns
+        -------
+        Self
+            This fatigue damage calculation, to chain calls.
+        """
+        stresses = self.gamma_ff * np.asarray(stresses, dtype=float).ravel()
+        self.n_samples += len(stresses)
+        closed_ranges, self._residue = rainflow(turning_points(np.concatenate((self._residue, stresses))))
+        counts = self._bin(closed_ranges, 1.0)
+        counts[: len(self._counts)] += self._counts
+        self._counts = counts
+        return self
+
+    def add_chunks(self, chunks: Iterable[npt.ArrayLike]) -> Self:
+        """Count the cycles of a stress history given in consecutive chunks, for example read from a file one by one.
+
+        Parameters
+        ----------
+        chunks : Iterable[npt.ArrayLike]
+            Consecutive chunks of the stress history [MPa].
+
+        Returns
+        -------
+        Self
+            This fatigue damage calculation, to chain calls.
+        """
+        for chunk in chunks:
+            self.add(chunk)
+        return self
+
+    def spectrum(self) -> tuple[FloatArray, FloatArray]:
+        r"""Binned design stress ranges [$\gamma_{Ff} \Delta\sigma_i$] and their numbers of cycles [$n_{Ei}$], including the residue.
+
+        Returns
+        -------
+        tuple[FloatArray, FloatArray]
+            The upper edges of the bins with cycles [MPa] and the numbers of cycles in these bins [-].
+        """
+        counts = self._bin(np.abs(np.diff(self._residue)), 0.5)
+        counts[: len(self._counts)] += self._counts
+        bins = np.flatnonzero(counts)
+        return bins.astype(float) * self.bin_width, counts[bins]
+
+    @property
+    def damage(self) -> DIMENSIONLESS:
+        """[$D_d$] Damage during the design life, formula (A.1) evaluated for all bins at once [-]."""
+        stress_ranges, n_e = self.spectrum()
+        return float(np.sum(n_e / self.curve.endurance(stress_ranges)))
+
+    def formula(self) -> FormADot1DamageDuringDesignLife:
+        """Formula (A.1) with the binned spectrum, for reporting.
+
+        Returns
+        -------
+        FormADot1DamageDuringDesignLife
+            The damage with the numbers of cycles and the endurances of all bins with cycles.
+
+        Raises
+        ------
+        ValueError
+            If no cycles have been counted.
+        """
+        stress_ranges, n_e = self.spectrum()
+        if len(n_e) == 0:
+            raise ValueError("No cycles have been counted, add the stress history first.")
+        return FormADot1DamageDuringDesignLife(n_e=n_e.tolist(), n_r=self.curve.endurance(stress_ranges).tolist())
+
+    def result(self) -> CheckResult:
+        r"""Result of the fatigue verification [$D_d \leq 1.0$].
+
+        Returns
+        -------
+        CheckResult
+            The damage compared with 1.0.
+        """
+        return CheckResult.from_comparison(provided=self.damage, required=1.0)
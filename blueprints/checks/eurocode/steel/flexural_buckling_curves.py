@@ -0,0 +1,354 @@
+"""Precomputed buckling resistance curves of steel members based on EN 1993-1-1:2005 art. 6.3.1 and 6.3.2.
+
+The reduction factors for flexural buckling (formulas 6.49 and 6.50) and lateral-torsional buckling (formula 6.56)
+are evaluated once on a geometric grid of buckling lengths. Resistances for arbitrary lengths are then obtained by
+linear interpolation on that grid, which is cheap enough to screen the columns of a whole building at once.
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Literal
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from blueprints.codes.eurocode.en_1993_1_1_2005 import EN_1993_1_1_2005
+from blueprints.structural_sections.steel.steel_cross_section import SteelCrossSection
+from blueprints.type_alias import DIMENSIONLESS, MM, MM3, MPA
+from blueprints.unit_conversion import N_TO_KN, NMM_TO_KNM
+
+FLOAT32_RELATIVE_PRECISION = float(np.finfo(np.float32).eps)
+"""Relative rounding error of the compact (single precision) storage of the reduction factors."""
+
+
+class BucklingCurve(Enum):
+    r"""Buckling curves with their imperfection factor [$\alpha$], EN 1993-1-1:2005 table 6.1 and table 6.3."""
+
+    A0 = ("a0", 0.13)
+    A = ("a", 0.21)
+    B = ("b", 0.34)
+    C = ("c", 0.49)
+    D = ("d", 0.76)
+
+    def __init__(self, label: str, alpha: DIMENSIONLESS) -> None:
+        self.label = label
+        self.alpha = alpha
+
+
+def reduction_factor(relative_slenderness: ArrayLike, alpha: DIMENSIONLESS, plateau: DIMENSIONLESS = 0.2) -> NDArray[np.float64]:
+    r"""Reduction factor [$\chi$] for an array of relative slenderness values, EN 1993-1-1:2005 formula (6.49) and (6.56).
+
+    [$\chi = \frac{1}{\Phi + \sqrt{\Phi^2 - \bar{\lambda}^2}} \leq 1.0$] with
+    [$\Phi = 0.5 \left[1 + \alpha (\bar{\lambda} - 0.2) + \bar{\lambda}^2\right]$].
+    For [$\bar{\lambda} \leq 0.2$] the reduction factor equals 1.0 (art. 6.3.1.2(4) and 6.3.2.2(4)).
+
+    Parameters
+    ----------
+    relative_slenderness : ArrayLike
+        [$\bar{\lambda}$] Non-dimensional slenderness [-].
+    alpha : DIMENSIONLESS
+        [$\alpha$] Imperfection factor of the buckling curve [-].
+    plateau : DIMENSIONLESS, optional
+        Slenderness up to which no reduction is applied [-] (default is 0.2).
+
+    Returns
+    -------
+    NDArray[np.float64]
+        [$\chi$] Reduction factor [-].
+    """
+    lambda_bar = np.asarray(relative_slenderness, dtype=np.float64)
+    phi = 0.5 * (1 + alpha * (lambda_bar - plateau) + lambda_bar**2)
+    chi = 1 / (phi + np.sqrt(np.maximum(phi**2 - lambda_bar**2, 0.0)))
+    return np.where(lambda_bar <= plateau, 1.0, np.minimum(chi, 1.0))
+
+
+@dataclass(frozen=True)
+class FlexuralBucklingCurves:
+    r"""Buckling resistances [$N_{b,Rd}$] and [$M_{b,Rd}$] of a steel cross-section as a function of the buckling length.
+
+    The reduction factors are evaluated vectorised on a geometric grid of buckling lengths between `min_length` and
+    `max_length` when the object is created, using the (cached) section properties of the profile. They are stored in
+    single precision, `n_points` values per buckling mode.
+
+    Queries for arbitrary lengths within the grid use linear interpolation between the grid points. Since the reduction
+    factors decrease monotonically with the buckling length, the interpolated value always lies between the exact values
+    at the neighbouring grid points. This gives the guaranteed bound `error_bound` on the relative interpolation error.
+    The actual error is much smaller and is estimated in `estimated_error` by comparing the interpolation with the exact
+    values at the midpoints of all grid intervals. Lengths outside the grid are evaluated exactly.
+
+    Flexural buckling follows EN 1993-1-1:2005 art. 6.3.1, formulas (6.47), (6.49) and (6.50), for cross-section classes 1, 2
+    and 3. Lateral-torsional buckling follows the general case of art. 6.3.2.2, formulas (6.55) and (6.56), with the elastic
+    critical moment of a doubly symmetric section loaded at the shear centre:
+    [$M_{cr} = C_1 \frac{\pi^2 E I_z}{L^2} \sqrt{\frac{I_w}{I_z} + \frac{L^2 G I_t}{\pi^2 E I_z}}$].
+
+    Coordinate System:
+    ```
+    z (vertical, usually strong axis)
+        ↑
+        |     x (longitudinal beam direction, into screen)
+        |    ↗
+        |   /
+        |  /
+        | /
+        |/
+    ←---O
+    y (horizontal/side, usually weak axis)
+    ```
+
+    Parameters
+    ----------
+    steel_cross_section : SteelCrossSection
+        The steel cross-section.
+    buckling_curve_y : BucklingCurve
+        Buckling curve for flexural buckling about the y-axis (table 6.2).
+    buckling_curve_z : BucklingCurve
+        Buckling curve for flexural buckling about the z-axis (table 6.2).
+    buckling_curve_lt : BucklingCurve | None, optional
+        Buckling curve for lateral-torsional buckling (table 6.4). If None (default), no lateral-torsional buckling
+        curve is calculated. This avoids the more expensive warping analysis of the profile.
+    cross_section_class : Literal[1, 2, 3], optional
+        Cross-section class, default is 1. Determines whether the plastic (class 1 and 2) or elastic (class 3)
+        section modulus is used for [$M_{b,Rd}$].
+    gamma_m1 : DIMENSIONLESS, optional
+        Partial factor for resistance of members to instability, default is 1.0.
+    c_1 : DIMENSIONLESS, optional
+        Factor for the shape of the bending moment diagram in [$M_{cr}$], default is 1.0 (uniform moment).
+    min_length : MM, optional
+        Smallest buckling length of the grid [mm], default is 100 mm.
+    max_length : MM, optional
+        Largest buckling length of the grid [mm], default is 30 000 mm.
+    n_points : int, optional
+        Number of grid points, default is 512.
+
+    Example
+    -------
+    ```python
+    import numpy as np
+
+    from blueprints.checks.eurocode.steel.flexural_buckling_curves import BucklingCurve, FlexuralBucklingCurves
+    from blueprints.materials.steel import SteelMaterial, SteelStrengthClass
+    from blueprints.structural_sections.steel.standard_profiles.heb import HEB
+    from blueprints.structural_sections.steel.steel_cross_section import SteelCrossSection
+
+    heb_300_s355 = SteelCrossSection(profile=HEB.HEB300, material=SteelMaterial(steel_class=SteelStrengthClass.S355))
+    curves = FlexuralBucklingCurves(heb_300_s355, buckling_curve_y=BucklingCurve.B, buckling_curve_z=BucklingCurve.C)
+
+    n_b_rd = curves.n_b_rd(np.array([3000, 4500, 6000]), axis="z")  # kN
+    unity_checks = curves.unity_check_compression(n=[-1500, -2500], buckling_length_y=[4000, 6000], buckling_length_z=[4000, 3000])
+    ```
+    """
+
+    steel_cross_section: SteelCrossSection
+    buckling_curve_y: BucklingCurve
+    buckling_curve_z: BucklingCurve
+    buckling_curve_lt: BucklingCurve | None = None
+    cross_section_class: Literal[1, 2, 3] = 1
+    gamma_m1: DIMENSIONLESS = 1.0
+    c_1: DIMENSIONLESS = 1.0
+    min_length: MM = 100.0
+    max_length: MM = 30_000.0
+    n_points: int = 512
+    _chi: dict[str, NDArray[np.float32]] = field(init=False, repr=False, compare=False)
+    error_bound: dict[str, float] = field(init=False, compare=False)
+    """Guaranteed upper bound of the relative interpolation error per buckling mode ('y', 'z' and 'lt')."""
+    estimated_error: dict[str, float] = field(init=False, compare=False)
+    """Largest relative interpolation error found at the midpoints of the grid intervals per buckling mode."""
+
+    def __post_init__(self) -> None:
+        """Validate the input and build the reduction factor curves."""
+        if self.cross_section_class not in (1, 2, 3):
+            raise ValueError(f"Cross-section class must be 1, 2 or 3. You provided {self.cross_section_class}.")
+        if not 0 < self.min_length < self.max_length:
+            raise ValueError(f"Buckling length grid must satisfy 0 < min_length < max_length, got {self.min_length} and {self.max_length}.")
+        if self.n_points < 2:
+            raise ValueError(f"At least 2 grid points are needed, got {self.n_points}.")
+        if self.gamma_m1 <= 0 or self.c_1 <= 0:
+            raise ValueError("gamma_m1 and c_1 must be positive.")
+
+        lengths = self.grid_lengths
+        midpoints = np.sqrt(lengths[:-1] * lengths[1:])
+        modes = ["y", "z"] + (["lt"] if self.buckling_curve_lt is not None else [])
+
+        chi: dict[str, NDArray[np.float32]] = {}
+        error_bound: dict[str, float] = {}
+        estimated_error: dict[str, float] = {}
+        for mode in modes:
+            exact = self._exact_chi(lengths, mode)
+            exact_midpoints = self._exact_chi(midpoints, mode)
+            # monotonically decreasing: the interpolated value lies between the values at the neighbouring grid points
+            error_bound[mode] = float(np.max((exact[:-1] - exact[1:]) / exact[1:])) + FLOAT32_RELATIVE_PRECISION
+            interpolated_midpoints = 0.5 * (exact[:-1] + exact[1:])
+            estimated_error[mode] = float(np.max(np.abs(interpolated_midpoints - exact_midpoints) / exact_midpoints)) + FLOAT32_RELATIVE_PRECISION
+            chi[mode] = exact.astype(np.float32)
+
+        object.__setattr__(self, "_chi", chi)
+        object.__setattr__(self, "error_bound", error_bound)
+        object.__setattr__(self, "estimated_error", estimated_error)
+
+    @staticmethod
+    def source_docs() -> list[str]:
+        """List of source document identifiers used for these curves.
+
+        Returns
+        -------
+        list[str]
+        """
+        return [EN_1993_1_1_2005]
+
+    @property
+    def grid_lengths(self) -> NDArray[np.float64]:
+        """Buckling lengths of the grid points [mm]."""
+        return np.geomspace(self.min_length, self.max_length, self.n_points)
+
+    @property
+    def yield_strength(self) -> MPA:
+        """Yield strength of the cross-section [MPa]."""
+        return self.steel_cross_section.yield_strength
+
+    @property
+    def n_pl(self) -> float:
+        """Plastic compression resistance [$A f_y$] [N]."""
+        return float(self.steel_cross_section.profile.section_properties().area or 0) * self.yield_strength
+
+    @property
+    def w_y(self) -> MM3:
+        """Section modulus about the y-axis used for [$M_{b,Rd}$] [mm³], plastic for class 1 and 2, elastic for class 3."""
+        props = self.steel_cross_section.profile.section_properties()
+        if self.cross_section_class == 3:
+            return float(min(props.zxx_plus or 0, props.zxx_minus or 0))
+        return float(props.sxx or 0)
+
+    def _relative_slenderness_flexural(self, lengths: NDArray[np.float64], axis: Literal["y", "z"]) -> NDArray[np.float64]:
+        r"""Relative slenderness [$\bar{\lambda} = \frac{L_{cr}}{i \lambda_1}$] for flexural buckling, formula (6.50)."""
+        props = self.steel_cross_section.profile.section_properties()
+        # The strong axis y of Blueprints is the x-axis of SectionProperties.
+        radius_of_gyration = float((props.rx_c if axis == "y" else props.ry_c) or 0)
+        lambda_1 = np.pi * np.sqrt(self.steel_cross_section.material.e_modulus / self.yield_strength)
+        return lengths / (radius_of_gyration * lambda_1)
+
+    def _relative_slenderness_lateral_torsional(self, lengths: NDArray[np.float64]) -> NDArray[np.float64]:
+        r"""Relative slenderness [$\bar{\lambda}_{LT} = \sqrt{\frac{W_y f_y}{M_{cr}}}$] for lateral-torsional buckling."""
+        props = self.steel_cross_section.profile.section_properties(warping=True)
+        e = self.steel_cross_section.material.e_modulus
+        g = self.steel_cross_section.material.shear_modulus
+        i_z = float(props.iyy_c or 0)
+        i_w = float(props.gamma or 0)
+        i_t = float(props.j or 0)
+        euler = np.pi**2 * e * i_z / lengths**2
+        m_cr = self.c_1 * euler * np.sqrt(i_w / i_z + lengths**2 * g * i_t / (np.pi**2 * e * i_z))
+        return np.sqrt(self.w_y * self.yield_strength / m_cr)
+
+    def _exact_chi(self, lengths: NDArray[np.float64], mode: str) -> NDArray[np.float64]:
+        """Exact reduction factors for the given lengths and buckling mode."""
+        if mode == "lt":
+            assert self.buckling_curve_lt is not None
+            return reduction_factor(self._relative_slenderness_lateral_torsional(lengths), self.buckling_curve_lt.alpha)
+        curve = self.buckling_curve_y if mode == "y" else self.buckling_curve_z
+        return reduction_factor(self._relative_slenderness_flexural(lengths, mode), curve.alpha)  # ty: ignore[invalid-argument-type]
+
+    def chi(self, length: ArrayLike, mode: Literal["y", "z", "lt"] = "y") -> NDArray[np.float64]:
+        r"""Reduction factor [$\chi$] or [$\chi_{LT}$] for the given buckling lengths.
+
+        Parameters
+        ----------
+        length : ArrayLike
+            Buckling length(s) [mm]. For lateral-torsional buckling the length between lateral restraints.
+        mode : Literal["y", "z", "lt"], optional
+            Buckling mode: flexural buckling about the y-axis ('y', default) or z-axis ('z'), or lateral-torsional buckling ('lt').
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Reduction factors [-] with the same shape as `length`.
+
+        Raises
+        ------
+        ValueError
+            If the mode is unknown or if lateral-torsional buckling is requested without `buckling_curve_lt`.
+        """
+        if mode not in self._chi:
+            raise ValueError(f"Buckling mode '{mode}' is not available. Available modes are: {', '.join(self._chi)}.")
+        lengths = np.asarray(length, dtype=np.float64)
+        if np.any(lengths <= 0):
+            raise ValueError("Buckling lengths must be positive.")
+
+        # index in the geometric grid, computed directly without searching
+        position = np.log(lengths / self.min_length) / np.log(self.max_length / self.min_length) * (self.n_points - 1)
+        inside = (position >= 0) & (position <= self.n_points - 1)
+        index = np.clip(np.floor(position), 0, self.n_points - 2).astype(np.intp)
+        weight = np.clip(position - index, 0.0, 1.0)
+        curve = self._chi[mode]
+        interpolated = (1 - weight) * curve[index] + weight * curve[index + 1]
+
+        if np.all(inside):
+            return interpolated
+        return np.where(inside, interpolated, self._exact_chi(np.where(inside, self.min_length, lengths), mode))
+
+    def n_b_rd(self, length: ArrayLike, axis: Literal["y", "z"] = "y") -> NDArray[np.float64]:
+        r"""Design buckling resistance [$N_{b,Rd} = \frac{\chi A f_y}{\gamma_{M1}}$] of a compression member, formula (6.47) [kN].
+
+        Parameters
+        ----------
+        length : ArrayLike
+            Buckling length(s) [mm].
+        axis : Literal["y", "z"], optional
+            Axis of flexural buckling, default is 'y'.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Design buckling resistance [kN] with the same shape as `length`.
+        """
+        return self.chi(length, axis) * self.n_pl / self.gamma_m1 * N_TO_KN
+
+    def m_b_rd(self, length: ArrayLike) -> NDArray[np.float64]:
+        r"""Design buckling resistance moment [$M_{b,Rd} = \chi_{LT} W_y \frac{f_y}{\gamma_{M1}}$], formula (6.55) [kNm].
+
+        Parameters
+        ----------
+        length : ArrayLike
+            Length(s) between lateral restraints [mm].
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Design buckling resistance moment [kNm] with the same shape as `length`.
+        """
+        return self.chi(length, "lt") * self.w_y * self.yield_strength / self.gamma_m1 * NMM_TO_KNM
+
+    def unity_check_compression(self, n: ArrayLike, buckling_length_y: ArrayLike, buckling_length_z: ArrayLike) -> NDArray[np.float64]:
+        r"""Unity checks [$\frac{N_{Ed}}{N_{b,Rd}}$] for flexural buckling, governing axis, formula (6.46).
+
+        Parameters
+        ----------
+        n : ArrayLike
+            Applied compressive force(s) [kN], negative for compression. Tension (positive values) gives a unity check of 0.
+        buckling_length_y : ArrayLike
+            Buckling length(s) for buckling about the y-axis [mm].
+        buckling_length_z : ArrayLike
+            Buckling length(s) for buckling about the z-axis [mm].
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Unity checks [-], broadcast over the input arrays.
+        """
+        n_ed = np.maximum(-np.asarray(n, dtype=np.float64), 0.0)
+        return n_ed / np.minimum(self.n_b_rd(buckling_length_y, "y"), self.n_b_rd(buckling_length_z, "z"))
+
+    def unity_check_bending(self, m: ArrayLike, length: ArrayLike) -> NDArray[np.float64]:
+        r"""Unity checks [$\frac{M_{Ed}}{M_{b,Rd}}$] for lateral-torsional buckling, formula (6.54).
+
+        Parameters
+        ----------
+        m : ArrayLike
+            Applied bending moment(s) about the y-axis [kNm]. The sign is ignored.
+        length : ArrayLike
+            Length(s) between lateral restraints [mm].
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Unity checks [-], broadcast over the input arrays.
+        """
+        return np.abs(np.asarray(m, dtype=np.float64)) / self.m_b_rd(length)
@@ -0,0 +1,342 @@
+"""Module for the vectorised interaction of axial force, shear force and bending moments in steel cross-sections,
+according to Eurocode 3 (EN 1993-1-1:2005), chapter 6.2.8 - 6.2.10.
+"""
+
+from dataclasses import dataclass, field
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.checks.check_result import CheckResult
+from blueprints.checks.eurocode.steel.cross_section_classification import StressDistribution, cross_section_class
+from blueprints.checks.eurocode.steel.strength_shear import CheckStrengthShearClass12
+from blueprints.codes.eurocode.en_1993_1_1_2005 import EN_1993_1_1_2005
+from blueprints.structural_sections.steel.profile_definitions.i_profile import IProfile
+from blueprints.structural_sections.steel.profile_definitions.rhs_profile import RHSProfile
+from blueprints.structural_sections.steel.steel_cross_section import SteelCrossSection
+from blueprints.type_alias import DIMENSIONLESS, MM, MM2, MM3, MPA
+from blueprints.unit_conversion import KN_TO_N, KNM_TO_NMM, NMM_TO_KNM
+
+type FloatArray = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class _SectionTerms:
+    """Section dependent terms of the interaction, computed once per cross-section."""
+
+    area: MM2
+    w_pl_y: MM3
+    w_pl_z: MM3
+    w_el_y: MM3
+    w_el_z: MM3
+    shear_area_y: MM2
+    shear_area_z: MM2
+    web_height: MM
+    web_thickness: MM
+    """Web height and total thickness of the webs, the part of the section that carries Vz."""
+    flange_width: MM
+    flange_thickness: MM
+    """Flange width and total thickness of the flanges, the part of the section that carries Vy."""
+    a_w: DIMENSIONLESS
+    """Ratio of the web area to the total area, formula (6.38) for I-profiles and (6.39) for RHS-profiles."""
+    a_f: DIMENSIONLESS
+    """Ratio of the flange area to the total area, formula (6.38) for I-profiles and (6.40) for RHS-profiles."""
+    f_y: MPA
+
+
+@dataclass(frozen=True)
+class CombinedActionsResults:
+    """Results of the interaction check for an array of load combinations, all arrays have one value per combination.
+
+    Parameters
+    ----------
+    rho_y : FloatArray
+        Reduction factor for the yield strength of the shear area due to Vy, formula (6.29) [-].
+    rho_z : FloatArray
+        Reduction factor for the yield strength of the shear area due to Vz, formula (6.29) [-].
+    m_n_y_rd : FloatArray
+        Resistance moment about the y-axis reduced for shear and axial force [kNm].
+    m_n_z_rd : FloatArray
+        Resistance moment about the z-axis reduced for shear and axial force [kNm].
+    unity_check_axial : FloatArray
+        Axial force divided by the axial resistance reduced for shear [-].
+    unity_check_shear_y : FloatArray
+        Unity check of the shear force Vy, formula (6.17) [-].
+    unity_check_shear_z : FloatArray
+        Unity check of the shear force Vz, formula (6.17) [-].
+    unity_check_bending : FloatArray
+        Left hand side of the bi-axial bending criterion (6.41) for class 1 and 2, or of criterion (6.42) for class 3 [-].
+    """
+
+    rho_y: FloatArray
+    rho_z: FloatArray
+    m_n_y_rd: FloatArray
+    m_n_z_rd: FloatArray
+    unity_check_axial: FloatArray
+    unity_check_shear_y: FloatArray
+    unity_check_shear_z: FloatArray
+    unity_check_bending: FloatArray
+
+    @property
+    def unity_check(self) -> FloatArray:
+        """Governing unity check of each combination [-]."""
+        return np.max([self.unity_check_axial, self.unity_check_shear_y, self.unity_check_shear_z, self.unity_check_bending], axis=0)
+
+    @property
+    def governing_combination(self) -> int:
+        """Index of the combination with the highest unity check."""
+        return int(np.argmax(self.unity_check))
+
+    def result(self) -> CheckResult:
+        """Result of the governing combination.
+
+        Returns
+        -------
+        CheckResult
+            Result based on the highest unity check of all combinations.
+        """
+        return CheckResult.from_unity_check(float(self.unity_check[self.governing_combination]))
+
+
+@dataclass(frozen=True)
+class CombinedActionsInteraction:
+    r"""Interaction of axial force, shear forces and bi-axial bending for steel I- and RHS-profiles,
+    based on EN 1993-1-1:2005 art. 6.2.8 - 6.2.10.
+
+    The section dependent terms (areas, section moduli, shear areas, [$a$], [$a_w$] and [$a_f$]) are computed once,
+    after which `evaluate` checks arrays of load combinations at once, for example a complete result set of a
+    structural analysis.
+
+    For class 1 and 2 cross-sections:
+
+    - Shear: the yield strength of the shear area is reduced with [$\rho$] from formula (6.29). For bending about
+      the y-axis the webs, and about the z-axis the flanges, are taken as shear area, see formula (6.30).
+    - Axial force: reduced resistance moments follow from formulas (6.36) - (6.38) for I-profiles and
+      (6.39) - (6.40) for RHS-profiles, taking into account the criteria (6.33) - (6.35) for I-profiles.
+    - Bi-axial bending: criterion (6.41) with [$\alpha$] and [$\beta$] from art. 6.2.9.1(6).
+
+    For class 3 cross-sections, the elastic criterion (6.42) is used with the yield strength reduced for shear.
+
+    Parameters
+    ----------
+    steel_cross_section : SteelCrossSection
+        The steel cross-section to check, with an I- or RHS-profile.
+    gamma_m0 : DIMENSIONLESS, optional
+        Partial safety factor for resistance of cross-sections, default is 1.0.
+    cross_section_class : Literal[1, 2, 3] | None, optional
+        Cross-section class. By default the class follows from the cross-section classification: for uniform compression
+        when one of the combinations has a compressive axial force, for pure bending otherwise.
+
+    Example
+    -------
+    ```python
+    import numpy as np
+
+    from blueprints.checks.eurocode.steel.strength_combined_actions import CombinedActionsInteraction
+    from blueprints.materials.steel import SteelMaterial, SteelStrengthClass
+    from blueprints.structural_sections.steel.standard_profiles.heb import HEB
+    from blueprints.structural_sections.steel.steel_cross_section import SteelCrossSection
+
+    heb_300_s355 = SteelCrossSection(profile=HEB.HEB300, material=SteelMaterial(steel_class=SteelStrengthClass.S355))
+    interaction = CombinedActionsInteraction(heb_300_s355)
+    results = interaction.evaluate(n=np.array([-1000.0, 200.0]), v_z=np.array([300.0, 50.0]), m_y=np.array([400.0, 100.0]))
+    print(results.unity_check, results.governing_combination)
+    ```
+
+    Raises
+    ------
+    NotImplementedError
+        If the profile is not an I- or RHS-profile, or if the cross-section is class 4.
+    """
+
+    steel_cross_section: SteelCrossSection
+    gamma_m0: DIMENSIONLESS = 1.0
+    cross_section_class: Literal[1, 2, 3] | None = None
+    name: str = "Combined axial force, shear force and bending moment check for steel profiles"
+    _section: _SectionTerms = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute the section dependent terms."""
+        profile = self.steel_cross_section.profile
+        if type(profile) not in (IProfile, RHSProfile):
+            raise NotImplementedError(f"The provided profile shape {type(profile).__name__} has not been implemented yet.")
+        if self.cross_section_class not in (None, 1, 2, 3):
+            raise ValueError(f"Cross-section class must be 1, 2, 3 or None. You provided {self.cross_section_class}.")
+
+        props = profile.section_properties()
+        area = float(props.area or 0)
+        if isinstance(profile, IProfile):
+            web_height = profile.total_height - profile.top_flange_thickness - profile.bottom_flange_thickness
+            web_thickness = profile.web_thickness
+            flange_width = profile.top_flange_width
+            flange_thickness = profile.top_flange_thickness + profile.bottom_flange_thickness
+            a_w = a_f = min((area - flange_width * flange_thickness) / area, 0.5)  # formula (6.38)
+        else:
+            assert isinstance(profile, RHSProfile)
+            web_height = profile.total_height - profile.top_wall_thickness - profile.bottom_wall_thickness
+            web_thickness = profile.left_wall_thickness + profile.right_wall_thickness
+            flange_width = profile.total_width
+            flange_thickness = profile.top_wall_thickness + profile.bottom_wall_thickness
+            a_w = min((area - flange_width * flange_thickness) / area, 0.5)  # formula (6.39) a_w
+            a_f = min((area - profile.total_height * web_thickness) / area, 0.5)  # formula (6.40) a_f
+
+        section = _SectionTerms(
+            area=area,
+            w_pl_y=float(props.sxx or 0),
+            w_pl_z=float(props.syy or 0),
+            w_el_y=min(float(props.zxx_plus or 0), float(props.zxx_minus or 0)),
+            w_el_z=min(float(props.zyy_plus or 0), float(props.zyy_minus or 0)),
+            shear_area_y=float(CheckStrengthShearClass12(self.steel_cross_section, axis="Vy").shear_area()),
+            shear_area_z=float(CheckStrengthShearClass12(self.steel_cross_section, axis="Vz").shear_area()),
+            web_height=web_height,
+            web_thickness=web_thickness,
+            flange_width=flange_width,
+            flange_thickness=flange_thickness,
+            a_w=a_w,
+            a_f=a_f,
+            f_y=self.steel_cross_section.yield_strength,
+        )
+        object.__setattr__(self, "_section", section)
+
+    @staticmethod
+    def source_docs() -> list[str]:
+        """List of source document identifiers used for this check.
+
+        Returns
+        -------
+        list[str]
+        """
+        return [EN_1993_1_1_2005]
+
+    def _class(self, has_compression: bool) -> int:
+        """Cross-section class used for the interaction."""
+        if self.cross_section_class is not None:
+            return self.cross_section_class
+        stress_distribution = StressDistribution.compression() if has_compression else StressDistribution.bending()
+        section_class = cross_section_class(self.steel_cross_section, stress_distribution)
+        if section_class == 4:
+            raise NotImplementedError(
+                f"Profile {self.steel_cross_section.profile.name} is cross-section class 4, which has not been implemented yet."
+            )
+        return section_class
+
+    def _reduced_moment_resistances(
+        self, n: FloatArray, n_ed: FloatArray, m_y_v_rd: FloatArray, m_z_v_rd: FloatArray
+    ) -> tuple[FloatArray, FloatArray]:
+        """Resistance moments reduced for the axial force, formulas (6.33) - (6.40) [Nmm]."""
+        sec = self._section
+        f_yd = sec.f_y / self.gamma_m0
+        if isinstance(self.steel_cross_section.profile, IProfile):
+            a = sec.a_w
+            m_n_y_rd = np.minimum(m_y_v_rd * (1 - n) / (1 - 0.5 * a), m_y_v_rd)  # formula (6.36)
+            # formulas (6.33) and (6.34): no reduction for small axial forces
+            no_reduction_y = (n_ed <= 0.25 * sec.area * f_yd) & (n_ed <= 0.5 * sec.web_height * sec.web_thickness * f_yd)
+            m_n_y_rd = np.where(no_reduction_y, m_y_v_rd, m_n_y_rd)
+            # formula (6.37), and formula (6.35): no reduction for small axial forces
+            m_n_z_rd = np.where(n <= a, m_z_v_rd, m_z_v_rd * (1 - ((n - a) / (1 - a)) ** 2))
+            m_n_z_rd = np.where(n_ed <= sec.web_height * sec.web_thickness * f_yd, m_z_v_rd, m_n_z_rd)
+        else:
+            m_n_y_rd = np.minimum(m_y_v_rd * (1 - n) / (1 - 0.5 * sec.a_w), m_y_v_rd)  # formula (6.39)
+            m_n_z_rd = np.minimum(m_z_v_rd * (1 - n) / (1 - 0.5 * sec.a_f), m_z_v_rd)  # formula (6.40)
+        return np.maximum(m_n_y_rd, 0), np.maximum(m_n_z_rd, 0)
+
+    def _exponents(self, n: FloatArray) -> tuple[FloatArray, FloatArray]:
+        r"""Exponents [$\alpha$] and [$\beta$] of the bi-axial bending criterion, art. 6.2.9.1(6)."""
+        if isinstance(self.steel_cross_section.profile, IProfile):
+            return np.full_like(n, 2.0), np.maximum(5 * n, 1.0)
+        denominator = 1 - 1.13 * n**2
+        alpha = np.where(denominator > 0, np.minimum(1.66 / np.where(denominator > 0, denominator, 1.0), 6.0), 6.0)
+        return alpha, alpha
+
+    def evaluate(
+        self,
+        n: npt.ArrayLike = 0.0,
+        v_y: npt.ArrayLike = 0.0,
+        v_z: npt.ArrayLike = 0.0,
+        m_y: npt.ArrayLike = 0.0,
+        m_z: npt.ArrayLike = 0.0,
+    ) -> CombinedActionsResults:
+        """Check an array of load combinations.
+
+        The arguments are broadcast against each other, so a scalar can be combined with arrays.
+        The signs of the shear forces and bending moments are irrelevant.
+
+        Parameters
+        ----------
+        n : npt.ArrayLike, optional
+            Axial forces, negative for compression [kN].
+        v_y : npt.ArrayLike, optional
+            Shear forces in the y-direction [kN].
+        v_z : npt.ArrayLike, optional
+            Shear forces in the z-direction [kN].
+        m_y : npt.ArrayLike, optional
+            Bending moments about the y-axis [kNm].
+        m_z : npt.ArrayLike, optional
+            Bending moments about the z-axis [kNm].
+
+        Returns
+        -------
+        CombinedActionsResults
+            Unity checks and reduced resistances of all combinations.
+        """
+        n_kn, v_y_kn, v_z_kn, m_y_knm, m_z_knm = np.broadcast_arrays(*(np.atleast_1d(np.asarray(x, dtype=float)) for x in (n, v_y, v_z, m_y, m_z)))
+        sec = self._section
+        f_yd = sec.f_y / self.gamma_m0
+
+        n_ed = np.abs(n_kn) * KN_TO_N
+        my_ed = np.abs(m_y_knm) * KNM_TO_NMM
+        mz_ed = np.abs(m_z_knm) * KNM_TO_NMM
+
+        # shear: formulas (6.17), (6.18) and (6.29)
+        v_pl_y_rd = sec.shear_area_y * f_yd / np.sqrt(3)
+        v_pl_z_rd = sec.shear_area_z * f_yd / np.sqrt(3)
+        unity_check_shear_y = np.abs(v_y_kn) * KN_TO_N / v_pl_y_rd
+        unity_check_shear_z = np.abs(v_z_kn) * KN_TO_N / v_pl_z_rd
+        rho_y = np.where(unity_check_shear_y > 0.5, (2 * np.minimum(unity_check_shear_y, 1) - 1) ** 2, 0.0)
+        rho_z = np.where(unity_check_shear_z > 0.5, (2 * np.minimum(unity_check_shear_z, 1) - 1) ** 2, 0.0)
+
+        if self._class(has_compression=bool(np.any(n_kn < 0))) == 3:
+            # formula (6.42) with the yield strength reduced for shear, formula (6.29)
+            f_yd_v = (1 - np.maximum(rho_y, rho_z)) * f_yd
+            sigma = n_ed / sec.area + my_ed / sec.w_el_y + mz_ed / sec.w_el_z
+            with np.errstate(divide="ignore", invalid="ignore"):
+                unity_check_bending = np.where(sigma == 0, 0.0, sigma / f_yd_v)
+            return CombinedActionsResults(
+                rho_y=rho_y,
+                rho_z=rho_z,
+                m_n_y_rd=np.maximum(1 - n_ed / (sec.area * f_yd_v), 0) * sec.w_el_y * f_yd_v * NMM_TO_KNM,
+                m_n_z_rd=np.maximum(1 - n_ed / (sec.area * f_yd_v), 0) * sec.w_el_z * f_yd_v * NMM_TO_KNM,
+                unity_check_axial=n_ed / (sec.area * f_yd),
+                unity_check_shear_y=unity_check_shear_y,
+                unity_check_shear_z=unity_check_shear_z,
+                unity_check_bending=unity_check_bending,
+            )
+
+        # resistances reduced for shear, formula (6.30) and its equivalents for the flanges and the axial force
+        web_area = sec.web_height * sec.web_thickness
+        flange_area = sec.flange_width * sec.flange_thickness
+        n_v_rd = (sec.area - rho_z * web_area - rho_y * flange_area) * f_yd
+        m_y_v_rd = (sec.w_pl_y - rho_z * sec.web_thickness * sec.web_height**2 / 4) * f_yd
+        m_z_v_rd = (sec.w_pl_z - rho_y * sec.flange_thickness * sec.flange_width**2 / 4) * f_yd
+
+        relative_n = n_ed / n_v_rd
+        m_n_y_rd, m_n_z_rd = self._reduced_moment_resistances(np.minimum(relative_n, 1), n_ed, m_y_v_rd, m_z_v_rd)
+
+        # bi-axial bending criterion, formula (6.41)
+        alpha, beta = self._exponents(np.minimum(relative_n, 1))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio_y = np.where(my_ed == 0, 0.0, my_ed / m_n_y_rd)
+            ratio_z = np.where(mz_ed == 0, 0.0, mz_ed / m_n_z_rd)
+        unity_check_bending = ratio_y**alpha + ratio_z**beta
+
+        return CombinedActionsResults(
+            rho_y=rho_y,
+            rho_z=rho_z,
+            m_n_y_rd=m_n_y_rd * NMM_TO_KNM,
+            m_n_z_rd=m_n_z_rd * NMM_TO_KNM,
+            unity_check_axial=relative_n,
+            unity_check_shear_y=unity_check_shear_y,
+            unity_check_shear_z=unity_check_shear_z,
+            unity_check_bending=unity_check_bending,
+        )
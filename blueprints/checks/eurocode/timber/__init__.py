@@ -0,0 +1 @@
+"""Timber checks."""
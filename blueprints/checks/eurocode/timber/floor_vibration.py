@@ -0,0 +1,191 @@
+r"""Module for the vectorised vibration screening of residential timber floors, according to EN 1995-1-1:2004, art. 7.3.3.
+
+The floors are rectangular and simply supported on all four sides. Every parameter is an array, broadcast against the
+others, so that thousands of combinations of spans, joists and floor build-ups are screened at once, for example one row
+per span and one column per joist option. For every floor the screening evaluates:
+
+- the fundamental frequency $f_1$, formula (7.5),
+- the number of first-order modes with a natural frequency below 40 Hz $n_{40}$, formula (7.7),
+- the unit impulse velocity response $v$, formula (7.6), and its limit, formula (7.4),
+- optionally the deflection under a static point load, formula (7.3).
+
+Formula (7.7) is the closed form of the number of modes $f_{1,n} = f_1 \sqrt{1 + n^4 (l/b)^4 (EI)_b/(EI)_l} < 40$ Hz of
+the orthotropic plate, so no summation over the modes is needed. Floors with a fundamental frequency of 8 Hz or less
+require a special investigation, art. 7.3.3 (1), and do not pass the screening.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.checks.check_result import CheckResult
+from blueprints.codes.eurocode.en_1995_1_1_2004 import EN_1995_1_1_2004
+from blueprints.type_alias import DIMENSIONLESS, HZ, MM_KN
+
+type FloatArray = npt.NDArray[np.float64]
+type BoolArray = npt.NDArray[np.bool_]
+
+MINIMUM_FREQUENCY: HZ = 8.0
+"""Fundamental frequency up to which a special investigation is required, art. 7.3.3 (1) [Hz]."""
+
+MODE_FREQUENCY_LIMIT: HZ = 40.0
+"""Upper limit of the natural frequencies of the first-order modes that contribute to the velocity response, art. 7.3.3 (5) [Hz]."""
+
+
+@dataclass(frozen=True)
+class FloorVibrationResults:
+    r"""Results of the vibration screening of an array of floors.
+
+    Parameters
+    ----------
+    f_1 : FloatArray
+        [$f_1$] Fundamental frequencies, formula (7.5) [Hz].
+    n_40 : FloatArray
+        [$n_{40}$] Numbers of first-order modes with natural frequencies up to 40 Hz, formula (7.7) [-].
+    v : FloatArray
+        [$v$] Unit impulse velocity responses, formula (7.6) [$m/(Ns^2)$].
+    v_limit : FloatArray
+        Limits of the unit impulse velocity responses, formula (7.4) [$m/(Ns^2)$].
+    deflection_check : FloatArray | None
+        Unity checks of the deflection under a static point load, formula (7.3), None when no deflections are given [-].
+    """
+
+    f_1: FloatArray
+    n_40: FloatArray
+    v: FloatArray
+    v_limit: FloatArray
+    deflection_check: FloatArray | None = None
+
+    @property
+    def special_investigation(self) -> BoolArray:
+        """True for the floors with a fundamental frequency of 8 Hz or less, which require a special investigation."""
+        return self.f_1 <= MINIMUM_FREQUENCY
+
+    @property
+    def unity_check(self) -> FloatArray:
+        """Largest unity check of the velocity response and the deflection of every floor, infinite for floors that require a
+        special investigation [-].
+        """
+        unity_check = self.v / self.v_limit
+        if self.deflection_check is not None:
+            unity_check = np.maximum(unity_check, self.deflection_check)
+        return np.where(self.special_investigation, np.inf, unity_check)
+
+    @property
+    def governing_floor(self) -> int:
+        """Index of the floor with the largest unity check, in the flattened array of floors."""
+        return int(np.argmax(self.unity_check))
+
+    def result(self) -> CheckResult:
+        """Result of the governing floor.
+
+        Returns
+        -------
+        CheckResult
+            Result based on the largest unity check of all floors.
+        """
+        return CheckResult.from_comparison(provided=float(self.unity_check.flat[self.governing_floor]), required=1.0)
+
+
+@dataclass(frozen=True)
+class FloorVibration:
+    r"""Vibration screening of residential timber floors with a fundamental frequency above 8 Hz, based on EN 1995-1-1:2004
+    art. 7.3.3.
+
+    Parameters
+    ----------
+    a : MM_KN, optional
+        [$a$] Limit of the ratio of the deflection under a static point load and the point load, figure 7.2. The value for use
+        in a country may be found in its National Annex (default is 1.0, a recommended default within the range of figure 7.2)
+        [mm/kN].
+    b : DIMENSIONLESS, optional
+        [$b$] Parameter of the velocity response limit, figure 7.2, between 50 and 150. The value for use in a country may be
+        found in its National Annex (default is 120, a recommended default within the range of figure 7.2) [-].
+    xi : DIMENSIONLESS, optional
+        [$\xi$] Modal damping ratio, art. 7.3.1 (3) (default is 0.01) [-].
+    name : str, optional
+        Name of the check (default is "Vibration of residential timber floors according to EN 1995-1-1:2004").
+    """
+
+    a: MM_KN = 1.0
+    b: DIMENSIONLESS = 120.0
+    xi: DIMENSIONLESS = 0.01
+    name: str = "Vibration of residential timber floors according to EN 1995-1-1:2004"
+
+    def __post_init__(self) -> None:
+        """Validate the limits and the damping ratio."""
+        if self.a <= 0:
+            raise ValueError(f"Invalid a: {self.a}, the limit must be positive.")
+        if not 50 <= self.b <= 150:
+            raise ValueError(f"Invalid b: {self.b}, the parameter must be between 50 and 150.")
+        if self.xi < 0:
+            raise ValueError(f"Invalid xi: {self.xi}, the damping ratio cannot be negative.")
+
+    @staticmethod
+    def source_docs() -> list[str]:
+        """List of source document identifiers used for this check.
+
+        Returns
+        -------
+        list[str]
+            List of source document identifiers.
+        """
+        return [EN_1995_1_1_2004]
+
+    def evaluate(
+        self,
+        length: npt.ArrayLike,
+        width: npt.ArrayLike,
+        ei_l: npt.ArrayLike,
+        ei_b: npt.ArrayLike,
+        m: npt.ArrayLike,
+        w: npt.ArrayLike | None = None,
+        f: npt.ArrayLike = 1.0,
+    ) -> FloorVibrationResults:
+        r"""Screen an array of floors, formulas (7.3) - (7.7).
+
+        Parameters
+        ----------
+        length : npt.ArrayLike
+            [$l$] Spans of the floors [m].
+        width : npt.ArrayLike
+            [$b$] Widths of the floors [m].
+        ei_l : npt.ArrayLike
+            [$(EI)_l$] Equivalent plate bending stiffnesses about an axis perpendicular to the beam direction [$Nm^2/m$].
+        ei_b : npt.ArrayLike
+            [$(EI)_b$] Equivalent plate bending stiffnesses about an axis parallel to the beam direction [$Nm^2/m$].
+        m : npt.ArrayLike
+            [$m$] Masses per unit area [$kg/m^2$].
+        w : npt.ArrayLike | None, optional
+            [$w$] Maximum instantaneous deflections caused by the static point loads `f`, the deflection check of formula
+            (7.3) is skipped when None [mm] (default is None).
+        f : npt.ArrayLike, optional
+            [$F$] Static point loads of the deflections `w` [kN] (default is 1.0).
+
+        Returns
+        -------
+        FloorVibrationResults
+            The results of every floor, broadcast against the parameters.
+
+        Raises
+        ------
+        ValueError
+            If a dimension, stiffness, mass or point load is not positive, or a deflection is negative.
+        """
+        length, width, ei_l, ei_b, m = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (length, width, ei_l, ei_b, m)))
+        if np.any(length <= 0) or np.any(width <= 0) or np.any(ei_l <= 0) or np.any(ei_b <= 0) or np.any(m <= 0):
+            raise ValueError("Invalid length, width, ei_l, ei_b or m: values must be positive.")
+        f_1 = np.pi / (2 * length**2) * np.sqrt(ei_l / m)
+        # floors with a fundamental frequency above 40 Hz have no first-order modes below 40 Hz
+        n_40 = (np.maximum((MODE_FREQUENCY_LIMIT / f_1) ** 2 - 1, 0.0) * (width / length) ** 4 * ei_l / ei_b) ** 0.25
+        v = 4 * (0.4 + 0.6 * n_40) / (m * width * length + 200)
+        v_limit = self.b ** (f_1 * self.xi - 1)
+
+        deflection_check = None
+        if w is not None:
+            w, f = np.asarray(w, dtype=float), np.asarray(f, dtype=float)
+            if np.any(w < 0) or np.any(f <= 0):
+                raise ValueError("Invalid w or f: deflections cannot be negative and point loads must be positive.")
+            deflection_check = np.broadcast_to(w / f / self.a, f_1.shape)
+        return FloorVibrationResults(f_1=f_1, n_40=n_40, v=v, v_limit=v_limit, deflection_check=deflection_check)
@@ -0,0 +1,249 @@
+r"""Module for the vectorised analysis of mechanically jointed beams, according to EN 1995-1-1:2023, Annex E.
+
+A `MechanicallyJointedBeam` holds an array of candidate layups, each with two or three layers of rectangular parts: layer 1
+at the top, the web (layer 2) and, for three layers, layer 3 at the bottom. The terms that only depend on the geometry,
+the moduli of elasticity and the span are calculated once when the beam is created, formulas (E.6) and (E.7). Sweeps over
+fastener spacings and slip moduli then only evaluate the terms of the connections:
+
+- the efficiency factors $\gamma_i$, formula (E.2),
+- the distances $a_i$ of the centroids of the layers to the centroid of the composite section, formulas (E.3) - (E.5),
+- the effective bending stiffness $(EI)_{ef}$, formula (E.1),
+- the normal stresses, formulas (E.8) and (E.9), and the maximum shear stress in the web, formula (E.10).
+
+Layups, spacings and slip moduli are broadcast against each other, with the layers along the last axis. Moments are in
+kNm and shear forces in kN, stresses in MPa.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.codes.eurocode.en_1995_1_1_2023 import EN_1995_1_1_2023
+from blueprints.unit_conversion import KN_TO_N, KNM_TO_NMM
+
+type FloatArray = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class MechanicallyJointedBeamResults:
+    r"""Results of the analysis of an array of mechanically jointed beams.
+
+    Parameters
+    ----------
+    gamma : FloatArray
+        [$\gamma_i$] Efficiency factors of the connections of every layer, formula (E.2) [-].
+    alpha : FloatArray
+        [$a_i$] Distances between the centroid of the composite section and the centroid of every layer, formulas (E.3) -
+        (E.5) [mm].
+    ei_ef : FloatArray
+        [$(EI)_{ef}$] Effective bending stiffnesses, formula (E.1) [$Nmm^2$].
+    sigma : FloatArray
+        [$\sigma_i$] Normal stresses at the centroid of every layer, formula (E.8) [MPa].
+    sigma_m : FloatArray
+        [$\sigma_{m,i}$] Bending stresses at the edges of every layer, formula (E.9) [MPa].
+    tau_2_max : FloatArray
+        [$\tau_{2,max}$] Maximum shear stresses in the web, formula (E.10) [MPa].
+    """
+
+    gamma: FloatArray
+    alpha: FloatArray
+    ei_ef: FloatArray
+    sigma: FloatArray
+    sigma_m: FloatArray
+    tau_2_max: FloatArray
+
+    @property
+    def extreme_fibre_stress(self) -> FloatArray:
+        """Largest absolute normal stresses in every layer, the sum of the stresses of formulas (E.8) and (E.9) [MPa]."""
+        return np.abs(self.sigma) + np.abs(self.sigma_m)
+
+    def unity_check(self, f_m: npt.ArrayLike, f_v: npt.ArrayLike) -> FloatArray:
+        """Largest unity check of the normal stresses of all layers and the shear stress in the web of every beam.
+
+        Parameters
+        ----------
+        f_m : npt.ArrayLike
+            Design strengths for the extreme fibre stresses, broadcast against the layers [MPa].
+        f_v : npt.ArrayLike
+            Design shear strengths of the webs [MPa].
+
+        Returns
+        -------
+        FloatArray
+            The unity checks of every beam [-].
+        """
+        return np.maximum(np.max(self.extreme_fibre_stress / np.asarray(f_m, dtype=float), axis=-1), self.tau_2_max / np.asarray(f_v, dtype=float))
+
+    def optimum(self, cost: npt.ArrayLike, f_m: npt.ArrayLike, f_v: npt.ArrayLike, ei_min: npt.ArrayLike = 0.0) -> tuple[int, ...] | None:
+        """Index of the beam with the lowest cost that satisfies the stress checks and the required bending stiffness.
+
+        Parameters
+        ----------
+        cost : npt.ArrayLike
+            Cost of every beam, for example the timber volume or the number of fasteners, broadcast against the beams.
+        f_m : npt.ArrayLike
+            Design strengths for the extreme fibre stresses, broadcast against the layers [MPa].
+        f_v : npt.ArrayLike
+            Design shear strengths of the webs [MPa].
+        ei_min : npt.ArrayLike, optional
+            Required effective bending stiffnesses, for example from a deflection or vibration limit [$Nmm^2$] (default is 0.0).
+
+        Returns
+        -------
+        tuple[int, ...] | None
+            The index of the optimal beam, None if no beam satisfies the requirements.
+        """
+        feasible = (self.unity_check(f_m, f_v) <= 1.0) & (self.ei_ef >= np.asarray(ei_min, dtype=float))
+        cost = np.broadcast_to(np.asarray(cost, dtype=float), feasible.shape)
+        if not feasible.any():
+            return None
+        index = np.unravel_index(np.argmin(np.where(feasible, cost, np.inf)), feasible.shape)
+        return tuple(int(value) for value in index)
+
+
+@dataclass(frozen=True, init=False)
+class MechanicallyJointedBeam:
+    r"""Array of simply supported beams of two or three rectangular layers, jointed with mechanical fasteners, based on
+    EN 1995-1-1:2023 Annex E.
+
+    Parameters
+    ----------
+    b : npt.ArrayLike
+        [$b_i$] Widths of the layers, with the layers along the last axis [mm].
+    h : npt.ArrayLike
+        [$h_i$] Depths of the layers, with the layers along the last axis [mm].
+    e : npt.ArrayLike
+        [$E_i$] Moduli of elasticity of the layers, with the layers along the last axis [MPa].
+    length : npt.ArrayLike
+        [$l$] Spans of the beams [mm].
+    name : str, optional
+        Name of the beams (default is "Mechanically jointed beams according to EN 1995-1-1:2023").
+    """
+
+    b: FloatArray
+    h: FloatArray
+    e: FloatArray
+    length: FloatArray
+    name: str
+    a: FloatArray = field(repr=False)
+    r"""[$A_i$] Areas of the layers, formula (E.6) [$mm^2$]."""
+    i: FloatArray = field(repr=False)
+    r"""[$I_i$] Second moments of area of the layers, formula (E.7) [$mm^4$]."""
+    _ea: FloatArray = field(repr=False)
+    _ei: FloatArray = field(repr=False)
+    _slip_factor: FloatArray = field(repr=False)
+
+    def __init__(
+        self,
+        b: npt.ArrayLike,
+        h: npt.ArrayLike,
+        e: npt.ArrayLike,
+        length: npt.ArrayLike,
+        name: str = "Mechanically jointed beams according to EN 1995-1-1:2023",
+    ) -> None:
+        """Broadcast the layups and calculate the terms that only depend on the geometry and the moduli of elasticity."""
+        b, h, e = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (b, h, e)))
+        if b.ndim == 0 or b.shape[-1] not in {2, 3}:
+            raise ValueError(f"Invalid layers: {b.shape}, the last axis must have two or three layers.")
+        length = np.asarray(length, dtype=float)
+        if np.any(b <= 0) or np.any(h <= 0) or np.any(e <= 0) or np.any(length <= 0):
+            raise ValueError("Invalid b, h, e or length: values must be positive.")
+        a = b * h
+        object.__setattr__(self, "b", b)
+        object.__setattr__(self, "h", h)
+        object.__setattr__(self, "e", e)
+        object.__setattr__(self, "length", length)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "a", a)
+        object.__setattr__(self, "i", b * h**3 / 12)
+        object.__setattr__(self, "_ea", e * a)
+        object.__setattr__(self, "_ei", e * self.i)
+        object.__setattr__(self, "_slip_factor", np.pi**2 * e * a / length[..., None] ** 2)
+
+    @staticmethod
+    def source_docs() -> list[str]:
+        """List of source document identifiers used for this check.
+
+        Returns
+        -------
+        list[str]
+            List of source document identifiers.
+        """
+        return [EN_1995_1_1_2023]
+
+    @property
+    def n_layers(self) -> int:
+        """Number of layers of the beams."""
+        return self.b.shape[-1]
+
+    def gamma(self, s: npt.ArrayLike, k: npt.ArrayLike) -> FloatArray:
+        r"""Efficiency factors $\gamma_i$ of the connections of the layers, formula (E.2), with $\gamma_2 = 1$ [-].
+
+        Parameters
+        ----------
+        s : npt.ArrayLike
+            [$s_i$] Spacings of the fasteners of the layers, broadcast against the layers, the values of the web are not
+            used [mm].
+        k : npt.ArrayLike
+            [$K_i$] Slip moduli of the fasteners of the layers for the limit state under consideration, broadcast against
+            the layers, the values of the web are not used [N/mm].
+
+        Returns
+        -------
+        FloatArray
+            The efficiency factors of every beam and layer.
+        """
+        s, k = np.asarray(s, dtype=float), np.asarray(k, dtype=float)
+        if np.any(s <= 0) or np.any(k <= 0):
+            raise ValueError("Invalid s or k: spacings and slip moduli must be positive.")
+        gamma = 1 / (1 + self._slip_factor * s / k)
+        gamma[..., 1] = 1.0
+        return gamma
+
+    def evaluate(self, s: npt.ArrayLike, k: npt.ArrayLike, m_d: npt.ArrayLike = 0.0, v_d: npt.ArrayLike = 0.0) -> MechanicallyJointedBeamResults:
+        r"""Effective bending stiffnesses and stresses of the beams for fastener spacings and slip moduli, formulas (E.1) - (E.10).
+
+        Parameters
+        ----------
+        s : npt.ArrayLike
+            [$s_i$] Spacings of the fasteners of the layers, see `gamma` [mm].
+        k : npt.ArrayLike
+            [$K_i$] Slip moduli of the fasteners of the layers, see `gamma` [N/mm].
+        m_d : npt.ArrayLike, optional
+            [$M_d$] Design bending moments of the beams [kNm] (default is 0.0).
+        v_d : npt.ArrayLike, optional
+            [$V_d$] Maximum design shear forces of the beams, regardless of the sign [kN] (default is 0.0).
+
+        Returns
+        -------
+        MechanicallyJointedBeamResults
+            The results of every beam, broadcast against the spacings, slip moduli and forces.
+        """
+        gamma = self.gamma(s, k)
+        h, ea = self.h, self._ea
+        gamma_ea = gamma * ea
+        h_1, h_2 = h[..., 0], h[..., 1]
+        moment_1 = gamma_ea[..., 0] * (h_1 + h_2)
+        if self.n_layers == 3:
+            h_3 = h[..., 2]
+            # formulas (E.4), (E.3) and (E.5)
+            alpha_2 = (moment_1 - gamma_ea[..., 2] * (h_2 + h_3)) / (2 * np.sum(gamma_ea, axis=-1))
+            alpha_3 = (h_2 + h_3) / 2 + alpha_2
+            alpha = np.stack(np.broadcast_arrays((h_1 + h_2) / 2 - alpha_2, alpha_2, alpha_3), axis=-1)
+        else:
+            alpha_2 = moment_1 / (2 * np.sum(gamma_ea, axis=-1))
+            alpha = np.stack(np.broadcast_arrays((h_1 + h_2) / 2 - alpha_2, alpha_2), axis=-1)
+        ei_ef = np.sum(self._ei + gamma_ea * alpha**2, axis=-1)
+
+        m_d = np.asarray(m_d, dtype=float)[..., None] * KNM_TO_NMM
+        sigma = gamma * self.e * alpha * m_d / ei_ef[..., None]
+        sigma_m = 0.5 * self.e * h * m_d / ei_ef[..., None]
+        b_2, e_2 = self.b[..., 1], self.e[..., 1]
+        v_d = np.asarray(v_d, dtype=float) * KN_TO_N
+        # formula (E.10), without the term of the third layer for two layers
+        first_moment = 0.5 * e_2 * b_2 * (h_2 / 2 + alpha_2) ** 2
+        if self.n_layers == 3:
+            first_moment = first_moment + gamma_ea[..., 2] * alpha[..., 2]
+        tau_2_max = first_moment * v_d / (b_2 * ei_ef)
+        return MechanicallyJointedBeamResults(gamma=gamma, alpha=alpha, ei_ef=ei_ef, sigma=sigma, sigma_m=sigma_m, tau_2_max=tau_2_max)
@@ -2,7 +2,10 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import ClassVar
+from typing import ClassVar, overload
+
+import numpy as np
+import numpy.typing as npt
 
 from blueprints.codes.eurocode.en_1993_1_1_2005 import EN_1993_1_1_2005
 from blueprints.type_alias import MM, MPA
@@ -153,6 +156,11 @@ class Table3Dot1NominalValuesHotRolledStructuralSteel:
         SteelStrengthClass.S460_MH_MLH_10219_1: (460, 530, None, None),
     }
 
+    # The same data as numpy arrays, with NaN for values that are not specified, for the lookup of thickness arrays.
+    _strength_arrays: ClassVar[dict[SteelStrengthClass, npt.NDArray[np.float64]]] = {
+        steel_class: np.array([np.nan if value is None else value for value in values], dtype=float) for steel_class, values in _strength_data.items()
+    }
+
     def __post_init__(self) -> None:
         """
         Validate the input parameters after initialization.
@@ -163,16 +171,125 @@ class Table3Dot1NominalValuesHotRolledStructuralSteel:
             If the steel class is not in the strength data dictionary
             If the thickness is not a positive number
         """
-        # Check if steel class is valid
-        if self.steel_class not in self._strength_data:
-            valid_classes = ", ".join([cls.name for cls in SteelStrengthClass])
-            error_msg = f"Invalid steel class: {self.steel_class}. Valid classes are: {valid_classes}"
-            raise ValueError(error_msg)
+        self._validate_steel_class(self.steel_class)
 
         # Check if thickness is positive
         if not isinstance(self.thickness, int | float) or self.thickness <= 0:
             raise ValueError(f"Thickness must be a positive number, got {self.thickness}")
 
+    @classmethod
+    def _validate_steel_class(cls, steel_class: SteelStrengthClass) -> None:
+        """Raise a ValueError if the steel class is not in the strength data dictionary."""
+        if steel_class not in cls._strength_data:
+            valid_classes = ", ".join([member.name for member in SteelStrengthClass])
+            error_msg = f"Invalid steel class: {steel_class}. Valid classes are: {valid_classes}"
+            raise ValueError(error_msg)
+
+    @classmethod
+    def _lookup(cls, steel_class: SteelStrengthClass, thickness: MM | npt.ArrayLike, column: int, name: str) -> MPA | npt.NDArray[np.float64]:
+        """Look up a strength for a thickness or an array of thicknesses, see `fy_lookup` and `fu_lookup`."""
+        cls._validate_steel_class(steel_class)
+
+        if np.ndim(thickness) == 0:
+            # scalar path: a dictionary lookup and a comparison, 0-d arrays are unwrapped to their value
+            scalar = np.asarray(thickness).item() if isinstance(thickness, np.ndarray) else thickness
+            if not isinstance(scalar, int | float | np.integer | np.floating) or float(scalar) <= 0:
+                raise ValueError(f"Thickness must be a positive number, got {scalar}")
+            value = float(scalar)
+            if value > 80:
+                raise ValueError(f"Thickness {scalar} mm exceeds maximum supported value of 80 mm")
+            # Choose value based on thickness (≤40 mm or >40 mm and ≤80 mm)
+            result = cls._strength_data[steel_class][column if value <= 40 else column + 2]
+            if result is None:
+                raise ValueError(
+                    f"{name} not specified for thickness > 40 mm for steel class '{steel_class.value}'. Check {cls.label} from {cls.source_document}."
+                )
+            return result
+
+        thicknesses = np.asarray(thickness, dtype=float)
+        if np.any(~(thicknesses > 0)):
+            raise ValueError(f"Thicknesses must be positive numbers, got {thicknesses[~(thicknesses > 0)]}")
+        if np.any(thicknesses > 80):
+            raise ValueError(f"Thicknesses {thicknesses[thicknesses > 80]} mm exceed maximum supported value of 80 mm")
+        values = cls._strength_arrays[steel_class]
+        results = np.where(thicknesses <= 40, values[column], values[column + 2])
+        if np.any(np.isnan(results)):
+            raise ValueError(
+                f"{name} not specified for thickness > 40 mm for steel class '{steel_class.value}'. Check {cls.label} from {cls.source_document}."
+            )
+        return results
+
+    @overload
+    @classmethod
+    def fy_lookup(cls, steel_class: SteelStrengthClass, thickness: MM) -> MPA: ...
+
+    @overload
+    @classmethod
+    def fy_lookup(cls, steel_class: SteelStrengthClass, thickness: npt.ArrayLike) -> npt.NDArray[np.float64]: ...
+
+    @classmethod
+    def fy_lookup(cls, steel_class: SteelStrengthClass, thickness: MM | npt.ArrayLike) -> MPA | npt.NDArray[np.float64]:
+        """
+        Get the yield strength (fy) for a steel class and a thickness or an array of thicknesses, without creating an instance.
+
+        Parameters
+        ----------
+        steel_class : SteelStrengthClass
+            The steel strength class according to EN standards
+        thickness : MM | npt.ArrayLike
+            The nominal thickness of the steel element in mm, or an array of thicknesses
+
+        Returns
+        -------
+        MPA | npt.NDArray[np.float64]
+            The yield strength in N/mm², an array with the same shape as the thicknesses for array input
+
+        Raises
+        ------
+        ValueError
+            If the steel class is invalid, a thickness is not positive or greater than 80 mm,
+            or the yield strength is not specified for a thickness
+
+        Examples
+        --------
+        >>> Table3Dot1NominalValuesHotRolledStructuralSteel.fy_lookup(SteelStrengthClass.S355, [10, 50])
+        array([355., 335.])
+        """
+        return cls._lookup(steel_class, thickness, column=0, name="Yield strength")
+
+    @overload
+    @classmethod
+    def fu_lookup(cls, steel_class: SteelStrengthClass, thickness: MM) -> MPA: ...
+
+    @overload
+    @classmethod
+    def fu_lookup(cls, steel_class: SteelStrengthClass, thickness: npt.ArrayLike) -> npt.NDArray[np.float64]: ...
+
+    @classmethod
+    def fu_lookup(cls, steel_class: SteelStrengthClass, thickness: MM | npt.ArrayLike) -> MPA | npt.NDArray[np.float64]:
+        """
+        Get the ultimate tensile strength (fu) for a steel class and a thickness or an array of thicknesses, without creating an instance.
+
+        Parameters
+        ----------
+        steel_class : SteelStrengthClass
+            The steel strength class according to EN standards
+        thickness : MM | npt.ArrayLike
+            The nominal thickness of the steel element in mm, or an array of thicknesses
+
+        Returns
+        -------
+        MPA | npt.NDArray[np.float64]
+            The ultimate tensile strength in N/mm², an array with the same shape as the thicknesses for array input
+
+        Raises
+        ------
+        ValueError
+            If the steel class is invalid, a thickness is not positive or greater than 80 mm,
+            or the ultimate tensile strength is not specified for a thickness
+        """
+        return cls._lookup(steel_class, thickness, column=1, name="Ultimate tensile strength")
+
     @property
     def fy(self) -> MPA:
         """
@@ -188,22 +305,7 @@ class Table3Dot1NominalValuesHotRolledStructuralSteel:
         ValueError
             If the thickness is greater than 80 mm
         """
-        # Check if thickness is within valid range (≤80 mm)
-        if self.thickness > 80:
-            raise ValueError(f"Thickness {self.thickness} mm exceeds maximum supported value of 80 mm")
-
-        strength_values = self._strength_data[self.steel_class]
-
-        # Choose value based on thickness (≤40 mm or >40 mm and ≤80 mm)
-        result = strength_values[0] if self.thickness <= 40 else strength_values[2]
-
-        if result is None:
-            raise ValueError(
-                f"Yield strength not specified for thickness > 40 mm for steel class '{self.steel_class.value}'. "
-                f"Check {self.label} from {self.source_document}."
-            )
-
-        return result
+        return self.fy_lookup(self.steel_class, self.thickness)
 
     @property
     def fu(self) -> MPA:
@@ -220,22 +322,7 @@ class Table3Dot1NominalValuesHotRolledStructuralSteel:
         ValueError
             If the thickness is greater than 80 mm
         """
-        # Check if thickness is within valid range (≤80 mm)
-        if self.thickness > 80:
-            raise ValueError(f"Thickness {self.thickness} mm exceeds maximum supported value of 80 mm")
-
-        strength_values = self._strength_data[self.steel_class]
-
-        # Choose value based on thickness (≤40 mm or >40 mm and ≤80 mm)
-        result = strength_values[1] if self.thickness <= 40 else strength_values[3]
-
-        if result is None:
-            raise ValueError(
-                f"Yield strength not specified for thickness > 40 mm for steel class '{self.steel_class.value}'. "
-                f"Check {self.label} from {self.source_document}."
-            )
-
-        return result
+        return self.fu_lookup(self.steel_class, self.thickness)
 
     def __str__(self) -> str:
         """
@@ -63,11 +63,11 @@ class FormEDot10ShearStressInLayer2(Formula):
         # Ensure that the input parameters have valid values
         raise_if_less_or_equal_to_zero(gamma_3=gamma_3, e_2=e_2, e_3=e_3, a_3=a_3, alpha_3=alpha_3, b_2=b_2, h_2=h_2, ei_ef=ei_ef)
 
-        return (gamma_3 * e_3 * a_3 * alpha_3 + 0.5 * e_2 * b_2 * ((alpha_2 + h_2) / 2) ** 2) * v_d / (ei_ef * b_2)
+        return (gamma_3 * e_3 * a_3 * alpha_3 + 0.5 * e_2 * b_2 * (h_2 / 2 + alpha_2) ** 2) * v_d / (ei_ef * b_2)
 
     def latex(self, n: int = 2) -> LatexFormula:
         """Returns LatexFormula object for formula E.10."""
-        eq_i = r"\left[\gamma_3 E_3 A_3 \alpha_3 + 0.5 E_2 b_2 \left(\frac{\alpha_2 + h_2}{2}\right)^2\right] \frac{V_d}{b_{2} EI_{ef}}"
+        eq_i = r"\left[\gamma_3 E_3 A_3 \alpha_3 + 0.5 E_2 b_2 \left(\frac{h_2}{2} + \alpha_2\right)^2\right] \frac{V_d}{b_{2} EI_{ef}}"
 
         repl_symb = {
             r"\gamma_3": rf"{self.gamma_3:.{n}f}",
@@ -16,7 +16,7 @@ class FormEDot5DistanceCentroidAlpha3(Formula):
     source_document = EN_1995_1_1_2023
 
     def __init__(self, h_2: MM, h_3: MM, alpha_2: MM) -> None:
-        r"""[$\alpha_3$] Distance between the centroid of the composite cross-section and the centroid of layer 1 of the cross-section.
+        r"""[$\alpha_3$] Distance between the centroid of the composite cross-section and the centroid of layer 3 of the cross-section.
 
         EN 1995-1-1:2023 art E.4(1) - Formula (E.5)
 
@@ -44,11 +44,11 @@ class FormEDot5DistanceCentroidAlpha3(Formula):
         # Ensure that the input parameters have valid values
         raise_if_less_or_equal_to_zero(h_2=h_2, h_3=h_3)
 
-        return (h_2 + h_3) / 2 - alpha_2
+        return (h_2 + h_3) / 2 + alpha_2
 
     def latex(self, n: int = 2) -> LatexFormula:
         """Returns LatexFormula object for formula E.5."""
-        eq_i = r"\frac{h_2 + h_3}{2} - \alpha_2"
+        eq_i = r"\frac{h_2 + h_3}{2} + \alpha_2"
 
         repl_symb = {r"h_2": rf"{self.h_2:.{n}f}", r"h_3": rf"{self.h_3:.{n}f}", r"\alpha_2": rf"\left({self.alpha_2:.{n}f}\right)"}
         numeric_eq = latex_replace_symbols(eq_i, repl_symb)
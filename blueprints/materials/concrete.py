@@ -2,11 +2,20 @@
 
 import math
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 
-from blueprints.type_alias import DIMENSIONLESS, KG_M3, MM, MPA, PER_DEGREE, PER_MILLE, PERCENTAGE
-from blueprints.unit_conversion import GPA_TO_MPA
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.materials.concrete_time_history import ConcreteTimeHistory
+from blueprints.materials.stress_strain_diagrams import BilinearConcreteDiagram, NonlinearConcreteDiagram, ParabolaRectangleDiagram
+from blueprints.type_alias import DAYS, DIMENSIONLESS, KG_M3, MM, MPA, PER_DEGREE, PER_MILLE, PERCENTAGE
+from blueprints.unit_conversion import GPA_TO_MPA, PER_MILLE_TO_RATIO
+
+type FloatArray = npt.NDArray[np.float64]
 
 
 class ConcreteAggregateType(Enum):
@@ -66,6 +75,149 @@ class CementType(Enum):
     CEM_V = "CEM V"
 
 
+@dataclass(frozen=True)
+class ConcreteStrengthClassProperties:
+    r"""Strength and deformation characteristics of a concrete strength class from table 3.1 of NEN-EN 1992-1-1.
+
+    These properties only depend on the strength class, see `CONCRETE_STRENGTH_CLASS_PROPERTIES` for the precomputed values of all
+    strength classes.
+
+    Parameters
+    ----------
+    f_ck: MPA
+        [$f_{ck}$] Characteristic compressive cylinder strength of concrete at 28 days [$MPa$].
+    f_ck_cube: MPA
+        [$f_{ck,cube}$] Characteristic compressive cubic strength of concrete at 28 days [$MPa$].
+    f_cm: MPA
+        [$f_{cm}$] Mean value of concrete cylinder compressive strength [$MPa$].
+    f_cm_cube: MPA
+        [$f_{cm,cube}$] Mean value of concrete cubic compressive strength [$MPa$].
+    f_ctm: MPA
+        [$f_{ctm}$] Mean value of axial tensile strength of concrete [$MPa$].
+    f_ctk_0_05: MPA
+        [$f_{ctk,0.05}$] Axial tensile strength of concrete, 5% fractile [$MPa$].
+    f_ctk_0_95: MPA
+        [$f_{ctk,0.95}$] Axial tensile strength of concrete, 95% fractile [$MPa$].
+    e_cm: MPA
+        [$E_{cm}$] Secant modulus of elasticity of concrete [$MPa$].
+    eps_c1: PER_MILLE
+        [$\epsilon_{c1}$] Compressive strain in the concrete at the peak stress [$‰$].
+    eps_cu1: PER_MILLE
+        [$\epsilon_{cu1}$] Nominal ultimate compressive strain in the concrete [$‰$].
+    eps_c2: PER_MILLE
+        [$\epsilon_{c2}$] Compressive strain at reaching the maximum strength of the parabola-rectangle diagram [$‰$].
+    eps_cu2: PER_MILLE
+        [$\epsilon_{cu2}$] Ultimate compressive strain of the parabola-rectangle diagram [$‰$].
+    n_factor: DIMENSIONLESS
+        [$n$] Exponent of the parabola-rectangle diagram [$-$].
+    eps_c3: PER_MILLE
+        [$\epsilon_{c3}$] Compressive strain at reaching the maximum strength of the bi-linear diagram [$‰$].
+    eps_cu3: PER_MILLE
+        [$\epsilon_{cu3}$] Ultimate compressive strain of the bi-linear diagram [$‰$].
+    """
+
+    f_ck: MPA
+    f_ck_cube: MPA
+    f_cm: MPA
+    f_cm_cube: MPA
+    f_ctm: MPA
+    f_ctk_0_05: MPA
+    f_ctk_0_95: MPA
+    e_cm: MPA
+    eps_c1: PER_MILLE
+    eps_cu1: PER_MILLE
+    eps_c2: PER_MILLE
+    eps_cu2: PER_MILLE
+    n_factor: DIMENSIONLESS
+    eps_c3: PER_MILLE
+    eps_cu3: PER_MILLE
+
+    @classmethod
+    def from_concrete_class(cls, concrete_class: ConcreteStrengthClass) -> "ConcreteStrengthClassProperties":
+        """Calculate the properties of a concrete strength class with the analytical relations of table 3.1 of NEN-EN 1992-1-1.
+
+        Parameters
+        ----------
+        concrete_class: ConcreteStrengthClass
+            Concrete strength class, for example C30/37.
+
+        Returns
+        -------
+        ConcreteStrengthClassProperties
+            The properties of the strength class.
+
+        Raises
+        ------
+        ValueError
+            If the strengths cannot be read from the name of the strength class.
+        """
+        value = concrete_class.value
+        if not (match_cylinder := re.search(pattern=r"C(\d+)/", string=value)):
+            raise ValueError("No match found for f_ck. Concrete class is invalid.")
+        if not (match_cube := re.search(pattern=r"/(\d+)", string=value)):
+            raise ValueError("No match found for f_ck_cube. Concrete class is invalid.")
+        f_ck = int(match_cylinder.group(1))
+        f_ck_cube = int(match_cube.group(1))
+        f_cm = f_ck + 8
+        f_ctm = 0.30 * f_ck ** (2 / 3) if f_ck <= 50 else 2.12 * math.log(1 + (f_cm / 10))
+        high_strength = f_ck >= 50
+        return cls(
+            f_ck=f_ck,
+            f_ck_cube=f_ck_cube,
+            f_cm=f_cm,
+            f_cm_cube=f_ck_cube + 8,
+            f_ctm=f_ctm,
+            f_ctk_0_05=f_ctm * 0.7,
+            f_ctk_0_95=f_ctm * 1.3,
+            e_cm=int(22 * ((f_cm / 10) ** 0.3) * GPA_TO_MPA),
+            eps_c1=min(0.7 * f_cm**0.31, 2.8),
+            eps_cu1=2.8 + 27 * ((98 - f_cm) / 100) ** 4 if high_strength else 3.5,
+            eps_c2=2.0 + 0.085 * (f_ck - 50) ** 0.53 if high_strength else 2.0,
+            eps_cu2=2.6 + 35 * ((90 - f_ck) / 100) ** 4 if high_strength else 3.5,
+            n_factor=1.4 + 23.4 * ((90 - f_ck) / 100) ** 4 if high_strength else 2.0,
+            eps_c3=1.75 + 0.55 * ((f_ck - 50) / 40) if high_strength else 1.75,
+            eps_cu3=2.6 + 35 * ((90 - f_ck) / 100) ** 4 if high_strength else 3.5,
+        )
+
+
+CONCRETE_STRENGTH_CLASS_PROPERTIES: dict[ConcreteStrengthClass, ConcreteStrengthClassProperties] = {
+    concrete_class: ConcreteStrengthClassProperties.from_concrete_class(concrete_class) for concrete_class in ConcreteStrengthClass
+}
+"""Precomputed properties of table 3.1 of NEN-EN 1992-1-1 for every concrete strength class."""
+
+_CONCRETE_CLASS_INDEX = {concrete_class: index for index, concrete_class in enumerate(ConcreteStrengthClass)}
+_CONCRETE_PROPERTY_COLUMNS: dict[str, FloatArray] = {
+    name: np.array([getattr(properties, name) for properties in CONCRETE_STRENGTH_CLASS_PROPERTIES.values()], dtype=np.float64)
+    for name in ConcreteStrengthClassProperties.__dataclass_fields__
+}
+
+
+def concrete_property_array(concrete_classes: Iterable[ConcreteStrengthClass], name: str) -> FloatArray:
+    """Return a property of table 3.1 of NEN-EN 1992-1-1 for every given concrete strength class.
+
+    Parameters
+    ----------
+    concrete_classes: Iterable[ConcreteStrengthClass]
+        Concrete strength classes, for example of all elements of a model.
+    name: str
+        Name of the property, one of the fields of `ConcreteStrengthClassProperties`, for example "f_ck" or "e_cm".
+
+    Returns
+    -------
+    FloatArray
+        The property of every concrete strength class, in the order of the given classes.
+
+    Raises
+    ------
+    ValueError
+        If the property is unknown.
+    """
+    if name not in _CONCRETE_PROPERTY_COLUMNS:
+        raise ValueError(f"Unknown concrete property '{name}', must be one of {', '.join(_CONCRETE_PROPERTY_COLUMNS)}.")
+    indices = np.fromiter((_CONCRETE_CLASS_INDEX[concrete_class] for concrete_class in concrete_classes), dtype=np.intp)
+    return _CONCRETE_PROPERTY_COLUMNS[name][indices]
+
+
 @dataclass(frozen=True)
 class ConcreteMaterial:
     r"""Representation of the strength and deformation characteristics for concrete material based on the analytical
@@ -114,6 +266,19 @@ class ConcreteMaterial:
     custom_name: str | None = field(default=None, compare=False)
     custom_e_c: MPA | None = field(default=None, metadata={"unit": "MPa"})
 
+    @cached_property
+    def strength_class_properties(self) -> ConcreteStrengthClassProperties:
+        """Properties of table 3.1 of NEN-EN 1992-1-1 of the concrete strength class, looked up once per material.
+
+        Returns
+        -------
+        ConcreteStrengthClassProperties
+            The precomputed properties of the concrete strength class.
+        """
+        if properties := CONCRETE_STRENGTH_CLASS_PROPERTIES.get(self.concrete_class):
+            return properties
+        return ConcreteStrengthClassProperties.from_concrete_class(self.concrete_class)
+
     @property
     def name(self) -> str:
         """Name of the concrete material.
@@ -151,10 +316,7 @@ class ConcreteMaterial:
         MPA
             Example: 30 (for C30/37)
         """
-        value = self.concrete_class.value
-        if match := re.search(pattern=r"C(\d+)/", string=value):
-            return int(match.group(1))
-        raise ValueError("No match found for f_ck. Concrete class is invalid.")
+        return self.strength_class_properties.f_ck
 
     @property
     def f_ck_cube(self) -> MPA:
@@ -165,10 +327,7 @@ class ConcreteMaterial:
         MPA
             Example: 37 (for C30/37)
         """
-        value = self.concrete_class.value
-        if match := re.search(pattern=r"/(\d+)", string=value):
-            return int(match.group(1))
-        raise ValueError("No match found for f_ck_cube. Concrete class is invalid.")
+        return self.strength_class_properties.f_ck_cube
 
     @property
     def f_cd(self) -> MPA:
@@ -190,7 +349,7 @@ class ConcreteMaterial:
         MPA
             Example: 38 (for C30/37)
         """
-        return self.f_ck + 8
+        return self.strength_class_properties.f_cm
 
     @property
     def f_cm_cube(self) -> MPA:
@@ -201,7 +360,7 @@ class ConcreteMaterial:
         MPA
             Example: 45 (for C30/37)
         """
-        return self.f_ck_cube + 8
+        return self.strength_class_properties.f_cm_cube
 
     @property
     def f_ctm(self) -> MPA:
@@ -212,9 +371,7 @@ class ConcreteMaterial:
         MPA
             Example: 2.896468153816889 (for C30/37)
         """
-        if self.f_ck <= 50:
-            return 0.30 * self.f_ck ** (2 / 3)
-        return 2.12 * math.log(1 + (self.f_cm / 10))
+        return self.strength_class_properties.f_ctm
 
     @property
     def sigma_cr(self) -> MPA:
@@ -247,7 +404,7 @@ class ConcreteMaterial:
         MPA
             Example: 2.027527707671822 (for C30/37)
         """
-        return self.f_ctm * 0.7
+        return self.strength_class_properties.f_ctk_0_05
 
     @property
     def f_ctd(self) -> MPA:
@@ -269,7 +426,7 @@ class ConcreteMaterial:
         MPA
             Example: 3.765408599961956 (for C30/37)
         """
-        return self.f_ctm * 1.3
+        return self.strength_class_properties.f_ctk_0_95
 
     @property
     def e_cm(self) -> MPA:
@@ -280,7 +437,7 @@ class ConcreteMaterial:
         MPA
             Example: 32836 (for C30/37)
         """
-        return int(22 * ((self.f_cm / 10) ** 0.3) * GPA_TO_MPA)
+        return self.strength_class_properties.e_cm
 
     @property
     def custom_e_c_present(self) -> bool:
@@ -303,7 +460,7 @@ class ConcreteMaterial:
         PER_MILLE
             Example: 2.1618768697354804 (for C30/37)
         """
-        return min(0.7 * self.f_cm**0.31, 2.8)
+        return self.strength_class_properties.eps_c1
 
     @property
     def eps_cu1(self) -> PER_MILLE:
@@ -314,9 +471,7 @@ class ConcreteMaterial:
         PER_MILLE
             Example: 3.5 (for C30/37)
         """
-        if self.f_ck >= 50:
-            return 2.8 + 27 * ((98 - self.f_cm) / 100) ** 4
-        return 3.5
+        return self.strength_class_properties.eps_cu1
 
     @property
     def eps_c2(self) -> PER_MILLE:
@@ -328,9 +483,7 @@ class ConcreteMaterial:
         PER_MILLE
             Example: 2.0 (for C30/37)
         """
-        if self.f_ck >= 50:
-            return 2.0 + 0.085 * (self.f_ck - 50) ** 0.53
-        return 2.0
+        return self.strength_class_properties.eps_c2
 
     @property
     def eps_cu2(self) -> PER_MILLE:
@@ -342,9 +495,7 @@ class ConcreteMaterial:
         PER_MILLE
             Example: 3.5 (for C30/37)
         """
-        if self.f_ck >= 50:
-            return 2.6 + 35 * ((90 - self.f_ck) / 100) ** 4
-        return 3.5
+        return self.strength_class_properties.eps_cu2
 
     @property
     def n_factor(self) -> DIMENSIONLESS:
@@ -355,9 +506,7 @@ class ConcreteMaterial:
         DIMENSIONLESS
             Example: 2.0 (for C30/37)
         """
-        if self.f_ck >= 50:
-            return 1.4 + 23.4 * ((90 - self.f_ck) / 100) ** 4
-        return 2.0
+        return self.strength_class_properties.n_factor
 
     @property
     def eps_c3(self) -> PER_MILLE:
@@ -370,9 +519,7 @@ class ConcreteMaterial:
         PER_MILLE
             Example: 1.75 (for C30/37)
         """
-        if self.f_ck >= 50:
-            return 1.75 + 0.55 * ((self.f_ck - 50) / 40)
-        return 1.75
+        return self.strength_class_properties.eps_c3
 
     @property
     def eps_cu3(self) -> PER_MILLE:
@@ -385,9 +532,7 @@ class ConcreteMaterial:
         PER_MILLE
             Example: 3.5 (for C30/37)
         """
-        if self.f_ck >= 50:
-            return 2.6 + 35 * ((90 - self.f_ck) / 100) ** 4
-        return 3.5
+        return self.strength_class_properties.eps_cu3
 
     def rho_min(self, f_yd: MPA) -> PERCENTAGE:
         r"""[$\rho_{min}$] Minimum reinforcement ratio (CB2, 7de druk 2011, pag.55) [$%$].
@@ -402,3 +547,82 @@ class ConcreteMaterial:
         PERCENTAGE
         """
         return (0.223 * (self.f_ctm / f_yd)) * 100
+
+    def time_history(self, h_0: MM, relative_humidity: PERCENTAGE, t_s: DAYS) -> ConcreteTimeHistory:
+        r"""Development of the strength and stiffness, creep and shrinkage of this material for arrays of ages (art.3.1.2 - 3.1.4, Annex B).
+
+        Parameters
+        ----------
+        h_0: MM
+            [$h_0$] Notional size of the cross-section, [$2 A_c / u$] [$mm$].
+        relative_humidity: PERCENTAGE
+            [$RH$] Relative humidity of the ambient environment [$\%$].
+        t_s: DAYS
+            [$t_s$] Age of the concrete at the beginning of drying shrinkage [$days$].
+
+        Returns
+        -------
+        ConcreteTimeHistory
+            Time history with the factors that do not depend on the age calculated once.
+        """
+        return ConcreteTimeHistory(material=self, h_0=h_0, relative_humidity=relative_humidity, t_s=t_s)
+
+    @cached_property
+    def parabola_rectangle_diagram(self) -> ParabolaRectangleDiagram:
+        r"""Parabola-rectangle diagram with the design compressive strength for the design of cross-sections (art.3.1.7 (1)).
+
+        Returns
+        -------
+        ParabolaRectangleDiagram
+            Diagram with [$f_{cd}$], [$\epsilon_{c2}$], [$\epsilon_{cu2}$] and [$n$] of this material.
+        """
+        return ParabolaRectangleDiagram(
+            f_c=self.f_cd, eps_c2=self.eps_c2 * PER_MILLE_TO_RATIO, eps_cu2=self.eps_cu2 * PER_MILLE_TO_RATIO, n=self.n_factor
+        )
+
+    @cached_property
+    def bilinear_diagram(self) -> BilinearConcreteDiagram:
+        r"""Bi-linear diagram with the design compressive strength for the design of cross-sections (art.3.1.7 (2)).
+
+        Returns
+        -------
+        BilinearConcreteDiagram
+            Diagram with [$f_{cd}$], [$\epsilon_{c3}$] and [$\epsilon_{cu3}$] of this material.
+        """
+        return BilinearConcreteDiagram(f_c=self.f_cd, eps_c3=self.eps_c3 * PER_MILLE_TO_RATIO, eps_cu3=self.eps_cu3 * PER_MILLE_TO_RATIO)
+
+    @cached_property
+    def nonlinear_diagram(self) -> NonlinearConcreteDiagram:
+        r"""Diagram of formula 3.14 with mean properties for non-linear structural analysis (art.3.1.5 (1)).
+
+        Returns
+        -------
+        NonlinearConcreteDiagram
+            Diagram with [$f_{cm}$], [$E_{cm}$], [$\epsilon_{c1}$] and [$\epsilon_{cu1}$] of this material.
+        """
+        return NonlinearConcreteDiagram(
+            f_cm=self.f_cm, e_cm=self.e_cm, eps_c1=self.eps_c1 * PER_MILLE_TO_RATIO, eps_cu1=self.eps_cu1 * PER_MILLE_TO_RATIO
+        )
+
+    @cached_property
+    def design_diagram(self) -> ParabolaRectangleDiagram | BilinearConcreteDiagram:
+        """Design stress-strain diagram for the diagram type of the material, created once per material.
+
+        Returns
+        -------
+        ParabolaRectangleDiagram | BilinearConcreteDiagram
+            The parabola-rectangle or bi-linear diagram.
+
+        Raises
+        ------
+        NotImplementedError
+            If the diagram type is user defined.
+        """
+        match self.diagram_type:
+            case DiagramType.PARABOLIC:
+                return self.parabola_rectangle_diagram
+            case DiagramType.BILINEAR:
+                return self.bilinear_diagram
+            case _:
+                msg = f"The concrete stress-strain diagram {self.diagram_type.value} has not been implemented yet."
+                raise NotImplementedError(msg)
@@ -0,0 +1,360 @@
+r"""Time-dependent properties of concrete for arrays of ages, EN 1992-1-1:2004 art.3.1.2 - 3.1.4 and Annex B.
+
+All methods accept arrays of ages in days and return arrays of the same shape, the creep methods broadcast the ages [$t$] and
+the ages at loading [$t_0$] against each other. The factors that do not depend on the age are calculated once, when the time
+history is created with `ConcreteMaterial.time_history`.
+
+Strengths and stiffnesses are in MPa. Creep and shrinkage strains are ratios [$-$] with positive values for shortening, as in
+the formulas of EN 1992-1-1. The ages are the ages at a temperature of 20 °C, the temperature adjustment of formula (B.10) is not
+included.
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.type_alias import DAYS, DIMENSIONLESS, MM, PERCENTAGE
+
+if TYPE_CHECKING:
+    from blueprints.materials.concrete import ConcreteMaterial
+
+type FloatArray = npt.NDArray[np.float64]
+
+REFERENCE_AGE = 28.0
+"""Age at which the strengths and the modulus of elasticity of table 3.1 are reached [days]."""
+
+
+@dataclass(frozen=True)
+class CementClassCoefficients:
+    r"""Coefficients of a cement class for the development of strength, creep and drying shrinkage.
+
+    Parameters
+    ----------
+    s : DIMENSIONLESS
+        [$s$] Coefficient of formula (3.2) [$-$].
+    alpha : DIMENSIONLESS
+        [$\alpha$] Exponent of formula (B.9) for the age at loading [$-$].
+    alpha_ds1 : DIMENSIONLESS
+        [$\alpha_{ds1}$] Coefficient of formula (B.11) [$-$].
+    alpha_ds2 : DIMENSIONLESS
+        [$\alpha_{ds2}$] Coefficient of formula (B.11) [$-$].
+    """
+
+    s: DIMENSIONLESS
+    alpha: DIMENSIONLESS
+    alpha_ds1: DIMENSIONLESS
+    alpha_ds2: DIMENSIONLESS
+
+
+CEMENT_CLASS_COEFFICIENTS: dict[str, CementClassCoefficients] = {
+    "S": CementClassCoefficients(s=0.38, alpha=-1.0, alpha_ds1=3.0, alpha_ds2=0.13),
+    "N": CementClassCoefficients(s=0.25, alpha=0.0, alpha_ds1=4.0, alpha_ds2=0.12),
+    "R": CementClassCoefficients(s=0.20, alpha=1.0, alpha_ds1=6.0, alpha_ds2=0.11),
+}
+"""Coefficients of art.3.1.2 (6), B.1 (2) and B.2 (1) by cement class."""
+
+_K_H_NOTIONAL_SIZES = np.array([100.0, 200.0, 300.0, 500.0])
+_K_H_VALUES = np.array([1.0, 0.85, 0.75, 0.70])
+
+
+def _ages(t: npt.ArrayLike, name: str = "t") -> FloatArray:
+    """Convert ages to an array and check that they are positive."""
+    ages = np.asarray(t, dtype=float)
+    if np.any(ages <= 0):
+        raise ValueError(f"Invalid {name}: all ages must be positive.")
+    return ages
+
+
+@dataclass(frozen=True, eq=False)
+class ConcreteTimeHistory:
+    r"""Development of the strength and stiffness, creep and shrinkage of a concrete material over time.
+
+    The cement class of the material gives the coefficients of formulas (3.2), (B.9) and (B.11). The cement type does not appear
+    in these formulas, the cement class of the material should match the cement type (for example class S for CEM III/B).
+
+    Parameters
+    ----------
+    material : ConcreteMaterial
+        The concrete material.
+    h_0 : MM
+        [$h_0$] Notional size of the cross-section, [$2 A_c / u$] (formula (3.10) and (B.6)) [$mm$].
+    relative_humidity : PERCENTAGE
+        [$RH$] Relative humidity of the ambient environment [$\%$].
+    t_s : DAYS
+        [$t_s$] Age of the concrete at the beginning of drying shrinkage, normally the end of curing [$days$].
+    """
+
+    material: "ConcreteMaterial"
+    h_0: MM
+    relative_humidity: PERCENTAGE
+    t_s: DAYS
+    cement: CementClassCoefficients = field(init=False, repr=False)
+    """Coefficients of the cement class of the material."""
+    phi_rh: DIMENSIONLESS = field(init=False, repr=False)
+    r"""[$\varphi_{RH}$] Factor for the relative humidity on the notional creep coefficient, formula (B.3) [$-$]."""
+    beta_f_cm: DIMENSIONLESS = field(init=False, repr=False)
+    r"""[$\beta(f_{cm})$] Factor for the concrete strength on the notional creep coefficient, formula (B.4) [$-$]."""
+    beta_h: DAYS = field(init=False, repr=False)
+    r"""[$\beta_H$] Coefficient for the relative humidity and the notional size, formula (B.8) [$days$]."""
+    epsilon_cd_0: DIMENSIONLESS = field(init=False, repr=False)
+    r"""[$\varepsilon_{cd,0}$] Nominal unrestrained drying shrinkage, formula (B.11) [$-$]."""
+    k_h: DIMENSIONLESS = field(init=False, repr=False)
+    r"""[$k_h$] Coefficient for the notional size, table 3.3 [$-$]."""
+    epsilon_ca_inf: DIMENSIONLESS = field(init=False, repr=False)
+    r"""[$\varepsilon_{ca}(\infty)$] Final autogenous shrinkage, formula (3.12) [$-$]."""
+
+    def __post_init__(self) -> None:
+        """Validate the parameters and calculate the factors that do not depend on the age."""
+        if self.h_0 <= 0:
+            raise ValueError(f"Invalid h_0: {self.h_0}. h_0 cannot be negative or zero")
+        if not 0 < self.relative_humidity <= 100:
+            raise ValueError(f"Invalid relative_humidity: {self.relative_humidity}. It must be larger than 0 and at most 100")
+        if self.t_s < 0:
+            raise ValueError(f"Negative t_s: {self.t_s}. t_s cannot be negative")
+        cement_class = self.material.cement_class.value
+        if cement_class not in CEMENT_CLASS_COEFFICIENTS:
+            raise ValueError(f"Invalid cement class: {cement_class}. Options: 'R', 'N' or 'S'")
+        object.__setattr__(self, "cement", CEMENT_CLASS_COEFFICIENTS[cement_class])
+
+        f_cm = self.material.f_cm
+        alpha_1, alpha_2, alpha_3 = (35 / f_cm) ** 0.7, (35 / f_cm) ** 0.2, (35 / f_cm) ** 0.5
+        humidity_term = (1 - self.relative_humidity / 100) / (0.1 * self.h_0 ** (1 / 3))
+        beta_h = 1.5 * (1 + (0.012 * self.relative_humidity) ** 18) * self.h_0
+        if f_cm <= 35:
+            object.__setattr__(self, "phi_rh", 1 + humidity_term)
+            object.__setattr__(self, "beta_h", min(beta_h + 250, 1500.0))
+        else:
+            object.__setattr__(self, "phi_rh", (1 + humidity_term * alpha_1) * alpha_2)
+            object.__setattr__(self, "beta_h", min(beta_h + 250 * alpha_3, 1500 * alpha_3))
+        object.__setattr__(self, "beta_f_cm", 16.8 / np.sqrt(f_cm))
+
+        beta_rh = 1.55 * (1 - (self.relative_humidity / 100) ** 3)
+        epsilon_cd_0 = 0.85 * (220 + 110 * self.cement.alpha_ds1) * np.exp(-self.cement.alpha_ds2 * f_cm / 10) * 1e-6 * beta_rh
+        object.__setattr__(self, "epsilon_cd_0", float(epsilon_cd_0))
+        object.__setattr__(self, "k_h", float(np.interp(self.h_0, _K_H_NOTIONAL_SIZES, _K_H_VALUES)))
+        object.__setattr__(self, "epsilon_ca_inf", 2.5 * (self.material.f_ck - 10) * 1e-6)
+
+    def beta_cc(self, t: npt.ArrayLike) -> FloatArray:
+        r"""[$\beta_{cc}(t)$] Coefficient for the age of the concrete, formula (3.2) [$-$].
+
+        Parameters
+        ----------
+        t : npt.ArrayLike
+            [$t$] Ages of the concrete [$days$].
+
+        Returns
+        -------
+        FloatArray
+            Coefficients for the ages.
+        """
+        return np.exp(self.cement.s * (1 - np.sqrt(REFERENCE_AGE / _ages(t))))
+
+    def f_cm(self, t: npt.ArrayLike) -> FloatArray:
+        r"""[$f_{cm}(t)$] Mean compressive strength at the age t, formula (3.1) [$MPa$].
+
+        Parameters
+        ----------
+        t : npt.ArrayLike
+            [$t$] Ages of the concrete [$days$].
+
+        Returns
+        -------
+        FloatArray
+            Mean compressive strengths at the ages.
+        """
+        return self.beta_cc(t) * self.material.f_cm
+
+    def f_ck(self, t: npt.ArrayLike) -> FloatArray:
+        r"""[$f_{ck}(t)$] Characteristic compressive strength at the age t, art.3.1.2 (5) [$MPa$].
+
+        [$f_{cm}(t) - 8$] before 28 days and [$f_{ck}$] from 28 days.
+
+        Parameters
+        ----------
+        t : npt.ArrayLike
+            [$t$] Ages of the concrete [$days$].
+
+        Returns
+        -------
+        FloatArray
+            Characteristic compressive strengths at the ages.
+        """
+        ages = _ages(t)
+        return np.where(ages < REFERENCE_AGE, self.f_cm(ages) - 8, float(self.material.f_ck))
+
+    def f_ctm(self, t: npt.ArrayLike) -> FloatArray:
+        r"""[$f_{ctm}(t)$] Mean tensile strength at the age t, formula (3.4) [$MPa$].
+
+        Parameters
+        ----------
+        t : npt.ArrayLike
+            [$t$] Ages of the concrete [$days$].
+
+        Returns
+        -------
+        FloatArray
+            Mean tensile strengths at the ages.
+        """
+        ages = _ages(t)
+        alpha = np.where(ages < REFERENCE_AGE, 1.0, 2 / 3)
+        return self.beta_cc(ages) ** alpha * self.material.f_ctm
+
+    def e_cm(self, t: npt.ArrayLike) -> FloatArray:
+        r"""[$E_{cm}(t)$] Modulus of elasticity at the age t, formula (3.5) [$MPa$].
+
+        Parameters
+        ----------
+        t : npt.ArrayLike
+            [$t$] Ages of the concrete [$days$].
+
+        Returns
+        -------
+        FloatArray
+            Moduli of elasticity at the ages.
+        """
+        return self.beta_cc(t) ** 0.3 * self.material.e_cm
+
+    def adjusted_loading_age(self, t_0: npt.ArrayLike) -> FloatArray:
+        r"""[$t_0$] Age at loading adjusted for the cement class, formula (B.9) [$days$].
+
+        Parameters
+        ----------
+        t_0 : npt.ArrayLike
+            [$t_{0,T}$] Ages of the concrete at loading [$days$].
+
+        Returns
+        -------
+        FloatArray
+            Adjusted ages at loading, at least 0.5 days.
+        """
+        t_0 = _ages(t_0, name="t_0")
+        return np.maximum(t_0 * (9 / (2 + t_0**1.2) + 1) ** self.cement.alpha, 0.5)
+
+    def notional_creep_coefficient(self, t_0: npt.ArrayLike) -> FloatArray:
+        r"""[$\varphi_0$] Notional creep coefficient, the final creep coefficient [$\varphi(\infty, t_0)$], formula (B.2) [$-$].
+
+        Parameters
+        ----------
+        t_0 : npt.ArrayLike
+            [$t_0$] Ages of the concrete at loading [$days$].
+
+        Returns
+        -------
+        FloatArray
+            Notional creep coefficients for the ages at loading.
+        """
+        beta_t_0 = 1 / (0.1 + self.adjusted_loading_age(t_0) ** 0.20)
+        return self.phi_rh * self.beta_f_cm * beta_t_0
+
+    def creep_coefficient(self, t: npt.ArrayLike, t_0: npt.ArrayLike) -> FloatArray:
+        r"""[$\varphi(t, t_0)$] Creep coefficient, formulas (B.1) and (B.7) [$-$].
+
+        Parameters
+        ----------
+        t : npt.ArrayLike
+            [$t$] Ages of the concrete [$days$].
+        t_0 : npt.ArrayLike
+            [$t_0$] Ages of the concrete at loading, broadcast against the ages [$days$].
+
+        Returns
+        -------
+        FloatArray
+            Creep coefficients, zero before loading.
+        """
+        t, t_0 = _ages(t), _ages(t_0, name="t_0")
+        duration = np.clip(t - t_0, 0.0, None)
+        beta_c = (duration / (self.beta_h + duration)) ** 0.3
+        return self.notional_creep_coefficient(t_0) * beta_c
+
+    def nonlinear_creep_coefficient(self, t: npt.ArrayLike, t_0: npt.ArrayLike, sigma_c: npt.ArrayLike) -> FloatArray:
+        r"""[$\varphi_{nl}(t, t_0)$] Creep coefficient including non-linear creep above [$0.45 f_{ck}(t_0)$], formula (3.7) [$-$].
+
+        Parameters
+        ----------
+        t : npt.ArrayLike
+            [$t$] Ages of the concrete [$days$].
+        t_0 : npt.ArrayLike
+            [$t_0$] Ages of the concrete at loading, broadcast against the ages [$days$].
+        sigma_c : npt.ArrayLike
+            [$\sigma_c$] Constant compressive stresses from the loading age, broadcast against the ages [$MPa$].
+
+        Returns
+        -------
+        FloatArray
+            Creep coefficients, equal to [$\varphi(t, t_0)$] for stress-strength ratios [$k_\sigma$] up to 0.45.
+        """
+        sigma_c = np.asarray(sigma_c, dtype=float)
+        if np.any(sigma_c < 0):
+            raise ValueError("Negative sigma_c: compressive stresses are positive in formula (3.7).")
+        k_sigma = sigma_c / self.f_ck(t_0)
+        return self.creep_coefficient(t, t_0) * np.exp(1.5 * np.clip(k_sigma - 0.45, 0.0, None))
+
+    def creep_strain(self, t: npt.ArrayLike, t_0: npt.ArrayLike, sigma_c: npt.ArrayLike) -> FloatArray:
+        r"""[$\varepsilon_{cc}(t, t_0)$] Creep strain for a constant compressive stress, formula (3.6) [$-$].
+
+        The tangent modulus is [$E_c = 1.05 E_{cm}$] (art.3.1.4 (2)) and non-linear creep is included above [$0.45 f_{ck}(t_0)$].
+
+        Parameters
+        ----------
+        t : npt.ArrayLike
+            [$t$] Ages of the concrete [$days$].
+        t_0 : npt.ArrayLike
+            [$t_0$] Ages of the concrete at loading, broadcast against the ages [$days$].
+        sigma_c : npt.ArrayLike
+            [$\sigma_c$] Constant compressive stresses from the loading age, broadcast against the ages [$MPa$].
+
+        Returns
+        -------
+        FloatArray
+            Creep strains, positive for shortening.
+        """
+        return self.nonlinear_creep_coefficient(t, t_0, sigma_c) * np.asarray(sigma_c, dtype=float) / (1.05 * self.material.e_cm)
+
+    def autogenous_shrinkage(self, t: npt.ArrayLike) -> FloatArray:
+        r"""[$\varepsilon_{ca}(t)$] Autogenous shrinkage strain, formulas (3.11) and (3.13) [$-$].
+
+        Parameters
+        ----------
+        t : npt.ArrayLike
+            [$t$] Ages of the concrete [$days$].
+
+        Returns
+        -------
+        FloatArray
+            Autogenous shrinkage strains, positive for shortening.
+        """
+        return (1 - np.exp(-0.2 * np.sqrt(_ages(t)))) * self.epsilon_ca_inf
+
+    def drying_shrinkage(self, t: npt.ArrayLike) -> FloatArray:
+        r"""[$\varepsilon_{cd}(t)$] Drying shrinkage strain, formulas (3.9) and (3.10) [$-$].
+
+        Parameters
+        ----------
+        t : npt.ArrayLike
+            [$t$] Ages of the concrete [$days$].
+
+        Returns
+        -------
+        FloatArray
+            Drying shrinkage strains, positive for shortening and zero before the beginning of drying.
+        """
+        drying = np.clip(_ages(t) - self.t_s, 0.0, None)
+        beta_ds = drying / (drying + 0.04 * np.sqrt(self.h_0**3))
+        return beta_ds * self.k_h * self.epsilon_cd_0
+
+    def total_shrinkage(self, t: npt.ArrayLike) -> FloatArray:
+        r"""[$\varepsilon_{cs}(t)$] Total shrinkage strain, formula (3.8) [$-$].
+
+        Parameters
+        ----------
+        t : npt.ArrayLike
+            [$t$] Ages of the concrete [$days$].
+
+        Returns
+        -------
+        FloatArray
+            Total shrinkage strains, positive for shortening.
+        """
+        return self.drying_shrinkage(t) + self.autogenous_shrinkage(t)
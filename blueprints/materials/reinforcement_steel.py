@@ -1,9 +1,18 @@
 """Module for reinforcement steel material properties."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.materials.stress_strain_diagrams import BilinearSteelDiagram
 from blueprints.type_alias import DIMENSIONLESS, KG_M3, MPA, PER_MILLE
+from blueprints.unit_conversion import PER_MILLE_TO_RATIO
+
+type FloatArray = npt.NDArray[np.float64]
 
 REBAR_STEEL_YOUNG_MODULUS = 200_000.0  # [MPa] from EN 1992-1-1 3.2.7(4)
 
@@ -63,6 +72,104 @@ class ReinforcementDiagramType(Enum):
     USER = "User-defined"
 
 
+@dataclass(frozen=True)
+class ReinforcementSteelQualityProperties:
+    r"""Properties of a reinforcement steel quality from table C.1 Annex C of EN 1992-1-1:2004.
+
+    These properties only depend on the steel quality, see `REINFORCEMENT_STEEL_QUALITY_PROPERTIES` for the precomputed values of all
+    steel qualities.
+
+    Parameters
+    ----------
+    f_yk: MPA
+        [$f_{yk}$] Characteristic yield strength of reinforcement [$MPa$].
+    steel_class: str
+        Reinforcement class, for example "B".
+    ductility_factor_k: DIMENSIONLESS
+        Ductility factor k ([$f_{tk}$] / [$f_{yk}$]) [$-$].
+    f_tk: MPA
+        [$f_{tk}$] Characteristic tensile strength of reinforcement [$MPa$].
+    eps_uk: PER_MILLE
+        [$\varepsilon_{uk}$] Characteristic strain of reinforcement at max. load [$‰$ (per mille)].
+    """
+
+    f_yk: MPA
+    steel_class: str
+    ductility_factor_k: DIMENSIONLESS
+    f_tk: MPA
+    eps_uk: PER_MILLE
+
+    @classmethod
+    def from_steel_quality(cls, steel_quality: ReinforcementSteelQuality) -> "ReinforcementSteelQualityProperties":
+        """Determine the properties of a steel quality from its name and table C.1 Annex C of EN 1992-1-1:2004.
+
+        Parameters
+        ----------
+        steel_quality: ReinforcementSteelQuality
+            Steel quality, for example B500B.
+
+        Returns
+        -------
+        ReinforcementSteelQualityProperties
+            The properties of the steel quality.
+
+        Raises
+        ------
+        ValueError
+            If the steel class of the steel quality is unknown.
+        """
+        steel_class = steel_quality.value[-1]
+        match steel_class.lower():
+            case "a":
+                ductility_factor_k, eps_uk = 1.05, 25
+            case "b":
+                ductility_factor_k, eps_uk = 1.08, 50
+            case "c":
+                ductility_factor_k, eps_uk = 1.15, 75
+            case _:
+                raise ValueError(f"Unknown steel class: {steel_class}")
+        f_yk = float(steel_quality.value[1:-1])
+        return cls(f_yk=f_yk, steel_class=steel_class, ductility_factor_k=ductility_factor_k, f_tk=f_yk * ductility_factor_k, eps_uk=eps_uk)
+
+
+REINFORCEMENT_STEEL_QUALITY_PROPERTIES: dict[ReinforcementSteelQuality, ReinforcementSteelQualityProperties] = {
+    steel_quality: ReinforcementSteelQualityProperties.from_steel_quality(steel_quality) for steel_quality in ReinforcementSteelQuality
+}
+"""Precomputed properties of table C.1 Annex C of EN 1992-1-1:2004 for every reinforcement steel quality."""
+
+_STEEL_QUALITY_INDEX = {steel_quality: index for index, steel_quality in enumerate(ReinforcementSteelQuality)}
+_STEEL_PROPERTY_COLUMNS: dict[str, FloatArray] = {
+    name: np.array([getattr(properties, name) for properties in REINFORCEMENT_STEEL_QUALITY_PROPERTIES.values()], dtype=np.float64)
+    for name in ("f_yk", "ductility_factor_k", "f_tk", "eps_uk")
+}
+
+
+def reinforcement_steel_property_array(steel_qualities: Iterable[ReinforcementSteelQuality], name: str) -> FloatArray:
+    """Return a numeric property of table C.1 Annex C of EN 1992-1-1:2004 for every given reinforcement steel quality.
+
+    Parameters
+    ----------
+    steel_qualities: Iterable[ReinforcementSteelQuality]
+        Reinforcement steel qualities, for example of all rebars of a model.
+    name: str
+        Name of the property, one of "f_yk", "ductility_factor_k", "f_tk" or "eps_uk".
+
+    Returns
+    -------
+    FloatArray
+        The property of every steel quality, in the order of the given steel qualities.
+
+    Raises
+    ------
+    ValueError
+        If the property is unknown.
+    """
+    if name not in _STEEL_PROPERTY_COLUMNS:
+        raise ValueError(f"Unknown reinforcement steel property '{name}', must be one of {', '.join(_STEEL_PROPERTY_COLUMNS)}.")
+    indices = np.fromiter((_STEEL_QUALITY_INDEX[steel_quality] for steel_quality in steel_qualities), dtype=np.intp)
+    return _STEEL_PROPERTY_COLUMNS[name][indices]
+
+
 @dataclass(frozen=True)
 class ReinforcementSteelMaterial:
     r"""Representation of the properties of reinforcement steel suitable for use with EN 1992-1-1:2004.
@@ -104,6 +211,19 @@ class ReinforcementSteelMaterial:
     custom_name: str | None = field(default=None, compare=False)
     custom_e_s: MPA | None = field(default=None, metadata={"unit": "MPa"})
 
+    @cached_property
+    def steel_quality_properties(self) -> ReinforcementSteelQualityProperties:
+        """Properties of table C.1 Annex C of EN 1992-1-1:2004 of the steel quality, looked up once per material.
+
+        Returns
+        -------
+        ReinforcementSteelQualityProperties
+            The precomputed properties of the steel quality.
+        """
+        if properties := REINFORCEMENT_STEEL_QUALITY_PROPERTIES.get(self.steel_quality):
+            return properties
+        return ReinforcementSteelQualityProperties.from_steel_quality(self.steel_quality)
+
     @property
     def name(self) -> str:
         r"""Name of the reinforcement steel material.
@@ -139,7 +259,7 @@ class ReinforcementSteelMaterial:
         MPA
             Example: 500.0 (for B500B)
         """
-        return float(self.steel_quality.value[1:-1])
+        return self.steel_quality_properties.f_yk
 
     @property
     def f_yd(self) -> MPA:
@@ -161,7 +281,7 @@ class ReinforcementSteelMaterial:
         str
             Example: "B" (for B500B)
         """
-        return self.steel_quality.value[-1]
+        return self.steel_quality_properties.steel_class
 
     @property
     def f_tk(self) -> MPA:
@@ -172,7 +292,7 @@ class ReinforcementSteelMaterial:
         MPA
             Example: 540.0 (for B500B)
         """
-        return self.f_yk * self.ductility_factor_k
+        return self.steel_quality_properties.f_tk
 
     @property
     def ductility_factor_k(self) -> DIMENSIONLESS:
@@ -187,35 +307,46 @@ class ReinforcementSteelMaterial:
         DIMENSIONLESS
             Example: 1.08 (for B500B)
         """
-        match self.steel_class.lower():
-            case "a":
-                return 1.05
-            case "b":
-                return 1.08
-            case "c":
-                return 1.15
-            case _:
-                raise ValueError(f"Unknown steel class: {self.steel_class}")
+        return self.steel_quality_properties.ductility_factor_k
 
     @property
     def eps_uk(self) -> PER_MILLE:
         r"""[$\varepsilon_{uk}$] Characteristic strain of reinforcement at max. load [$‰$ (per mille)] (table C.1 Annex C from EN 1992-1-1:2004).
 
-        * 250 ‰ for steel class A
-        * 500 ‰ for steel class B
-        * 750 ‰ for steel class C
+        * 25 ‰ (2.5 %) for steel class A
+        * 50 ‰ (5.0 %) for steel class B
+        * 75 ‰ (7.5 %) for steel class C
 
         Returns
         -------
         PER_MILLE
-            Example: 500 (for B500B)
+            Example: 50 (for B500B)
         """
-        match self.steel_class.lower():
-            case "a":
-                return 250
-            case "b":
-                return 500
-            case "c":
-                return 750
+        return self.steel_quality_properties.eps_uk
+
+    @cached_property
+    def design_diagram(self) -> BilinearSteelDiagram:
+        r"""Design stress-strain diagram for the diagram type of the material (EN 1992-1-1:2004 art.3.2.7 (2)), created once per material.
+
+        The inclined top branch reaches [$k \cdot f_{yd}$] at [$\varepsilon_{uk}$].
+
+        Returns
+        -------
+        BilinearSteelDiagram
+            Diagram with [$E_s$] and [$f_{yd}$] of this material.
+
+        Raises
+        ------
+        NotImplementedError
+            If the diagram type is user defined.
+        """
+        match self.diagram_type:
+            case ReinforcementDiagramType.BILINEAR_NOT_INCLINED:
+                return BilinearSteelDiagram(e_s=self.e_s, f_y=self.f_yd)
+            case ReinforcementDiagramType.BILINEAR_INCLINED:
+                f_td = self.ductility_factor_k * self.f_yd
+                hardening_modulus = (f_td - self.f_yd) / (self.eps_uk * PER_MILLE_TO_RATIO - self.f_yd / self.e_s)
+                return BilinearSteelDiagram(e_s=self.e_s, f_y=self.f_yd, hardening_modulus=hardening_modulus)
             case _:
-                raise ValueError(f"Unknown steel class: {self.steel_class}")
+                msg = f"The reinforcement stress-strain diagram {self.diagram_type.value} has not been implemented yet."
+                raise NotImplementedError(msg)
@@ -3,6 +3,9 @@
 from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
+import numpy.typing as npt
+
 from blueprints.codes.eurocode.en_1993_1_1_2005.chapter_3_materials.table_3_1 import (
     SteelStrengthClass,
     Table3Dot1NominalValuesHotRolledStructuralSteel,
@@ -143,7 +146,26 @@ class SteelMaterial:
         """
         if self.custom_yield_strength:
             return self.custom_yield_strength
-        return Table3Dot1NominalValuesHotRolledStructuralSteel(steel_class=self.steel_class, thickness=thickness).fy
+        return Table3Dot1NominalValuesHotRolledStructuralSteel.fy_lookup(self.steel_class, thickness)
+
+    def yield_strength_array(self, thickness: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Yield strength of the steel material [$f_y$] for an array of thicknesses in one call.
+
+        Parameters
+        ----------
+        thickness: npt.ArrayLike
+            Nominal thicknesses of the steel elements [$mm$]
+
+        Returns
+        -------
+        npt.NDArray[np.float64]
+            Yield strengths with the same shape as the thicknesses [$MPa$]
+        """
+        if self.custom_yield_strength:
+            return np.full(np.shape(thickness), self.custom_yield_strength, dtype=float)
+        return np.asarray(
+            Table3Dot1NominalValuesHotRolledStructuralSteel.fy_lookup(self.steel_class, np.asarray(thickness, dtype=float)), dtype=float
+        )
 
     def ultimate_strength(self, thickness: MM) -> MPA | None:
         """Ultimate strength of the steel material for steel [$f_u$].
@@ -160,4 +182,23 @@ class SteelMaterial:
         """
         if self.custom_ultimate_strength:
             return self.custom_ultimate_strength
-        return Table3Dot1NominalValuesHotRolledStructuralSteel(steel_class=self.steel_class, thickness=thickness).fu
+        return Table3Dot1NominalValuesHotRolledStructuralSteel.fu_lookup(self.steel_class, thickness)
+
+    def ultimate_strength_array(self, thickness: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Ultimate strength of the steel material [$f_u$] for an array of thicknesses in one call.
+
+        Parameters
+        ----------
+        thickness: npt.ArrayLike
+            Nominal thicknesses of the steel elements [$mm$]
+
+        Returns
+        -------
+        npt.NDArray[np.float64]
+            Ultimate strengths with the same shape as the thicknesses [$MPa$]
+        """
+        if self.custom_ultimate_strength:
+            return np.full(np.shape(thickness), self.custom_ultimate_strength, dtype=float)
+        return np.asarray(
+            Table3Dot1NominalValuesHotRolledStructuralSteel.fu_lookup(self.steel_class, np.asarray(thickness, dtype=float)), dtype=float
+        )
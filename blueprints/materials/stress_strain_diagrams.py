@@ -0,0 +1,173 @@
+r"""Stress-strain diagrams of concrete and reinforcement steel, evaluated for arrays of strains.
+
+The diagrams are immutable and hold their parameters as ratios, so a sectional analysis evaluates the stresses and tangent
+stiffnesses of all fibres with a few array operations. The materials create their diagrams once, see
+`ConcreteMaterial.design_diagram` and `ReinforcementSteelMaterial.design_diagram`.
+
+Strains are ratios [-] and stresses are in MPa. Compressive strains and stresses are negative, the tangent stiffness
+[$d\sigma / d\varepsilon$] is positive for a loaded material.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.type_alias import DIMENSIONLESS, MPA
+
+type FloatArray = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class ParabolaRectangleDiagram:
+    r"""Parabola-rectangle diagram for concrete in compression, EN 1992-1-1 3.1.7(1) formulas (3.17) and (3.18).
+
+    Tension is neglected. The stress remains at [$f_c$] beyond [$\varepsilon_{c2}$], the ultimate strain is a limit of the
+    sectional analysis and not of the diagram.
+
+    Parameters
+    ----------
+    f_c : MPA
+        [$f_c$] Compressive strength of the plateau, for example [$f_{cd}$] [$MPa$].
+    eps_c2 : DIMENSIONLESS
+        [$\varepsilon_{c2}$] Strain at reaching the compressive strength, positive [$-$].
+    eps_cu2 : DIMENSIONLESS
+        [$\varepsilon_{cu2}$] Ultimate compressive strain, positive [$-$].
+    n : DIMENSIONLESS
+        [$n$] Exponent of the parabola [$-$].
+    """
+
+    f_c: MPA
+    eps_c2: DIMENSIONLESS
+    eps_cu2: DIMENSIONLESS
+    n: DIMENSIONLESS
+
+    def stress(self, strain: npt.ArrayLike) -> FloatArray:
+        """Stresses for an array of strains [MPa]."""
+        compression = np.clip(-np.asarray(strain, dtype=float), 0.0, None)
+        return -self.f_c * (1.0 - (1.0 - np.minimum(compression, self.eps_c2) / self.eps_c2) ** self.n)
+
+    def tangent(self, strain: npt.ArrayLike) -> FloatArray:
+        """Tangent stiffnesses for an array of strains, the initial stiffness at zero strain [MPa]."""
+        compression = -np.asarray(strain, dtype=float)
+        parabola = (compression >= 0.0) & (compression < self.eps_c2)
+        remaining = 1.0 - np.where(parabola, compression, 0.0) / self.eps_c2
+        return np.where(parabola, self.n * self.f_c / self.eps_c2 * remaining ** (self.n - 1.0), 0.0)
+
+
+@dataclass(frozen=True)
+class BilinearConcreteDiagram:
+    r"""Bi-linear diagram for concrete in compression, EN 1992-1-1 3.1.7(2) figure 3.4.
+
+    Tension is neglected. The stress remains at [$f_c$] beyond [$\varepsilon_{c3}$].
+
+    Parameters
+    ----------
+    f_c : MPA
+        [$f_c$] Compressive strength of the plateau, for example [$f_{cd}$] [$MPa$].
+    eps_c3 : DIMENSIONLESS
+        [$\varepsilon_{c3}$] Strain at reaching the compressive strength, positive [$-$].
+    eps_cu3 : DIMENSIONLESS
+        [$\varepsilon_{cu3}$] Ultimate compressive strain, positive [$-$].
+    """
+
+    f_c: MPA
+    eps_c3: DIMENSIONLESS
+    eps_cu3: DIMENSIONLESS
+
+    def stress(self, strain: npt.ArrayLike) -> FloatArray:
+        """Stresses for an array of strains [MPa]."""
+        compression = np.clip(-np.asarray(strain, dtype=float), 0.0, None)
+        return -self.f_c * np.minimum(compression / self.eps_c3, 1.0)
+
+    def tangent(self, strain: npt.ArrayLike) -> FloatArray:
+        """Tangent stiffnesses for an array of strains, the initial stiffness at zero strain [MPa]."""
+        compression = -np.asarray(strain, dtype=float)
+        return np.where((compression >= 0.0) & (compression < self.eps_c3), self.f_c / self.eps_c3, 0.0)
+
+
+@dataclass(frozen=True)
+class NonlinearConcreteDiagram:
+    r"""Diagram for non-linear structural analysis of concrete in compression, EN 1992-1-1 3.1.5(1) formula (3.14).
+
+    [$\sigma_c / f_{cm} = (k \eta - \eta^2) / (1 + (k - 2) \eta)$] with [$\eta = \varepsilon_c / \varepsilon_{c1}$] and
+    [$k = 1.05 E_{cm} \varepsilon_{c1} / f_{cm}$]. Tension is neglected and the concrete is crushed, without stress, beyond
+    [$\varepsilon_{cu1}$].
+
+    Parameters
+    ----------
+    f_cm : MPA
+        [$f_{cm}$] Mean compressive strength [$MPa$].
+    e_cm : MPA
+        [$E_{cm}$] Secant modulus of elasticity [$MPa$].
+    eps_c1 : DIMENSIONLESS
+        [$\varepsilon_{c1}$] Strain at the peak stress, positive [$-$].
+    eps_cu1 : DIMENSIONLESS
+        [$\varepsilon_{cu1}$] Ultimate compressive strain, positive [$-$].
+    """
+
+    f_cm: MPA
+    e_cm: MPA
+    eps_c1: DIMENSIONLESS
+    eps_cu1: DIMENSIONLESS
+
+    @property
+    def k(self) -> DIMENSIONLESS:
+        """[$k$] Plasticity number of formula (3.14) [$-$]."""
+        return 1.05 * self.e_cm * self.eps_c1 / self.f_cm
+
+    def _eta(self, strain: npt.ArrayLike) -> tuple[FloatArray, npt.NDArray[np.bool_]]:
+        """Strain to peak-strain ratios within the diagram, and the mask of these strains."""
+        compression = -np.asarray(strain, dtype=float)
+        loaded = (compression >= 0.0) & (compression <= self.eps_cu1)
+        return np.where(loaded, compression, 0.0) / self.eps_c1, loaded
+
+    def stress(self, strain: npt.ArrayLike) -> FloatArray:
+        """Stresses for an array of strains [MPa]."""
+        eta, loaded = self._eta(strain)
+        k = self.k
+        return np.where(loaded, -self.f_cm * (k * eta - eta**2) / (1.0 + (k - 2.0) * eta), 0.0)
+
+    def tangent(self, strain: npt.ArrayLike) -> FloatArray:
+        """Tangent stiffnesses for an array of strains, the initial stiffness at zero strain [MPa]."""
+        eta, loaded = self._eta(strain)
+        k = self.k
+        denominator = 1.0 + (k - 2.0) * eta
+        derivative = ((k - 2.0 * eta) * denominator - (k * eta - eta**2) * (k - 2.0)) / denominator**2
+        return np.where(loaded, self.f_cm / self.eps_c1 * derivative, 0.0)
+
+
+@dataclass(frozen=True)
+class BilinearSteelDiagram:
+    r"""Bi-linear diagram for reinforcement steel in tension and compression, EN 1992-1-1 3.2.7(2) figure 3.8.
+
+    Parameters
+    ----------
+    e_s : MPA
+        [$E_s$] Modulus of elasticity [$MPa$].
+    f_y : MPA
+        [$f_y$] Yield strength, for example [$f_{yd}$] [$MPa$].
+    hardening_modulus : MPA, optional
+        Slope of the top branch, zero for a horizontal top branch [$MPa$] (default is 0.0).
+    """
+
+    e_s: MPA
+    f_y: MPA
+    hardening_modulus: MPA = 0.0
+
+    @property
+    def eps_y(self) -> DIMENSIONLESS:
+        r"""[$\varepsilon_y$] Yield strain [$-$]."""
+        return self.f_y / self.e_s
+
+    def stress(self, strain: npt.ArrayLike) -> FloatArray:
+        """Stresses for an array of strains [MPa]."""
+        strain = np.asarray(strain, dtype=float)
+        if self.hardening_modulus == 0.0:
+            return np.clip(self.e_s * strain, -self.f_y, self.f_y)
+        plastic = np.sign(strain) * (self.f_y + self.hardening_modulus * (np.abs(strain) - self.eps_y))
+        return np.where(np.abs(strain) <= self.eps_y, self.e_s * strain, plastic)
+
+    def tangent(self, strain: npt.ArrayLike) -> FloatArray:
+        """Tangent stiffnesses for an array of strains [MPa]."""
+        return np.where(np.abs(np.asarray(strain, dtype=float)) <= self.eps_y, self.e_s, self.hardening_modulus)
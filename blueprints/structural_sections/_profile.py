@@ -16,6 +16,7 @@ from shapely.affinity import rotate, translate
 
 from blueprints.type_alias import DEG, KN, KNM, M3_M, MM, MM2
 from blueprints.unit_conversion import KN_TO_N, KNM_TO_NMM, M_TO_MM, MM3_TO_M3
+from blueprints.utils.cache import ComputeOnceCache
 
 
 @dataclass(frozen=True)
@@ -35,12 +36,14 @@ class Profile(ABC):
     rotation: DEG = field(default=0.0, kw_only=True)
     """Rotation of the profile [degrees]. Positive values rotate the profile counter-clockwise around its centroid."""
 
-    _section_props_cache: dict[tuple[bool, bool, bool], SectionProperties] = field(
-        default_factory=dict, init=False, repr=False, compare=False, hash=False
+    _section_props_cache: ComputeOnceCache[tuple[bool, bool, bool], SectionProperties] = field(
+        default_factory=ComputeOnceCache, init=False, repr=False, compare=False, hash=False
     )
-    """Cache for section properties to avoid recalculation."""
-    _unit_stress_cache: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False, hash=False)
-    """Cache for unit stress to avoid recalculation."""
+    """Thread-safe cache for section properties to avoid recalculation."""
+    _unit_stress_cache: ComputeOnceCache[str, dict[str, Any]] = field(
+        default_factory=ComputeOnceCache, init=False, repr=False, compare=False, hash=False
+    )
+    """Thread-safe cache for unit stress to avoid recalculation."""
 
     @property
     def mesh_creator(self) -> partial:
@@ -168,6 +171,9 @@ class Profile(ABC):
     ) -> SectionProperties:
         """Calculate and return the section properties of the profile.
 
+        The result is cached per combination of flags. The cache is thread-safe: when several threads request the
+        same properties of a shared profile at the same time, the calculation is only performed once.
+
         Parameters
         ----------
         geometric : bool
@@ -178,12 +184,13 @@ class Profile(ABC):
             Whether to calculate warping properties.
         """
         cache_key = (geometric, plastic, warping)
+        return self._section_props_cache.get_or_compute(
+            cache_key,
+            partial(self._calculate_section_properties, geometric=geometric, plastic=plastic, warping=warping),
+        )
 
-        # Check if we already have cached properties for this configuration
-        if cache_key in self._section_props_cache:
-            return self._section_props_cache[cache_key]
-
-        # Calculate section properties
+    def _calculate_section_properties(self, geometric: bool, plastic: bool, warping: bool) -> SectionProperties:
+        """Calculate the section properties of the profile without using the cache."""
         section = self._section()
 
         if any([geometric, plastic, warping]):
@@ -193,9 +200,6 @@ class Profile(ABC):
         if plastic:
             section.calculate_plastic_properties()
 
-        # Cache the result
-        self._section_props_cache[cache_key] = section.section_props
-
         return section.section_props
 
     @property
@@ -275,17 +279,7 @@ class Profile(ABC):
         dict[str, Any]
             The unit stress distribution for the profile, derived from self.calculate_stress(...).get_stress()[0].
         """
-        # Check if unit stress is already cached
-        if self._unit_stress_cache is not None:
-            return self._unit_stress_cache
-
-        # Calculate unit stress
-        result = self.calculate_stress(1, 1, 1, 1, 1, 1).get_stress()[0]
-
-        # Cache the result
-        object.__setattr__(self, "_unit_stress_cache", result)
-
-        return result
+        return self._unit_stress_cache.get_or_compute("unit_stress", lambda: self.calculate_stress(1, 1, 1, 1, 1, 1).get_stress()[0])
 
     def plot(self, plotter: Callable[[Any], plt.Figure] | None = None, *args, **kwargs) -> plt.Figure:
         """Plot the profile. Making use of the standard plotter.
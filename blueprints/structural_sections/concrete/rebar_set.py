@@ -0,0 +1,286 @@
+"""Columnar representation of a set of reinforcement bars in a cross-section."""
+
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import overload
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.type_alias import KG_M, MM, MM2, MM3
+from blueprints.unit_conversion import MM2_TO_M2
+from blueprints.utils.cache import ComputeOnceCache
+
+type FloatArray = npt.NDArray[np.float64]
+type IntArray = npt.NDArray[np.intp]
+
+
+@dataclass(frozen=True, eq=False, kw_only=True)
+class RebarSet(Sequence[Rebar]):
+    """Set of reinforcement bars stored as arrays, one entry per bar.
+
+    Large reinforcement layouts (for example diaphragm walls with thousands of bars) are stored as arrays instead of a list of
+    `Rebar` objects. Areas, weights, centroid and static moments are calculated on the arrays directly. The set behaves like a
+    read-only sequence of `Rebar` objects; an individual `Rebar` is only created when it is requested.
+
+    Parameters
+    ----------
+    x : npt.ArrayLike
+        x-coordinates of the centers of the rebars [mm]
+    y : npt.ArrayLike
+        y-coordinates of the centers of the rebars [mm]
+    diameter : npt.ArrayLike
+        Diameters of the rebars [mm]. A single value is applied to all rebars.
+    materials : tuple[ReinforcementSteelMaterial, ...]
+        Reinforcement steel materials used in the set.
+    material_index : npt.ArrayLike, optional
+        Index in `materials` of the material of every rebar. A single value is applied to all rebars (default is 0).
+    relative_start_position : npt.ArrayLike, optional
+        Relative position of the start of the rebars in the longitudinal direction of the host element [-] (default is 0.0).
+    relative_end_position : npt.ArrayLike, optional
+        Relative position of the end of the rebars in the longitudinal direction of the host element [-] (default is 1.0).
+    name : str, optional
+        Name of the rebar elements, default is "Rebar"
+    """
+
+    x: FloatArray
+    y: FloatArray
+    diameter: FloatArray
+    materials: tuple[ReinforcementSteelMaterial, ...]
+    material_index: IntArray = field(default_factory=lambda: np.zeros(1, dtype=np.intp))
+    relative_start_position: FloatArray = field(default_factory=lambda: np.zeros(1))
+    relative_end_position: FloatArray = field(default_factory=lambda: np.ones(1))
+    name: str = "Rebar"
+    _rebar_cache: ComputeOnceCache[int, Rebar] = field(default_factory=ComputeOnceCache, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Convert the given values to arrays of equal length and validate them."""
+        x = np.atleast_1d(np.asarray(self.x, dtype=float))
+        n = x.size
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", self._column(self.y, n, "y"))
+        object.__setattr__(self, "diameter", self._column(self.diameter, n, "diameter"))
+        object.__setattr__(self, "material_index", self._column(self.material_index, n, "material_index").astype(np.intp))
+        object.__setattr__(self, "relative_start_position", self._column(self.relative_start_position, n, "relative_start_position"))
+        object.__setattr__(self, "relative_end_position", self._column(self.relative_end_position, n, "relative_end_position"))
+        object.__setattr__(self, "materials", tuple(self.materials))
+
+        if np.any(self.diameter <= 0):
+            msg = f"Diameter must be a positive value, but got {self.diameter.min()}"
+            raise ValueError(msg)
+        if np.any((self.relative_start_position < 0.0) | (self.relative_start_position > 1.0)):
+            raise ValueError("Relative start position of the rebars must be between 0.0 and 1.0")
+        if np.any((self.relative_end_position < 0.0) | (self.relative_end_position > 1.0)):
+            raise ValueError("Relative end position of the rebars must be between 0.0 and 1.0")
+        if n and (self.material_index.min() < 0 or self.material_index.max() >= len(self.materials)):
+            msg = f"Material index must refer to one of the {len(self.materials)} given materials"
+            raise ValueError(msg)
+
+    @staticmethod
+    def _column(values: npt.ArrayLike, n: int, name: str) -> FloatArray:
+        """Return the values as a float array of length n, repeating a single value for all rebars."""
+        column = np.atleast_1d(np.asarray(values, dtype=float))
+        if column.size == 1 and n != 1:
+            return np.full(n, column[0])
+        if column.size != n:
+            msg = f"Length of '{name}' ({column.size}) does not match the number of rebars ({n})"
+            raise ValueError(msg)
+        return column
+
+    @classmethod
+    def empty(cls) -> "RebarSet":
+        """Return a set without rebars."""
+        return cls(x=np.empty(0), y=np.empty(0), diameter=np.empty(0), materials=())
+
+    @classmethod
+    def from_rebars(cls, rebars: Iterable[Rebar]) -> "RebarSet":
+        """Create a set from individual rebars.
+
+        Parameters
+        ----------
+        rebars : Iterable[Rebar]
+            Rebars to store in the set.
+
+        Returns
+        -------
+        RebarSet
+            Set with the same rebars, in the same order.
+        """
+        rebars = list(rebars)
+        if not rebars:
+            return cls.empty()
+
+        materials = tuple(dict.fromkeys(rebar.material for rebar in rebars))
+        material_index = {material: index for index, material in enumerate(materials)}
+        names = {rebar.name for rebar in rebars}
+        return cls(
+            x=np.array([rebar.x for rebar in rebars], dtype=float),
+            y=np.array([rebar.y for rebar in rebars], dtype=float),
+            diameter=np.array([rebar.diameter for rebar in rebars], dtype=float),
+            materials=materials,
+            material_index=np.array([material_index[rebar.material] for rebar in rebars], dtype=np.intp),
+            relative_start_position=np.array([rebar.relative_start_position for rebar in rebars], dtype=float),
+            relative_end_position=np.array([rebar.relative_end_position for rebar in rebars], dtype=float),
+            name=names.pop() if len(names) == 1 else "Rebar",
+        )
+
+    @classmethod
+    def concatenate(cls, rebar_sets: Iterable["RebarSet"]) -> "RebarSet":
+        """Combine several sets into a single set.
+
+        Parameters
+        ----------
+        rebar_sets : Iterable[RebarSet]
+            Sets to combine. The rebars keep their order.
+
+        Returns
+        -------
+        RebarSet
+            Set with all rebars of the given sets. Materials that are equal are stored once.
+        """
+        rebar_sets = [rebar_set for rebar_set in rebar_sets if len(rebar_set)]
+        if not rebar_sets:
+            return cls.empty()
+        if len(rebar_sets) == 1:
+            return rebar_sets[0]
+
+        materials = tuple(dict.fromkeys(material for rebar_set in rebar_sets for material in rebar_set.materials))
+        material_index = {material: index for index, material in enumerate(materials)}
+        names = {rebar_set.name for rebar_set in rebar_sets}
+        return cls(
+            x=np.concatenate([rebar_set.x for rebar_set in rebar_sets]),
+            y=np.concatenate([rebar_set.y for rebar_set in rebar_sets]),
+            diameter=np.concatenate([rebar_set.diameter for rebar_set in rebar_sets]),
+            materials=materials,
+            material_index=np.concatenate(
+                [
+                    np.array([material_index[material] for material in rebar_set.materials], dtype=np.intp)[rebar_set.material_index]
+                    for rebar_set in rebar_sets
+                ]
+            ),
+            relative_start_position=np.concatenate([rebar_set.relative_start_position for rebar_set in rebar_sets]),
+            relative_end_position=np.concatenate([rebar_set.relative_end_position for rebar_set in rebar_sets]),
+            name=names.pop() if len(names) == 1 else "Rebar",
+        )
+
+    def __len__(self) -> int:
+        """Number of rebars in the set."""
+        return self.x.size
+
+    @overload
+    def __getitem__(self, index: int) -> Rebar: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "RebarSet": ...
+
+    def __getitem__(self, index: int | slice) -> "Rebar | RebarSet":
+        """Return a single rebar, or a new set for a slice of the rebars."""
+        if isinstance(index, slice):
+            return RebarSet(
+                x=self.x[index],
+                y=self.y[index],
+                diameter=self.diameter[index],
+                materials=self.materials,
+                material_index=self.material_index[index],
+                relative_start_position=self.relative_start_position[index],
+                relative_end_position=self.relative_end_position[index],
+                name=self.name,
+            )
+
+        n = len(self)
+        if not -n <= index < n:
+            msg = f"Rebar index {index} is out of range for a set of {n} rebars"
+            raise IndexError(msg)
+        index %= n
+        return self._rebar_cache.get_or_compute(index, lambda: self._create_rebar(index))
+
+    def __iter__(self) -> Iterator[Rebar]:
+        """Iterate over the rebars, creating every `Rebar` when it is reached."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def _create_rebar(self, index: int) -> Rebar:
+        """Create the `Rebar` object of the rebar with the given index."""
+        return Rebar(
+            diameter=float(self.diameter[index]),
+            x=float(self.x[index]),
+            y=float(self.y[index]),
+            material=self.materials[self.material_index[index]],
+            relative_start_position=float(self.relative_start_position[index]),
+            relative_end_position=float(self.relative_end_position[index]),
+            name=self.name,
+        )
+
+    def to_rebars(self) -> list[Rebar]:
+        """Return all rebars of the set as a list of `Rebar` objects."""
+        return list(self)
+
+    @property
+    def radius(self) -> FloatArray:
+        """Radii of the rebars [mm]."""
+        return self.diameter / 2.0
+
+    @property
+    def areas(self) -> FloatArray:
+        """Cross-sectional areas of the rebars [mm²]."""
+        return 0.25 * np.pi * self.diameter**2
+
+    @property
+    def area(self) -> MM2:
+        """Total cross-sectional area of the rebars [mm²]."""
+        return float(self.areas.sum())
+
+    @property
+    def weights_per_meter(self) -> FloatArray:
+        """Unit weights of the rebars per meter [kg/m]."""
+        densities = np.array([material.density for material in self.materials], dtype=float)
+        return densities[self.material_index] * self.areas * MM2_TO_M2
+
+    @property
+    def weight_per_meter(self) -> KG_M:
+        """Total unit weight of the rebars per meter [kg/m]."""
+        return float(self.weights_per_meter.sum())
+
+    @property
+    def present_materials(self) -> list[ReinforcementSteelMaterial]:
+        """Materials that are used by at least one rebar of the set."""
+        return [self.materials[index] for index in np.unique(self.material_index)]
+
+    def static_moments(self, x_ref: MM = 0.0, y_ref: MM = 0.0) -> tuple[MM3, MM3]:
+        """Static moments (first moments of area) of the rebars around a reference point.
+
+        Parameters
+        ----------
+        x_ref : MM, optional
+            x-coordinate of the reference point [mm] (default is 0.0).
+        y_ref : MM, optional
+            y-coordinate of the reference point [mm] (default is 0.0).
+
+        Returns
+        -------
+        tuple[MM3, MM3]
+            Static moment around the horizontal axis through the reference point (sum of A·(y - y_ref)) and around the
+            vertical axis through the reference point (sum of A·(x - x_ref)) [mm³].
+        """
+        areas = self.areas
+        return float(areas @ (self.y - y_ref)), float(areas @ (self.x - x_ref))
+
+    @property
+    def centroid(self) -> tuple[MM, MM]:
+        """Area-weighted centroid (x, y) of the rebars [mm].
+
+        Raises
+        ------
+        ValueError
+            If the set does not contain any rebars.
+        """
+        if not len(self):
+            raise ValueError("The centroid of an empty set of rebars is undefined.")
+        static_moment_x, static_moment_y = self.static_moments()
+        return static_moment_y / self.area, static_moment_x / self.area
+
+    def __repr__(self) -> str:
+        """Representation of the set of rebars."""
+        return f"{self.__class__.__name__}(n={len(self)}, area={self.area:.0f} mm²)"
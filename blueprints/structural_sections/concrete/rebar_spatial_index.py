@@ -0,0 +1,239 @@
+"""Spatial index of a set of reinforcement bars, for the clear spacing between bars and clashes with stirrups.
+
+The centers of the bars are stored in a shapely `STRtree`. Every query first selects the bars within a search distance with the
+tree and only then calculates the exact clear distances of those candidates, so the number of distance calculations grows with
+the number of bars instead of with the number of pairs of bars.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+import numpy as np
+import numpy.typing as npt
+import shapely
+
+from blueprints.structural_sections.concrete.rebar_set import RebarSet
+from blueprints.structural_sections.concrete.stirrups import StirrupConfiguration
+from blueprints.type_alias import DIMENSIONLESS, MM
+
+type FloatArray = npt.NDArray[np.float64]
+type IntArray = npt.NDArray[np.intp]
+
+MINIMUM_CLEAR_SPACING = 20.0
+"""Minimum clear distance between bars, regardless of the bar diameter and the aggregate size, EN 1992-1-1 8.2(2) [mm]."""
+
+CLASH_TOLERANCE = 1e-6
+"""Overlap that is not reported as a clash, bars placed against a stirrup touch it within rounding errors [mm]."""
+
+
+def minimum_clear_spacing(diameter: MM | FloatArray, aggregate_size: MM = 16.0, k_1: DIMENSIONLESS = 1.0, k_2: MM = 5.0) -> MM | FloatArray:
+    """Minimum clear distance between bars, max(k1·⌀, dg + k2, 20 mm), EN 1992-1-1 8.2(2) [mm].
+
+    Parameters
+    ----------
+    diameter : MM | FloatArray
+        Largest diameter of the adjacent bars [mm].
+    aggregate_size : MM, optional
+        Maximum size of the aggregate [mm] (default is 16 mm).
+    k_1 : DIMENSIONLESS, optional
+        Factor on the bar diameter, the recommended value is 1 (default is 1.0).
+    k_2 : MM, optional
+        Addition to the aggregate size, the recommended value is 5 mm (default is 5.0).
+
+    Returns
+    -------
+    MM | FloatArray
+        Minimum clear distance [mm].
+    """
+    return np.maximum(np.maximum(k_1 * np.asarray(diameter, dtype=float), aggregate_size + k_2), MINIMUM_CLEAR_SPACING)
+
+
+@dataclass(frozen=True)
+class RebarPairs:
+    """Pairs of bars of a rebar set, the first index is always smaller than the second.
+
+    Parameters
+    ----------
+    first : IntArray
+        Index of the first bar of every pair.
+    second : IntArray
+        Index of the second bar of every pair.
+    clear_spacing : FloatArray
+        Clear distance between the bars, negative for overlapping bars [mm].
+    required : FloatArray
+        Required clear distance between the bars [mm].
+    """
+
+    first: IntArray
+    second: IntArray
+    clear_spacing: FloatArray
+    required: FloatArray
+
+    def __len__(self) -> int:
+        """Number of pairs."""
+        return len(self.first)
+
+
+@dataclass(frozen=True)
+class StirrupClashes:
+    """Longitudinal bars that overlap a stirrup.
+
+    Parameters
+    ----------
+    rebar : IntArray
+        Index of the bar in the rebar set.
+    stirrup : IntArray
+        Index of the stirrup in the given stirrups.
+    overlap : FloatArray
+        Overlap of the bar and the stirrup bar [mm].
+    """
+
+    rebar: IntArray
+    stirrup: IntArray
+    overlap: FloatArray
+
+    def __len__(self) -> int:
+        """Number of clashes."""
+        return len(self.rebar)
+
+
+@dataclass(frozen=True, eq=False)
+class RebarSpatialIndex:
+    """Spatial index of the centers of a set of reinforcement bars.
+
+    Bars only interact if they are present at the same position along the host element, so pairs of bars without overlap of their
+    relative start and end positions are never reported.
+
+    Parameters
+    ----------
+    rebars : RebarSet
+        The bars to index.
+    """
+
+    rebars: RebarSet
+    points: npt.NDArray[np.object_] = field(init=False, repr=False)
+    """Centers of the bars as shapely points."""
+    tree: shapely.STRtree = field(init=False, repr=False)
+    """Tree of the centers of the bars."""
+
+    def __post_init__(self) -> None:
+        """Build the tree of the centers of the bars."""
+        points = np.asarray(shapely.points(self.rebars.x, self.rebars.y), dtype=object)
+        object.__setattr__(self, "points", points)
+        object.__setattr__(self, "tree", shapely.STRtree(points))
+
+    def _pairs(self, search_distance: MM | FloatArray) -> tuple[IntArray, IntArray, FloatArray]:
+        """Pairs of bars (first < second) with centers within the search distance, and their clear distances."""
+        if not len(self.rebars):
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty, np.empty(0)
+
+        first, second = self.tree.query(self.points, predicate="dwithin", distance=search_distance)
+        keep = first < second
+        first, second = first[keep], second[keep]
+
+        start, end = self.rebars.relative_start_position, self.rebars.relative_end_position
+        overlapping = (start[first] < end[second]) & (start[second] < end[first])
+        first, second = first[overlapping], second[overlapping]
+
+        radius = self.rebars.radius
+        distance = np.hypot(self.rebars.x[first] - self.rebars.x[second], self.rebars.y[first] - self.rebars.y[second])
+        return first, second, distance - radius[first] - radius[second]
+
+    def pairs_within(self, clear_spacing: MM) -> RebarPairs:
+        """All pairs of bars with a clear distance smaller than the given distance.
+
+        Parameters
+        ----------
+        clear_spacing : MM
+            Clear distance between the bars [mm].
+
+        Returns
+        -------
+        RebarPairs
+            Pairs of bars closer than the given distance, with the given distance as the required distance.
+        """
+        first, second, clear = self._pairs(clear_spacing + self.rebars.diameter.max(initial=0.0))
+        closer = clear < clear_spacing
+        return RebarPairs(first=first[closer], second=second[closer], clear_spacing=clear[closer], required=np.full(closer.sum(), clear_spacing))
+
+    def spacing_violations(self, aggregate_size: MM = 16.0, k_1: DIMENSIONLESS = 1.0, k_2: MM = 5.0) -> RebarPairs:
+        """All pairs of bars closer than the minimum clear distance of EN 1992-1-1 8.2(2), for the largest bar of every pair.
+
+        Parameters
+        ----------
+        aggregate_size : MM, optional
+            Maximum size of the aggregate [mm] (default is 16 mm).
+        k_1 : DIMENSIONLESS, optional
+            Factor on the bar diameter, the recommended value is 1 (default is 1.0).
+        k_2 : MM, optional
+            Addition to the aggregate size, the recommended value is 5 mm (default is 5.0).
+
+        Returns
+        -------
+        RebarPairs
+            Pairs of bars that violate the minimum clear distance.
+        """
+        diameter = self.rebars.diameter
+        largest = diameter.max(initial=0.0)
+        first, second, clear = self._pairs(minimum_clear_spacing(largest, aggregate_size, k_1, k_2) + largest)
+        required = np.asarray(minimum_clear_spacing(np.maximum(diameter[first], diameter[second]), aggregate_size, k_1, k_2))
+        too_close = clear < required - CLASH_TOLERANCE
+        return RebarPairs(first=first[too_close], second=second[too_close], clear_spacing=clear[too_close], required=required[too_close])
+
+    def nearest_clear_spacing(self) -> FloatArray:
+        """Clear distance of every bar to its nearest bar in the cross-section, regardless of the longitudinal positions [mm].
+
+        Returns
+        -------
+        FloatArray
+            Smallest clear distance to any other bar, infinite for a single bar [mm].
+        """
+        spacing = np.full(len(self.rebars), np.inf)
+        if len(self.rebars) < 2:
+            return spacing
+
+        # the nearest center gives an upper bound, a bar closer by clear distance is at most one radius further away
+        (point, _), distance = self.tree.query_nearest(self.points, exclusive=True, return_distance=True)
+        center_distance = np.zeros(len(self.rebars))
+        center_distance[point] = distance
+
+        radius = self.rebars.radius
+        first, second = self.tree.query(self.points, predicate="dwithin", distance=center_distance + radius.max())
+        keep = first != second
+        first, second = first[keep], second[keep]
+        clear = np.hypot(self.rebars.x[first] - self.rebars.x[second], self.rebars.y[first] - self.rebars.y[second]) - radius[first] - radius[second]
+        np.minimum.at(spacing, first, clear)
+        return spacing
+
+    def stirrup_clashes(self, stirrups: Iterable[StirrupConfiguration]) -> StirrupClashes:
+        """All bars that overlap the bar of a stirrup, bars touching a stirrup are allowed.
+
+        Parameters
+        ----------
+        stirrups : Iterable[StirrupConfiguration]
+            The stirrups, their geometry is the center line of the stirrup bar.
+
+        Returns
+        -------
+        StirrupClashes
+            Bars that overlap a stirrup.
+        """
+        rebar_indices, stirrup_indices, overlaps = [], [], []
+        largest_radius = self.rebars.radius.max(initial=0.0)
+        for index, stirrup in enumerate(stirrups):
+            center_line = stirrup.geometry.exterior
+            candidates = self.tree.query(center_line, predicate="dwithin", distance=stirrup.radius + largest_radius)
+            candidates = candidates[
+                (self.rebars.relative_start_position[candidates] < stirrup.relative_end_position)
+                & (stirrup.relative_start_position < self.rebars.relative_end_position[candidates])
+            ]
+            overlap = stirrup.radius + self.rebars.radius[candidates] - shapely.distance(center_line, self.points[candidates])
+            clash = overlap > CLASH_TOLERANCE
+            rebar_indices.append(candidates[clash])
+            stirrup_indices.append(np.full(clash.sum(), index, dtype=np.intp))
+            overlaps.append(overlap[clash])
+
+        if not rebar_indices:
+            return StirrupClashes(rebar=np.empty(0, dtype=np.intp), stirrup=np.empty(0, dtype=np.intp), overlap=np.empty(0))
+        return StirrupClashes(rebar=np.concatenate(rebar_indices), stirrup=np.concatenate(stirrup_indices), overlap=np.concatenate(overlaps))
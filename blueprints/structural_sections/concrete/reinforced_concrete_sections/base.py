@@ -3,19 +3,30 @@
 from abc import ABC
 from collections.abc import Callable
 from functools import partial
+from typing import Literal
 
+import numpy as np
+import numpy.typing as npt
+import shapely
 from shapely import LineString
 
 from blueprints.materials.concrete import ConcreteMaterial
 from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
 from blueprints.structural_sections._profile import Profile
 from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.rebar_set import RebarSet
+from blueprints.structural_sections.concrete.rebar_spatial_index import RebarPairs, RebarSpatialIndex, StirrupClashes
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.capacity_surface import CapacitySurface
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.fibre_section import ConcreteMesh, FibreSection, default_mesh_size
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.interaction_diagram import NMInteractionDiagram
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.moment_curvature import MomentCurvatureSolver, SectionState
 from blueprints.structural_sections.concrete.reinforced_concrete_sections.reinforcement_configurations import (
     ReinforcementConfiguration,
 )
 from blueprints.structural_sections.concrete.stirrups import StirrupConfiguration
-from blueprints.type_alias import KG_M, KG_M3, M3_M, MM2_M
+from blueprints.type_alias import DIMENSIONLESS, KG_M, KG_M3, M3_M, MM, MM2_M
 from blueprints.unit_conversion import MM3_TO_M3
+from blueprints.utils.cache import ComputeOnceCache
 
 
 class ReinforcedCrossSection(ABC):
@@ -40,36 +51,253 @@ class ReinforcedCrossSection(ABC):
         self._reinforcement_configurations: list[tuple[LineString | Callable[[], LineString], ReinforcementConfiguration]] = []
         self._single_longitudinal_rebars: list[Rebar] = []
         self._stirrups: list[StirrupConfiguration] = []
+        self._layout_cache: ComputeOnceCache[str, RebarSet] = ComputeOnceCache()
+        self._spatial_index_cache: ComputeOnceCache[str, RebarSpatialIndex] = ComputeOnceCache()
+        self._concrete_mesh_cache: ComputeOnceCache[MM, ConcreteMesh] = ComputeOnceCache()
+        self._fibre_section_cache: ComputeOnceCache[MM, FibreSection] = ComputeOnceCache()
+        self._sls_solver_cache: ComputeOnceCache[tuple[MM, DIMENSIONLESS, bool], MomentCurvatureSolver] = ComputeOnceCache()
+
+    @property
+    def longitudinal_rebar_set(self) -> RebarSet:
+        """Return all longitudinal rebars as a single set of rebars.
+
+        The layout is resolved once and cached until the cross-section is changed with one of the `add_*` methods.
+        """
+        return self._layout_cache.get_or_compute("longitudinal_rebars", self._resolve_longitudinal_rebars)
 
     @property
     def longitudinal_rebars(self) -> list[Rebar]:
         """Return a list of all longitudinal rebars."""
-        rebars: list[Rebar] = []
+        return self.longitudinal_rebar_set.to_rebars()
+
+    @property
+    def rebar_spatial_index(self) -> RebarSpatialIndex:
+        """Return the spatial index of the longitudinal rebars, cached together with the layout of the rebars."""
+        return self._spatial_index_cache.get_or_compute("longitudinal_rebars", lambda: RebarSpatialIndex(self.longitudinal_rebar_set))
+
+    def rebar_spacing_violations(self, aggregate_size: MM = 16.0) -> RebarPairs:
+        """Return all pairs of longitudinal rebars closer than the minimum clear distance of EN 1992-1-1 8.2(2).
+
+        Parameters
+        ----------
+        aggregate_size : MM, optional
+            Maximum size of the aggregate [mm] (default is 16 mm).
+
+        Returns
+        -------
+        RebarPairs
+            Indices in `longitudinal_rebar_set` of the pairs of rebars that are too close, with their clear distances.
+        """
+        return self.rebar_spatial_index.spacing_violations(aggregate_size=aggregate_size)
 
+    def stirrup_clashes(self) -> StirrupClashes:
+        """Return all longitudinal rebars that overlap one of the stirrups of the cross-section.
+
+        Returns
+        -------
+        StirrupClashes
+            Indices in `longitudinal_rebar_set` and in `stirrups` of the overlapping rebars and stirrups.
+        """
+        return self.rebar_spatial_index.stirrup_clashes(self._stirrups)
+
+    def _invalidate_layout(self) -> None:
+        """Clear the cached reinforcement layout. Called by every method that changes the reinforcement of the cross-section."""
+        self._layout_cache.clear()
+        self._spatial_index_cache.clear()
+        self._fibre_section_cache.clear()
+        self._sls_solver_cache.clear()
+
+    def _resolve_longitudinal_rebars(self) -> RebarSet:
+        """Create all longitudinal rebars from the single rebars and the reinforcement configurations.
+
+        Raises
+        ------
+        ValueError
+            If a rebar is not (fully) inside the cross-section.
+        """
         # add the single longitudinal rebars
-        rebars.extend(self._single_longitudinal_rebars)
+        rebar_sets = [RebarSet.from_rebars(self._single_longitudinal_rebars)]
 
         # add the rebars from the reinforcement configurations
         for line, configuration in self._reinforcement_configurations:
             if isinstance(line, LineString):
-                rebars.extend(configuration.to_rebars(line=line))
+                rebar_sets.append(configuration.to_rebars(line=line))
             else:
                 # partial function with additional arguments where the line should be called to get the LineString
                 # the implementation will be made at that level and inserted here to produce the rebars needed.
                 # this keeps this ABC class clean and allows for a lot of flexibility in the implementation of the line.
                 # this has been done to be able to add any shape of line to the cross-section (e.g. a circle or any other in the future).
                 line_string = line()
-                rebars.extend(configuration.to_rebars(line=line_string))
+                rebar_sets.append(configuration.to_rebars(line=line_string))
+        rebars = RebarSet.concatenate(rebar_sets)
 
         # check if all rebars are inside the cross-section.
         # needed for the case where custom configurations are added to the RCS
-        for rebar in rebars:
-            if not self.profile.polygon.contains(other=rebar.polygon):
-                msg = f"Rebar (diameter={rebar.diameter}, x={rebar.x}, y={rebar.y}) is not (fully) inside the cross-section."
-                raise ValueError(msg)
+        self._validate_rebars_inside(rebars=rebars)
 
         return rebars
 
+    def _validate_rebars_inside(self, rebars: RebarSet) -> None:
+        """Check that all rebars are fully inside the cross-section.
+
+        A rebar is fully inside the cross-section when its center lies inside the cross-section shrunk by the radius of the rebar.
+        This is checked for all rebars of the same diameter at once, instead of comparing the polygon of every rebar with the cross-section.
+
+        Parameters
+        ----------
+        rebars : RebarSet
+            Rebars to check.
+
+        Raises
+        ------
+        ValueError
+            If a rebar is not (fully) inside the cross-section.
+        """
+        inside = np.ones(len(rebars), dtype=bool)
+        for diameter in np.unique(rebars.diameter):
+            same_diameter = rebars.diameter == diameter
+            # points on the boundary of the shrunk cross-section belong to rebars that touch the outer edge, which is allowed
+            inset_polygon = self.profile.polygon.buffer(-diameter / 2)
+            inside[same_diameter] = shapely.intersects_xy(inset_polygon, rebars.x[same_diameter], rebars.y[same_diameter])
+
+        if not inside.all():
+            index = int(np.argmin(inside))
+            msg = f"Rebar (diameter={rebars.diameter[index]}, x={rebars.x[index]}, y={rebars.y[index]}) is not (fully) inside the cross-section."
+            raise ValueError(msg)
+
+    def concrete_mesh(self, mesh_size: MM | None = None) -> ConcreteMesh:
+        """Return the concrete fibres of the cross-section.
+
+        The mesh only depends on the outline of the cross-section, so it is created once per mesh size and shared by all fibre
+        models of the cross-section, also after the reinforcement is changed.
+
+        Parameters
+        ----------
+        mesh_size : MM | None, optional
+            Size of the concrete fibres [mm]. Default is the largest dimension of the cross-section divided by 50.
+
+        Returns
+        -------
+        ConcreteMesh
+            Concrete fibres of the profile of the cross-section.
+        """
+        mesh_size = default_mesh_size(self.profile.polygon) if mesh_size is None else mesh_size
+        return self._concrete_mesh_cache.get_or_compute(mesh_size, lambda: ConcreteMesh.from_polygon(self.profile.polygon, mesh_size))
+
+    def fibre_section(self, mesh_size: MM | None = None) -> FibreSection:
+        """Return the fibre model of the cross-section for sectional analysis.
+
+        The concrete is meshed once per mesh size, the fibre model (and everything calculated with it, like the interaction
+        diagrams) is cached until the reinforcement is changed with one of the `add_*` methods.
+
+        Parameters
+        ----------
+        mesh_size : MM | None, optional
+            Size of the concrete fibres [mm]. Default is the largest dimension of the cross-section divided by 50.
+
+        Returns
+        -------
+        FibreSection
+            Fibre model of the concrete and the longitudinal rebars.
+        """
+        mesh_size = default_mesh_size(self.profile.polygon) if mesh_size is None else mesh_size
+        return self._fibre_section_cache.get_or_compute(
+            mesh_size,
+            lambda: FibreSection(
+                concrete=self.concrete_mesh(mesh_size),
+                rebars=self.longitudinal_rebar_set,
+                concrete_material=self.concrete_material,
+            ),
+        )
+
+    def nm_interaction_diagram(self, axis: Literal["x", "y"] = "x", mesh_size: MM | None = None) -> NMInteractionDiagram:
+        """Return the N-M interaction diagram at the ultimate limit state, for bending about the x- or y-axis.
+
+        Parameters
+        ----------
+        axis : Literal["x", "y"], optional
+            Axis of bending (default is "x", bending about the horizontal axis).
+        mesh_size : MM | None, optional
+            Size of the concrete fibres [mm]. Default is the largest dimension of the cross-section divided by 50.
+
+        Returns
+        -------
+        NMInteractionDiagram
+            Interaction diagram of the axial force (compression negative) [kN] and the bending moment [kNm].
+        """
+        return self.fibre_section(mesh_size=mesh_size).nm_interaction_diagram(axis=axis)
+
+    def capacity_surface(self, mesh_size: MM | None = None) -> CapacitySurface:
+        """Return the N-Mx-My capacity surface at the ultimate limit state, for biaxial bending.
+
+        Parameters
+        ----------
+        mesh_size : MM | None, optional
+            Size of the concrete fibres [mm]. Default is the largest dimension of the cross-section divided by 50.
+
+        Returns
+        -------
+        CapacitySurface
+            Capacity surface of the axial force (compression negative) [kN] and the bending moments about both axes [kNm].
+        """
+        return self.fibre_section(mesh_size=mesh_size).capacity_surface()
+
+    def moment_curvature_solver(
+        self, creep_coefficient: DIMENSIONLESS = 0.0, cracked: bool = True, mesh_size: MM | None = None
+    ) -> MomentCurvatureSolver:
+        """Return the solver for the equilibrium at the serviceability limit state, sharing the fibre model of the cross-section.
+
+        Parameters
+        ----------
+        creep_coefficient : DIMENSIONLESS, optional
+            Final creep coefficient of the concrete, 0.0 for short term loading (default is 0.0).
+        cracked : bool, optional
+            True for cracked concrete without tensile stresses, False for uncracked concrete (default is True).
+        mesh_size : MM | None, optional
+            Size of the concrete fibres [mm]. Default is the largest dimension of the cross-section divided by 50.
+
+        Returns
+        -------
+        MomentCurvatureSolver
+            Solver with linear elastic concrete and reinforcement.
+        """
+        mesh_size = default_mesh_size(self.profile.polygon) if mesh_size is None else mesh_size
+        fibre_section = self.fibre_section(mesh_size=mesh_size)
+        return self._sls_solver_cache.get_or_compute(
+            (mesh_size, creep_coefficient, cracked),
+            lambda: MomentCurvatureSolver(fibre_section=fibre_section, creep_coefficient=creep_coefficient, cracked=cracked),
+        )
+
+    def sls_state(
+        self,
+        n: npt.ArrayLike = 0.0,
+        m_x: npt.ArrayLike = 0.0,
+        m_y: npt.ArrayLike = 0.0,
+        creep_coefficient: DIMENSIONLESS = 0.0,
+        cracked: bool = True,
+    ) -> SectionState:
+        """Return the stresses and curvatures at the serviceability limit state for an array of internal force combinations.
+
+        Parameters
+        ----------
+        n : npt.ArrayLike, optional
+            Axial forces, compression is negative [kN] (default is 0.0).
+        m_x : npt.ArrayLike, optional
+            Bending moments about the x-axis, positive for compression at the top [kNm] (default is 0.0).
+        m_y : npt.ArrayLike, optional
+            Bending moments about the y-axis, positive for compression at the right side [kNm] (default is 0.0).
+        creep_coefficient : DIMENSIONLESS, optional
+            Final creep coefficient of the concrete, 0.0 for short term loading (default is 0.0).
+        cracked : bool, optional
+            True for cracked concrete without tensile stresses, False for uncracked concrete (default is True).
+
+        Returns
+        -------
+        SectionState
+            Equilibrium states with the steel stresses, concrete stresses and curvatures of all combinations.
+        """
+        return self.moment_curvature_solver(creep_coefficient=creep_coefficient, cracked=cracked).solve(n=n, m_x=m_x, m_y=m_y)
+
     @property
     def stirrups(self) -> list[StirrupConfiguration]:
         """Return a list of all stirrups."""
@@ -78,7 +306,7 @@ class ReinforcedCrossSection(ABC):
     @property
     def reinforcement_weight_longitudinal_bars(self) -> KG_M:
         """Total mass of the longitudinal reinforcement in the cross-section per meter length [kg/m]."""
-        return sum(rebar.weight_per_meter for rebar in self.longitudinal_rebars)
+        return self.longitudinal_rebar_set.weight_per_meter
 
     @property
     def reinforcement_weight_stirrups(self) -> KG_M:
@@ -93,7 +321,7 @@ class ReinforcedCrossSection(ABC):
     @property
     def reinforcement_area_longitudinal_bars(self) -> MM2_M:
         """Total area of the longitudinal reinforcement in the cross-section per meter length [mm²/m]."""
-        return sum(rebar.area for rebar in self.longitudinal_rebars)
+        return self.longitudinal_rebar_set.area
 
     @property
     def concrete_volume(self) -> M3_M:
@@ -108,7 +336,7 @@ class ReinforcedCrossSection(ABC):
 
     def get_present_steel_materials(self) -> list[ReinforcementSteelMaterial]:
         """Return a list of all present steel materials in the cross-section."""
-        materials = [rebar.material for rebar in self.longitudinal_rebars]
+        materials = self.longitudinal_rebar_set.present_materials
         materials.extend(stirrup.material for stirrup in self._stirrups)
         return list(set(materials))
 
@@ -140,6 +368,7 @@ class ReinforcedCrossSection(ABC):
 
         # add the rebar to the list of longitudinal rebars
         self._single_longitudinal_rebars.append(rebar)
+        self._invalidate_layout()
 
         return rebar
 
@@ -170,6 +399,9 @@ class ReinforcedCrossSection(ABC):
         # add the stirrup to the list
         self._stirrups.append(stirrup)
 
+        # the reference lines of the reinforcement configurations depend on the stirrups present
+        self._invalidate_layout()
+
         return stirrup
 
     def add_reinforcement_configuration(
@@ -202,3 +434,4 @@ class ReinforcedCrossSection(ABC):
 
         # add the reinforcement configuration to the list
         self._reinforcement_configurations.append((line, configuration))
+        self._invalidate_layout()
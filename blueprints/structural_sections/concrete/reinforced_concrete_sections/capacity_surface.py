@@ -0,0 +1,252 @@
+"""Capacity surface of the axial force and biaxial bending moment resistance of a reinforced concrete cross-section."""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.type_alias import KN
+
+type FloatArray = npt.NDArray[np.float64]
+type IntArray = npt.NDArray[np.intp]
+
+RAY_CASTING_CHUNK_SIZE = 4096
+"""Number of load points that are intersected with the triangles of a bin at once, limiting the memory use."""
+
+_POLE_TOLERANCE = 1e-9
+_BARYCENTRIC_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True, eq=False)
+class CapacitySurface:
+    """Closed N-Mx-My capacity surface at the ultimate limit state, stored as a triangle mesh.
+
+    The vertices are the internal forces of the ultimate strain planes for a sweep of directions of the neutral axis. Every row
+    of the vertex arrays holds one direction, from uniform tension (first column) to uniform compression (last column).
+    Neighbouring rows and columns are connected by triangles, closing the surface around the origin.
+
+    For fast unity checks the triangles are sorted into bins of ray directions (azimuth and elevation of the load point in the
+    normalised force space), so every ray is only intersected with the few triangles in its direction.
+
+    Parameters
+    ----------
+    n : FloatArray
+        Axial forces of the vertices with shape (directions, planes), compression is negative [kN].
+    m_x : FloatArray
+        Bending moments about the x-axis of the vertices with shape (directions, planes) [kNm].
+    m_y : FloatArray
+        Bending moments about the y-axis of the vertices with shape (directions, planes) [kNm].
+    """
+
+    n: FloatArray
+    m_x: FloatArray
+    m_y: FloatArray
+    triangles: IntArray = field(init=False, repr=False)
+    """Indices of the three (flattened) vertices of every triangle of the surface."""
+    _scale: FloatArray = field(init=False, repr=False)
+    _vertex_0: FloatArray = field(init=False, repr=False)
+    _edge_1: FloatArray = field(init=False, repr=False)
+    _edge_2: FloatArray = field(init=False, repr=False)
+    _n_azimuth_bins: int = field(init=False, repr=False)
+    _n_elevation_bins: int = field(init=False, repr=False)
+    _bin_offsets: IntArray = field(init=False, repr=False)
+    _bin_triangles: IntArray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Create the triangles of the surface and sort them into bins of ray directions."""
+        n_directions, n_planes = self.n.shape
+
+        # two triangles per quad between neighbouring directions (rows, periodic) and planes (columns)
+        row, column = np.meshgrid(np.arange(n_directions), np.arange(n_planes - 1), indexing="ij")
+        v_00, v_10 = row * n_planes + column, (row + 1) % n_directions * n_planes + column
+        v_01, v_11 = v_00 + 1, v_10 + 1
+        triangles = np.concatenate(
+            [np.column_stack([v_00.ravel(), v_10.ravel(), v_11.ravel()]), np.column_stack([v_00.ravel(), v_11.ravel(), v_01.ravel()])]
+        )
+
+        # the ray casting is done in a normalised space, with all force components in the same order of magnitude
+        vertices = np.column_stack([self.n.ravel(), self.m_x.ravel(), self.m_y.ravel()])
+        scale = np.abs(vertices).max(axis=0)
+        scale[scale == 0] = 1.0
+        vertices = vertices / scale
+
+        # drop the degenerate triangles at the poles (uniform tension and compression are shared by all directions)
+        vertex_0 = vertices[triangles[:, 0]]
+        edge_1, edge_2 = vertices[triangles[:, 1]] - vertex_0, vertices[triangles[:, 2]] - vertex_0
+        valid = np.linalg.norm(np.cross(edge_1, edge_2), axis=1) > 0
+
+        object.__setattr__(self, "triangles", triangles[valid])
+        object.__setattr__(self, "_scale", scale)
+        object.__setattr__(self, "_vertex_0", vertex_0[valid])
+        object.__setattr__(self, "_edge_1", edge_1[valid])
+        object.__setattr__(self, "_edge_2", edge_2[valid])
+        object.__setattr__(self, "_n_azimuth_bins", 2 * n_directions)
+        object.__setattr__(self, "_n_elevation_bins", 2 * n_directions)
+        bin_offsets, bin_triangles = self._sort_into_bins(vertices[self.triangles])
+        object.__setattr__(self, "_bin_offsets", bin_offsets)
+        object.__setattr__(self, "_bin_triangles", bin_triangles)
+
+    @property
+    def n_rd_compression(self) -> KN:
+        """Axial compression resistance without bending, the most negative axial force of the surface [kN]."""
+        return float(self.n.min())
+
+    @property
+    def n_rd_tension(self) -> KN:
+        """Axial tension resistance without bending, the most positive axial force of the surface [kN]."""
+        return float(self.n.max())
+
+    @staticmethod
+    def _directions(points: FloatArray) -> tuple[FloatArray, FloatArray]:
+        """Azimuth (-pi to pi) and elevation (sine of the elevation angle, -1 to 1) of the directions of normalised points."""
+        length = np.linalg.norm(points, axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            elevation = np.clip(np.where(length > 0, points[..., 0] / length, 0.0), -1.0, 1.0)
+        return np.arctan2(points[..., 2], points[..., 1]), elevation
+
+    def _azimuth_bin(self, azimuth: npt.ArrayLike) -> IntArray:
+        """Column of the bins of azimuths between -pi and pi."""
+        azimuth_bin = np.floor((np.asarray(azimuth) + np.pi) / (2 * np.pi) * self._n_azimuth_bins).astype(np.intp)
+        return np.clip(azimuth_bin, 0, self._n_azimuth_bins - 1)
+
+    def _elevation_bin(self, elevation: npt.ArrayLike) -> IntArray:
+        """Row of the bins of elevations between -1 and 1."""
+        elevation_bin = np.floor((np.asarray(elevation) + 1.0) / 2.0 * self._n_elevation_bins).astype(np.intp)
+        return np.clip(elevation_bin, 0, self._n_elevation_bins - 1)
+
+    def _sort_into_bins(self, corners: FloatArray) -> tuple[IntArray, IntArray]:
+        """Sort the triangles into bins of ray directions.
+
+        Parameters
+        ----------
+        corners : FloatArray
+            Normalised vertices of the triangles with shape (triangles, 3, 3).
+
+        Returns
+        -------
+        tuple[IntArray, IntArray]
+            Offsets of the bins into the triangle indices (number of bins + 1), and the triangle indices sorted per bin.
+        """
+        azimuth, elevation = self._directions(corners)
+        # the edges from a pole are meridians, so the azimuth range of a triangle follows from its vertices away from the poles
+        at_pole = np.linalg.norm(corners[..., 1:], axis=-1) <= _POLE_TOLERANCE
+        # a margin of one bin accounts for the curved edges of the triangles projected on the unit sphere
+        azimuth_margin = 2 * np.pi / self._n_azimuth_bins
+        elevation_margin = 2.0 / self._n_elevation_bins
+        all_azimuths = np.arange(self._n_azimuth_bins)
+
+        bin_indices, triangle_indices = [], []
+        for index in range(len(corners)):
+            angles = azimuth[index][~at_pole[index]]
+            # unwrap the azimuths relative to the first vertex to handle the jump at -pi/pi
+            unwrapped = angles[0] + (angles - angles[0] + np.pi) % (2 * np.pi) - np.pi
+            low, high = unwrapped.min() - azimuth_margin, unwrapped.max() + azimuth_margin
+            if high - low < np.pi:
+                steps = np.append(np.arange(low, high, azimuth_margin / 2), high)
+                azimuths = np.unique(self._azimuth_bin((steps + np.pi) % (2 * np.pi) - np.pi))
+            else:
+                # the triangle surrounds one of the poles
+                azimuths = all_azimuths
+            first_row, last_row = self._elevation_bin([elevation[index].min() - elevation_margin, elevation[index].max() + elevation_margin])
+            rows = np.arange(first_row, last_row + 1)
+            bins = (rows[:, np.newaxis] * self._n_azimuth_bins + azimuths).ravel()
+            bin_indices.append(bins)
+            triangle_indices.append(np.full(bins.size, index))
+
+        bin_index, triangle_index = np.concatenate(bin_indices), np.concatenate(triangle_indices)
+        order = np.argsort(bin_index, kind="stable")
+        offsets = np.searchsorted(bin_index[order], np.arange(self._n_azimuth_bins * self._n_elevation_bins + 1))
+        return offsets, triangle_index[order]
+
+    def _ray_parameters(self, points: FloatArray, triangles: IntArray) -> FloatArray:
+        """Smallest distances along the rays from the origin through the points to the triangles (Möller-Trumbore algorithm).
+
+        Parameters
+        ----------
+        points : FloatArray
+            Normalised load points with shape (points, 3).
+        triangles : IntArray
+            Indices of the triangles that are intersected with every ray.
+
+        Returns
+        -------
+        FloatArray
+            Ray parameter t of the nearest intersection per point (the load point itself is at t = 1), infinite when missed.
+        """
+        vertex_0, edge_1, edge_2 = self._vertex_0[triangles], self._edge_1[triangles], self._edge_2[triangles]
+        direction = points[:, np.newaxis, :]
+        h = np.cross(direction, edge_2)
+        q = np.cross(-vertex_0, edge_1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f = 1.0 / np.einsum("ij,kij->ki", edge_1, h)
+            u = -f * np.einsum("ij,kij->ki", vertex_0, h)
+            v = f * np.einsum("kj,ij->ki", points, q)
+            t = f * (edge_2 * q).sum(axis=1)
+            hit = np.isfinite(f) & (u >= -_BARYCENTRIC_TOLERANCE) & (v >= -_BARYCENTRIC_TOLERANCE) & (u + v <= 1.0 + _BARYCENTRIC_TOLERANCE) & (t > 0)
+        return np.where(hit, t, np.inf).min(axis=1, initial=np.inf)
+
+    def unity_check(self, n: npt.ArrayLike, m_x: npt.ArrayLike, m_y: npt.ArrayLike) -> FloatArray:
+        """Unity checks of an array of load points.
+
+        The unity check is the ratio between the distance of the load point to the origin and the distance of the surface to the
+        origin in the same direction (all internal forces scaled proportionally). It is found by casting a ray from the origin through
+        the load point and intersecting it with the triangles of the surface in the direction of the ray.
+
+        Parameters
+        ----------
+        n : npt.ArrayLike
+            Axial forces, compression is negative [kN].
+        m_x : npt.ArrayLike
+            Bending moments about the x-axis [kNm].
+        m_y : npt.ArrayLike
+            Bending moments about the y-axis [kNm].
+
+        Returns
+        -------
+        FloatArray
+            Unity checks of the load points, values above 1.0 are outside the surface.
+        """
+        n, m_x, m_y = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (n, m_x, m_y)))
+        shape = n.shape
+        points = np.column_stack([n.ravel(), m_x.ravel(), m_y.ravel()]) / self._scale
+
+        # the load points are grouped per bin of ray directions and only intersected with the triangles in the bin
+        azimuth, elevation = self._directions(points)
+        bins = self._elevation_bin(elevation) * self._n_azimuth_bins + self._azimuth_bin(azimuth)
+        order = np.argsort(bins, kind="stable")
+        bin_starts = np.flatnonzero(np.diff(bins[order], prepend=-1))
+        t = np.full(len(points), np.inf)
+        for start, end in zip(bin_starts, [*bin_starts[1:], len(points)]):
+            bin_index = bins[order[start]]
+            triangles = self._bin_triangles[self._bin_offsets[bin_index] : self._bin_offsets[bin_index + 1]]
+            for chunk in range(start, end, RAY_CASTING_CHUNK_SIZE):
+                indices = order[chunk : min(chunk + RAY_CASTING_CHUNK_SIZE, end)]
+                t[indices] = self._ray_parameters(points[indices], triangles)
+
+        # rays that pass between the bins because of rounding are intersected with all triangles
+        missed = np.flatnonzero(np.isinf(t) & np.any(points != 0, axis=1))
+        all_triangles = np.arange(len(self.triangles))
+        for chunk in range(0, missed.size, RAY_CASTING_CHUNK_SIZE):
+            indices = missed[chunk : chunk + RAY_CASTING_CHUNK_SIZE]
+            t[indices] = self._ray_parameters(points[indices], all_triangles)
+
+        return (1.0 / t).reshape(shape)
+
+    def contains(self, n: npt.ArrayLike, m_x: npt.ArrayLike, m_y: npt.ArrayLike) -> npt.NDArray[np.bool_]:
+        """Check for an array of load points whether they are inside the surface (boundary included).
+
+        Parameters
+        ----------
+        n : npt.ArrayLike
+            Axial forces, compression is negative [kN].
+        m_x : npt.ArrayLike
+            Bending moments about the x-axis [kNm].
+        m_y : npt.ArrayLike
+            Bending moments about the y-axis [kNm].
+
+        Returns
+        -------
+        npt.NDArray[np.bool_]
+            True for every load point on or inside the surface.
+        """
+        return self.unity_check(n, m_x, m_y) <= 1.0 + _BARYCENTRIC_TOLERANCE
@@ -0,0 +1,414 @@
+"""Fibre discretisation of reinforced concrete cross-sections for sectional analysis.
+
+The concrete polygon is divided into small fibres by clipping a square grid with the polygon, the rebars are point fibres.
+Strains are given by strain planes, which are evaluated for many planes at once:
+
+    strain(x, y) = eps_0 - kappa_x * (y - y_ref) - kappa_y * (x - x_ref)
+
+where (x_ref, y_ref) is the centroid of the concrete. Compressive strains, stresses and axial forces are negative. A positive
+curvature or moment compresses the fibres at the positive side of the axis (m_x: top fibres, positive y; m_y: positive x).
+"""
+
+from dataclasses import dataclass, field
+from math import ceil
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+import shapely
+from shapely import Polygon
+
+from blueprints.materials.concrete import ConcreteMaterial, DiagramType
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.rebar_set import RebarSet
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.capacity_surface import CapacitySurface
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.interaction_diagram import NMInteractionDiagram
+from blueprints.type_alias import DEG, DIMENSIONLESS, MM
+from blueprints.unit_conversion import DEG_TO_RAD, N_TO_KN, NMM_TO_KNM, PER_MILLE_TO_RATIO
+from blueprints.utils.cache import ComputeOnceCache
+
+type FloatArray = npt.NDArray[np.float64]
+
+DEFAULT_FIBRES_PER_SIDE = 50
+"""Default number of fibres along the largest dimension of the cross-section."""
+
+ULTIMATE_STEEL_STRAIN_FACTOR = 0.9
+"""Ratio between the design and characteristic strain limit of the reinforcement, [$\\varepsilon_{ud} / \\varepsilon_{uk}$] (EN 1992-1-1 3.2.7(2))."""
+
+
+@dataclass(frozen=True, eq=False)
+class ConcreteMesh:
+    """Concrete fibres of a polygon.
+
+    Parameters
+    ----------
+    x : FloatArray
+        x-coordinates of the centroids of the fibres [mm]
+    y : FloatArray
+        y-coordinates of the centroids of the fibres [mm]
+    area : FloatArray
+        Areas of the fibres [mm²]
+    boundary_x : FloatArray
+        x-coordinates of the vertices of the polygon, used to find the extreme fibres [mm]
+    boundary_y : FloatArray
+        y-coordinates of the vertices of the polygon, used to find the extreme fibres [mm]
+    """
+
+    x: FloatArray
+    y: FloatArray
+    area: FloatArray
+    boundary_x: FloatArray
+    boundary_y: FloatArray
+
+    @classmethod
+    def from_polygon(cls, polygon: Polygon, mesh_size: MM) -> "ConcreteMesh":
+        """Divide a polygon into fibres by clipping a square grid with the polygon.
+
+        Parameters
+        ----------
+        polygon : Polygon
+            Outline of the concrete.
+        mesh_size : MM
+            Size of the grid cells [mm].
+
+        Returns
+        -------
+        ConcreteMesh
+            Fibres of the polygon. The clipped fibres have exactly the area and centroid of the polygon.
+        """
+        if mesh_size <= 0:
+            msg = f"Mesh size must be a positive value, but got {mesh_size}"
+            raise ValueError(msg)
+
+        min_x, min_y, max_x, max_y = polygon.bounds
+        grid_x = np.linspace(min_x, max_x, max(ceil((max_x - min_x) / mesh_size), 1) + 1)
+        grid_y = np.linspace(min_y, max_y, max(ceil((max_y - min_y) / mesh_size), 1) + 1)
+        x_0, y_0 = np.meshgrid(grid_x[:-1], grid_y[:-1])
+        x_1, y_1 = np.meshgrid(grid_x[1:], grid_y[1:])
+
+        fibres = shapely.intersection(shapely.box(x_0.ravel(), y_0.ravel(), x_1.ravel(), y_1.ravel()), polygon)
+        area = shapely.area(fibres)
+        fibres, area = fibres[area > 0], area[area > 0]
+        centroids = shapely.get_coordinates(shapely.centroid(fibres))
+        boundary = shapely.get_coordinates(polygon.exterior)
+
+        return cls(x=centroids[:, 0], y=centroids[:, 1], area=area, boundary_x=boundary[:, 0], boundary_y=boundary[:, 1])
+
+    @property
+    def total_area(self) -> float:
+        """Total area of the fibres [mm²]."""
+        return float(self.area.sum())
+
+    @property
+    def centroid(self) -> tuple[MM, MM]:
+        """Centroid (x, y) of the fibres [mm]."""
+        return float(self.area @ self.x) / self.total_area, float(self.area @ self.y) / self.total_area
+
+
+def default_mesh_size(polygon: Polygon) -> MM:
+    """Default mesh size for a polygon, resulting in `DEFAULT_FIBRES_PER_SIDE` fibres along its largest dimension [mm]."""
+    min_x, min_y, max_x, max_y = polygon.bounds
+    return max(max_x - min_x, max_y - min_y) / DEFAULT_FIBRES_PER_SIDE
+
+
+def concrete_design_stress(material: ConcreteMaterial, strain: npt.ArrayLike) -> FloatArray:
+    """Design stresses of concrete for an array of strains (EN 1992-1-1 3.1.7), tension is neglected.
+
+    Parameters
+    ----------
+    material : ConcreteMaterial
+        Concrete material, its diagram type selects the parabola-rectangle (formulas 3.17 and 3.18) or bi-linear (figure 3.4) diagram.
+    strain : npt.ArrayLike
+        Strains [-], compression is negative.
+
+    Returns
+    -------
+    FloatArray
+        Stresses [MPa], compression is negative.
+    """
+    return material.design_diagram.stress(strain)
+
+
+def steel_design_stress(material: ReinforcementSteelMaterial, strain: npt.ArrayLike) -> FloatArray:
+    """Design stresses of reinforcement steel for an array of strains (EN 1992-1-1 3.2.7, figure 3.8).
+
+    Parameters
+    ----------
+    material : ReinforcementSteelMaterial
+        Reinforcement steel material, its diagram type selects the bi-linear diagram with horizontal or inclined top branch.
+    strain : npt.ArrayLike
+        Strains [-], compression is negative.
+
+    Returns
+    -------
+    FloatArray
+        Stresses [MPa], compression is negative.
+    """
+    return material.design_diagram.stress(strain)
+
+
+@dataclass(frozen=True, eq=False)
+class FibreSection:
+    """Fibre model of a reinforced concrete cross-section.
+
+    Parameters
+    ----------
+    concrete : ConcreteMesh
+        Concrete fibres of the cross-section.
+    rebars : RebarSet
+        Longitudinal rebars, used as point fibres. The concrete displaced by the rebars is subtracted at the rebar positions.
+    concrete_material : ConcreteMaterial
+        Material of the concrete.
+    """
+
+    concrete: ConcreteMesh
+    rebars: RebarSet
+    concrete_material: ConcreteMaterial
+    x_ref: MM = field(init=False)
+    """x-coordinate of the reference point of the strain planes, the centroid of the concrete [mm]."""
+    y_ref: MM = field(init=False)
+    """y-coordinate of the reference point of the strain planes, the centroid of the concrete [mm]."""
+    _diagram_cache: ComputeOnceCache[tuple[str, int], NMInteractionDiagram] = field(default_factory=ComputeOnceCache, init=False, repr=False)
+    _surface_cache: ComputeOnceCache[tuple[int, int], CapacitySurface] = field(default_factory=ComputeOnceCache, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Set the reference point of the strain planes."""
+        x_ref, y_ref = self.concrete.centroid
+        object.__setattr__(self, "x_ref", x_ref)
+        object.__setattr__(self, "y_ref", y_ref)
+
+    @property
+    def eps_cu(self) -> DIMENSIONLESS:
+        """Ultimate compressive strain of the concrete for the diagram type of the concrete material [-]."""
+        if self.concrete_material.diagram_type == DiagramType.PARABOLIC:
+            return self.concrete_material.eps_cu2 * PER_MILLE_TO_RATIO
+        return self.concrete_material.eps_cu3 * PER_MILLE_TO_RATIO
+
+    @property
+    def eps_c(self) -> DIMENSIONLESS:
+        """Compressive strain of the concrete at reaching the design strength, for the diagram type of the concrete material [-]."""
+        if self.concrete_material.diagram_type == DiagramType.PARABOLIC:
+            return self.concrete_material.eps_c2 * PER_MILLE_TO_RATIO
+        return self.concrete_material.eps_c3 * PER_MILLE_TO_RATIO
+
+    @property
+    def eps_ud(self) -> DIMENSIONLESS:
+        """Design strain limit of the reinforcement, the smallest of all rebar materials [-]."""
+        return min(material.eps_uk for material in self.rebars.materials) * PER_MILLE_TO_RATIO * ULTIMATE_STEEL_STRAIN_FACTOR
+
+    def strains(
+        self,
+        eps_0: npt.ArrayLike,
+        kappa_x: npt.ArrayLike = 0.0,
+        kappa_y: npt.ArrayLike = 0.0,
+        x: FloatArray | None = None,
+        y: FloatArray | None = None,
+    ) -> FloatArray:
+        """Strains of the fibres at the given coordinates for an array of strain planes.
+
+        Parameters
+        ----------
+        eps_0 : npt.ArrayLike
+            Strains at the reference point [-].
+        kappa_x : npt.ArrayLike, optional
+            Curvatures about the x-axis, positive for compression at positive y [1/mm] (default is 0.0).
+        kappa_y : npt.ArrayLike, optional
+            Curvatures about the y-axis, positive for compression at positive x [1/mm] (default is 0.0).
+        x : FloatArray | None, optional
+            x-coordinates of the fibres [mm], default are the concrete fibres.
+        y : FloatArray | None, optional
+            y-coordinates of the fibres [mm], default are the concrete fibres.
+
+        Returns
+        -------
+        FloatArray
+            Strains with shape (number of planes, number of fibres) [-].
+        """
+        x = self.concrete.x if x is None else x
+        y = self.concrete.y if y is None else y
+        eps_0, kappa_x, kappa_y = (
+            np.atleast_1d(np.asarray(value, dtype=float))[:, np.newaxis] for value in np.broadcast_arrays(eps_0, kappa_x, kappa_y)
+        )
+        return eps_0 - kappa_x * (y - self.y_ref) - kappa_y * (x - self.x_ref)
+
+    def rebar_stresses(self, strain: FloatArray) -> FloatArray:
+        """Design stresses in the rebars for an array of rebar strains [MPa].
+
+        Parameters
+        ----------
+        strain : FloatArray
+            Strains of the rebars with shape (number of planes, number of rebars) [-].
+
+        Returns
+        -------
+        FloatArray
+            Stresses in the rebars [MPa].
+        """
+        stress = np.empty_like(strain)
+        for index, material in enumerate(self.rebars.materials):
+            same_material = self.rebars.material_index == index
+            stress[:, same_material] = steel_design_stress(material, strain[:, same_material])
+        return stress
+
+    def resultants(
+        self, eps_0: npt.ArrayLike, kappa_x: npt.ArrayLike = 0.0, kappa_y: npt.ArrayLike = 0.0
+    ) -> tuple[FloatArray, FloatArray, FloatArray]:
+        """Internal forces of the design stresses for an array of strain planes.
+
+        Parameters
+        ----------
+        eps_0 : npt.ArrayLike
+            Strains at the reference point [-].
+        kappa_x : npt.ArrayLike, optional
+            Curvatures about the x-axis, positive for compression at positive y [1/mm] (default is 0.0).
+        kappa_y : npt.ArrayLike, optional
+            Curvatures about the y-axis, positive for compression at positive x [1/mm] (default is 0.0).
+
+        Returns
+        -------
+        tuple[FloatArray, FloatArray, FloatArray]
+            Axial force n [kN] (compression negative), moment m_x [kNm] and moment m_y [kNm] per strain plane.
+        """
+        concrete_force = concrete_design_stress(self.concrete_material, self.strains(eps_0, kappa_x, kappa_y)) * self.concrete.area
+        n = concrete_force.sum(axis=1)
+        m_x = -concrete_force @ (self.concrete.y - self.y_ref)
+        m_y = -concrete_force @ (self.concrete.x - self.x_ref)
+
+        if len(self.rebars):
+            rebar_strain = self.strains(eps_0, kappa_x, kappa_y, x=self.rebars.x, y=self.rebars.y)
+            rebar_stress = self.rebar_stresses(rebar_strain) - concrete_design_stress(self.concrete_material, rebar_strain)
+            rebar_force = rebar_stress * self.rebars.areas
+            n += rebar_force.sum(axis=1)
+            m_x -= rebar_force @ (self.rebars.y - self.y_ref)
+            m_y -= rebar_force @ (self.rebars.x - self.x_ref)
+
+        return n * N_TO_KN, m_x * NMM_TO_KNM, m_y * NMM_TO_KNM
+
+    def ultimate_strain_planes(self, angle: DEG, n_points: int = 40) -> tuple[FloatArray, FloatArray, FloatArray]:
+        """Strain planes at the ultimate limit state for one direction of the neutral axis (EN 1992-1-1 6.1(5), figure 6.1).
+
+        The planes run from pure tension to pure compression, rotating around the three pivots of figure 6.1:
+
+        - A: the design strain limit of the reinforcement at the most tensioned rebar.
+        - B: the ultimate compressive strain of the concrete at the most compressed fibre.
+        - C: the compressive strain at reaching the design strength, at the pivot depth of a fully compressed section.
+
+        Parameters
+        ----------
+        angle : DEG
+            Direction from the tension side towards the compression side of the cross-section, measured counterclockwise
+            from the positive x-axis [deg]. For example 90 degrees compresses the top of the cross-section.
+        n_points : int, optional
+            Number of strain planes per pivot (default is 40).
+
+        Returns
+        -------
+        tuple[FloatArray, FloatArray, FloatArray]
+            Arrays eps_0 [-], kappa_x [1/mm] and kappa_y [1/mm] of the strain planes.
+
+        Raises
+        ------
+        ValueError
+            If the cross-section has no longitudinal rebars.
+        """
+        if not len(self.rebars):
+            raise ValueError("The cross-section needs longitudinal rebars to determine the strain planes at the ultimate limit state.")
+
+        direction_x, direction_y = np.cos(angle * DEG_TO_RAD), np.sin(angle * DEG_TO_RAD)
+        boundary = direction_x * (self.concrete.boundary_x - self.x_ref) + direction_y * (self.concrete.boundary_y - self.y_ref)
+        u_top, u_bottom = boundary.max(), boundary.min()
+        u_steel = (direction_x * (self.rebars.x - self.x_ref) + direction_y * (self.rebars.y - self.y_ref)).min()
+        height = u_top - u_bottom
+        depth = u_top - u_steel
+        eps_cu, eps_c, eps_ud = self.eps_cu, self.eps_c, self.eps_ud
+
+        # every plane is defined by the strain at the top and the strain at a second level u
+        # pivot A: design strain limit at the most tensioned rebar, from uniform tension to eps_cu at the top
+        eps_top_a = np.linspace(eps_ud, -eps_cu, n_points, endpoint=False)
+        eps_a = np.full(n_points, eps_ud)
+        u_a = np.full(n_points, u_steel)
+
+        # pivot B: eps_cu at the top, the depth of the neutral axis increases until the bottom is free of strain
+        neutral_axis_depth = np.linspace(depth * eps_cu / (eps_cu + eps_ud), height, n_points, endpoint=False)
+        eps_top_b = np.full(n_points, -eps_cu)
+        eps_b = -eps_cu * (1.0 - height / neutral_axis_depth)
+        u_b = np.full(n_points, u_bottom)
+
+        # pivot C: eps_c at the pivot depth, the strain at the bottom increases to eps_c (uniform compression)
+        u_pivot = u_top - (1.0 - eps_c / eps_cu) * height
+        eps_bottom_c = np.linspace(0.0, -eps_c, n_points + 1)
+        eps_top_c = eps_bottom_c + (-eps_c - eps_bottom_c) * height / (u_pivot - u_bottom)
+        u_c = np.full(n_points + 1, u_bottom)
+
+        eps_top = np.concatenate([eps_top_a, eps_top_b, eps_top_c])
+        eps_level = np.concatenate([eps_a, eps_b, eps_bottom_c])
+        u_level = np.concatenate([u_a, u_b, u_c])
+
+        # strain(u) = eps_0 - kappa * u, with u measured from the reference point along the direction
+        kappa = (eps_level - eps_top) / (u_top - u_level)
+        eps_0 = eps_top + kappa * u_top
+        return eps_0, kappa * direction_y, kappa * direction_x
+
+    def nm_interaction_diagram(self, axis: Literal["x", "y"] = "x", n_points: int = 40) -> NMInteractionDiagram:
+        """N-M interaction diagram at the ultimate limit state for bending about one of the axes of the cross-section.
+
+        The diagram is calculated once per axis and number of points, and cached.
+
+        Parameters
+        ----------
+        axis : Literal["x", "y"], optional
+            Axis of bending (default is "x", bending about the horizontal axis).
+        n_points : int, optional
+            Number of strain planes per pivot and per side of the diagram (default is 40).
+
+        Returns
+        -------
+        NMInteractionDiagram
+            Interaction diagram of the axial force and the moment about the given axis.
+        """
+        return self._diagram_cache.get_or_compute((axis, n_points), lambda: self._nm_interaction_diagram(axis=axis, n_points=n_points))
+
+    def _nm_interaction_diagram(self, axis: Literal["x", "y"], n_points: int) -> NMInteractionDiagram:
+        """Calculate the N-M interaction diagram for bending about one of the axes of the cross-section."""
+        match axis:
+            case "x":
+                positive_angle = 90.0
+            case "y":
+                positive_angle = 0.0
+            case _:
+                msg = f"Axis '{axis}' is not supported. Supported axes are 'x' and 'y'."
+                raise ValueError(msg)
+
+        # positive side from pure tension to pure compression, followed by the negative side back to pure tension
+        positive_planes = self.ultimate_strain_planes(angle=positive_angle, n_points=n_points)
+        negative_planes = self.ultimate_strain_planes(angle=positive_angle + 180.0, n_points=n_points)
+        eps_0, kappa_x, kappa_y = (np.concatenate([positive, negative[::-1]]) for positive, negative in zip(positive_planes, negative_planes))
+
+        n, m_x, m_y = self.resultants(eps_0, kappa_x, kappa_y)
+        return NMInteractionDiagram(n=n, m=m_x if axis == "x" else m_y, axis=axis)
+
+    def capacity_surface(self, n_directions: int = 36, n_points: int = 20) -> CapacitySurface:
+        """N-Mx-My capacity surface at the ultimate limit state for biaxial bending.
+
+        The strain planes of all directions of the neutral axis are swept and the internal forces are calculated per direction
+        for all planes at once. The surface is calculated once per number of directions and points, and cached.
+
+        Parameters
+        ----------
+        n_directions : int, optional
+            Number of directions of the neutral axis, evenly spaced over 360 degrees (default is 36).
+        n_points : int, optional
+            Number of strain planes per pivot and per direction (default is 20).
+
+        Returns
+        -------
+        CapacitySurface
+            Capacity surface of the axial force and the moments about the x- and y-axis.
+        """
+        return self._surface_cache.get_or_compute((n_directions, n_points), lambda: self._capacity_surface(n_directions, n_points))
+
+    def _capacity_surface(self, n_directions: int, n_points: int) -> CapacitySurface:
+        """Calculate the N-Mx-My capacity surface, one direction of the neutral axis per row of the surface."""
+        angles = np.linspace(0.0, 360.0, n_directions, endpoint=False)
+        resultants = np.array([self.resultants(*self.ultimate_strain_planes(angle=angle, n_points=n_points)) for angle in angles])
+        return CapacitySurface(n=resultants[:, 0], m_x=resultants[:, 1], m_y=resultants[:, 2])
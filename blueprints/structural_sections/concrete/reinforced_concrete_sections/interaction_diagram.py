@@ -0,0 +1,121 @@
+"""Interaction diagram of the axial force and bending moment resistance of a reinforced concrete cross-section."""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import numpy.typing as npt
+import shapely
+from shapely import Polygon
+
+from blueprints.type_alias import KN, KNM
+
+type FloatArray = npt.NDArray[np.float64]
+
+RAY_CASTING_CHUNK_SIZE = 4096
+"""Number of load points that are checked against all edges of the diagram at once, limiting the memory use."""
+
+
+@dataclass(frozen=True, eq=False)
+class NMInteractionDiagram:
+    """Closed N-M interaction diagram at the ultimate limit state.
+
+    Parameters
+    ----------
+    n : FloatArray
+        Axial forces of the points on the diagram, compression is negative [kN].
+    m : FloatArray
+        Bending moments of the points on the diagram [kNm].
+    axis : str
+        Axis of bending of the moments, "x" or "y".
+    """
+
+    n: FloatArray
+    m: FloatArray
+    axis: str
+    polygon: Polygon = field(init=False, repr=False)
+    """Diagram as a polygon with the moments on the horizontal axis and the axial forces on the vertical axis."""
+
+    def __post_init__(self) -> None:
+        """Create the polygon of the diagram."""
+        object.__setattr__(self, "polygon", Polygon(np.column_stack([self.m, self.n])))
+        shapely.prepare(self.polygon)
+
+    @property
+    def n_rd_compression(self) -> KN:
+        """Axial compression resistance without bending, the most negative axial force of the diagram [kN]."""
+        return float(self.n.min())
+
+    @property
+    def n_rd_tension(self) -> KN:
+        """Axial tension resistance without bending, the most positive axial force of the diagram [kN]."""
+        return float(self.n.max())
+
+    @property
+    def m_rd_max(self) -> KNM:
+        """Largest positive bending moment resistance of the diagram [kNm]."""
+        return float(self.m.max())
+
+    @property
+    def m_rd_min(self) -> KNM:
+        """Largest negative bending moment resistance of the diagram [kNm]."""
+        return float(self.m.min())
+
+    def contains(self, n: npt.ArrayLike, m: npt.ArrayLike) -> npt.NDArray[np.bool_]:
+        """Check for an array of load points whether they are inside the diagram (boundary included).
+
+        Parameters
+        ----------
+        n : npt.ArrayLike
+            Axial forces, compression is negative [kN].
+        m : npt.ArrayLike
+            Bending moments [kNm].
+
+        Returns
+        -------
+        npt.NDArray[np.bool_]
+            True for every load point on or inside the diagram.
+        """
+        return shapely.intersects_xy(self.polygon, np.asarray(m, dtype=float), np.asarray(n, dtype=float))
+
+    def unity_check(self, n: npt.ArrayLike, m: npt.ArrayLike) -> FloatArray:
+        """Unity checks of an array of load points.
+
+        The unity check is the ratio between the distance of the load point to the origin and the distance of the diagram to the
+        origin in the same direction (the load point is scaled proportionally). It is found by casting a ray from the origin through
+        the load point and intersecting it with all edges of the diagram at once.
+
+        Parameters
+        ----------
+        n : npt.ArrayLike
+            Axial forces, compression is negative [kN].
+        m : npt.ArrayLike
+            Bending moments [kNm].
+
+        Returns
+        -------
+        FloatArray
+            Unity checks of the load points, values above 1.0 are outside the diagram.
+        """
+        n, m = np.broadcast_arrays(np.asarray(n, dtype=float), np.asarray(m, dtype=float))
+        shape = n.shape
+        points_m, points_n = m.ravel(), n.ravel()
+
+        start_m, start_n = self.m, self.n
+        edge_m, edge_n = np.roll(self.m, -1) - self.m, np.roll(self.n, -1) - self.n
+        # cross products of the start points and edges, independent of the load points
+        start_cross_edge = start_m * edge_n - start_n * edge_m
+
+        unity_checks = np.zeros(points_m.size)
+        for chunk in range(0, points_m.size, RAY_CASTING_CHUNK_SIZE):
+            p_m = points_m[chunk : chunk + RAY_CASTING_CHUNK_SIZE, np.newaxis]
+            p_n = points_n[chunk : chunk + RAY_CASTING_CHUNK_SIZE, np.newaxis]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                denominator = p_m * edge_n - p_n * edge_m
+                # the ray t * p crosses the edge start + s * edge at t = (start x edge) / (p x edge) and s = (start x p) / (p x edge)
+                t = start_cross_edge / denominator
+                s = (start_m * p_n - start_n * p_m) / denominator
+            hits = (denominator != 0) & (s >= 0.0) & (s <= 1.0) & (t > 0.0)
+            t_boundary = np.where(hits, t, np.inf).min(axis=1)
+            unity_checks[chunk : chunk + RAY_CASTING_CHUNK_SIZE] = 1.0 / t_boundary
+
+        return unity_checks.reshape(shape)
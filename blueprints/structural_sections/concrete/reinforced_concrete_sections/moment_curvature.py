@@ -0,0 +1,337 @@
+"""Moment-curvature and cracked-section analysis of reinforced concrete cross-sections at the serviceability limit state.
+
+The fibre model of the cross-section is reused with linear elastic stress-strain relations for the serviceability limit state:
+
+- concrete: the effective modulus of elasticity (EN 1992-1-1 formula 7.20) in compression. In tension the concrete is either
+  fully cracked (no stress, state II) or uncracked (linear elastic, state I).
+- reinforcement: the modulus of elasticity of the steel up to the characteristic yield strength.
+
+The equilibrium of an array of internal forces is found with a vectorised Newton-Raphson iteration of the strain planes, using
+the same sign convention as the fibre model: compressive strains, stresses and axial forces are negative.
+"""
+
+from dataclasses import dataclass, field
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_7_serviceability_limit_state.formula_7_20 import Form7Dot20EffectiveModulusCreep
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.fibre_section import FibreSection
+from blueprints.type_alias import DIMENSIONLESS, KN, KNM, MPA
+from blueprints.unit_conversion import KN_TO_N, KNM_TO_NMM, N_TO_KN, NMM_TO_KNM
+
+type FloatArray = npt.NDArray[np.float64]
+
+SOLVER_CHUNK_SIZE = 1024
+"""Number of internal force combinations that are solved at once, limiting the memory use."""
+
+_STIFFNESS_REGULARISATION = 1e-9
+"""Fraction of the uncracked stiffness added to the tangent stiffness, keeping it invertible when (almost) all fibres have no stiffness."""
+
+
+@dataclass(frozen=True, eq=False)
+class SectionState:
+    """Equilibrium states of a cross-section for an array of internal force combinations.
+
+    Parameters
+    ----------
+    solver : MomentCurvatureSolver
+        Solver that found the equilibrium states, defining the fibre model and the stress-strain relations.
+    eps_0 : FloatArray
+        Strains at the reference point (the centroid of the concrete) [-].
+    kappa_x : FloatArray
+        Curvatures about the x-axis, positive for compression at positive y [1/mm].
+    kappa_y : FloatArray
+        Curvatures about the y-axis, positive for compression at positive x [1/mm].
+    converged : npt.NDArray[np.bool_]
+        False for every combination without equilibrium within the maximum number of iterations, for example beyond yielding.
+    """
+
+    solver: "MomentCurvatureSolver"
+    eps_0: FloatArray
+    kappa_x: FloatArray
+    kappa_y: FloatArray
+    converged: npt.NDArray[np.bool_]
+
+    def __len__(self) -> int:
+        """Number of internal force combinations."""
+        return self.eps_0.size
+
+    @property
+    def curvature(self) -> FloatArray:
+        """Magnitude of the curvature, [$1/r$] [1/mm]."""
+        return np.hypot(self.kappa_x, self.kappa_y)
+
+    @property
+    def internal_forces(self) -> tuple[FloatArray, FloatArray, FloatArray]:
+        """Axial force n [kN] (compression negative), moment m_x [kNm] and moment m_y [kNm] of the stresses."""
+        return self.solver.resultants(self.eps_0, self.kappa_x, self.kappa_y)
+
+    @property
+    def rebar_strains(self) -> FloatArray:
+        """Strains in the rebars with shape (combinations, rebars) [-]."""
+        rebars = self.solver.fibre_section.rebars
+        return self.solver.fibre_section.strains(self.eps_0, self.kappa_x, self.kappa_y, x=rebars.x, y=rebars.y)
+
+    @property
+    def rebar_stresses(self) -> FloatArray:
+        """Stresses in the rebars with shape (combinations, rebars), tension is positive [MPa]."""
+        return self.solver.steel_stress(self.rebar_strains)[0]
+
+    @property
+    def steel_stress(self) -> FloatArray:
+        r"""Largest tensile stress in the reinforcement per combination, [$\sigma_s$] [MPa]. Negative when all rebars are compressed."""
+        return self.rebar_stresses.max(axis=1)
+
+    @property
+    def concrete_stress(self) -> FloatArray:
+        r"""Largest compressive stress in the concrete per combination, [$\sigma_c$] [MPa]. Zero when no concrete is compressed."""
+        concrete = self.solver.fibre_section.concrete
+        strains = self.solver.fibre_section.strains(self.eps_0, self.kappa_x, self.kappa_y, x=concrete.boundary_x, y=concrete.boundary_y)
+        return np.minimum(self.solver.concrete_stress(strains)[0].min(axis=1), 0.0)
+
+    @property
+    def compression_zone_depth(self) -> FloatArray:
+        """Depth of the neutral axis below the most compressed concrete fibre per combination, [$x$] [mm].
+
+        Infinite without curvature, and larger than the height of the cross-section when the cross-section is fully compressed.
+        """
+        concrete = self.solver.fibre_section.concrete
+        strains = self.solver.fibre_section.strains(self.eps_0, self.kappa_x, self.kappa_y, x=concrete.boundary_x, y=concrete.boundary_y)
+        curvature = self.curvature
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(curvature > 0, np.maximum(-strains.min(axis=1), 0.0) / curvature, np.inf)
+
+
+@dataclass(frozen=True, eq=False)
+class MomentCurvatureSolver:
+    r"""Solver for the equilibrium of a reinforced concrete cross-section at the serviceability limit state.
+
+    The fibre model is shared with the ultimate limit state analyses, only the stress-strain relations differ. The geometry of all
+    fibres is collected once, so every iteration for an array of combinations is a few matrix products.
+
+    Parameters
+    ----------
+    fibre_section : FibreSection
+        Fibre model of the concrete and the longitudinal rebars.
+    creep_coefficient : DIMENSIONLESS, optional
+        Final creep coefficient of the concrete [$\varphi(\infty, t_0)$], 0.0 for short term loading (default is 0.0).
+    cracked : bool, optional
+        True for cracked concrete without tensile stresses (state II), False for uncracked concrete (state I) (default is True).
+    tolerance : DIMENSIONLESS, optional
+        Largest change of the fibre strains in the last iteration of a converged equilibrium [-] (default is 1e-12).
+    max_iterations : int, optional
+        Maximum number of Newton-Raphson iterations (default is 50).
+    """
+
+    fibre_section: FibreSection
+    creep_coefficient: DIMENSIONLESS = 0.0
+    cracked: bool = True
+    tolerance: DIMENSIONLESS = 1e-12
+    max_iterations: int = 50
+    e_c_eff: MPA = field(init=False)
+    """Effective modulus of elasticity of the concrete [MPa] (formula 7.20)."""
+    _geometry: FloatArray = field(init=False, repr=False)
+    _geometry_products: FloatArray = field(init=False, repr=False)
+    _areas: FloatArray = field(init=False, repr=False)
+    _uncracked_stiffness: FloatArray = field(init=False, repr=False)
+    _extent: FloatArray = field(init=False, repr=False)
+    _e_s: FloatArray = field(init=False, repr=False)
+    _f_yk: FloatArray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Collect the geometry of the concrete fibres and the rebars, and the uncracked stiffness of the cross-section."""
+        section = self.fibre_section
+        e_c_eff = Form7Dot20EffectiveModulusCreep(e_cm=section.concrete_material.e_cm, phi_inf_t0=self.creep_coefficient)
+        object.__setattr__(self, "e_c_eff", float(e_c_eff))
+
+        # strain = geometry.T @ (eps_0, kappa_x, kappa_y) for every fibre, the concrete fibres followed by the rebars
+        x = np.concatenate([section.concrete.x, section.rebars.x]) - section.x_ref
+        y = np.concatenate([section.concrete.y, section.rebars.y]) - section.y_ref
+        geometry = np.stack([np.ones_like(x), -y, -x])
+        object.__setattr__(self, "_geometry", geometry)
+        object.__setattr__(self, "_geometry_products", (geometry[:, np.newaxis, :] * geometry[np.newaxis, :, :]).reshape(9, -1))
+        object.__setattr__(self, "_areas", np.concatenate([section.concrete.area, section.rebars.areas]))
+        object.__setattr__(self, "_extent", np.array([1.0, np.abs(y).max(), np.abs(x).max()]))
+
+        # modulus of elasticity and characteristic yield strength per rebar
+        materials = section.rebars.materials
+        object.__setattr__(self, "_e_s", np.array([material.e_s for material in materials] or [0.0])[section.rebars.material_index])
+        object.__setattr__(self, "_f_yk", np.array([material.f_yk for material in materials] or [0.0])[section.rebars.material_index])
+
+        moduli = np.concatenate([np.full(section.concrete.x.size, self.e_c_eff), self._e_s - self.e_c_eff])
+        object.__setattr__(self, "_uncracked_stiffness", (geometry * moduli * self._areas) @ geometry.T)
+
+    def concrete_stress(self, strain: FloatArray) -> tuple[FloatArray, FloatArray]:
+        """Stresses and tangent moduli of the concrete for an array of strains.
+
+        Parameters
+        ----------
+        strain : FloatArray
+            Strains of the concrete [-].
+
+        Returns
+        -------
+        tuple[FloatArray, FloatArray]
+            Stresses [MPa] and tangent moduli [MPa] of the concrete.
+        """
+        modulus = np.where((strain < 0) | (not self.cracked), self.e_c_eff, 0.0)
+        return modulus * strain, modulus
+
+    def steel_stress(self, strain: FloatArray) -> tuple[FloatArray, FloatArray]:
+        """Stresses and tangent moduli of the rebars for an array of rebar strains, limited by the characteristic yield strength.
+
+        Parameters
+        ----------
+        strain : FloatArray
+            Strains of the rebars with shape (combinations, rebars) [-].
+
+        Returns
+        -------
+        tuple[FloatArray, FloatArray]
+            Stresses [MPa] and tangent moduli [MPa] of the rebars.
+        """
+        elastic_stress = self._e_s * strain
+        yielding = np.abs(elastic_stress) > self._f_yk
+        return np.clip(elastic_stress, -self._f_yk, self._f_yk), np.where(yielding, 0.0, self._e_s)
+
+    def _stresses(self, strain: FloatArray) -> tuple[FloatArray, FloatArray]:
+        """Stresses and tangent moduli of all fibres, with the concrete displaced by the rebars subtracted at the rebars."""
+        n_concrete = self.fibre_section.concrete.x.size
+        stress, modulus = self.concrete_stress(strain)
+        steel_stress, steel_modulus = self.steel_stress(strain[:, n_concrete:])
+        stress[:, n_concrete:] = steel_stress - stress[:, n_concrete:]
+        modulus[:, n_concrete:] = steel_modulus - modulus[:, n_concrete:]
+        return stress, modulus
+
+    def resultants(
+        self, eps_0: npt.ArrayLike, kappa_x: npt.ArrayLike = 0.0, kappa_y: npt.ArrayLike = 0.0
+    ) -> tuple[FloatArray, FloatArray, FloatArray]:
+        """Internal forces of the stresses for an array of strain planes.
+
+        Parameters
+        ----------
+        eps_0 : npt.ArrayLike
+            Strains at the reference point [-].
+        kappa_x : npt.ArrayLike, optional
+            Curvatures about the x-axis, positive for compression at positive y [1/mm] (default is 0.0).
+        kappa_y : npt.ArrayLike, optional
+            Curvatures about the y-axis, positive for compression at positive x [1/mm] (default is 0.0).
+
+        Returns
+        -------
+        tuple[FloatArray, FloatArray, FloatArray]
+            Axial force n [kN] (compression negative), moment m_x [kNm] and moment m_y [kNm] per strain plane.
+        """
+        planes = np.column_stack([np.atleast_1d(value).astype(float) for value in np.broadcast_arrays(eps_0, kappa_x, kappa_y)])
+        stress, _ = self._stresses(planes @ self._geometry)
+        forces = (stress * self._areas) @ self._geometry.T
+        return forces[:, 0] * N_TO_KN, forces[:, 1] * NMM_TO_KNM, forces[:, 2] * NMM_TO_KNM
+
+    def solve(
+        self,
+        n: npt.ArrayLike = 0.0,
+        m_x: npt.ArrayLike = 0.0,
+        m_y: npt.ArrayLike = 0.0,
+        initial: SectionState | None = None,
+    ) -> SectionState:
+        """Find the strain planes in equilibrium with an array of internal force combinations.
+
+        All combinations are iterated at once. Every iteration starts from the strain planes of the previous iteration, and the
+        first iteration starts from the given equilibrium (a warm start, for example the previous load step) or from the uncracked
+        elastic solution.
+
+        Parameters
+        ----------
+        n : npt.ArrayLike, optional
+            Axial forces, compression is negative [kN] (default is 0.0).
+        m_x : npt.ArrayLike, optional
+            Bending moments about the x-axis, positive for compression at positive y [kNm] (default is 0.0).
+        m_y : npt.ArrayLike, optional
+            Bending moments about the y-axis, positive for compression at positive x [kNm] (default is 0.0).
+        initial : SectionState | None, optional
+            Equilibrium states to start the iterations from, with one state or one state per combination (default is None).
+
+        Returns
+        -------
+        SectionState
+            Equilibrium states of all combinations, in the (broadcast and flattened) order of the internal forces.
+        """
+        n, m_x, m_y = np.broadcast_arrays(*(np.atleast_1d(np.asarray(value, dtype=float)) for value in (n, m_x, m_y)))
+        targets = np.column_stack([n.ravel() * KN_TO_N, m_x.ravel() * KNM_TO_NMM, m_y.ravel() * KNM_TO_NMM])
+
+        if initial is None:
+            planes = np.linalg.solve(self._uncracked_stiffness, targets.T).T
+        else:
+            planes = np.broadcast_to(np.column_stack([initial.eps_0, initial.kappa_x, initial.kappa_y]), targets.shape).copy()
+
+        converged = np.zeros(len(targets), dtype=bool)
+        for chunk in range(0, len(targets), SOLVER_CHUNK_SIZE):
+            selection = slice(chunk, chunk + SOLVER_CHUNK_SIZE)
+            planes[selection], converged[selection] = self._iterate(planes[selection], targets[selection])
+
+        return SectionState(solver=self, eps_0=planes[:, 0], kappa_x=planes[:, 1], kappa_y=planes[:, 2], converged=converged)
+
+    def _iterate(self, planes: FloatArray, targets: FloatArray) -> tuple[FloatArray, npt.NDArray[np.bool_]]:
+        """Newton-Raphson iterations of the strain planes of the combinations that have not converged yet."""
+        converged = np.zeros(len(targets), dtype=bool)
+        for _ in range(self.max_iterations):
+            active = np.flatnonzero(~converged)
+            if not active.size:
+                break
+            stress, modulus = self._stresses(planes[active] @ self._geometry)
+            residuals = targets[active] - (stress * self._areas) @ self._geometry.T
+            # tangent stiffness K = sum(E_t * A * g * g^T) of every combination at once
+            stiffness = ((modulus * self._areas) @ self._geometry_products.T).reshape(-1, 3, 3)
+            stiffness += _STIFFNESS_REGULARISATION * self._uncracked_stiffness
+            steps = np.linalg.solve(stiffness, residuals[..., np.newaxis])[..., 0]
+            planes[active] += steps
+            converged[active] = np.abs(steps) @ self._extent <= self.tolerance
+        return planes, converged
+
+    def moment_curvature(
+        self,
+        m_max: KNM,
+        n: KN = 0.0,
+        axis: Literal["x", "y"] = "x",
+        n_steps: int = 50,
+    ) -> SectionState:
+        """Moment-curvature relation for increasing bending moments about one axis at a constant axial force.
+
+        The load is applied incrementally, every load step starts from the equilibrium of the previous load step.
+
+        Parameters
+        ----------
+        m_max : KNM
+            Largest bending moment [kNm].
+        n : KN, optional
+            Constant axial force, compression is negative [kN] (default is 0.0).
+        axis : Literal["x", "y"], optional
+            Axis of bending (default is "x").
+        n_steps : int, optional
+            Number of load steps (default is 50).
+
+        Returns
+        -------
+        SectionState
+            Equilibrium states of the load steps, starting at zero moment.
+        """
+        if axis not in ("x", "y"):
+            msg = f"Axis '{axis}' is not supported. Supported axes are 'x' and 'y'."
+            raise ValueError(msg)
+
+        moments = np.linspace(0.0, m_max, n_steps + 1)
+        states: list[SectionState] = []
+        state = None
+        for moment in moments:
+            state = self.solve(n=n, m_x=moment if axis == "x" else 0.0, m_y=moment if axis == "y" else 0.0, initial=state)
+            states.append(state)
+
+        return SectionState(
+            solver=self,
+            eps_0=np.concatenate([state.eps_0 for state in states]),
+            kappa_x=np.concatenate([state.kappa_x for state in states]),
+            kappa_y=np.concatenate([state.kappa_y for state in states]),
+            converged=np.concatenate([state.converged for state in states]),
+        )
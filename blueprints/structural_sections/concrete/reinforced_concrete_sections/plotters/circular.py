@@ -276,11 +276,12 @@ class CircularCrossSectionPlotter:
         axes_i: int
             Index of the axes to plot on. Default is 0.
         """
-        for rebar in self.cross_section.longitudinal_rebars:
+        rebars = self.cross_section.longitudinal_rebar_set
+        for x, y, radius in zip(rebars.x, rebars.y, rebars.radius):
             self.axes[axes_i].add_patch(
                 mplpatches.Circle(
-                    xy=(rebar.x, rebar.y),
-                    radius=rebar.radius,
+                    xy=(x, y),
+                    radius=radius,
                     linewidth=1,
                     color=REBAR_COLOR,
                 )
@@ -322,8 +323,8 @@ class CircularCrossSectionPlotter:
     def _add_longitudinal_rebars_to_legend(self) -> str:
         """Add longitudinal rebars to the legend text."""
         longitudinal_rebars = ""
-        if self.cross_section.longitudinal_rebars:
-            longitudinal_rebars += f"\nReinforcement ({sum(rebar.area for rebar in self.cross_section.longitudinal_rebars):.0f} mm²/m): "
+        if len(self.cross_section.longitudinal_rebar_set):
+            longitudinal_rebars += f"\nReinforcement ({self.cross_section.longitudinal_rebar_set.area:.0f} mm²/m): "
         return longitudinal_rebars
 
     def _add_single_longitudinal_rebars_to_legend(self) -> str:
@@ -348,7 +349,7 @@ class CircularCrossSectionPlotter:
     def _add_covers_info_to_legend(self) -> str:
         """Add covers info to legend text."""
         covers_text = ""
-        if self.cross_section.stirrups or self.cross_section.longitudinal_rebars:
+        if self.cross_section.stirrups or len(self.cross_section.longitudinal_rebar_set):
             covers_text += f"\nCover: {self.cross_section.cover:.0f} mm"
         return covers_text
 
@@ -315,11 +315,12 @@ class RectangularCrossSectionPlotter:
         axes_i: int
             Index of the axes to plot on. Default is 0.
         """
-        for rebar in self.cross_section.longitudinal_rebars:
+        rebars = self.cross_section.longitudinal_rebar_set
+        for x, y, radius in zip(rebars.x, rebars.y, rebars.radius):
             self.axes[axes_i].add_patch(
                 mplpatches.Circle(
-                    xy=(rebar.x, rebar.y),
-                    radius=rebar.radius,
+                    xy=(x, y),
+                    radius=radius,
                     linewidth=1,
                     color=REBAR_COLOR,
                 )
@@ -361,8 +362,8 @@ class RectangularCrossSectionPlotter:
     def _add_longitudinal_rebars_to_legend(self) -> str:
         """Add longitudinal rebars to the legend text."""
         longitudinal_rebars = ""
-        if self.cross_section.longitudinal_rebars:
-            longitudinal_rebars += f"\nReinforcement ({sum(rebar.area for rebar in self.cross_section.longitudinal_rebars):.0f} mm²/m): "
+        if len(self.cross_section.longitudinal_rebar_set):
+            longitudinal_rebars += f"\nReinforcement ({self.cross_section.longitudinal_rebar_set.area:.0f} mm²/m): "
         return longitudinal_rebars
 
     def _add_single_longitudinal_rebars_to_legend(self) -> str:
@@ -387,7 +388,7 @@ class RectangularCrossSectionPlotter:
     def _add_covers_info_to_legend(self) -> str:
         """Add covers info to legend text."""
         covers_text = ""
-        if self.cross_section.stirrups or self.cross_section.longitudinal_rebars:
+        if self.cross_section.stirrups or len(self.cross_section.longitudinal_rebar_set):
             covers_text += "\n" + self.cross_section.covers.get_covers_info()
         return covers_text
 
@@ -4,10 +4,11 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 import numpy as np
+import shapely
 from shapely import LineString
 
 from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
-from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.rebar_set import RebarSet
 from blueprints.type_alias import DIMENSIONLESS, MM, MM2, MM2_M
 from blueprints.unit_conversion import M_TO_MM
 
@@ -40,8 +41,8 @@ class ReinforcementConfiguration(ABC):
         """Each reinforcement configuration must have a resulting area."""
 
     @abstractmethod
-    def to_rebars(self, line: LineString) -> list[Rebar]:
-        """Convert the reinforcement configuration to a list of rebars.
+    def to_rebars(self, line: LineString) -> RebarSet:
+        """Convert the reinforcement configuration to a set of rebars.
 
         Parameters
         ----------
@@ -51,10 +52,16 @@ class ReinforcementConfiguration(ABC):
 
         Returns
         -------
-        List[Rebar]
-            List of Rebar objects.
+        RebarSet
+            Set of rebars, which can be used as a sequence of Rebar objects.
         """
 
+    @staticmethod
+    def _points_along_line(line: LineString, distances: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return the x- and y-coordinates of the points at the given distances along the line."""
+        coordinates = shapely.get_coordinates(shapely.line_interpolate_point(line, distances))
+        return coordinates[:, 0], coordinates[:, 1]
+
 
 @dataclass(kw_only=True, frozen=True)
 class ReinforcementByDistance(ReinforcementConfiguration):
@@ -91,8 +98,8 @@ class ReinforcementByDistance(ReinforcementConfiguration):
         """Number of rebars per meter [1/m]."""
         return 1.0 * M_TO_MM / self.center_to_center
 
-    def to_rebars(self, line: LineString) -> list[Rebar]:
-        """Convert the reinforcement configuration to a list of rebars.
+    def to_rebars(self, line: LineString) -> RebarSet:
+        """Convert the reinforcement configuration to a set of rebars.
 
         Parameters
         ----------
@@ -102,14 +109,12 @@ class ReinforcementByDistance(ReinforcementConfiguration):
 
         Returns
         -------
-        List[Rebar]
-            List of Rebar objects.
+        RebarSet
+            Set of rebars, which can be used as a sequence of Rebar objects.
         """
         if line.is_closed:
             raise ValueError("Reinforcement configuration cannot be applied to closed lines. Start and end points must be different.")
 
-        rebars = []
-
         # define the number of rebars based on the length of the line, minimum 1
         n_rebars = line.length / self.center_to_center
         n_rebars_applied = max(int(n_rebars), 1)  # at least one rebar
@@ -122,17 +127,8 @@ class ReinforcementByDistance(ReinforcementConfiguration):
         reinforcement_area = 0.25 * np.pi * self.diameter**2 * n_rebars
         repr_diameter = np.sqrt(reinforcement_area / (0.25 * np.pi * n_rebars_applied))
 
-        for distance in distances:
-            point = line.interpolate(distance)
-            rebars.append(
-                Rebar(
-                    diameter=repr_diameter,
-                    x=point.x,
-                    y=point.y,
-                    material=self.material,
-                )
-            )
-        return rebars
+        x, y = self._points_along_line(line=line, distances=distances)
+        return RebarSet(x=x, y=y, diameter=np.full(n_rebars_applied, repr_diameter), materials=(self.material,))
 
     def __repr__(self) -> str:
         """Representation of the reinforcement configuration."""
@@ -180,8 +176,8 @@ class ReinforcementByQuantity(ReinforcementConfiguration):
         """Area of the reinforcement configuration [mm²]."""
         return 0.25 * np.pi * self.diameter**2 * self.n
 
-    def to_rebars(self, line: LineString) -> list[Rebar]:
-        """Convert the reinforcement configuration to a list of rebars.
+    def to_rebars(self, line: LineString) -> RebarSet:
+        """Convert the reinforcement configuration to a set of rebars.
 
         Parameters
         ----------
@@ -191,28 +187,16 @@ class ReinforcementByQuantity(ReinforcementConfiguration):
 
         Returns
         -------
-        List[Rebar]
-            List of Rebar objects.
+        RebarSet
+            Set of rebars, which can be used as a sequence of Rebar objects.
 
         """
-        rebars = []
-
         # for closed lines, the first and last point in the line are the same
         # so to avoid placing a rebar in the same position, we need to remove one of them
         space_between_bars = line.length / self.n if line.is_closed else line.length / (self.n - 1)
 
-        for index in range(self.n):
-            distance = index * space_between_bars
-            point = line.interpolate(distance)
-            rebars.append(
-                Rebar(
-                    diameter=self.diameter,
-                    x=point.x,
-                    y=point.y,
-                    material=ReinforcementSteelMaterial(),
-                )
-            )
-        return rebars
+        x, y = self._points_along_line(line=line, distances=np.arange(self.n) * space_between_bars)
+        return RebarSet(x=x, y=y, diameter=np.full(self.n, self.diameter, dtype=float), materials=(self.material,))
 
     def __repr__(self) -> str:
         """Representation of the reinforcement by quantity."""
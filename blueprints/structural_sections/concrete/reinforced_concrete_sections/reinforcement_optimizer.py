@@ -0,0 +1,390 @@
+"""Search for the lightest longitudinal reinforcement of a reinforced concrete cross-section that resists a set of load points.
+
+The candidates are all combinations of the given bar diameters, counts (or center-to-center distances) and layer configurations.
+They are checked from light to heavy, in three steps of increasing cost:
+
+1. Detailing: the clear spacing between the bars (EN 1992-1-1 8.2) and the cover of the bars.
+2. Bounds: the axial resistances and the largest possible lever arm between the tension in the reinforcement and the compression
+   in the concrete give upper bounds of the resistances, without calculating any strain plane.
+3. Capacity: the unity checks of the load points with the interaction diagram (uniaxial bending) or the capacity surface
+   (biaxial bending) of the fibre model.
+
+All fibre models share the concrete mesh of the cross-section, only the rebars differ between the candidates. The capacity of
+the remaining candidates is evaluated in parallel in a thread pool, in batches of increasing weight, until a batch contains a
+candidate that resists all load points.
+"""
+
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+import shapely
+
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.rebar_set import RebarSet
+from blueprints.structural_sections.concrete.rebar_spatial_index import RebarSpatialIndex, minimum_clear_spacing
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.circular import CircularReinforcedCrossSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.fibre_section import (
+    ULTIMATE_STEEL_STRAIN_FACTOR,
+    FibreSection,
+    steel_design_stress,
+)
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.reinforcement_configurations import (
+    ReinforcementByDistance,
+    ReinforcementByQuantity,
+    ReinforcementConfiguration,
+)
+from blueprints.type_alias import DIMENSIONLESS, KG_M, MM
+from blueprints.unit_conversion import KN_TO_N, KNM_TO_NMM, PER_MILLE_TO_RATIO
+
+type FloatArray = npt.NDArray[np.float64]
+type Edge = Literal["upper", "lower"]
+
+COVER_TOLERANCE = 1.0
+"""Allowed shortfall of the cover of the bars, to accept the polygonal approximation of curved outlines like circles [mm]."""
+
+_BOUND_TOLERANCE = 1e-9
+"""Relative tolerance of the resistance bounds, so candidates are never pruned by rounding errors."""
+
+
+@dataclass(frozen=True)
+class ReinforcementLayout:
+    """Longitudinal reinforcement of one candidate of the optimizer.
+
+    Parameters
+    ----------
+    configuration : ReinforcementConfiguration
+        Bar diameter and count or center-to-center distance, applied to every edge and layer.
+    edges : tuple[Edge, ...], optional
+        Edges of a rectangular cross-section with reinforcement, empty for the perimeter of a circular cross-section.
+    n_layers : int, optional
+        Number of layers at every edge (default is 1).
+    layer_distance : MM, optional
+        Center-to-center distance between the layers [mm] (default is 0.0, only used for more than one layer).
+    """
+
+    configuration: ReinforcementConfiguration
+    edges: tuple[Edge, ...] = ()
+    n_layers: int = 1
+    layer_distance: MM = 0.0
+
+    def __str__(self) -> str:
+        """String representation of the layout, for example 2x 4⌀20 lower."""
+        layers = f"{self.n_layers}x " if self.n_layers > 1 else ""
+        edges = f" {', '.join(self.edges)}" if self.edges else ""
+        return f"{layers}{self.configuration}{edges}"
+
+
+@dataclass(frozen=True, eq=False)
+class ReinforcementDesign:
+    """Lightest reinforcement layout found by the optimizer.
+
+    Parameters
+    ----------
+    layout : ReinforcementLayout
+        The reinforcement layout.
+    rebars : RebarSet
+        Rebars of the layout, without the rebars that were already present in the cross-section.
+    fibre_section : FibreSection
+        Fibre model of the cross-section with the present rebars and the rebars of the layout.
+    unity_check : DIMENSIONLESS
+        Largest unity check of all load points [-].
+    n_candidates : int
+        Number of candidates.
+    n_pruned : int
+        Number of candidates rejected by the detailing rules or the resistance bounds, without calculating their capacity.
+    n_evaluated : int
+        Number of candidates of which the capacity is calculated.
+    """
+
+    layout: ReinforcementLayout
+    rebars: RebarSet
+    fibre_section: FibreSection
+    unity_check: DIMENSIONLESS
+    n_candidates: int
+    n_pruned: int
+    n_evaluated: int
+
+    @property
+    def weight_per_meter(self) -> KG_M:
+        """Weight of the rebars of the layout [kg/m]."""
+        return self.rebars.weight_per_meter
+
+
+@dataclass(frozen=True)
+class ReinforcementOptimizer:
+    """Optimizer for the longitudinal reinforcement of rectangular and circular reinforced concrete cross-sections.
+
+    The rebars of the candidates are added to the longitudinal rebars that are already present in the cross-section. The reference
+    lines of the rebars account for the covers and the stirrups of the cross-section, in the same way as
+    `add_longitudinal_reinforcement_by_quantity`.
+
+    Parameters
+    ----------
+    cross_section : RectangularReinforcedCrossSection | CircularReinforcedCrossSection
+        The cross-section to reinforce.
+    material : ReinforcementSteelMaterial, optional
+        Material of the rebars (default is B500B).
+    diameters : tuple[MM, ...], optional
+        Bar diameters of the candidates [mm].
+    n_rebars : tuple[int, ...], optional
+        Numbers of bars per edge and layer (or around the perimeter) of the candidates with a `ReinforcementByQuantity`.
+    center_to_center : tuple[MM, ...], optional
+        Center-to-center distances of the candidates with a `ReinforcementByDistance`, for example for slabs [mm].
+        Only for rectangular cross-sections (default is none).
+    edges : tuple[tuple[Edge, ...], ...], optional
+        Combinations of edges of a rectangular cross-section with reinforcement (default is only the lower edge, or both edges).
+    n_layers : tuple[int, ...], optional
+        Numbers of layers at every edge of a rectangular cross-section (default is one or two layers).
+    aggregate_size : MM, optional
+        Maximum size of the aggregate [mm] (default is 16 mm). The minimum clear spacing is max(k1·⌀, dg + k2, 20 mm) with the
+        recommended k1 = 1 and k2 = 5 mm, EN 1992-1-1 8.2(2).
+    minimum_cover : MM | None, optional
+        Minimum distance between the surface of the rebars and the edge of the cross-section [mm]. Default is the smallest cover
+        of the cross-section.
+    mesh_size : MM | None, optional
+        Size of the concrete fibres [mm]. Default is the largest dimension of the cross-section divided by 50.
+    max_workers : int | None, optional
+        Number of candidates of which the capacity is calculated in parallel. Defaults to the number of CPUs.
+
+    Example
+    -------
+    ```python
+    optimizer = ReinforcementOptimizer(cross_section, diameters=(16, 20, 25), n_rebars=(2, 3, 4, 5))
+    design = optimizer.optimize(n=[0.0, -500.0], m_x=[150.0, 120.0])
+    optimizer.apply(design.layout)
+    ```
+    """
+
+    cross_section: RectangularReinforcedCrossSection | CircularReinforcedCrossSection
+    material: ReinforcementSteelMaterial = field(default_factory=ReinforcementSteelMaterial)
+    diameters: tuple[MM, ...] = (10.0, 12.0, 16.0, 20.0, 25.0, 32.0)
+    n_rebars: tuple[int, ...] = tuple(range(2, 13))
+    center_to_center: tuple[MM, ...] = ()
+    edges: tuple[tuple[Edge, ...], ...] = (("lower",), ("upper", "lower"))
+    n_layers: tuple[int, ...] = (1, 2)
+    aggregate_size: MM = 16.0
+    minimum_cover: MM | None = None
+    mesh_size: MM | None = None
+    max_workers: int | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the candidates."""
+        if isinstance(self.cross_section, CircularReinforcedCrossSection) and self.center_to_center:
+            raise ValueError("A reinforcement by center-to-center distance cannot be applied to the perimeter of a circular cross-section.")
+
+    def minimum_clear_spacing(self, diameter: MM | FloatArray) -> MM | FloatArray:
+        """Minimum clear spacing between bars of the given diameter, EN 1992-1-1 8.2(2) [mm].
+
+        Parameters
+        ----------
+        diameter : MM | FloatArray
+            Largest diameter of two adjacent bars [mm].
+        """
+        return minimum_clear_spacing(diameter, aggregate_size=self.aggregate_size)
+
+    def candidates(self) -> list[ReinforcementLayout]:
+        """All candidate layouts, from every combination of diameter, count or distance, and layer configuration.
+
+        Returns
+        -------
+        list[ReinforcementLayout]
+            Candidate layouts, in no particular order.
+        """
+        configurations: list[ReinforcementConfiguration] = [
+            ReinforcementByQuantity(diameter=diameter, material=self.material, n=n) for diameter, n in product(self.diameters, self.n_rebars)
+        ]
+        configurations += [
+            ReinforcementByDistance(diameter=diameter, material=self.material, center_to_center=distance)
+            for diameter, distance in product(self.diameters, self.center_to_center)
+            if distance >= diameter
+        ]
+        if isinstance(self.cross_section, CircularReinforcedCrossSection):
+            return [ReinforcementLayout(configuration=configuration) for configuration in configurations]
+
+        return [
+            ReinforcementLayout(
+                configuration=configuration,
+                edges=edges,
+                n_layers=n_layers,
+                layer_distance=configuration.diameter + float(self.minimum_clear_spacing(configuration.diameter)),
+            )
+            for configuration, edges, n_layers in product(configurations, self.edges, self.n_layers)
+        ]
+
+    def _placements(self, layout: ReinforcementLayout) -> Iterator[dict]:
+        """Keyword arguments of the reference line of every edge and layer of a layout."""
+        if isinstance(self.cross_section, CircularReinforcedCrossSection):
+            yield {"diameter": layout.configuration.diameter}
+            return
+
+        for edge, layer in product(layout.edges, range(layout.n_layers)):
+            cover = self.cross_section.covers.upper if edge == "upper" else self.cross_section.covers.lower
+            yield {
+                "edge": edge,
+                "diameter": layout.configuration.diameter,
+                "cover": cover + layer * layout.layer_distance if layer else None,
+            }
+
+    def rebars(self, layout: ReinforcementLayout) -> RebarSet:
+        """Rebars of a layout in the cross-section.
+
+        Parameters
+        ----------
+        layout : ReinforcementLayout
+            The reinforcement layout.
+
+        Returns
+        -------
+        RebarSet
+            Rebars of all edges and layers of the layout.
+        """
+        return RebarSet.concatenate(
+            layout.configuration.to_rebars(line=self.cross_section._get_reference_line(**placement))  # noqa: SLF001
+            for placement in self._placements(layout)
+        )
+
+    def apply(self, layout: ReinforcementLayout) -> None:
+        """Add the rebars of a layout to the cross-section.
+
+        Parameters
+        ----------
+        layout : ReinforcementLayout
+            The reinforcement layout, for example the layout of the design found by `optimize`.
+        """
+        for placement in self._placements(layout):
+            self.cross_section.add_reinforcement_configuration(
+                self.cross_section._get_reference_line,  # noqa: SLF001
+                layout.configuration,
+                **placement,
+            )
+
+    def _satisfies_detailing(self, rebars: RebarSet) -> bool:
+        """Check the clear spacing between all bars and the cover of the bars of a candidate."""
+        polygon = self.cross_section.profile.polygon
+        if isinstance(self.cross_section, CircularReinforcedCrossSection):
+            minimum_cover = self.cross_section.cover if self.minimum_cover is None else self.minimum_cover
+        else:
+            covers = self.cross_section.covers
+            minimum_cover = min(covers.upper, covers.right, covers.lower, covers.left) if self.minimum_cover is None else self.minimum_cover
+        covers_of_bars = shapely.distance(polygon.exterior, shapely.points(rebars.x, rebars.y)) - rebars.radius
+        if not (shapely.contains_xy(polygon, rebars.x, rebars.y).all() and (covers_of_bars >= minimum_cover - COVER_TOLERANCE).all()):
+            return False
+
+        return not len(RebarSpatialIndex(rebars).spacing_violations(aggregate_size=self.aggregate_size))
+
+    def _satisfies_bounds(self, rebars: RebarSet, n: FloatArray, m_x: FloatArray, m_y: FloatArray) -> bool:
+        """Check the load points against upper bounds of the resistances of a candidate.
+
+        The tension in the cross-section is carried by the rebars only, at most T = Σ σs(εud)·As. The compression in the concrete and
+        the rebars equals T - N and acts at most at the extreme fibre, so for compression at the top:
+
+            M_x <= T·(y_top - y_s,min) - N·(y_top - y_ref)
+
+        and likewise for the other directions. The bounds hold for any strain plane, so a candidate that violates them for a load
+        point can never resist that load point.
+        """
+        mesh = self.cross_section.concrete_mesh(self.mesh_size)
+        x_ref, y_ref = mesh.centroid
+        stresses = np.array(
+            [steel_design_stress(material, material.eps_uk * PER_MILLE_TO_RATIO * ULTIMATE_STEEL_STRAIN_FACTOR) for material in rebars.materials]
+        )
+        tension = float(stresses[rebars.material_index] @ rebars.areas)
+        compression = self.cross_section.concrete_material.f_cd * mesh.total_area + tension
+
+        n, m_x, m_y = n * KN_TO_N, m_x * KNM_TO_NMM, m_y * KNM_TO_NMM
+        tolerance = _BOUND_TOLERANCE * (compression + 1.0)
+        extent = max(np.ptp(mesh.boundary_x), np.ptp(mesh.boundary_y))
+        levers = (
+            (m_x, mesh.boundary_y.max() - rebars.y.min(), mesh.boundary_y.max() - y_ref),
+            (-m_x, rebars.y.max() - mesh.boundary_y.min(), y_ref - mesh.boundary_y.min()),
+            (m_y, mesh.boundary_x.max() - rebars.x.min(), mesh.boundary_x.max() - x_ref),
+            (-m_y, rebars.x.max() - mesh.boundary_x.min(), x_ref - mesh.boundary_x.min()),
+        )
+        return bool(
+            np.all(n <= tension + tolerance)
+            and np.all(-n <= compression + tolerance)
+            and all(np.all(moment <= tension * lever_arm - n * extreme_fibre + tolerance * extent) for moment, lever_arm, extreme_fibre in levers)
+        )
+
+    def _fibre_section(self, rebars: RebarSet) -> FibreSection:
+        """Fibre model of the cross-section with the present rebars and the rebars of a candidate, sharing the concrete mesh."""
+        return FibreSection(
+            concrete=self.cross_section.concrete_mesh(self.mesh_size),
+            rebars=RebarSet.concatenate([self.cross_section.longitudinal_rebar_set, rebars]),
+            concrete_material=self.cross_section.concrete_material,
+        )
+
+    @staticmethod
+    def _unity_check(fibre_section: FibreSection, n: FloatArray, m_x: FloatArray, m_y: FloatArray) -> DIMENSIONLESS:
+        """Largest unity check of the load points, with an interaction diagram for uniaxial bending."""
+        if not m_y.any():
+            return float(fibre_section.nm_interaction_diagram(axis="x").unity_check(n, m_x).max())
+        if not m_x.any():
+            return float(fibre_section.nm_interaction_diagram(axis="y").unity_check(n, m_y).max())
+        return float(fibre_section.capacity_surface().unity_check(n, m_x, m_y).max())
+
+    def optimize(self, n: npt.ArrayLike = 0.0, m_x: npt.ArrayLike = 0.0, m_y: npt.ArrayLike = 0.0) -> ReinforcementDesign:
+        """Find the lightest candidate layout that resists all load points.
+
+        The arguments are broadcast against each other, so a scalar can be combined with arrays.
+
+        Parameters
+        ----------
+        n : npt.ArrayLike, optional
+            Axial forces of the load points, compression is negative [kN].
+        m_x : npt.ArrayLike, optional
+            Bending moments about the x-axis, positive for compression at the top [kNm].
+        m_y : npt.ArrayLike, optional
+            Bending moments about the y-axis, positive for compression at the right side [kNm].
+
+        Returns
+        -------
+        ReinforcementDesign
+            The lightest layout, ties are resolved in the order of the candidates.
+
+        Raises
+        ------
+        ValueError
+            If none of the candidates resists all load points.
+        """
+        n, m_x, m_y = (np.atleast_1d(np.asarray(value, dtype=float)).ravel() for value in np.broadcast_arrays(n, m_x, m_y))
+        candidates = self.candidates()
+        rebar_sets = [self.rebars(layout) for layout in candidates]
+        order = np.argsort([rebars.weight_per_meter for rebars in rebar_sets], kind="stable")
+        present = self.cross_section.longitudinal_rebar_set
+
+        remaining = [
+            index
+            for index in order
+            if self._satisfies_detailing(RebarSet.concatenate([present, rebar_sets[index]]))
+            and self._satisfies_bounds(RebarSet.concatenate([present, rebar_sets[index]]), n, m_x, m_y)
+        ]
+
+        def evaluate(index: int) -> tuple[DIMENSIONLESS, FibreSection]:
+            fibre_section = self._fibre_section(rebar_sets[index])
+            return self._unity_check(fibre_section, n, m_x, m_y), fibre_section
+
+        batch_size = self.max_workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=batch_size) as pool:
+            for start in range(0, len(remaining), batch_size):
+                batch = remaining[start : start + batch_size]
+                for index, (unity_check, fibre_section) in zip(batch, pool.map(evaluate, batch)):
+                    if unity_check <= 1.0:
+                        return ReinforcementDesign(
+                            layout=candidates[index],
+                            rebars=rebar_sets[index],
+                            fibre_section=fibre_section,
+                            unity_check=unity_check,
+                            n_candidates=len(candidates),
+                            n_pruned=len(candidates) - len(remaining),
+                            n_evaluated=start + len(batch),
+                        )
+
+        raise ValueError(f"None of the {len(candidates)} candidate layouts resists all load points.")
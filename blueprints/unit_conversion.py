@@ -23,6 +23,10 @@ KNM_TO_NMM = 1e6
 MM2_TO_M2 = 1e-6
 # </editor-fold>
 
+# <editor-fold desc="Strain conversion">
+PER_MILLE_TO_RATIO = 1e-3
+# </editor-fold>
+
 # <editor-fold desc="Rotation conversion">
 RAD_TO_MRAD = 1e3
 MRAD_TO_RAD = 1e-3
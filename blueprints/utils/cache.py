@@ -0,0 +1,109 @@
+"""Thread-safe caching utilities for Blueprints."""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class ComputeOnceCache[K: Hashable, V]:
+    """Thread-safe cache that computes the value of each key at most once.
+
+    The cache is safe to share between threads, also on free-threaded (no-GIL) builds of CPython.
+    Concurrent requests for the same key block until the first caller has computed the value,
+    while requests for different keys are computed in parallel.
+
+    The cache can be pickled and copied. The cached values are kept, the locks are recreated.
+
+    Examples
+    --------
+    >>> cache = ComputeOnceCache()
+    >>> cache.get_or_compute("area", lambda: 100.0)
+    100.0
+    >>> "area" in cache
+    True
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._values: dict[K, V] = {}
+        self._lock = threading.Lock()
+        self._key_locks: dict[K, threading.Lock] = {}
+
+    def get_or_compute(self, key: K, factory: Callable[[], V]) -> V:
+        """Return the cached value for the given key, computing it with the factory if it is not present yet.
+
+        Parameters
+        ----------
+        key : K
+            Key of the cached value.
+        factory : Callable[[], V]
+            Function without arguments that computes the value. Only called when the key is not cached yet.
+            If the factory raises an exception, nothing is cached and the next caller retries the computation.
+
+        Returns
+        -------
+        V
+            The cached or newly computed value.
+        """
+        # fast path: no locking needed once the value is present
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # another thread may have computed the value while we were waiting for the lock
+            try:
+                return self._values[key]
+            except KeyError:
+                pass
+            value = factory()
+            self._values[key] = value
+
+        with self._lock:
+            self._key_locks.pop(key, None)
+
+        return value
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the cached value for the given key without computing it.
+
+        Parameters
+        ----------
+        key : K
+            Key of the cached value.
+        default : V | None, optional
+            Value returned when the key is not cached (default is None).
+
+        Returns
+        -------
+        V | None
+            The cached value or the default.
+        """
+        return self._values.get(key, default)
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        with self._lock:
+            self._values.clear()
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a value is cached for the given key."""
+        return key in self._values
+
+    def __len__(self) -> int:
+        """Return the number of cached values."""
+        return len(self._values)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state for pickling and copying, without the (unpicklable) locks."""
+        return {"_values": dict(self._values)}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state after unpickling or copying, recreating the locks."""
+        self._values = state["_values"]
+        self._lock = threading.Lock()
+        self._key_locks = {}
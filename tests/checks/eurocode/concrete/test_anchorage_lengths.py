@@ -0,0 +1,153 @@
+"""Tests for the vectorised anchorage and lap lengths according to EN 1992-1-1:2004 art. 8.4 - 8.7 and 8.9."""
+
+import numpy as np
+import pytest
+
+from blueprints.checks.eurocode.concrete.anchorage_lengths import AnchorageLengths, BondCondition, anchorage_lengths
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_2 import (
+    Form8Dot2UltimateBondStress,
+    SubForm8Dot2CoefficientBarDiameter,
+    SubForm8Dot2CoefficientQualityOfBond,
+)
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_3 import (
+    Form8Dot3RequiredAnchorageLength,
+)
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_4 import (
+    Form8Dot4DesignAnchorageLength,
+)
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_6 import (
+    Form8Dot6MinimumTensionAnchorage,
+)
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_7 import (
+    Form8Dot7MinimumCompressionAnchorage,
+)
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_10 import (
+    Form8Dot10DesignLapLength,
+    SubForm8Dot10Alpha6,
+)
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_11 import (
+    Form8Dot11MinimumDesignLapLength,
+)
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_14 import (
+    Form8Dot14EquivalentDiameterBundledBars,
+)
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial, ReinforcementSteelQuality
+
+C30 = ConcreteStrengthClass.C30_37
+B500 = ReinforcementSteelQuality.B500B
+
+
+def bond_stress(concrete_class: ConcreteStrengthClass, diameter: float, bond: str) -> float:
+    """Return the bond stress of formula (8.2) for a single bar."""
+    return Form8Dot2UltimateBondStress(
+        eta_1=SubForm8Dot2CoefficientQualityOfBond(bond_quality=bond),
+        eta_2=SubForm8Dot2CoefficientBarDiameter(diameter=diameter),
+        f_ctd=ConcreteMaterial(concrete_class=concrete_class).f_ctd,
+    )
+
+
+def basic_length(concrete_class: ConcreteStrengthClass, steel_quality: ReinforcementSteelQuality, diameter: float, bond: str) -> float:
+    """Return the basic required anchorage length of formula (8.3) for a single fully stressed bar."""
+    sigma_sd = ReinforcementSteelMaterial(steel_quality=steel_quality).f_yd
+    return Form8Dot3RequiredAnchorageLength(diameter=diameter, sigma_sd=sigma_sd, f_bd=bond_stress(concrete_class, diameter, bond))
+
+
+class TestAnchorageLengths:
+    """Tests for the AnchorageLengths class and the anchorage_lengths cache."""
+
+    def test_tables(self) -> None:
+        """Test every entry of the tables against formulas (8.2) and (8.3)."""
+        tables = anchorage_lengths(concrete_classes=tuple(ConcreteStrengthClass)[:11])
+        assert tables.l_b_rqd.shape == (9, 11, len(ReinforcementSteelQuality), 2)
+        for i, diameter in enumerate(tables.diameters):
+            for j, concrete_class in enumerate(tables.concrete_classes):
+                for b, bond in enumerate(BondCondition):
+                    assert tables.f_bd[i, j, b] == pytest.approx(bond_stress(concrete_class, diameter, bond.value))
+                    for k, steel_quality in enumerate(tables.steel_qualities):
+                        assert tables.l_b_rqd[i, j, k, b] == pytest.approx(basic_length(concrete_class, steel_quality, diameter, bond.value))
+        assert tables.source_docs() == ["EN 1992-1-1:2004"]
+
+    def test_schedule(self) -> None:
+        """Test the lookup of a schedule with tabulated and other diameters, mixed classes, bond conditions and design stresses."""
+        tables = anchorage_lengths()
+        diameters = np.array([8.0, 14.0, 32.0, 36.0, 40.0, 50.0])
+        classes = [C30, ConcreteStrengthClass.C20_25, C30, ConcreteStrengthClass.C45_55, C30, C30]
+        bonds = ["good", BondCondition.OTHER, "good", "other", BondCondition.GOOD, "good"]
+        sigma_sd = np.array([435.0, 300.0, 200.0, 435.0, 0.0, 350.0])
+        np.testing.assert_allclose(
+            tables.bond_stress(diameters, classes, bonds),
+            [bond_stress(c, d, b.value if isinstance(b, BondCondition) else b) for c, d, b in zip(classes, diameters, bonds, strict=True)],
+        )
+        expected = [
+            Form8Dot3RequiredAnchorageLength(diameter=d, sigma_sd=s, f_bd=bond_stress(c, d, b.value if isinstance(b, BondCondition) else b))
+            for c, d, b, s in zip(classes, diameters, bonds, sigma_sd, strict=True)
+        ]
+        np.testing.assert_allclose(tables.basic_anchorage_length(diameters, classes, B500, bonds, sigma_sd=sigma_sd), expected)
+
+    def test_high_strength_concrete(self) -> None:
+        """Test that the tensile strength of concrete classes above C60/75 is limited to the value of C60/75."""
+        tables = anchorage_lengths()
+        np.testing.assert_allclose(tables.bond_stress(16, ConcreteStrengthClass.C90_105), tables.bond_stress(16, ConcreteStrengthClass.C60_75))
+        assert tables.bond_stress(16, ConcreteStrengthClass.C50_60) < tables.bond_stress(16, ConcreteStrengthClass.C60_75)
+
+    def test_design_anchorage_length(self) -> None:
+        """Test the design anchorage lengths against formulas (8.4) - (8.7) for tension and compression."""
+        tables = anchorage_lengths()
+        alpha_2 = np.array([[1.0], [0.7], [0.85]])
+        results = tables.design_anchorage_length([10, 25], C30, B500, alpha_1=0.7, alpha_2=alpha_2, alpha_5=0.7, compression=[[False, True]])
+        assert results.shape == (3, 2)
+        for row, alpha in enumerate(alpha_2[:, 0]):
+            for column, (diameter, minimum) in enumerate([(10, Form8Dot6MinimumTensionAnchorage), (25, Form8Dot7MinimumCompressionAnchorage)]):
+                l_b_rqd = basic_length(C30, B500, diameter, "good")
+                expected = Form8Dot4DesignAnchorageLength(
+                    alpha_1=0.7,
+                    alpha_2=alpha,
+                    alpha_3=1.0,
+                    alpha_4=1.0,
+                    alpha_5=0.7,
+                    l_b_rqd=l_b_rqd,
+                    l_b_min=minimum(l_b_rqd=l_b_rqd, diameter=diameter),
+                )
+                assert results[row, column] == pytest.approx(expected)
+        assert tables.design_anchorage_length(12, C30, B500, sigma_sd=10.0) == pytest.approx(120.0)
+
+    @pytest.mark.parametrize("rho_1", [10.0, 50.0, 100.0])
+    def test_lap_length(self, rho_1: float) -> None:
+        """Test the design lap lengths against formulas (8.10) and (8.11), including bundled bars of formula (8.14)."""
+        tables = anchorage_lengths()
+        results = tables.lap_length([12, 20, 25], C30, B500, "other", n_b=[1, 2, 3], alpha_1=0.7, alpha_3=0.9, rho_1=rho_1)
+        alpha_6 = SubForm8Dot10Alpha6(rho_1=rho_1)
+        for index, (diameter, n_b) in enumerate([(12, 1), (20, 2), (25, 3)]):
+            equivalent = Form8Dot14EquivalentDiameterBundledBars(diameter=diameter, n_b=n_b)
+            l_b_rqd = basic_length(C30, B500, equivalent, "other")
+            l_0_min = Form8Dot11MinimumDesignLapLength(alpha_6=alpha_6, l_b_rqd=l_b_rqd, diameter=equivalent)
+            expected = Form8Dot10DesignLapLength(alpha_1=0.7, alpha_2=1, alpha_3=0.9, alpha_5=1, alpha_6=alpha_6, l_b_rqd=l_b_rqd, l_0_min=l_0_min)
+            assert results[index] == pytest.approx(expected)
+
+    def test_cache(self) -> None:
+        """Test that equal tables are shared and that custom partial factors are applied."""
+        assert anchorage_lengths() is anchorage_lengths()
+        accidental = anchorage_lengths(gamma_c=1.2, gamma_s=1.0)
+        assert accidental.f_yd[accidental.steel_qualities.index(B500)] == pytest.approx(500.0)
+        assert AnchorageLengths(diameters=(12.0, 16.0), concrete_classes=(C30,)).f_bd.shape == (2, 1, 2)
+
+    def test_invalid(self) -> None:
+        """Test that invalid tables and lookups raise errors."""
+        with pytest.raises(ValueError, match="Invalid diameters"):
+            AnchorageLengths(diameters=(16.0, 12.0))
+        with pytest.raises(ValueError, match="Invalid tables"):
+            AnchorageLengths(concrete_classes=())
+        with pytest.raises(ValueError, match="gamma"):
+            AnchorageLengths(gamma_s=0)
+        tables = AnchorageLengths(concrete_classes=(C30,), steel_qualities=(B500,))
+        with pytest.raises(ValueError, match="Invalid concrete_class"):
+            tables.bond_stress(12, ConcreteStrengthClass.C20_25)
+        with pytest.raises(ValueError, match="Invalid bond"):
+            tables.bond_stress(12, C30, "poor")
+        with pytest.raises(ValueError, match="Invalid diameter"):
+            tables.bond_stress(12, C30, n_b=0)
+        with pytest.raises(ValueError, match="sigma_sd"):
+            tables.basic_anchorage_length(12, C30, B500, sigma_sd=-1.0)
+        with pytest.raises(ValueError, match="alpha"):
+            tables.lap_length(12, C30, B500, alpha_1=-1.0)
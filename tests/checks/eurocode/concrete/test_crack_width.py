@@ -0,0 +1,111 @@
+"""Tests for the vectorised crack width calculation according to EN 1992-1-1:2004 art. 7.3.4."""
+
+import numpy as np
+import pytest
+
+from blueprints.checks.eurocode.concrete.crack_width import CrackWidth
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_7_serviceability_limit_state.formula_7_8 import Form7Dot8CrackWidth
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_7_serviceability_limit_state.formula_7_9 import Form7Dot9EpsilonSmMinusEpsilonCm
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_7_serviceability_limit_state.formula_7_10 import Form7Dot10RhoPEff
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_7_serviceability_limit_state.formula_7_11 import Form7Dot11MaximumCrackSpacing
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_7_serviceability_limit_state.formula_7_14 import Form7Dot14MaximumCrackSpacing
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.covers import CoversRectangular
+from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+
+
+def beam(width: float = 300, n: int = 4) -> RectangularReinforcedCrossSection:
+    """Return a beam with a height of 500 mm and ⌀20 rebars at the bottom."""
+    cross_section = RectangularReinforcedCrossSection(
+        width=width,
+        height=500,
+        concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37),
+        covers=CoversRectangular(upper=40, right=40, lower=40, left=40),
+    )
+    cross_section.add_longitudinal_reinforcement_by_quantity(n=n, diameter=20, material=ReinforcementSteelMaterial(), edge="lower")
+    return cross_section
+
+
+class TestCrackWidth:
+    """Tests for the CrackWidth class."""
+
+    def test_against_formulas(self) -> None:
+        """Test a single combination against the formulas (7.8) - (7.11) with the stresses of the cracked cross-section."""
+        cross_section = beam()
+        results = CrackWidth(cross_section, creep_coefficient=1.0).evaluate(n=-50.0, m_x=120.0)
+        state = cross_section.sls_state(n=-50.0, m_x=120.0, creep_coefficient=1.0)
+
+        x, sigma_s = state.compression_zone_depth[0], state.steel_stress[0]
+        rho_p_eff = Form7Dot10RhoPEff(a_s=4 * np.pi * 10**2, xi_1=0.0, a_p_prime=0.0, a_c_eff=300 * min(2.5 * 50, (500 - x) / 3, 250))
+        s_r_max = Form7Dot11MaximumCrackSpacing(k_3=3.4, c=40, k_1=0.8, k_2=0.5, k_4=0.425, diam=20, rho_p_eff=rho_p_eff)
+        concrete = cross_section.concrete_material
+        epsilon = Form7Dot9EpsilonSmMinusEpsilonCm(
+            sigma_s=sigma_s, k_t=0.4, f_ct_eff=concrete.f_ctm, rho_p_eff=rho_p_eff, e_s=200_000, e_cm=concrete.e_cm
+        )
+        w_k = Form7Dot8CrackWidth(s_r_max=s_r_max, epsilon_sm_minus_epsilon_cm=epsilon)
+
+        assert results.x[0] == pytest.approx(x)
+        assert results.sigma_s[0] == pytest.approx(sigma_s)
+        assert results.rho_p_eff[0] == pytest.approx(rho_p_eff)
+        assert results.s_r_max[0] == pytest.approx(s_r_max)
+        assert results.epsilon_sm_minus_epsilon_cm[0] == pytest.approx(epsilon)
+        assert results.w_k[0] == pytest.approx(w_k)
+
+    def test_vectorised(self) -> None:
+        """Test that an array of combinations gives the same crack widths as the combinations one by one."""
+        check = CrackWidth(beam())
+        n, m_x = np.array([0.0, -100.0, 0.0, -300.0]), np.array([100.0, 150.0, 0.0, 20.0])
+        results = check.evaluate(n=n, m_x=m_x)
+        for index in range(4):
+            assert check.evaluate(n=n[index], m_x=m_x[index]).w_k[0] == pytest.approx(results.w_k[index])
+
+        # no cracks without tension in the reinforcement
+        np.testing.assert_array_equal(results.w_k[2:], 0.0)
+        assert results.governing_combination == 1
+        assert results.result().provided == pytest.approx(results.w_k[1])
+        assert results.result().is_ok
+        np.testing.assert_allclose(results.unity_check, results.w_k / 0.3)
+        assert not CrackWidth(beam(), w_max=0.2).evaluate(n=n, m_x=m_x).result().is_ok
+
+    def test_wide_spacing(self) -> None:
+        """Test that formula (7.14) is used when the spacing of the rebars exceeds 5(c + ⌀/2)."""
+        results = CrackWidth(beam(width=1000, n=2)).evaluate(m_x=[20.0, 40.0])
+        np.testing.assert_allclose(results.s_r_max, Form7Dot14MaximumCrackSpacing(h=500, x=results.x[0]), rtol=1e-12)
+        assert results.w_k[1] > results.w_k[0]
+
+    def test_tension_member(self) -> None:
+        """Test a cross-section in tension over its full height, with k_2 from formula (7.13) and h_c,ef without (h - x)/3."""
+        cross_section = beam()
+        cross_section.add_longitudinal_reinforcement_by_quantity(n=4, diameter=20, material=ReinforcementSteelMaterial(), edge="upper")
+        results = CrackWidth(cross_section).evaluate(n=[300.0, 300.0], m_x=[0.0, 10.0])
+
+        np.testing.assert_allclose(results.x, 0.0)
+        np.testing.assert_allclose(results.rho_p_eff, 4 * np.pi * 10**2 / (300 * 125))
+        # uniform tension gives k_2 = 1.0, a small moment gives a k_2 between 0.5 and 1.0
+        assert results.s_r_max[0] == pytest.approx(3.4 * 40 + 0.8 * 1.0 * 0.425 * 20 / results.rho_p_eff[0])
+        assert results.s_r_max[0] > results.s_r_max[1] > 3.4 * 40 + 0.8 * 0.5 * 0.425 * 20 / results.rho_p_eff[1]
+
+    def test_top_face(self) -> None:
+        """Test that the reinforcement at the top is used for negative moments."""
+        cross_section = beam()
+        cross_section.add_longitudinal_reinforcement_by_quantity(n=2, diameter=16, material=ReinforcementSteelMaterial(), edge="upper")
+        results = CrackWidth(cross_section).evaluate(m_x=[100.0, -50.0])
+        assert results.s_r_max[1] == pytest.approx(3.4 * 40 + 0.8 * 0.5 * 0.425 * 16 / results.rho_p_eff[1])
+        assert results.rho_p_eff[1] == pytest.approx(2 * np.pi * 8**2 / (300 * min(2.5 * 48, (500 - results.x[1]) / 3)))
+
+    def test_no_reinforcement_at_tension_face(self) -> None:
+        """Test that tension at a face without reinforcement, or a combination without equilibrium, raises an error."""
+        cross_section = beam()
+        with pytest.raises(ValueError, match="no equilibrium"):
+            CrackWidth(cross_section).evaluate(m_x=-100.0)
+
+        # a rebar just below the middle of the cross-section is in tension when the top is in tension
+        cross_section.add_longitudinal_rebar(Rebar(diameter=16, x=0, y=-20, material=ReinforcementSteelMaterial()))
+        with pytest.raises(ValueError, match="top face"):
+            CrackWidth(cross_section).evaluate(n=-300.0, m_x=-60.0)
+
+    def test_source_docs(self) -> None:
+        """Test the source documents."""
+        assert CrackWidth.source_docs() == ["EN 1992-1-1:2004"]
@@ -0,0 +1,127 @@
+"""Tests for the vectorised fatigue verification of concrete according to EN 1992-1-1:2004 art. 6.8.7."""
+
+import numpy as np
+import pytest
+
+from blueprints.checks.eurocode.concrete.fatigue import ConcreteFatigue
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_70 import Form6Dot70FatigueDamageFactor
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_72 import Form6Dot72FatigueResistanceConcreteCompression
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_73 import Form6Dot73StressRatio
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_74 import Form6Dot74MinimumCompressiveStressLevel
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_75 import Form6Dot75MaximumCompressiveStressLevel
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_76 import Form6Dot76DesignFatigueStrengthConcrete
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_77 import Form6Dot77FatigueVerification
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_78_79 import Form6Dot78And79FatigueResistance
+from blueprints.materials.concrete import CementClass, ConcreteMaterial, ConcreteStrengthClass
+
+SIGMA_MAX = np.array([[4.0, 8.0, 10.0], [9.0, 11.0, 13.0]])
+SIGMA_MIN = np.array([[1.0, 2.0, 9.0], [0.0, 5.0, 3.0]])
+
+
+@pytest.fixture
+def fatigue() -> ConcreteFatigue:
+    """Fatigue check of a C35/45 concrete loaded from an age of 14 days."""
+    return ConcreteFatigue(ConcreteMaterial(concrete_class=ConcreteStrengthClass.C35_45, cement_class=CementClass.R), t_0=14)
+
+
+class TestConcreteFatigue:
+    """Tests for the ConcreteFatigue class."""
+
+    def test_fatigue_strength(self, fatigue: ConcreteFatigue) -> None:
+        """Test the design fatigue strength against formula (6.76) with formula (3.2) for the age at the start of the loading."""
+        beta_cc_t0 = np.exp(0.20 * (1 - np.sqrt(28 / 14)))
+        expected = Form6Dot76DesignFatigueStrengthConcrete(k_1=0.85, beta_cc_t0=beta_cc_t0, f_cd=fatigue.material.f_cd, f_ck=35)
+        assert fatigue.f_cd_fat == pytest.approx(expected)
+        assert fatigue.source_docs() == ["EN 1992-1-1:2004"]
+
+    def test_stress_levels(self, fatigue: ConcreteFatigue) -> None:
+        """Test the stress levels against formulas (6.73) - (6.75), with tension taken as zero."""
+        e_cd_max, e_cd_min, r = fatigue.stress_levels(10.0, [4.0, -1.0])
+        e_max = Form6Dot75MaximumCompressiveStressLevel(sigma_cd_max_equ=10.0, f_cd_fat=fatigue.f_cd_fat)
+        e_min = Form6Dot74MinimumCompressiveStressLevel(sigma_cd_min_equ=4.0, f_cd_fat=fatigue.f_cd_fat)
+        np.testing.assert_allclose(e_cd_max, [e_max, e_max])
+        np.testing.assert_allclose(e_cd_min, [e_min, 0.0])
+        np.testing.assert_allclose(r, [Form6Dot73StressRatio(e_cd_min_equ=e_min, e_cd_max_equ=e_max), 0.0])
+
+    def test_equivalent_check(self, fatigue: ConcreteFatigue) -> None:
+        """Test that the unity checks agree with formula (6.72) at every location."""
+        results = fatigue.equivalent_check(SIGMA_MAX, SIGMA_MIN)
+        assert results.unity_check.shape == SIGMA_MAX.shape
+        for uc, sigma_max, sigma_min in zip(results.unity_check.flat, SIGMA_MAX.flat, SIGMA_MIN.flat, strict=True):
+            e_max, e_min = sigma_max / fatigue.f_cd_fat, sigma_min / fatigue.f_cd_fat
+            assert (uc <= 1) == bool(Form6Dot72FatigueResistanceConcreteCompression(e_cd_max_equ=e_max, r_equ=e_min / e_max))
+            assert uc == pytest.approx(e_max + 0.43 * np.sqrt(1 - e_min / e_max))
+        assert results.governing_location == 5
+        assert not results.result().is_ok
+
+    def test_simplified_check(self, fatigue: ConcreteFatigue) -> None:
+        """Test that the unity checks agree with formula (6.77) at every location."""
+        results = fatigue.simplified_check(SIGMA_MAX, SIGMA_MIN)
+        for uc, sigma_max, sigma_min in zip(results.unity_check.flat, SIGMA_MAX.flat, SIGMA_MIN.flat, strict=True):
+            verification = Form6Dot77FatigueVerification(sigma_c_max=sigma_max, sigma_c_min=sigma_min, f_cd_fat=fatigue.f_cd_fat, f_ck=35)
+            assert (uc <= 1) == bool(verification)
+
+    def test_damage(self, fatigue: ConcreteFatigue) -> None:
+        """Test the Palmgren-Miner sum of formula (6.70) and the endurance of 1 million cycles for formula (6.72)."""
+        n = np.array([1e3, 1e4, 1e5])
+        results = fatigue.damage(SIGMA_MAX, SIGMA_MIN, n)
+        endurance = fatigue.endurance(SIGMA_MAX, SIGMA_MIN)
+        np.testing.assert_allclose(results.unity_check, (n / endurance).sum(axis=1))
+        for uc, endurance_row in zip(results.unity_check, endurance, strict=True):
+            assert (uc < 1) == bool(Form6Dot70FatigueDamageFactor(n_delta_sigma_i=n.tolist(), capital_n_delta_sigma_i=endurance_row.tolist()))
+
+        # stresses that just satisfy formula (6.72) have an endurance of 1 million cycles, with 0.43 rounded from 6/14
+        e_max, r = 0.6, 0.25
+        e_max_limit = 1 - 0.43 * np.sqrt(1 - r)
+        sigma_max = e_max_limit * fatigue.f_cd_fat
+        assert fatigue.endurance(sigma_max, r * sigma_max) == pytest.approx(1e6, rel=0.05)
+        assert fatigue.endurance(e_max * fatigue.f_cd_fat, e_max * fatigue.f_cd_fat) == np.inf
+        with pytest.raises(ValueError, match="Invalid n"):
+            fatigue.damage(SIGMA_MAX, SIGMA_MIN, -n)
+
+    @pytest.mark.filterwarnings("error")
+    def test_constant_stress(self, fatigue: ConcreteFatigue) -> None:
+        """Test that cycles with a constant stress are not damaging below f_cd,fat and fail at or above it, without NaN."""
+        f_cd_fat = fatigue.f_cd_fat
+        sigma = np.array([0.0, 0.5 * f_cd_fat, f_cd_fat, 1.2 * f_cd_fat])
+        np.testing.assert_array_equal(fatigue.endurance(sigma, sigma), [np.inf, np.inf, 0.0, 0.0])
+        results = fatigue.damage(sigma, sigma, n=[10.0, 10.0, 1.0, 0.0], axis=0)
+        assert results.unity_check == np.inf
+        assert fatigue.damage(sigma[:2], sigma[:2], n=10.0).unity_check == 0.0
+
+    def test_damage_from_histories(self, fatigue: ConcreteFatigue) -> None:
+        """Test that the damage of stress histories equals the damage of their rainflow cycles."""
+        history = np.array([2.0, 12.0, 6.0, 9.0, 3.0, 12.0, 2.0, -1.0])
+        histories = np.stack((history, 0.5 * history))
+        results = fatigue.damage_from_histories(histories, repetitions=1000)
+
+        # closed cycles 6 - 9 and 3 - 12 and the residue 2 - 12 - 0 as half cycles, the tension is taken as zero
+        expected = fatigue.damage([9.0, 12.0, 12.0, 12.0], [6.0, 3.0, 2.0, 0.0], [1.0, 1.0, 0.5, 0.5]).unity_check
+        assert results.unity_check[0] == pytest.approx(1000 * expected)
+        assert results.unity_check[1] < results.unity_check[0]
+        assert fatigue.damage_from_histories(history).unity_check.shape == ()
+
+    def test_shear_check(self, fatigue: ConcreteFatigue) -> None:
+        """Test that the unity checks agree with formulas (6.78) and (6.79), for shear forces with equal and opposite signs."""
+        v_ed_max = np.array([50.0, 50.0, -80.0, 20.0, 30.0])
+        v_ed_min = np.array([20.0, -10.0, -60.0, -60.0, 0.0])
+        results = fatigue.shear_check(v_ed_max, v_ed_min, 100.0)
+        for uc, v_max, v_min in zip(results.unity_check, v_ed_max, v_ed_min, strict=True):
+            assert (uc <= 1) == bool(Form6Dot78And79FatigueResistance(v_ed_max=v_max, v_ed_min=v_min, v_rd_c=100.0, f_ck=35))
+        assert results.unity_check[3] == np.inf
+        assert results.unity_check[1] == pytest.approx(0.5 / 0.4)
+
+    def test_high_strength_limit(self) -> None:
+        """Test the limit of 0.8 for the maximum stress level of concrete above C50/60."""
+        fatigue = ConcreteFatigue(ConcreteMaterial(concrete_class=ConcreteStrengthClass.C70_85))
+        results = fatigue.simplified_check(0.8 * fatigue.f_cd_fat, 0.8 * fatigue.f_cd_fat)
+        assert results.unity_check == pytest.approx(1.0)
+
+    def test_invalid(self, fatigue: ConcreteFatigue) -> None:
+        """Test that invalid ages, stresses and resistances raise errors."""
+        with pytest.raises(ValueError, match="t_0"):
+            ConcreteFatigue(ConcreteMaterial(), t_0=0)
+        with pytest.raises(ValueError, match="sigma_c_min"):
+            fatigue.stress_levels(5.0, 6.0)
+        with pytest.raises(ValueError, match="v_rd_c"):
+            fatigue.shear_check(10.0, 5.0, 0.0)
@@ -1,8 +1,12 @@
 """Testing nominal concrete cover check of EN 1992-1-1."""
 
+from dataclasses import dataclass
+from itertools import product
+
+import numpy as np
 import pytest
 
-from blueprints.checks.eurocode.concrete.nominal_concrete_cover import NominalConcreteCover
+from blueprints.checks.eurocode.concrete.nominal_concrete_cover import NominalConcreteCover, NominalConcreteCoverTable
 from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_4_durability_and_cover._base_classes.nominal_cover_constants import (
     AbrasionClass,
     CastingSurface,
@@ -19,6 +23,10 @@ from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_4_durability_and_cover.t
     Table4Dot1ExposureClasses,
 )
 from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_4_durability_and_cover.table_4_3 import Table4Dot3ConcreteStructuralClass
+from blueprints.codes.eurocode.national_annex.nl.nen_en_1992_1_1_a1_2020.chapter_4_durability_and_cover import table_4_1 as nl_table_4_1
+from blueprints.codes.eurocode.national_annex.nl.nen_en_1992_1_1_a1_2020.chapter_4_durability_and_cover.constants import (
+    NominalConcreteCoverConstants as NLNominalConcreteCoverConstants,
+)
 from blueprints.materials.concrete import ConcreteMaterial
 from blueprints.type_alias import MM
 from blueprints.utils.report import Report
@@ -427,3 +435,96 @@ class TestNominalConcreteCover:
         assert "table 4.4" in report.content
         # Casting surface
         assert "art. 4.4.1.3 (4)" in report.content
+
+
+class TestNominalConcreteCoverTable:
+    """Validation of the precomputed nominal concrete cover against the nominal concrete cover check."""
+
+    @pytest.mark.parametrize("constants", [NominalConcreteCoverConstants(), NLNominalConcreteCoverConstants()])
+    @pytest.mark.parametrize(
+        ("casting_surface", "uneven_surface", "nominal_max_aggregate_size", "delta_c_dur_gamma"),
+        [
+            (CastingSurface.PERMANENTLY_EXPOSED, False, 16, 0),
+            (CastingSurface.PREPARED_GROUND, True, 40, 5),
+            (CastingSurface.DIRECTLY_AGAINST_SOIL, False, 32, 0),
+        ],
+    )
+    def test_values(
+        self,
+        constants: NominalConcreteCoverConstantsBase,
+        casting_surface: CastingSurface,
+        uneven_surface: bool,
+        nominal_max_aggregate_size: MM,
+        delta_c_dur_gamma: MM,
+    ) -> None:
+        """Test that the covers of all combinations of exposure classes equal those of NominalConcreteCover."""
+        table = NominalConcreteCoverTable(
+            constants,
+            nominal_max_aggregate_size=nominal_max_aggregate_size,
+            delta_c_dur_gamma=delta_c_dur_gamma,
+            casting_surface=casting_surface,
+            uneven_surface=uneven_surface,
+        )
+        elements = list(product(Carbonation, Chloride, ChlorideSeawater, [1, 4, 6], [8, 32], [AbrasionClass.NA, AbrasionClass.XM3]))
+        carbonation, chloride, chloride_seawater, structural_classes, diameters, abrasion_classes = zip(*elements, strict=True)
+        values = table.values(diameters, structural_classes, carbonation, chloride, chloride_seawater, abrasion_class=abrasion_classes)
+        expected = [
+            NominalConcreteCover(
+                reinforcement_diameter=element[4],
+                nominal_max_aggregate_size=nominal_max_aggregate_size,
+                constants=constants,
+                structural_class=element[3],
+                carbonation=element[0],
+                chloride=element[1],
+                chloride_seawater=element[2],
+                delta_c_dur_gamma=delta_c_dur_gamma,
+                casting_surface=casting_surface,
+                uneven_surface=uneven_surface,
+                abrasion_class=element[5],
+            ).value()
+            for element in elements
+        ]
+        np.testing.assert_allclose(values, expected)
+
+    def test_value_and_broadcasting(self) -> None:
+        """Test the cached covers of single elements, names of classes and broadcasting of the arguments."""
+        table = NominalConcreteCoverTable(NominalConcreteCoverConstants(), nominal_max_aggregate_size=32)
+        assert table.value(25, 4, "xc3", "XD1") == 45
+        assert table.value(25, 4, "xc3", "XD1") is table.value(25, 4, Carbonation.XC3, Chloride.XD1)
+        assert table.value(12, 1, delta_c_dev=0) == 12
+        np.testing.assert_allclose(table.values([12, 16, 25], 4, ["XC1", "XC3", "XC4"], delta_c_dev=[5, 10, 15]), [20, 35, 45])
+        assert table.values(np.full((2, 3), 16), 4, "XC4").shape == (2, 3)
+
+    def test_national_annex(self) -> None:
+        """Test that the exposure classes are those of the code of the constants, also for subclasses of the constants."""
+
+        @dataclass(frozen=True)
+        class ProjectConstants(NLNominalConcreteCoverConstants):
+            """Constants of a project, based on the Dutch national annex."""
+
+        table = NominalConcreteCoverTable(ProjectConstants(), nominal_max_aggregate_size=32)
+        expected = NominalConcreteCover(
+            reinforcement_diameter=16,
+            nominal_max_aggregate_size=32,
+            constants=ProjectConstants(),
+            structural_class=4,
+            carbonation=Carbonation.XC3,
+            chloride=Chloride.XD1,
+        ).value()
+        assert table.value(16, 4, nl_table_4_1.Carbonation.XC3, nl_table_4_1.Chloride.XD1) == expected
+        np.testing.assert_array_equal(table.c_min_dur, NominalConcreteCoverTable(NLNominalConcreteCoverConstants(), 32).c_min_dur)
+        assert table == NominalConcreteCoverTable(ProjectConstants(), nominal_max_aggregate_size=32)
+
+    def test_invalid(self) -> None:
+        """Test that invalid diameters, structural classes, exposure classes and deviations raise errors."""
+        table = NominalConcreteCoverTable(NominalConcreteCoverConstants(), nominal_max_aggregate_size=32)
+        with pytest.raises(ValueError, match="Invalid diameter"):
+            table.values(0, 4)
+        with pytest.raises(ValueError, match="Invalid structural_class"):
+            table.values(16, 7)
+        with pytest.raises(ValueError, match="Invalid carbonation"):
+            table.values(16, 4, "XD1")
+        with pytest.raises(ValueError, match="Invalid abrasion_class"):
+            table.values(16, 4, abrasion_class=3)
+        with pytest.raises(ValueError, match="Invalid delta_c_dev"):
+            table.values(16, 4, delta_c_dev=-5)
@@ -0,0 +1,200 @@
+"""Tests for the vectorised punching shear verification according to EN 1992-1-1:2004 art. 6.4."""
+
+import numpy as np
+import pytest
+from shapely.geometry import Polygon, box
+
+from blueprints.checks.eurocode.concrete.punching_shear import (
+    CONTROL_PERIMETER_CACHE_SIZE,
+    ColumnType,
+    ControlPerimeter,
+    PunchingShear,
+    control_perimeter,
+    effective_depth,
+    k_factor,
+)
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_2 import Form6Dot2aSub1ThicknessFactor
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_3n import Form6Dot3nShearCapacityWithoutRebar
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_32 import Form6Dot32EffectiveDepthSlab
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_39 import Form6Dot39BetaCoefficient
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_41 import Form6Dot41W1Rectangular
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_43 import Form6Dot43BetaRectangular
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_44 import Form6Dot44BetaRectangular
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_45 import Form6Dot45W1Rectangular
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_46 import Form6Dot46BetaCorner
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_47 import Form6Dot47PunchingShearResistance
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_48 import Form6Dot48NetAppliedPunchingForce
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_49 import Form6Dot49AppliedPunchingShearStress
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_51 import (
+    Form6Dot51AppliedPunchingShearStressEccentricLoading,
+)
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+
+D = 200.0
+REL = 1e-3
+
+
+@pytest.fixture
+def punching() -> PunchingShear:
+    """Punching shear check of a C30/37 slab with B500B punching shear reinforcement."""
+    return PunchingShear(ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37))
+
+
+class TestControlPerimeter:
+    """Tests for the ControlPerimeter class and the control_perimeter cache."""
+
+    def test_lengths(self) -> None:
+        """Test the lengths of the perimeters of internal, edge and corner columns against the closed form expressions."""
+        internal = control_perimeter(400, 300, D)
+        edge = control_perimeter(400, 300, D, ColumnType.EDGE)
+        corner = control_perimeter(400, 300, D, ColumnType.CORNER)
+        circular = control_perimeter(500, 500, D, circular=True)
+        assert internal.u_1 == pytest.approx(2 * (400 + 300) + 4 * np.pi * D, rel=REL)
+        assert internal.u_1_star == internal.u_1
+        assert edge.u_1 == pytest.approx(300 + 2 * 400 + 2 * np.pi * D, rel=REL)
+        assert edge.u_1_star == pytest.approx(300 + 2 * 200 + 2 * np.pi * D, rel=REL)
+        assert corner.u_1 == pytest.approx(400 + 300 + np.pi * D, rel=REL)
+        assert corner.u_1_star == pytest.approx(200 + 150 + np.pi * D, rel=REL)
+        assert circular.u_1 == pytest.approx(np.pi * (500 + 4 * D), rel=REL)
+        np.testing.assert_allclose([internal.u_0, edge.u_0, corner.u_0, circular.u_0], [1400, 900, 600, 500 * np.pi])
+
+    def test_w_1(self) -> None:
+        """Test the numerical integration of formula (6.40) against formulas (6.41), (6.42) and (6.45)."""
+        internal = control_perimeter(400, 300, D)
+        assert internal.w_1 == pytest.approx(Form6Dot41W1Rectangular(c_1=400, c_2=300, d=D), rel=REL)
+        assert internal.w_2 == pytest.approx(Form6Dot41W1Rectangular(c_1=300, c_2=400, d=D), rel=REL)
+        edge = control_perimeter(400, 300, D, ColumnType.EDGE)
+        assert edge.w_2 == pytest.approx(Form6Dot45W1Rectangular(c_1=400, c_2=300, d=D), rel=REL)
+        circular = control_perimeter(500, 500, D, circular=True)
+        assert circular.w_1 == pytest.approx((500 + 4 * D) ** 2, rel=REL)
+
+    def test_openings(self) -> None:
+        """Test that an opening within 6d removes the part of the perimeter between its tangents and a farther opening does not."""
+        opening = box(500, -100, 700, 100)
+        perimeter = control_perimeter(400, 400, D, openings=(opening,))
+        lost = 2 * (200 + 2 * D) * 100 / 500
+        assert perimeter.u_1 == pytest.approx(control_perimeter(400, 400, D).u_1 - lost, rel=REL)
+        far_opening = box(2000, -100, 2200, 100)
+        assert control_perimeter(400, 400, D, openings=(far_opening,)).u_1 == control_perimeter(400, 400, D).u_1
+
+        surrounding = Polygon(box(-1000, -1000, 1000, 1000).exterior.coords, [box(-250, -250, 250, 250).exterior.coords])
+        with pytest.raises(ValueError, match="Invalid openings"):
+            control_perimeter(400, 400, D, openings=(surrounding,))
+
+    def test_cache(self) -> None:
+        """Test that equal columns share the same perimeter and that the cache is bounded."""
+        assert control_perimeter(400, 400, D) is control_perimeter(400, 400, D)
+        assert control_perimeter(400, 400, D) == ControlPerimeter(400, 400, D)
+        assert control_perimeter.cache_info().maxsize == CONTROL_PERIMETER_CACHE_SIZE
+
+    def test_effective_depth(self) -> None:
+        """Test the effective depth against formula (6.32)."""
+        np.testing.assert_allclose(effective_depth([180, 220], 200), [Form6Dot32EffectiveDepthSlab(d_y=d_y, d_z=200) for d_y in (180, 220)])
+        with pytest.raises(ValueError, match="Invalid d_y or d_z"):
+            effective_depth(200, 0)
+
+    def test_invalid(self) -> None:
+        """Test that invalid dimensions and circular edge columns raise errors."""
+        with pytest.raises(ValueError, match="Invalid column"):
+            ControlPerimeter(400, 400, 0)
+        with pytest.raises(ValueError, match="Invalid circular column"):
+            ControlPerimeter(400, 500, D, circular=True)
+        with pytest.raises(NotImplementedError):
+            ControlPerimeter(400, 400, D, ColumnType.EDGE, circular=True)
+
+
+class TestPunchingShear:
+    """Tests for the PunchingShear class."""
+
+    def test_k_factor(self) -> None:
+        """Test the interpolation of table 6.1."""
+        np.testing.assert_allclose(k_factor([0.25, 0.5, 0.75, 1, 2, 3, 4], 1), [0.45, 0.45, 0.525, 0.6, 0.7, 0.8, 0.8])
+
+    def test_v_rd_c(self, punching: PunchingShear) -> None:
+        """Test the resistance without punching shear reinforcement against formulas (6.47) and (6.3N)."""
+        for d, rho_l, sigma_cp in [(150.0, 0.005, 0.0), (250.0, 0.03, 1.5), (400.0, 0.0, 0.0)]:
+            k = Form6Dot2aSub1ThicknessFactor(d=d)
+            expected = Form6Dot47PunchingShearResistance(
+                c_rd_c=0.12, k=k, rho_l=min(rho_l, 0.02), f_ck=30, k_1=0.1, sigma_cp=sigma_cp, v_min=Form6Dot3nShearCapacityWithoutRebar(k=k, f_ck=30)
+            )
+            assert punching.v_rd_c(d, rho_l, sigma_cp) == pytest.approx(expected)
+        assert punching.source_docs() == ["EN 1992-1-1:2004"]
+
+    def test_beta(self, punching: PunchingShear) -> None:
+        """Test beta of all combinations and columns against formulas (6.39), (6.42), (6.43), (6.44) and (6.46)."""
+        internal = control_perimeter(400, 300, D)
+        edge = control_perimeter(400, 300, D, ColumnType.EDGE)
+        corner = control_perimeter(400, 300, D, ColumnType.CORNER)
+        circular = control_perimeter(500, 500, D, circular=True)
+        v_ed = np.array([[500.0], [800.0], [0.0]])
+        m_ed_1 = np.array([[50.0], [0.0], [10.0]])
+        m_ed_2 = np.array([[40.0], [60.0], [10.0]])
+        results = punching.evaluate([internal, edge, corner, circular], rho_l=0.01, v_ed=v_ed, m_ed_1=m_ed_1, m_ed_2=m_ed_2)
+        assert results.beta.shape == (3, 4)
+
+        e_1, e_2 = 1e3 * 50 / 500, 1e3 * 40 / 500
+        assert results.beta[0, 0] == pytest.approx(Form6Dot43BetaRectangular(ey=e_1, ez=e_2, by=internal.b_2, bz=internal.b_1))
+        expected = Form6Dot39BetaCoefficient(k=k_factor(300, 400), m_ed=60e6, v_ed=800e3, u_1=internal.u_1, w_1=internal.w_2)
+        assert results.beta[1, 0] == pytest.approx(expected)
+        for row, e_par in enumerate([e_2, 1e3 * 60 / 800]):
+            expected = Form6Dot44BetaRectangular(u1=edge.u_1, u1_star=edge.u_1_star, k=k_factor(400, 600), w_1=edge.w_2, e_par=e_par)
+            assert results.beta[row, 1] == pytest.approx(expected)
+        np.testing.assert_allclose(results.beta[:, 2], Form6Dot46BetaCorner(u1=corner.u_1, u1_star=corner.u_1_star))
+        assert results.beta[0, 3] == pytest.approx(1 + 0.6 * np.pi * np.hypot(e_1, e_2) / (500 + 4 * D), rel=REL)
+        assert results.beta[2, 0] == 1.0
+
+    def test_stresses(self, punching: PunchingShear) -> None:
+        """Test the shear stresses, the required reinforcement and the outer perimeter against formulas (6.38), (6.52) - (6.54)."""
+        perimeters = [control_perimeter(400, 400, D), control_perimeter(400, 400, 300)]
+        v_ed = np.array([[300.0, 1200.0], [600.0, 600.0]])
+        results = punching.evaluate(perimeters, rho_l=[0.01, 0.015], v_ed=v_ed)
+        d = np.array([D, 300.0])
+        u_1 = np.array([perimeter.u_1 for perimeter in perimeters])
+        np.testing.assert_allclose(results.v_ed, 1e3 * v_ed / (u_1 * d))
+        np.testing.assert_allclose(results.v_ed_0, 1e3 * v_ed / (1600 * d))
+        assert results.v_rd_max == pytest.approx(0.4 * 0.6 * (1 - 30 / 250) * 20)
+        np.testing.assert_allclose(results.v_rd_c, [punching.v_rd_c(D, 0.01), punching.v_rd_c(300, 0.015)])
+        np.testing.assert_allclose(results.u_out_ef, 1e3 * v_ed / (results.v_rd_c * d))
+
+        f_ywd_ef = np.minimum(250 + 0.25 * d, 500 / 1.15)
+        resistance = 0.75 * results.v_rd_c + 1.5 * results.a_sw_s_r * f_ywd_ef / u_1
+        reinforced = results.a_sw_s_r > 0
+        assert reinforced.any()
+        assert not reinforced.all()
+        np.testing.assert_allclose(resistance[reinforced], results.v_ed[reinforced])
+        assert np.all(results.v_ed[~reinforced] <= 0.75 * np.broadcast_to(results.v_rd_c, v_ed.shape)[~reinforced])
+
+    def test_column_base(self, punching: PunchingShear) -> None:
+        """Test the stresses of column bases against formulas (6.48), (6.49) and (6.51)."""
+        perimeter = control_perimeter(400, 400, 300)
+        v_ed, delta_v_ed = np.array([[1500.0], [1200.0]]), np.array([[600.0], [1200.0]])
+        centric = punching.evaluate([perimeter], rho_l=0.005, v_ed=v_ed, delta_v_ed=delta_v_ed)
+        v_ed_red = Form6Dot48NetAppliedPunchingForce(v_ed=1500e3, delta_v_ed=600e3)
+        assert centric.v_ed[0, 0] == pytest.approx(Form6Dot49AppliedPunchingShearStress(v_ed_red=v_ed_red, u=perimeter.u_1, d=300))
+        assert centric.v_ed[1, 0] == 0.0
+        np.testing.assert_allclose(centric.v_ed_0, 1e3 * v_ed / (1600 * 300))
+
+        eccentric = punching.evaluate([perimeter], rho_l=0.005, v_ed=1500.0, m_ed_1=90.0, delta_v_ed=600.0)
+        expected = Form6Dot51AppliedPunchingShearStressEccentricLoading(v_ed_red=v_ed_red, u=perimeter.u_1, d=300, k=0.6, m_ed=90e6, w=perimeter.w_1)
+        assert eccentric.v_ed[0, 0] == pytest.approx(expected)
+        with pytest.raises(ValueError, match="Invalid delta_v_ed"):
+            punching.evaluate([perimeter], rho_l=0.005, v_ed=500.0, delta_v_ed=600.0)
+
+    def test_unity_check(self, punching: PunchingShear) -> None:
+        """Test the unity checks, the governing combination and column, and the result."""
+        perimeters = [control_perimeter(400, 400, D), control_perimeter(300, 300, D, ColumnType.EDGE)]
+        results = punching.evaluate(perimeters, rho_l=0.01, v_ed=[[200.0, 100.0], [250.0, 300.0]])
+        np.testing.assert_allclose(results.unity_check, results.v_ed / results.v_rd_c)
+        np.testing.assert_allclose(results.unity_check_max, results.v_ed_0 / results.v_rd_max)
+        assert results.governing == (1, 1)
+        assert not results.result().is_ok
+        assert punching.evaluate(perimeters, rho_l=0.01, v_ed=50.0).result().is_ok
+
+    def test_outward_eccentricity(self, punching: PunchingShear) -> None:
+        """Test that eccentricities out of the slab at edge and corner columns raise errors."""
+        edge = control_perimeter(400, 300, D, ColumnType.EDGE)
+        corner = control_perimeter(400, 300, D, ColumnType.CORNER)
+        with pytest.raises(NotImplementedError):
+            punching.evaluate([edge], rho_l=0.01, v_ed=500.0, m_ed_1=-20.0)
+        with pytest.raises(NotImplementedError):
+            punching.evaluate([corner], rho_l=0.01, v_ed=500.0, m_ed_2=-20.0)
@@ -0,0 +1,117 @@
+"""Tests for the vectorised shear resistance along members according to EN 1992-1-1:2004 art. 6.2."""
+
+import numpy as np
+import pytest
+
+from blueprints.checks.eurocode.concrete.shear_resistance import ShearResistance
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_2 import (
+    Form6Dot2aSub1ThicknessFactor,
+    Form6Dot2ShearResistance,
+)
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_3n import Form6Dot3nShearCapacityWithoutRebar
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_8 import Form6Dot8ShearResistance
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_9 import Form6Dot9MaximumShearResistance
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_6_ultimate_limit_state.formula_6_11abcn import Form6Dot11abcnCompressionChordCoefficient
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+
+X = np.linspace(0.0, 3000.0, 7)
+D = np.array([150.0, 250.0, 400.0, 450.0, 450.0, 600.0, 900.0])
+RHO_L = np.array([0.005, 0.01, 0.015, 0.025, 0.01, 0.002, 0.0])
+SIGMA_CP = np.array([0.0, 1.0, 2.0, 0.0, 6.0, 3.0, 0.5])
+
+
+def shear(cot_theta: float | None = None, prestressed: bool = False, reduced_stirrup_stress: bool = False) -> ShearResistance:
+    """Return the shear resistance of a C30/37 member with a web width of 300 mm and B500B shear reinforcement."""
+    return ShearResistance(
+        ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37),
+        ReinforcementSteelMaterial(),
+        b_w=300,
+        cot_theta=cot_theta,
+        prestressed=prestressed,
+        reduced_stirrup_stress=reduced_stirrup_stress,
+    )
+
+
+class TestShearResistance:
+    """Tests for the ShearResistance class."""
+
+    def test_concrete_resistance(self) -> None:
+        """Test the resistance without shear reinforcement against formulas (6.2) and (6.3N) at every station."""
+        check = shear()
+        results = check.evaluate(x=X, d=D, rho_l=RHO_L, v_ed=100.0, sigma_cp=SIGMA_CP)
+        for index, (d, rho_l, sigma_cp) in enumerate(zip(D, RHO_L, SIGMA_CP, strict=True)):
+            k = Form6Dot2aSub1ThicknessFactor(d=d)
+            expected = Form6Dot2ShearResistance(
+                c_rd_c=0.12,
+                k=k,
+                rho_l=min(rho_l, 0.02),
+                f_ck=30,
+                k_1=0.15,
+                sigma_cp=min(sigma_cp, 0.2 * 20),
+                b_w=300,
+                d=d,
+                v_min=Form6Dot3nShearCapacityWithoutRebar(k=k, f_ck=30),
+            )
+            assert results.v_rd_c[index] == pytest.approx(expected / 1000)
+        np.testing.assert_array_equal(results.v_rd, results.v_rd_c)
+        np.testing.assert_array_equal(results.v_rd_s, 0.0)
+        np.testing.assert_array_equal(results.x, X)
+        assert check.source_docs() == ["EN 1992-1-1:2004"]
+
+    @pytest.mark.parametrize("cot_theta", [1.0, 2.5])
+    def test_reinforced_resistance(self, cot_theta: float) -> None:
+        """Test the resistances with shear reinforcement against formulas (6.8), (6.9) and (6.11) for a given inclination."""
+        check = shear(cot_theta=cot_theta, prestressed=True)
+        a_sw_s = np.linspace(0.2, 2.0, len(D))
+        results = check.evaluate(x=X, d=D, rho_l=RHO_L, v_ed=300.0, a_sw_s=a_sw_s, sigma_cp=SIGMA_CP)
+        theta = np.rad2deg(np.arctan(1 / cot_theta))
+        nu_1 = 0.6 * (1 - 30 / 250)
+        for index, (d, a_sw, sigma_cp) in enumerate(zip(D, a_sw_s, SIGMA_CP, strict=True)):
+            alpha_cw = Form6Dot11abcnCompressionChordCoefficient(sigma_cp=sigma_cp, f_cd=20) if sigma_cp > 0 else 1.0
+            v_rd_s = Form6Dot8ShearResistance(a_sw=a_sw, s=1, z=0.9 * d, f_ywd=500 / 1.15, theta=theta)
+            v_rd_max = Form6Dot9MaximumShearResistance(b_w=300, z=0.9 * d, f_cd=20, nu_1=nu_1, alpha_cw=alpha_cw, theta=theta)
+            assert results.v_rd_s[index] == pytest.approx(v_rd_s / 1000)
+            assert results.v_rd_max[index] == pytest.approx(v_rd_max / 1000)
+            assert results.v_rd[index] == pytest.approx(min(v_rd_s, v_rd_max) / 1000)
+
+    def test_balanced_inclination(self) -> None:
+        """Test that the inclination of every station gives the largest resistance within the limits of formula (6.7N)."""
+        check = shear()
+        a_sw_s = np.array([0.0, 0.1, 0.5, 1.5, 3.0, 10.0])
+        results = check.evaluate(x=0.0, d=500.0, rho_l=0.01, v_ed=0.0, a_sw_s=a_sw_s)
+        for index, a_sw in enumerate(a_sw_s[1:], start=1):
+            v_rd = [shear(cot_theta=c).evaluate(x=0.0, d=500.0, rho_l=0.01, v_ed=0.0, a_sw_s=a_sw).v_rd[0] for c in np.linspace(1, 2.5, 151)]
+            assert max(v_rd) <= results.v_rd[index] <= 1.005 * max(v_rd)
+        np.testing.assert_allclose(results.cot_theta[[0, 1, 5]], [2.5, 2.5, 1.0])
+        balanced = (results.cot_theta > 1) & (results.cot_theta < 2.5)
+        np.testing.assert_allclose(results.v_rd_s[balanced], results.v_rd_max[balanced])
+
+    def test_unity_check(self) -> None:
+        """Test the unity checks and the governing station, including a resistance of zero for large tensile stresses."""
+        check = shear(reduced_stirrup_stress=True)
+        results = check.evaluate(x=X, d=450.0, rho_l=0.01, v_ed=np.array([-200.0, -100.0, 0.0, 50.0, 100.0, 150.0, 600.0]), a_sw_s=0.5)
+        np.testing.assert_allclose(results.unity_check, np.abs(results.v_ed) / results.v_rd)
+        assert check.f_ywd == pytest.approx(400.0)
+        assert check.nu_1 == pytest.approx(0.6)
+        assert results.governing_station == 6
+        assert not results.result().is_ok
+
+        thin_web = ShearResistance(ConcreteMaterial(), ReinforcementSteelMaterial(), b_w=50)
+        tension = thin_web.evaluate(x=0.0, d=400.0, rho_l=0.0, v_ed=50.0, sigma_cp=-50.0)
+        assert tension.v_rd_c[0] == 0.0
+        assert tension.unity_check[0] == np.inf
+
+    def test_invalid(self) -> None:
+        """Test that invalid parameters and stations raise errors."""
+        with pytest.raises(ValueError, match="b_w"):
+            ShearResistance(ConcreteMaterial(), ReinforcementSteelMaterial(), b_w=0)
+        with pytest.raises(ValueError, match="cot_theta"):
+            shear(cot_theta=3.0)
+        check = shear()
+        with pytest.raises(ValueError, match="Invalid d"):
+            check.evaluate(x=0.0, d=0.0, rho_l=0.01, v_ed=10.0)
+        with pytest.raises(ValueError, match="rho_l"):
+            check.evaluate(x=0.0, d=400.0, rho_l=-0.01, v_ed=10.0)
+        with pytest.raises(ValueError, match="a_sw_s"):
+            check.evaluate(x=0.0, d=400.0, rho_l=0.01, v_ed=10.0, a_sw_s=-1.0)
@@ -0,0 +1,183 @@
+"""Tests for the vectorised second order analysis of column schedules according to EN 1992-1-1:2004 art. 5.8."""
+
+import numpy as np
+import pytest
+
+from blueprints.checks.eurocode.concrete.slender_columns import (
+    ColumnSchedule,
+    SlenderColumns,
+    biaxial_unity_check,
+    effective_length,
+    separate_directions_allowed,
+)
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_13n import (
+    Form5Dot13nSlendernessCriterionIsolatedMembers,
+    SubForm5Dot13aCreepRatio,
+    SubForm5Dot13bMechanicalReinforcementFactor,
+    SubForm5Dot13cMomentRatio,
+)
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_15 import Form5Dot15EffectiveLengthBraced
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_16 import Form5Dot16EffectiveLengthUnbraced
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_21 import Form5Dot21NominalStiffness
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_22 import Form5Dot22FactorKc, Form5Dot22FactorKs
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_23 import Form5Dot23FactorConcreteStrengthClass
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_24 import Form5Dot24AxialForceCorrectionFactor
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_28 import Form5Dot28TotalDesignMoment
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_29 import Form5Dot29BetaFactor
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_31 import Form5Dot31DesignMoment
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_32 import Form5Dot32EquivalentFirstOrderEndMoment
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_33 import Form5Dot33NominalSecondOrderMoment
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_34 import Form5Dot34Curvature
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_36 import Form5Dot36RelativeAxialForce
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_37 import Form5Dot37CreepFactor
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_38a import Form5Dot38aCheckRelativeSlendernessRatio
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_38b import Form5Dot38bCheckRelativeEccentricityRatio
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_5_structural_analysis.formula_5_39 import Form5Dot39SimplifiedCriterionBiaxialBending
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+
+F_YD = 500 / 1.15
+A_C = 300.0 * 300.0
+A_S = 0.02 * A_C
+
+
+@pytest.fixture
+def columns() -> SlenderColumns:
+    """Second order analysis of C30/37 columns with B500B reinforcement."""
+    return SlenderColumns(ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37), ReinforcementSteelMaterial())
+
+
+def schedule(l_0: float = 6000.0, braced: bool = True) -> ColumnSchedule:
+    """Return a schedule of a single 300x300 mm column with 2% reinforcement and an effective creep ratio of 1."""
+    return ColumnSchedule(b=300, h=300, d=250, rho=0.02, l_0=l_0, phi_ef=1.0, braced=braced)
+
+
+def first_order_moments() -> tuple[float, float, float]:
+    """Return the end moments of 20 and 40 kNm including the imperfection of l_0/400 at 1000 kN, and the equivalent moment."""
+    m_01, m_02 = 20 + 15, 40 + 15
+    return m_01, m_02, float(Form5Dot32EquivalentFirstOrderEndMoment(m_01=m_01, m_02=m_02))
+
+
+class TestSlenderColumns:
+    """Tests for the SlenderColumns class."""
+
+    def test_effective_length(self) -> None:
+        """Test the effective lengths against formulas (5.15) and (5.16)."""
+        k_1, k_2 = np.array([0.1, 0.5, 2.0, 0.0]), np.array([0.3, 0.5, 0.2, 0.0])
+        braced = effective_length(4000, k_1, k_2)
+        unbraced = effective_length(4000, k_1, k_2, braced=False)
+        for index, (k_1_value, k_2_value) in enumerate(zip(k_1, k_2, strict=True)):
+            assert braced[index] == pytest.approx(Form5Dot15EffectiveLengthBraced(k_1=k_1_value, k_2=k_2_value, height=4000))
+            if k_1_value + k_2_value > 0:
+                assert unbraced[index] == pytest.approx(Form5Dot16EffectiveLengthUnbraced(k_1=k_1_value, k_2=k_2_value, height=4000))
+        assert unbraced[3] == pytest.approx(4000)
+        with pytest.raises(ValueError, match="Invalid height"):
+            effective_length(4000, -0.1, 0.1)
+
+    def test_slenderness_limit(self, columns: SlenderColumns) -> None:
+        """Test the slenderness ratio and limit against formulas (5.13N) and (5.14)."""
+        results = columns.nominal_curvature(schedule(), n_ed=1000.0, m_01=20.0, m_02=40.0)
+        expected = Form5Dot13nSlendernessCriterionIsolatedMembers(
+            a=SubForm5Dot13aCreepRatio(phi_ef=1.0),
+            b=SubForm5Dot13bMechanicalReinforcementFactor(a_s=A_S, f_yd=F_YD, a_c=A_C, f_cd=20),
+            c=SubForm5Dot13cMomentRatio(m_01=20, m_02=40),
+            n_ed=1e6,
+            a_c=A_C,
+            f_cd=20,
+        )
+        assert results.slenderness_limit[0, 0] == pytest.approx(expected)
+        assert results.slenderness[0] == pytest.approx(6000 / (300 / np.sqrt(12)))
+        assert results.slender[0, 0]
+        assert columns.source_docs() == ["EN 1992-1-1:2004"]
+
+    def test_nominal_curvature(self, columns: SlenderColumns) -> None:
+        """Test the design moment against formulas (5.31) - (5.37)."""
+        results = columns.nominal_curvature(schedule(), n_ed=1000.0, m_01=20.0, m_02=40.0)
+        m_01, m_02, m_0e = first_order_moments()
+        k_r = Form5Dot36RelativeAxialForce(n_ed=1e6, ac=A_C, fcd=20, as_=A_S, fyd=F_YD, n_bal=0.4)
+        k_phi = Form5Dot37CreepFactor(f_ck=30, lambda_=results.slenderness[0], phi_ef=1.0)
+        curvature = Form5Dot34Curvature(k_r=k_r, k_phi=k_phi, f_yd=F_YD, e_s=200000, d=250)
+        m_2 = Form5Dot33NominalSecondOrderMoment(n_ed=1000, curvature=curvature, l_o=6000, c=10) / 1000
+        assert results.m_0ed[0, 0] == pytest.approx(m_0e)
+        assert results.m_2[0, 0] == pytest.approx(m_2)
+        assert results.m_ed[0, 0] == pytest.approx(max(Form5Dot31DesignMoment(m_0ed=m_0e, m_2=m_2), m_02, m_01 + 0.5 * m_2))
+
+        swapped = columns.nominal_curvature(schedule(), n_ed=1000.0, m_01=40.0, m_02=20.0)
+        assert swapped.m_ed[0, 0] == pytest.approx(results.m_ed[0, 0])
+
+        unbraced = columns.nominal_curvature(schedule(l_0=4000, braced=False), n_ed=1000.0, m_01=20.0, m_02=40.0)
+        assert unbraced.m_0ed[0, 0] == pytest.approx(40 + 10)
+        assert unbraced.m_ed[0, 0] == pytest.approx(unbraced.m_0ed[0, 0] + unbraced.m_2[0, 0])
+
+    def test_nominal_stiffness(self, columns: SlenderColumns) -> None:
+        """Test the design moment against formulas (5.21) - (5.24), (5.28) and (5.29)."""
+        results = columns.nominal_stiffness(schedule(), n_ed=1000.0, m_01=20.0, m_02=40.0)
+        _, _, m_0e = first_order_moments()
+        k_2 = Form5Dot24AxialForceCorrectionFactor(n=1e6 / (A_C * 20), lambda_factor=results.slenderness[0])
+        k_c = Form5Dot22FactorKc(k1=Form5Dot23FactorConcreteStrengthClass(f_ck=30), k2=k_2, phi_ef=1.0, rho=0.02)
+        e_cd = columns.concrete_material.e_cm / 1.2
+        i_s = A_S * (250 - 150) ** 2
+        ei = Form5Dot21NominalStiffness(k_c=k_c, e_cd=e_cd, i_c=300**4 / 12, k_s=Form5Dot22FactorKs(rho=0.02), e_s=200000, i_s=i_s)
+        n_b = np.pi**2 * ei / 6000**2 / 1000
+        expected = Form5Dot28TotalDesignMoment(m_0ed=m_0e, beta=Form5Dot29BetaFactor(c_0=8), n_ed=1000, n_b=n_b)
+        assert results.m_ed[0, 0] == pytest.approx(expected)
+        assert results.m_2[0, 0] == pytest.approx(expected - m_0e)
+
+        buckling = columns.nominal_stiffness(schedule(l_0=9000), n_ed=[[1000.0], [1200.0]], m_01=20.0, m_02=40.0)
+        assert np.all(np.isinf(buckling.m_ed))
+        with pytest.raises(ValueError, match="Invalid rho"):
+            columns.nominal_stiffness(ColumnSchedule(b=300, h=300, d=250, rho=0.001, l_0=6000), n_ed=1000.0, m_01=0.0, m_02=0.0)
+
+    def test_schedule(self, columns: SlenderColumns) -> None:
+        """Test a schedule of short, slender and tensioned columns for several combinations at once."""
+        columns_schedule = ColumnSchedule(b=300, h=[300, 300, 400], d=[250, 250, 350], rho=0.01, l_0=[2000, 7000, 7000])
+        n_ed = np.array([[800.0, 800.0, 1500.0], [-200.0, 1200.0, 1500.0]])
+        m_02 = np.array([[30.0, 10.0, 60.0], [5.0, 0.0, -60.0]])
+        for method in (columns.nominal_curvature, columns.nominal_stiffness):
+            results = method(columns_schedule, n_ed=n_ed, m_01=0.0, m_02=m_02)
+            assert results.m_ed.shape == (2, 3)
+            assert not results.slender[:, 0].any()
+            assert results.slender[:, 1].all()
+            assert results.slenderness_limit[1, 0] == np.inf
+            np.testing.assert_array_equal(results.m_2[~results.slender], 0.0)
+            e_0 = np.maximum(columns_schedule.h / 30, 20)
+            assert np.all(results.m_ed >= np.maximum(n_ed, 0) * e_0 / 1000 - 1e-9)
+            assert results.m_ed[0, 0] == pytest.approx(30 + 800 * 2000 / 400 / 1000)
+            assert results.m_ed[1, 0] == pytest.approx(5.0)
+            np.testing.assert_allclose(results.m_ed_envelope, results.m_ed.max(axis=0))
+
+    def test_invalid(self) -> None:
+        """Test that invalid schedules and coefficients raise errors."""
+        with pytest.raises(ValueError, match="Invalid b"):
+            ColumnSchedule(b=0, h=300, d=250, rho=0.01, l_0=3000)
+        with pytest.raises(ValueError, match="Invalid d"):
+            ColumnSchedule(b=300, h=300, d=100, rho=0.01, l_0=3000)
+        with pytest.raises(ValueError, match="Invalid rho"):
+            ColumnSchedule(b=300, h=300, d=250, rho=-0.01, l_0=3000)
+        with pytest.raises(ValueError, match="Invalid c"):
+            SlenderColumns(ConcreteMaterial(), ReinforcementSteelMaterial(), c=0)
+
+
+class TestBiaxialBending:
+    """Tests for the criteria for biaxial bending."""
+
+    def test_separate_directions(self) -> None:
+        """Test the criteria for separate checks against formulas (5.38a) and (5.38b)."""
+        slenderness_y, slenderness_z = np.array([40.0, 40.0, 90.0, 40.0]), np.array([30.0, 30.0, 30.0, 30.0])
+        e_y, e_z = np.array([10.0, 50.0, 10.0, 0.0]), np.array([100.0, 60.0, 100.0, 40.0])
+        allowed = separate_directions_allowed(slenderness_y, slenderness_z, e_y, e_z, b_eq=300, h_eq=400)
+        for index in range(4):
+            slenderness_ok = Form5Dot38aCheckRelativeSlendernessRatio(lambda_y=slenderness_y[index], lambda_z=slenderness_z[index])
+            eccentricity_ok = Form5Dot38bCheckRelativeEccentricityRatio(e_y=e_y[index], e_z=e_z[index], b_eq=300, h_eq=400)
+            assert allowed[index] == (bool(slenderness_ok) and bool(eccentricity_ok))
+        np.testing.assert_array_equal(allowed, [True, False, False, True])
+
+    def test_biaxial_unity_check(self) -> None:
+        """Test the exponents of art. 5.8.9 (4) and the criterion of formula (5.39)."""
+        n_ed = np.array([100.0, 700.0, 1000.0, 400.0])
+        unity_check = biaxial_unity_check(m_edz=40.0, m_rdz=100.0, m_edy=60.0, m_rdy=120.0, n_ed=n_ed, n_rd=1000.0)
+        for uc, a in zip(unity_check, [1.0, 1.5, 2.0, 1.25], strict=True):
+            assert uc == pytest.approx(0.4**a + 0.5**a)
+            assert (uc <= 1) == bool(Form5Dot39SimplifiedCriterionBiaxialBending(m_edz=40, m_rdz=100, m_edy=60, m_rdy=120, a=a))
+        with pytest.raises(ValueError, match="Invalid m_rdz"):
+            biaxial_unity_check(m_edz=40.0, m_rdz=0.0, m_edy=60.0, m_rdy=120.0, n_ed=100.0, n_rd=1000.0)
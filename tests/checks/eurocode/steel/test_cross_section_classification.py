@@ -0,0 +1,151 @@
+"""Tests for the cross-section classification according to EN 1993-1-1:2005 Table 5.2."""
+
+import numpy as np
+import pytest
+
+from blueprints.checks.eurocode.steel.cross_section_classification import (
+    CLASSIFICATION_CACHE_SIZE,
+    StressDistribution,
+    _cached_class,
+    classify_profiles,
+    cross_section_class,
+    select_bending_check,
+    select_shear_check,
+)
+from blueprints.checks.eurocode.steel.strength_bending import CheckStrengthBendingClass3, CheckStrengthBendingClass12
+from blueprints.checks.eurocode.steel.strength_shear import CheckStrengthShearClass12, CheckStrengthShearClass34
+from blueprints.materials.steel import SteelMaterial, SteelStrengthClass
+from blueprints.structural_sections.steel.profile_definitions.i_profile import IProfile
+from blueprints.structural_sections.steel.profile_definitions.strip_profile import StripProfile
+from blueprints.structural_sections.steel.standard_profiles.chs import CHS
+from blueprints.structural_sections.steel.standard_profiles.hea import HEA
+from blueprints.structural_sections.steel.standard_profiles.heb import HEB
+from blueprints.structural_sections.steel.standard_profiles.ipe import IPE
+from blueprints.structural_sections.steel.standard_profiles.lnp import LNP
+from blueprints.structural_sections.steel.standard_profiles.rhs import RHS
+from blueprints.structural_sections.steel.standard_profiles.unp import UNP
+from blueprints.structural_sections.steel.steel_cross_section import SteelCrossSection
+
+S235 = SteelMaterial(steel_class=SteelStrengthClass.S235)
+S355 = SteelMaterial(steel_class=SteelStrengthClass.S355)
+
+
+class TestStressDistribution:
+    """Tests for StressDistribution."""
+
+    def test_limits_compression_and_bending(self) -> None:
+        """Test the limits of internal parts for uniform compression and pure bending."""
+        assert StressDistribution.compression().internal_part_limits() == pytest.approx((33, 38, 42))
+        assert StressDistribution.bending().internal_part_limits() == pytest.approx((72, 83, 124))
+
+    def test_limits_below_minus_one(self) -> None:
+        """Test the class 1, 2 and 3 limits for alpha < 0.5 and psi < -1."""
+        assert StressDistribution(alpha=0.4, psi=-2).internal_part_limits() == pytest.approx((90, 103.75, 62 * 3 * np.sqrt(2)))
+
+    def test_from_psi(self) -> None:
+        """Test the stress distribution derived from psi."""
+        assert StressDistribution.from_psi(-1) == StressDistribution.bending()
+        assert StressDistribution.from_psi(0.5) == StressDistribution(alpha=1, psi=0.5)
+
+    def test_from_alpha(self) -> None:
+        """Test the stress distribution derived from alpha."""
+        assert StressDistribution.from_alpha(0.5) == StressDistribution.bending()
+        assert StressDistribution.from_alpha(1) == StressDistribution.compression()
+
+    @pytest.mark.parametrize(("alpha", "psi"), [(0, 1), (1.2, 1), (1, 1.5)])
+    def test_invalid(self, alpha: float, psi: float) -> None:
+        """Test that invalid distributions raise an error."""
+        with pytest.raises(ValueError):
+            StressDistribution(alpha=alpha, psi=psi)
+
+
+class TestClassifyProfiles:
+    """Tests for classify_profiles."""
+
+    @pytest.mark.parametrize(
+        ("profile", "material", "stress_distribution", "expected"),
+        [
+            # flange c/t = (300 - 8.5 - 54) / 2 / 14 = 8.48, between 10 eps and 14 eps for S355
+            (HEA.HEA300, S355, StressDistribution.compression(), 3),
+            (HEA.HEA300, S235, StressDistribution.compression(), 1),
+            # web c/t = (600 - 2 * 19 - 2 * 24) / 12 = 42.8 > 42 eps in compression, < 72 eps in bending
+            (IPE.IPE600, S235, StressDistribution.compression(), 4),
+            (IPE.IPE600, S235, StressDistribution.bending(), 1),
+            (HEB.HEB300, S355, StressDistribution.compression(), 1),
+            (CHS.CHS1016x12_5, S355, StressDistribution.compression(), 4),
+            (UNP.UNP80, S355, StressDistribution.compression(), 1),
+            # (b + h) / 2t = 10 > 11.5 eps for S355
+            (LNP.LNP40x40x4, S355, StressDistribution.compression(), 4),
+            (LNP.LNP40x40x4, S235, StressDistribution.compression(), 1),
+            (RHS.RHS50x30x2_6, S355, StressDistribution.compression(), 1),
+        ],
+    )
+    def test_single(self, profile: object, material: SteelMaterial, stress_distribution: StressDistribution, expected: int) -> None:
+        """Test the classification of single profiles against hand calculations."""
+        assert classify_profiles([profile], [material], stress_distribution)[0, 0] == expected  # ty: ignore[invalid-argument-type]
+
+    def test_catalogue(self) -> None:
+        """Test that a catalogue is classified at once and matches the classification of the single profiles."""
+        materials = [S235, S355]
+        classes = classify_profiles(HEA, materials)
+        assert classes.shape == (2, len(list(HEA)))
+        assert np.all(classes[1] >= classes[0])
+        for j, profile in enumerate(HEA):
+            assert cross_section_class(SteelCrossSection(profile=profile, material=S355)) == classes[1, j]
+
+    def test_default_stress_distribution_is_compression(self) -> None:
+        """Test that uniform compression is the default stress distribution."""
+        steel_cross_section = SteelCrossSection(profile=IPE.IPE600, material=S235)
+        assert cross_section_class(steel_cross_section) == 4
+        assert cross_section_class(steel_cross_section, StressDistribution.bending()) == 1
+
+    def test_cache_is_bounded(self) -> None:
+        """Test that the cache of the classes of single cross-sections has a maximum size."""
+        cross_section_class(SteelCrossSection(profile=IPE.IPE600, material=S235))
+        cache_info = _cached_class.cache_info()
+        assert cache_info.maxsize == CLASSIFICATION_CACHE_SIZE
+        assert 0 < cache_info.currsize <= CLASSIFICATION_CACHE_SIZE
+
+    def test_unsupported_profile(self) -> None:
+        """Test that unsupported profiles raise an error."""
+        with pytest.raises(NotImplementedError):
+            classify_profiles([StripProfile(width=100, height=10)], [S355])
+
+    def test_no_yield_strength(self) -> None:
+        """Test that an error is raised when no yield strength is available for the thickness."""
+        material = SteelMaterial(steel_class=SteelStrengthClass.S355_H_10219_1)
+        with pytest.raises(ValueError, match="Yield strength not specified"):
+            classify_profiles(
+                [
+                    IProfile(
+                        top_flange_width=300,
+                        top_flange_thickness=50,
+                        bottom_flange_width=300,
+                        bottom_flange_thickness=50,
+                        total_height=600,
+                        web_thickness=25,
+                        top_radius=27,
+                        bottom_radius=27,
+                    )
+                ],
+                [material],
+            )
+
+
+class TestSelectChecks:
+    """Tests for the selection of strength checks based on the cross-section class."""
+
+    def test_bending(self) -> None:
+        """Test that the bending check matches the cross-section class."""
+        assert isinstance(select_bending_check(SteelCrossSection(profile=HEB.HEB300, material=S355), 100), CheckStrengthBendingClass12)
+        assert isinstance(select_bending_check(SteelCrossSection(profile=HEA.HEA300, material=S355), 100, axis="Mz"), CheckStrengthBendingClass3)
+
+    def test_bending_class_4(self) -> None:
+        """Test that class 4 cross-sections raise an error."""
+        with pytest.raises(NotImplementedError, match="class 4"):
+            select_bending_check(SteelCrossSection(profile=CHS.CHS1016x12_5, material=S355), 100)
+
+    def test_shear(self) -> None:
+        """Test that the shear check matches the cross-section class."""
+        assert isinstance(select_shear_check(SteelCrossSection(profile=HEB.HEB300, material=S355), 100), CheckStrengthShearClass12)
+        assert isinstance(select_shear_check(SteelCrossSection(profile=HEA.HEA300, material=S355), 100), CheckStrengthShearClass34)
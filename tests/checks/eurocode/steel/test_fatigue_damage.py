@@ -0,0 +1,149 @@
+"""Tests for the fatigue damage with rainflow counting according to EN 1993-1-9:2005."""
+
+import numpy as np
+import pytest
+
+from blueprints.checks.eurocode.steel.fatigue_damage import (
+    DETAIL_CATEGORIES,
+    SHEAR_DETAIL_CATEGORIES,
+    FatigueDamage,
+    FatigueStrengthCurve,
+    rainflow,
+    turning_points,
+)
+
+
+def stack_rainflow(points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Reference four-point rainflow counting, processing the turning points one by one."""
+    stack: list[float] = []
+    ranges: list[float] = []
+    for point in points.tolist():
+        stack.append(point)
+        while len(stack) >= 4 and abs(stack[-2] - stack[-3]) <= min(abs(stack[-3] - stack[-4]), abs(stack[-1] - stack[-2])):
+            ranges.append(abs(stack[-2] - stack[-3]))
+            del stack[-3:-1]
+    return np.sort(ranges), np.array(stack)
+
+
+def random_history(n: int, seed: int = 0) -> np.ndarray:
+    """Random stress history with a slowly varying mean and decaying vibrations [MPa]."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n)
+    return 20 * np.sin(t / 400) + 40 * np.exp(-(t % 3000) / 500) * np.sin(t / 3) + rng.normal(scale=5.0, size=n)
+
+
+class TestFatigueStrengthCurve:
+    """Tests for the FatigueStrengthCurve class."""
+
+    def test_limits(self) -> None:
+        """Test the fatigue limits of figure 7.1 and the endurance at the limits."""
+        curve = FatigueStrengthCurve(delta_sigma_c=71.0)
+        assert curve.delta_sigma_d == pytest.approx(0.737 * 71.0, rel=1e-3)
+        assert curve.delta_sigma_l == pytest.approx(0.405 * 71.0, rel=1e-3)
+        np.testing.assert_allclose(curve.endurance([71.0, curve.delta_sigma_d, curve.delta_sigma_l, 142.0]), [2e6, 5e6, 1e8, 2.5e5])
+        assert curve.endurance(0.99 * curve.delta_sigma_l) == np.inf
+        assert curve.endurance(0.0) == np.inf
+
+    def test_shear_and_partial_factor(self) -> None:
+        """Test the single slope of the curves for shear stress ranges and the partial factor."""
+        curve = FatigueStrengthCurve(delta_sigma_c=100.0, gamma_mf=1.25, shear=True)
+        assert curve.delta_sigma_l == pytest.approx(0.457 * 80.0, rel=1e-3)
+        np.testing.assert_allclose(curve.endurance([80.0, 40.0]), [2e6, 2e6 * 2**5])
+
+    def test_invalid(self) -> None:
+        """Test that a non-positive detail category or partial factor and an unknown shear detail category raise an error."""
+        with pytest.raises(ValueError, match="delta_sigma_c"):
+            FatigueStrengthCurve(delta_sigma_c=0.0)
+        with pytest.raises(ValueError, match="Shear detail categories"):
+            FatigueStrengthCurve(delta_sigma_c=71.0, shear=True)
+        assert FatigueStrengthCurve(delta_sigma_c=SHEAR_DETAIL_CATEGORIES[1], shear=True).design_delta_sigma_c == 80.0
+        with pytest.raises(ValueError, match="gamma_mf"):
+            FatigueStrengthCurve(delta_sigma_c=71.0, gamma_mf=-1.0)
+
+
+class TestRainflow:
+    """Tests for the turning points and the rainflow counting."""
+
+    def test_turning_points(self) -> None:
+        """Test that plateaus and points between a peak and a valley are removed."""
+        np.testing.assert_array_equal(turning_points([0.0, 1.0, 2.0, 2.0, 1.0, 1.0, 3.0, 3.0]), [0.0, 2.0, 1.0, 3.0])
+        np.testing.assert_array_equal(turning_points([1.0, 1.0]), [1.0])
+        assert len(turning_points([])) == 0
+
+    def test_example(self) -> None:
+        """Test the example of ASTM E1049 figure 6, with one closed cycle of 4 and residue ranges of 3, 4, 8, 9, 8 and 6."""
+        ranges, residue = rainflow([-2.0, 1.0, -3.0, 5.0, -1.0, 3.0, -4.0, 4.0, -2.0])
+        np.testing.assert_array_equal(ranges, [4.0])
+        np.testing.assert_array_equal(residue, [-2.0, 1.0, -3.0, 5.0, -4.0, 4.0, -2.0])
+
+    def test_few_closed_cycles(self) -> None:
+        """Test that a sequence in which a single pass closes few cycles is counted with the stack."""
+        growing = np.arange(1.0, 41.0) * np.tile([1.0, -1.0], 20)
+        points = np.concatenate((growing[:20], [3.0, -3.0], growing[20:]))
+        ranges, residue = rainflow(points)
+        np.testing.assert_array_equal(ranges, [6.0])
+        np.testing.assert_array_equal(residue, growing)
+        assert len(rainflow(growing)[0]) == 0
+
+    @pytest.mark.parametrize("seed", [0, 1])
+    def test_against_stack(self, seed: int) -> None:
+        """Test that removing all closed cycles at once gives the cycles and residue of the one-by-one algorithm."""
+        points = turning_points(random_history(50_000, seed))
+        ranges, residue = rainflow(points)
+        expected_ranges, expected_residue = stack_rainflow(points)
+        np.testing.assert_allclose(np.sort(ranges), expected_ranges)
+        np.testing.assert_array_equal(residue, expected_residue)
+
+
+class TestFatigueDamage:
+    """Tests for the FatigueDamage class."""
+
+    def test_chunks(self) -> None:
+        """Test that the spectrum and damage do not depend on the chunks of the stress history."""
+        history = random_history(100_000)
+        whole = FatigueDamage(FatigueStrengthCurve(delta_sigma_c=36.0)).add(history)
+        chunked = FatigueDamage(FatigueStrengthCurve(delta_sigma_c=36.0)).add_chunks(np.array_split(history, 37))
+        for whole_values, chunked_values in zip(whole.spectrum(), chunked.spectrum(), strict=True):
+            np.testing.assert_allclose(whole_values, chunked_values)
+        assert chunked.damage == pytest.approx(whole.damage)
+        assert chunked.n_samples == len(history)
+
+        expected_ranges, residue = stack_rainflow(turning_points(history))
+        n_cycles = len(expected_ranges) + 0.5 * (len(residue) - 1)
+        assert whole.spectrum()[1].sum() == pytest.approx(n_cycles)
+
+    def test_constant_amplitude(self) -> None:
+        """Test the damage and formula (A.1) of a constant amplitude history with partial factors."""
+        n_cycles = 1000
+        stresses = np.tile([0.0, 100.0], n_cycles)
+        fatigue = FatigueDamage(FatigueStrengthCurve(delta_sigma_c=DETAIL_CATEGORIES[6], gamma_mf=1.15), gamma_ff=1.1).add(stresses)
+        stress_ranges, n_e = fatigue.spectrum()
+        np.testing.assert_allclose(stress_ranges, [110.0])
+        assert n_e.sum() == pytest.approx(n_cycles - 0.5)
+
+        expected = (n_cycles - 0.5) / (2e6 * (80.0 / 1.15 / 110.0) ** 3)
+        assert fatigue.damage == pytest.approx(expected)
+        assert fatigue.formula() == pytest.approx(expected)
+        assert fatigue.result().is_ok
+        assert fatigue.result().unity_check == pytest.approx(expected)
+        assert fatigue.source_docs() == ["EN 1993-1-9:2005"]
+
+    def test_bins(self) -> None:
+        """Test that every bin is represented by its upper edge and that small ranges do not contribute to the damage."""
+        fatigue = FatigueDamage(FatigueStrengthCurve(delta_sigma_c=71.0), bin_width=5.0).add([0.0, 21.0, 3.0, 14.0, 0.0, 100.0, 0.0])
+        stress_ranges, n_e = fatigue.spectrum()
+        np.testing.assert_allclose(stress_ranges, [15.0, 25.0, 100.0])
+        np.testing.assert_allclose(n_e, [1.0, 1.0, 1.0])
+        # the closed cycles of 11 and 21 MPa are below the cut-off limit of 28.8 MPa
+        assert fatigue.damage == pytest.approx(1.0 / (2e6 * (71.0 / 100.0) ** 3))
+
+    def test_invalid(self) -> None:
+        """Test that invalid parameters and a report without cycles raise errors."""
+        curve = FatigueStrengthCurve(delta_sigma_c=71.0)
+        with pytest.raises(ValueError, match="gamma_ff"):
+            FatigueDamage(curve, gamma_ff=0.0)
+        with pytest.raises(ValueError, match="bin_width"):
+            FatigueDamage(curve, bin_width=0.0)
+        with pytest.raises(ValueError, match="No cycles"):
+            FatigueDamage(curve).formula()
+        assert FatigueDamage(curve).damage == 0.0
@@ -0,0 +1,127 @@
+"""Tests for the precomputed buckling resistance curves according to EN 1993-1-1:2005 art. 6.3."""
+
+import numpy as np
+import pytest
+
+from blueprints.checks.eurocode.steel.flexural_buckling_curves import BucklingCurve, FlexuralBucklingCurves, reduction_factor
+from blueprints.materials.steel import SteelMaterial, SteelStrengthClass
+from blueprints.structural_sections.steel.standard_profiles.ipe import IPE
+from blueprints.structural_sections.steel.steel_cross_section import SteelCrossSection
+
+
+@pytest.fixture(scope="module")
+def ipe_steel_cross_section() -> SteelCrossSection:
+    """Create a SteelCrossSection fixture with IPE200 profile and S235 steel material."""
+    return SteelCrossSection(profile=IPE.IPE200, material=SteelMaterial(steel_class=SteelStrengthClass.S235))
+
+
+@pytest.fixture(scope="module")
+def ipe_curves(ipe_steel_cross_section: SteelCrossSection) -> FlexuralBucklingCurves:
+    """Buckling curves of the IPE200 including lateral-torsional buckling."""
+    return FlexuralBucklingCurves(
+        ipe_steel_cross_section,
+        buckling_curve_y=BucklingCurve.A,
+        buckling_curve_z=BucklingCurve.B,
+        buckling_curve_lt=BucklingCurve.A,
+    )
+
+
+class TestReductionFactor:
+    """Tests for the vectorised reduction factor (6.49)."""
+
+    def test_plateau(self) -> None:
+        """Test that no reduction is applied up to a slenderness of 0.2."""
+        assert reduction_factor([0.0, 0.1, 0.2], alpha=0.49) == pytest.approx([1.0, 1.0, 1.0])
+
+    def test_values(self) -> None:
+        """Test against hand calculated values."""
+        # lambda = 1.0, curve c: phi = 0.5 * (1 + 0.49 * 0.8 + 1) = 1.196, chi = 1 / (1.196 + sqrt(1.196^2 - 1)) = 0.5399
+        assert reduction_factor([1.0, 2.0], alpha=BucklingCurve.C.alpha) == pytest.approx([0.5399, 0.1962], rel=1e-3)
+
+
+class TestFlexuralBucklingCurves:
+    """Tests for FlexuralBucklingCurves."""
+
+    def test_n_b_rd(self, heb_steel_cross_section: SteelCrossSection) -> None:
+        """Test the buckling resistance of a HEB300 S355 about the z-axis, curve c, against a hand calculation."""
+        curves = FlexuralBucklingCurves(heb_steel_cross_section, buckling_curve_y=BucklingCurve.B, buckling_curve_z=BucklingCurve.C)
+        # lambda_bar = 4000 / (75.78 * 93.9 * sqrt(235 / 355)) = 0.691 -> chi = 0.730
+        assert curves.chi(4000, "z") == pytest.approx(0.730, rel=2e-3)
+        assert curves.n_b_rd(4000, "z") == pytest.approx(0.730 * 14910.7 * 355 / 1e3, rel=2e-3)
+        assert curves.source_docs() == ["EN 1993-1-1:2005"]
+
+    def test_interpolation_error(self, heb_steel_cross_section: SteelCrossSection) -> None:
+        """Test that the interpolation error stays within the stated bounds."""
+        curves = FlexuralBucklingCurves(heb_steel_cross_section, buckling_curve_y=BucklingCurve.B, buckling_curve_z=BucklingCurve.C)
+        lengths = np.random.default_rng(1).uniform(curves.min_length, curves.max_length, 10_000)
+        for axis in ("y", "z"):
+            exact = curves._exact_chi(lengths, axis)  # noqa: SLF001
+            error = np.max(np.abs(curves.chi(lengths, axis) - exact) / exact)
+            assert error <= curves.error_bound[axis]
+            assert error <= 2 * curves.estimated_error[axis]
+            assert curves.estimated_error[axis] < 1e-3
+
+    def test_outside_grid_is_exact(self, heb_steel_cross_section: SteelCrossSection) -> None:
+        """Test that lengths outside of the grid are evaluated exactly."""
+        curves = FlexuralBucklingCurves(
+            heb_steel_cross_section, buckling_curve_y=BucklingCurve.B, buckling_curve_z=BucklingCurve.C, min_length=1000, max_length=5000
+        )
+        lengths = np.array([500.0, 3000.0, 20_000.0])
+        exact = curves._exact_chi(lengths, "y")  # noqa: SLF001
+        result = curves.chi(lengths, "y")
+        assert result[[0, 2]] == pytest.approx(exact[[0, 2]], rel=1e-12)
+        assert result[1] == pytest.approx(exact[1], rel=curves.error_bound["y"])
+
+    def test_unity_check_compression(self, heb_steel_cross_section: SteelCrossSection) -> None:
+        """Test that the governing axis is used and tension gives a unity check of zero."""
+        curves = FlexuralBucklingCurves(heb_steel_cross_section, buckling_curve_y=BucklingCurve.B, buckling_curve_z=BucklingCurve.C)
+        unity_checks = curves.unity_check_compression(n=[-1000.0, 500.0], buckling_length_y=[6000.0, 6000.0], buckling_length_z=[3000.0, 3000.0])
+        expected = 1000.0 / min(curves.n_b_rd(6000.0, "y"), curves.n_b_rd(3000.0, "z"))
+        assert unity_checks == pytest.approx([expected, 0.0])
+
+    def test_m_b_rd(self, ipe_curves: FlexuralBucklingCurves, ipe_steel_cross_section: SteelCrossSection) -> None:
+        """Test the lateral-torsional buckling resistance against a direct calculation of M_cr."""
+        props = ipe_steel_cross_section.profile.section_properties(warping=True)
+        e, g, length = 210_000.0, 80_769.23, 4000.0
+        m_cr = np.pi**2 * e * props.iyy_c / length**2 * np.sqrt(props.gamma / props.iyy_c + length**2 * g * props.j / (np.pi**2 * e * props.iyy_c))
+        lambda_lt = np.sqrt(props.sxx * 235 / m_cr)
+        chi_lt = reduction_factor(lambda_lt, BucklingCurve.A.alpha)
+        assert ipe_curves.m_b_rd(length) == pytest.approx(chi_lt * props.sxx * 235 / 1e6, rel=ipe_curves.error_bound["lt"])
+        assert ipe_curves.m_b_rd(10.0) == pytest.approx(props.sxx * 235 / 1e6)
+        assert ipe_curves.unity_check_bending([-10.0, 10.0], length) == pytest.approx(10.0 / ipe_curves.m_b_rd(length))
+
+    def test_class_3_uses_elastic_modulus(self, ipe_steel_cross_section: SteelCrossSection) -> None:
+        """Test that class 3 uses the elastic section modulus."""
+        curves = FlexuralBucklingCurves(
+            ipe_steel_cross_section, buckling_curve_y=BucklingCurve.A, buckling_curve_z=BucklingCurve.B, cross_section_class=3
+        )
+        props = ipe_steel_cross_section.profile.section_properties()
+        assert curves.w_y == pytest.approx(min(props.zxx_plus, props.zxx_minus))
+
+    def test_monotone(self, ipe_curves: FlexuralBucklingCurves) -> None:
+        """Test that the interpolated resistances decrease with the length."""
+        lengths = np.linspace(50, 40_000, 5000)
+        for mode in ("y", "z", "lt"):
+            assert np.all(np.diff(ipe_curves.chi(lengths, mode)) <= 1e-12)  # ty: ignore[invalid-argument-type]
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"cross_section_class": 4}, "Cross-section class"),
+            ({"min_length": 1000, "max_length": 100}, "grid"),
+            ({"n_points": 1}, "grid points"),
+            ({"gamma_m1": 0}, "positive"),
+        ],
+    )
+    def test_invalid_input(self, ipe_steel_cross_section: SteelCrossSection, kwargs: dict, message: str) -> None:
+        """Test that invalid input raises an error."""
+        with pytest.raises(ValueError, match=message):
+            FlexuralBucklingCurves(ipe_steel_cross_section, buckling_curve_y=BucklingCurve.A, buckling_curve_z=BucklingCurve.B, **kwargs)
+
+    def test_invalid_queries(self, heb_steel_cross_section: SteelCrossSection) -> None:
+        """Test that unavailable modes and non-positive lengths raise an error."""
+        curves = FlexuralBucklingCurves(heb_steel_cross_section, buckling_curve_y=BucklingCurve.B, buckling_curve_z=BucklingCurve.C)
+        with pytest.raises(ValueError, match="not available"):
+            curves.m_b_rd(1000)
+        with pytest.raises(ValueError, match="positive"):
+            curves.chi([1000, 0], "y")
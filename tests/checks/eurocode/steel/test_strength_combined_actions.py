@@ -0,0 +1,152 @@
+"""Tests for the interaction of axial force, shear force and bending moments according to EN 1993-1-1:2005 art. 6.2.8 - 6.2.10."""
+
+import numpy as np
+import pytest
+
+from blueprints.checks.eurocode.steel.strength_combined_actions import CombinedActionsInteraction
+from blueprints.codes.eurocode.en_1993_1_1_2005.chapter_6_ultimate_limit_state import (
+    formula_6_29rho,
+    formula_6_30,
+    formula_6_36,
+    formula_6_37_38,
+    formula_6_39,
+    formula_6_40,
+)
+from blueprints.materials.steel import SteelMaterial, SteelStrengthClass
+from blueprints.structural_sections.steel.standard_profiles.chs import CHS
+from blueprints.structural_sections.steel.standard_profiles.hea import HEA
+from blueprints.structural_sections.steel.standard_profiles.heb import HEB
+from blueprints.structural_sections.steel.standard_profiles.ipe import IPE
+from blueprints.structural_sections.steel.standard_profiles.rhs import RHS
+from blueprints.structural_sections.steel.steel_cross_section import SteelCrossSection
+
+
+@pytest.fixture(scope="module")
+def heb_interaction() -> CombinedActionsInteraction:
+    """Interaction check of a HEB300 profile in S355, the section terms are computed once for all tests."""
+    return CombinedActionsInteraction(SteelCrossSection(profile=HEB.HEB300, material=SteelMaterial(steel_class=SteelStrengthClass.S355)))
+
+
+@pytest.fixture(scope="module")
+def rhs_interaction() -> CombinedActionsInteraction:
+    """Interaction check of a RHS200x100x8 profile in S355."""
+    return CombinedActionsInteraction(SteelCrossSection(profile=RHS.RHS200x100x8, material=SteelMaterial(steel_class=SteelStrengthClass.S355)))
+
+
+class TestCombinedActionsInteraction:
+    """Tests for CombinedActionsInteraction."""
+
+    def test_shear_reduction(self, heb_interaction: CombinedActionsInteraction) -> None:
+        """Test the moment resistance reduced for shear against formulas (6.29) and (6.30)."""
+        props = heb_interaction.steel_cross_section.profile.section_properties()
+        v_pl_z_rd = 4745.68 * 355 / np.sqrt(3)
+        rho = formula_6_29rho.Form6Dot29Rho(v_ed=900e3, v_pl_rd=v_pl_z_rd)
+        m_y_v_rd = formula_6_30.Form6Dot30ReducedPlasticResistanceMoment(
+            w_pl_y=props.sxx, rho=rho, h_w=262, t_w=11, f_y=355, gamma_m0=1.0, m_y_c_rd=props.sxx * 355
+        )
+
+        results = heb_interaction.evaluate(v_z=900, m_y=300)
+        assert results.rho_z[0] == pytest.approx(rho, rel=1e-4)
+        assert results.m_n_y_rd[0] == pytest.approx(m_y_v_rd / 1e6, rel=1e-4)
+        assert results.unity_check_shear_z[0] == pytest.approx(900e3 / v_pl_z_rd, rel=1e-4)
+
+    def test_axial_force_reduction_i_profile(self, heb_interaction: CombinedActionsInteraction) -> None:
+        """Test the moment resistances reduced for axial force against formulas (6.36) - (6.38)."""
+        props = heb_interaction.steel_cross_section.profile.section_properties()
+        n = 3000e3 / (props.area * 355)
+        a = (props.area - 2 * 300 * 19) / props.area
+        m_n_y_rd = formula_6_36.Form6Dot36MomentReduction(mpl_y_rd=props.sxx * 355, a=a, n=n)
+        m_n_z_rd = formula_6_37_38.Form6Dot37And38MomentReduction(mpl_z_rd=props.syy * 355, a=a, n=n)
+
+        results = heb_interaction.evaluate(n=-3000, m_y=300, m_z=50)
+        assert results.unity_check_axial[0] == pytest.approx(n)
+        assert results.m_n_y_rd[0] == pytest.approx(m_n_y_rd / 1e6)
+        assert results.m_n_z_rd[0] == pytest.approx(m_n_z_rd / 1e6)
+        # formula (6.41) with alpha = 2 and beta = 5n
+        expected = (300 / results.m_n_y_rd[0]) ** 2 + (50 / results.m_n_z_rd[0]) ** (5 * n)
+        assert results.unity_check_bending[0] == pytest.approx(expected)
+
+    def test_small_axial_force_i_profile(self, heb_interaction: CombinedActionsInteraction) -> None:
+        """Test that small axial forces do not reduce the resistance moments, criteria (6.33) - (6.35)."""
+        props = heb_interaction.steel_cross_section.profile.section_properties()
+        results = heb_interaction.evaluate(n=-200, m_y=100, m_z=10)
+        assert results.m_n_y_rd[0] == pytest.approx(props.sxx * 355 / 1e6)
+        assert results.m_n_z_rd[0] == pytest.approx(props.syy * 355 / 1e6)
+
+    def test_axial_force_reduction_rhs(self, rhs_interaction: CombinedActionsInteraction) -> None:
+        """Test the moment resistances reduced for axial force against formulas (6.39) and (6.40)."""
+        props = rhs_interaction.steel_cross_section.profile.section_properties()
+        n = 500e3 / (props.area * 355)
+        a_w = min((props.area - 2 * 100 * 8) / props.area, 0.5)
+        a_f = min((props.area - 2 * 200 * 8) / props.area, 0.5)
+        m_n_y_rd = formula_6_39.Form6Dot39ReducedBendingMomentResistance(mpl_y_rd=props.sxx * 355, n=n, a_w=a_w)
+        m_n_z_rd = formula_6_40.Form6Dot40ReducedBendingMomentResistance(mpl_z_rd=props.syy * 355, n=n, a_f=a_f)
+
+        results = rhs_interaction.evaluate(n=500, m_y=40, m_z=10)
+        assert results.m_n_y_rd[0] == pytest.approx(m_n_y_rd / 1e6)
+        assert results.m_n_z_rd[0] == pytest.approx(m_n_z_rd / 1e6)
+        exponent = 1.66 / (1 - 1.13 * n**2)
+        expected = (40 / results.m_n_y_rd[0]) ** exponent + (10 / results.m_n_z_rd[0]) ** exponent
+        assert results.unity_check_bending[0] == pytest.approx(expected)
+
+    def test_rhs_exponent_limit(self, rhs_interaction: CombinedActionsInteraction) -> None:
+        """Test that the exponents are limited to 6 for large axial forces."""
+        results = rhs_interaction.evaluate(n=-1500, m_y=1, m_z=1)
+        assert results.unity_check_axial[0] > 0.94
+        assert results.unity_check[0] == pytest.approx(results.unity_check_axial[0])
+
+    def test_arrays_match_single_combinations(self, heb_interaction: CombinedActionsInteraction) -> None:
+        """Test that the arrays give the same results as the single combinations, and the governing combination."""
+        n = np.array([-1000.0, 0.0, -3000.0, 500.0])
+        v_y = np.array([0.0, 1500.0, 100.0, 0.0])
+        v_z = np.array([300.0, 0.0, 0.0, 900.0])
+        m_y = np.array([400.0, 500.0, 300.0, 300.0])
+        m_z = np.array([0.0, 0.0, 50.0, 10.0])
+        results = heb_interaction.evaluate(n, v_y, v_z, m_y, m_z)
+        for i in range(len(n)):
+            single = heb_interaction.evaluate(n[i], v_y[i], v_z[i], m_y[i], m_z[i])
+            assert results.unity_check[i] == pytest.approx(single.unity_check[0])
+        assert results.governing_combination == int(np.argmax(results.unity_check))
+        assert results.result().unity_check == pytest.approx(results.unity_check.max())
+
+    def test_overloaded(self, heb_interaction: CombinedActionsInteraction) -> None:
+        """Test that axial forces above the resistance give no moment resistance."""
+        results = heb_interaction.evaluate(n=-6000, m_y=[0, 10])
+        assert results.m_n_y_rd == pytest.approx([0, 0])
+        assert results.unity_check_bending[0] == 0
+        assert results.unity_check_bending[1] == np.inf
+        assert results.result().is_ok is False
+
+    def test_class_3(self) -> None:
+        """Test the elastic criterion (6.42) for a class 3 cross-section (HEA300 in S355 in compression)."""
+        steel_cross_section = SteelCrossSection(profile=HEA.HEA300, material=SteelMaterial(steel_class=SteelStrengthClass.S355))
+        interaction = CombinedActionsInteraction(steel_cross_section)
+        props = steel_cross_section.profile.section_properties()
+        results = interaction.evaluate(n=[-1000, 0], m_y=[100, 0], m_z=[20, 0])
+        sigma = 1000e3 / props.area + 100e6 / min(props.zxx_plus, props.zxx_minus) + 20e6 / min(props.zyy_plus, props.zyy_minus)
+        assert results.unity_check_bending == pytest.approx([sigma / 355, 0])
+        assert results.m_n_y_rd[1] == pytest.approx(min(props.zxx_plus, props.zxx_minus) * 355 / 1e6)
+
+    def test_class_4(self) -> None:
+        """Test that class 4 cross-sections raise an error."""
+        steel_cross_section = SteelCrossSection(profile=IPE.IPE600, material=SteelMaterial(steel_class=SteelStrengthClass.S355))
+        interaction = CombinedActionsInteraction(steel_cross_section)
+        with pytest.raises(NotImplementedError, match="class 4"):
+            interaction.evaluate(n=-100, m_y=100)
+        assert CombinedActionsInteraction(steel_cross_section, cross_section_class=1).evaluate(n=-100, m_y=100).unity_check[0] < 1
+
+        # without compression the cross-section is classified for bending: class 1
+        props = steel_cross_section.profile.section_properties()
+        assert interaction.evaluate(n=100, m_y=100).m_n_y_rd[0] == pytest.approx(props.sxx * 355 / 1e6)
+
+    def test_invalid_input(self) -> None:
+        """Test that unsupported profiles and classes raise an error."""
+        material = SteelMaterial(steel_class=SteelStrengthClass.S355)
+        with pytest.raises(NotImplementedError):
+            CombinedActionsInteraction(SteelCrossSection(profile=CHS.CHS1016x12_5, material=material))
+        with pytest.raises(ValueError, match="Cross-section class"):
+            CombinedActionsInteraction(SteelCrossSection(profile=RHS.RHS200x100x8, material=material), cross_section_class=4)  # ty: ignore[invalid-argument-type]
+
+    def test_source_docs(self) -> None:
+        """Test the source documents."""
+        assert CombinedActionsInteraction.source_docs() == ["EN 1993-1-1:2005"]
@@ -0,0 +1 @@
+"""Test checks for timber."""
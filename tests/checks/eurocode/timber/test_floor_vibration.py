@@ -0,0 +1,74 @@
+"""Tests for the vectorised vibration screening of timber floors according to EN 1995-1-1:2004 art. 7.3.3."""
+
+import numpy as np
+import pytest
+
+from blueprints.checks.eurocode.timber.floor_vibration import FloorVibration
+from blueprints.codes.eurocode.en_1995_1_1_2004.chapter_7_serviceability_limit_states.formula_7_3 import Form7Dot3RatioDeflectionPointLoadUC
+from blueprints.codes.eurocode.en_1995_1_1_2004.chapter_7_serviceability_limit_states.formula_7_4 import Form7Dot4VelocityResponseLimit
+from blueprints.codes.eurocode.en_1995_1_1_2004.chapter_7_serviceability_limit_states.formula_7_5 import Form7Dot5NaturalFrequency
+from blueprints.codes.eurocode.en_1995_1_1_2004.chapter_7_serviceability_limit_states.formula_7_6 import Form7Dot6VelocityResponse
+from blueprints.codes.eurocode.en_1995_1_1_2004.chapter_7_serviceability_limit_states.formula_7_7 import Form7Dot7NumberOfFOVibrations
+
+LENGTH = np.array([[3.5], [4.5], [6.0]])
+EI_L = np.array([1.2e6, 2.0e6, 3.5e6])
+EI_B = 0.1e6
+WIDTH = 5.0
+M = 40.0
+
+
+class TestFloorVibration:
+    """Tests for the FloorVibration class."""
+
+    def test_evaluate(self) -> None:
+        """Test every floor of a grid of spans and joist options against formulas (7.3) - (7.7)."""
+        check = FloorVibration()
+        results = check.evaluate(length=LENGTH, width=WIDTH, ei_l=EI_L, ei_b=EI_B, m=M, w=[[0.5, 1.2, 0.8]], f=1.0)
+        assert results.v.shape == (3, 3)
+        for row, length in enumerate(LENGTH[:, 0]):
+            for column, ei_l in enumerate(EI_L):
+                f_1 = Form7Dot5NaturalFrequency(length=length, ei_l=ei_l, m=M)
+                n_40 = Form7Dot7NumberOfFOVibrations(f_1=f_1, b=WIDTH, length=length, ei_l=ei_l, ei_b=EI_B)
+                assert results.f_1[row, column] == pytest.approx(f_1)
+                assert results.n_40[row, column] == pytest.approx(n_40)
+                assert results.v[row, column] == pytest.approx(Form7Dot6VelocityResponse(n_40=n_40, m=M, length=length, b=WIDTH))
+                assert results.v_limit[row, column] == pytest.approx(Form7Dot4VelocityResponseLimit(b=120, f_1=f_1, ksi=0.01))
+        assert results.deflection_check is not None
+        np.testing.assert_allclose(results.deflection_check[1], [Form7Dot3RatioDeflectionPointLoadUC(w=w, f=1.0, alpha=1.0) for w in [0.5, 1.2, 0.8]])
+        assert check.source_docs() == ["EN 1995-1-1:2004"]
+
+    def test_unity_check(self) -> None:
+        """Test the unity checks, the floors that require a special investigation and the result."""
+        check = FloorVibration(a=1.5, b=100, xi=0.02)
+        results = check.evaluate(length=LENGTH, width=WIDTH, ei_l=EI_L, ei_b=EI_B, m=M)
+        assert results.deflection_check is None
+        assert results.special_investigation.tolist() == [[False, False, False], [False, False, False], [True, False, False]]
+        np.testing.assert_allclose(results.unity_check[:2], results.v[:2] / results.v_limit[:2])
+        assert results.unity_check[2, 0] == np.inf
+        assert results.governing_floor == 6
+        assert not results.result().is_ok
+
+        stiff = check.evaluate(length=3.0, width=4.0, ei_l=3.0e6, ei_b=0.2e6, m=40.0, w=2.0, f=2.0)
+        assert stiff.unity_check == pytest.approx(max(stiff.v / stiff.v_limit, 1 / 1.5))
+        assert stiff.result().is_ok
+
+    def test_high_frequency(self) -> None:
+        """Test that floors with a fundamental frequency above 40 Hz have no first-order modes below 40 Hz."""
+        results = FloorVibration().evaluate(length=1.5, width=3.0, ei_l=5.0e6, ei_b=0.5e6, m=30.0)
+        assert results.f_1 > 40
+        assert results.n_40 == 0.0
+        assert results.v == pytest.approx(4 * 0.4 / (30 * 3 * 1.5 + 200))
+
+    def test_invalid(self) -> None:
+        """Test that invalid limits and floors raise errors."""
+        with pytest.raises(ValueError, match="Invalid a"):
+            FloorVibration(a=0)
+        with pytest.raises(ValueError, match="Invalid b"):
+            FloorVibration(b=40)
+        with pytest.raises(ValueError, match="Invalid xi"):
+            FloorVibration(xi=-0.01)
+        check = FloorVibration()
+        with pytest.raises(ValueError, match="Invalid length"):
+            check.evaluate(length=[4.0, 0.0], width=5.0, ei_l=2e6, ei_b=1e5, m=40)
+        with pytest.raises(ValueError, match="Invalid w"):
+            check.evaluate(length=4.0, width=5.0, ei_l=2e6, ei_b=1e5, m=40, w=1.0, f=0.0)
@@ -0,0 +1,142 @@
+"""Tests for the vectorised analysis of mechanically jointed beams according to EN 1995-1-1:2023 Annex E."""
+
+import numpy as np
+import pytest
+
+from blueprints.checks.eurocode.timber.mechanically_jointed_beams import MechanicallyJointedBeam
+from blueprints.codes.eurocode.en_1995_1_1_2023.appendix_e.formula_e_1 import FormEDot1EffBendingStiffness
+from blueprints.codes.eurocode.en_1995_1_1_2023.appendix_e.formula_e_2 import FormEDot2MechanicalConnectEfficiencyFactor
+from blueprints.codes.eurocode.en_1995_1_1_2023.appendix_e.formula_e_3 import FormEDot3DistanceCentroidAlpha1
+from blueprints.codes.eurocode.en_1995_1_1_2023.appendix_e.formula_e_4 import FormEDot4DistanceToCentroidA2
+from blueprints.codes.eurocode.en_1995_1_1_2023.appendix_e.formula_e_5 import FormEDot5DistanceCentroidAlpha3
+from blueprints.codes.eurocode.en_1995_1_1_2023.appendix_e.formula_e_6 import FormEDot6AreaOfLayerI
+from blueprints.codes.eurocode.en_1995_1_1_2023.appendix_e.formula_e_7 import FormEDot7SecondMomentInertia
+from blueprints.codes.eurocode.en_1995_1_1_2023.appendix_e.formula_e_8 import FormEDot8AxialStressInILayer
+from blueprints.codes.eurocode.en_1995_1_1_2023.appendix_e.formula_e_9 import FormEDot9BendingStressInILayer
+from blueprints.codes.eurocode.en_1995_1_1_2023.appendix_e.formula_e_10 import FormEDot10ShearStressInLayer2
+
+B = [200.0, 60.0, 200.0]
+H = [40.0, 240.0, 40.0]
+E = [9000.0, 11000.0, 9000.0]
+LENGTH = 5000.0
+S = 100.0
+K = 800.0
+
+
+class TestMechanicallyJointedBeam:
+    """Tests for the MechanicallyJointedBeam class."""
+
+    def test_symmetric_layup(self) -> None:
+        """Test a symmetric I-beam against formulas (E.1) - (E.10)."""
+        beam = MechanicallyJointedBeam(b=B, h=H, e=E, length=LENGTH)
+        results = beam.evaluate(s=S, k=K, m_d=20.0, v_d=12.0)
+        a = [float(FormEDot6AreaOfLayerI(b_i=b, h_i=h, i=i)) for i, (b, h) in enumerate(zip(B, H, strict=True), start=1)]
+        inertia = [float(FormEDot7SecondMomentInertia(b_i=b, h_i=h, i=i)) for i, (b, h) in enumerate(zip(B, H, strict=True), start=1)]
+        gamma = [float(FormEDot2MechanicalConnectEfficiencyFactor(i=i, e_i=E[i - 1], a_i=a[i - 1], s_i=S, k_i=K, length=LENGTH)) for i in (1, 2, 3)]
+        alpha_2 = FormEDot4DistanceToCentroidA2(e_i=E, a_i=a, gamma_i=gamma, h_i=H)
+        alpha_1 = FormEDot3DistanceCentroidAlpha1(h_1=H[0], h_2=H[1], alpha_2=alpha_2)
+        alpha = [float(alpha_1), float(alpha_2), float(FormEDot5DistanceCentroidAlpha3(h_2=H[1], h_3=H[2], alpha_2=alpha_2))]
+        ei_ef = FormEDot1EffBendingStiffness(e_i=E, i_i=inertia, gamma_i=gamma, a_i=a, alpha_i=alpha)
+
+        np.testing.assert_allclose(beam.a, a)
+        np.testing.assert_allclose(beam.i, inertia)
+        np.testing.assert_allclose(results.gamma, gamma)
+        np.testing.assert_allclose(results.alpha, alpha, atol=1e-9)
+        assert results.ei_ef == pytest.approx(ei_ef)
+        for i in (1, 3):
+            expected = FormEDot8AxialStressInILayer(i=i, gamma_i=gamma[i - 1], e_i=E[i - 1], alpha_i=alpha[i - 1], m_yd=20e6, ei_ef=ei_ef)
+            assert results.sigma[i - 1] == pytest.approx(expected)
+        for i in (1, 2, 3):
+            assert results.sigma_m[i - 1] == pytest.approx(FormEDot9BendingStressInILayer(i=i, e_i=E[i - 1], h_i=H[i - 1], m_yd=20e6, ei_ef=ei_ef))
+        expected = FormEDot10ShearStressInLayer2(
+            gamma_3=gamma[2], e_2=E[1], e_3=E[2], a_3=a[2], alpha_2=alpha_2, alpha_3=alpha[2], h_2=H[1], b_2=B[1], v_d=12e3, ei_ef=ei_ef
+        )
+        assert results.tau_2_max == pytest.approx(expected)
+        assert beam.source_docs() == ["EN 1995-1-1:2023"]
+
+    def test_asymmetric_three_layers(self) -> None:
+        """Test an asymmetric I-beam against formulas (E.1) - (E.5) and (E.10)."""
+        b, h, e = [300.0, 80.0, 120.0], [30.0, 200.0, 45.0], [8000.0, 11000.0, 12000.0]
+        beam = MechanicallyJointedBeam(b=b, h=h, e=e, length=LENGTH)
+        results = beam.evaluate(s=[80.0, 1.0, 150.0], k=K, v_d=15.0)
+        a = beam.a.tolist()
+        gamma = [
+            float(FormEDot2MechanicalConnectEfficiencyFactor(i=i, e_i=e[i - 1], a_i=a[i - 1], s_i=s, k_i=K, length=LENGTH))
+            for i, s in [(1, 80), (2, 1), (3, 150)]
+        ]
+        alpha_2 = FormEDot4DistanceToCentroidA2(e_i=e, a_i=a, gamma_i=gamma, h_i=h)
+        assert abs(alpha_2) > 1
+        alpha_1 = FormEDot3DistanceCentroidAlpha1(h_1=h[0], h_2=h[1], alpha_2=alpha_2)
+        alpha_3 = FormEDot5DistanceCentroidAlpha3(h_2=h[1], h_3=h[2], alpha_2=alpha_2)
+        ei_ef = FormEDot1EffBendingStiffness(
+            e_i=e, i_i=beam.i.tolist(), gamma_i=gamma, a_i=a, alpha_i=[float(alpha_1), float(alpha_2), float(alpha_3)]
+        )
+        np.testing.assert_allclose(results.gamma, gamma)
+        np.testing.assert_allclose(results.alpha, [alpha_1, alpha_2, alpha_3])
+        assert results.ei_ef == pytest.approx(ei_ef)
+        expected = FormEDot10ShearStressInLayer2(
+            gamma_3=gamma[2], e_2=e[1], e_3=e[2], a_3=a[2], alpha_2=alpha_2, alpha_3=alpha_3, h_2=h[1], b_2=b[1], v_d=15e3, ei_ef=ei_ef
+        )
+        assert results.tau_2_max == pytest.approx(expected)
+
+    def test_asymmetric_layups(self) -> None:
+        """Test that the centroid of asymmetric layups of two and three layers is the centroid of the effective section."""
+        for b, h, e in [([300.0, 80.0, 120.0], [30.0, 200.0, 45.0], [8000.0, 11000.0, 12000.0]), ([300.0, 80.0], [30.0, 200.0], [8000.0, 11000.0])]:
+            beam = MechanicallyJointedBeam(b=b, h=h, e=e, length=LENGTH)
+            results = beam.evaluate(s=[80.0, 1.0, 150.0][: beam.n_layers], k=K)
+            sign = np.array([1.0, -1.0, -1.0])[: beam.n_layers]
+            assert np.sum(results.gamma * beam.a * np.array(e) * sign * results.alpha) == pytest.approx(0.0, abs=1e-3)
+            alpha_2 = FormEDot4DistanceToCentroidA2(e_i=e, a_i=beam.a.tolist(), gamma_i=results.gamma.tolist(), h_i=h)
+            assert results.alpha[1] == pytest.approx(alpha_2)
+            assert results.ei_ef == pytest.approx(
+                FormEDot1EffBendingStiffness(
+                    e_i=e, i_i=beam.i.tolist(), gamma_i=results.gamma.tolist(), a_i=beam.a.tolist(), alpha_i=results.alpha.tolist()
+                )
+            )
+        # the web part below the centroid of the two layer beam carries the shear force
+        shear = beam.evaluate(s=80.0, k=K, v_d=10.0)
+        z = h[1] / 2 + shear.alpha[1]
+        assert shear.tau_2_max == pytest.approx(0.5 * e[1] * b[1] * z**2 * 10e3 / (b[1] * shear.ei_ef))
+
+    def test_sweep(self) -> None:
+        """Test a sweep over layups and fastener spacings, with the limits of rigid and absent connections."""
+        depths = np.array([[40.0, 200.0, 40.0], [40.0, 240.0, 40.0], [50.0, 240.0, 50.0]])
+        beam = MechanicallyJointedBeam(b=B, h=depths, e=E, length=LENGTH)
+        spacings = np.array([[[1e-9]], [[50.0]], [[200.0]], [[1e12]]])
+        results = beam.evaluate(s=spacings, k=K, m_d=10.0)
+        assert results.ei_ef.shape == (4, 3)
+        assert np.all(np.diff(results.ei_ef, axis=0) < 0)
+        rigid = E[0] * 2 * (B[0] * 40**3 / 12 + B[0] * 40 * 140**2) + E[1] * B[1] * 240**3 / 12
+        assert results.ei_ef[0, 1] == pytest.approx(rigid, rel=1e-6)
+        assert results.ei_ef[-1, 1] == pytest.approx(np.sum(np.array(E) * beam.i[1]), rel=1e-6)
+        single = beam.evaluate(s=50.0, k=K, m_d=10.0)
+        np.testing.assert_allclose(results.sigma[1], single.sigma)
+
+    def test_optimum(self) -> None:
+        """Test the selection of the cheapest layup and spacing that satisfies the stresses and the required stiffness."""
+        depths = np.array([[40.0, 200.0, 40.0], [40.0, 240.0, 40.0], [50.0, 300.0, 50.0]])
+        beam = MechanicallyJointedBeam(b=B, h=depths, e=E, length=LENGTH)
+        spacings = np.array([[[50.0]], [[100.0]], [[200.0]]])
+        results = beam.evaluate(s=spacings, k=K, m_d=25.0, v_d=20.0)
+        unity_check = results.unity_check(f_m=[14.0, 18.0, 14.0], f_v=2.5)
+        np.testing.assert_allclose(
+            unity_check, np.maximum(np.max(results.extreme_fibre_stress / [14.0, 18.0, 14.0], axis=-1), results.tau_2_max / 2.5)
+        )
+        # more fasteners cost more, a larger section costs more timber
+        cost = np.sum(depths * B, axis=-1) / 1e3 + 1e3 / spacings[..., 0]
+        optimum = results.optimum(cost, f_m=[14.0, 18.0, 14.0], f_v=2.5, ei_min=1.5e12)
+        assert optimum is not None
+        feasible = (unity_check <= 1) & (results.ei_ef >= 1.5e12)
+        assert feasible[optimum]
+        assert cost[optimum] == np.min(np.broadcast_to(cost, feasible.shape)[feasible])
+        assert results.optimum(cost, f_m=1.0, f_v=2.5) is None
+
+    def test_invalid(self) -> None:
+        """Test that invalid layups and connections raise errors."""
+        with pytest.raises(ValueError, match="Invalid layers"):
+            MechanicallyJointedBeam(b=[100.0] * 4, h=50.0, e=E[0], length=LENGTH)
+        with pytest.raises(ValueError, match="Invalid b"):
+            MechanicallyJointedBeam(b=B, h=[40.0, 0.0, 40.0], e=E, length=LENGTH)
+        beam = MechanicallyJointedBeam(b=B, h=H, e=E, length=LENGTH)
+        with pytest.raises(ValueError, match="Invalid s or k"):
+            beam.evaluate(s=0.0, k=K)
@@ -0,0 +1,78 @@
+"""Tests for the parallel check runner."""
+
+from dataclasses import dataclass
+
+import pytest
+
+from blueprints.checks.check_result import CheckResult
+from blueprints.checks.check_runner import _picklable_check_result, is_free_threaded, run_checks
+from blueprints.checks.eurocode.steel.strength_compression import CheckStrengthCompressionClass123
+from blueprints.materials.steel import SteelMaterial
+from blueprints.structural_sections.steel.standard_profiles.strip import Strip
+from blueprints.structural_sections.steel.steel_cross_section import SteelCrossSection
+from blueprints.utils.report import Report
+
+
+@dataclass(frozen=True)
+class UnityCheck:
+    """Minimal check returning a given unity check."""
+
+    unity_check: float
+    name: str = "Unity check"
+
+    @staticmethod
+    def source_docs() -> list[str]:
+        """Return no source documents."""
+        return []
+
+    def subchecks(self) -> dict:
+        """Return no sub-checks."""
+        return {}
+
+    def result(self) -> CheckResult:
+        """Return the result."""
+        return CheckResult.from_comparison(provided=self.unity_check, required=1.0)
+
+    def report(self, n: int = 2) -> Report:
+        """Return an empty report."""
+        return Report(f"{self.name} ({n} decimals)")
+
+
+class TestRunChecks:
+    """Tests for run_checks."""
+
+    @pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+    def test_results_in_order(self, executor: str) -> None:
+        """Test that all executors return the results in the order of the checks."""
+        checks = [UnityCheck(unity_check=value) for value in (0.5, 1.5, 0.9, 0.1)]
+        results = run_checks(checks, max_workers=2, executor=executor)  # ty: ignore[invalid-argument-type]
+        assert [result.unity_check for result in results] == pytest.approx([0.5, 1.5, 0.9, 0.1])
+        assert [result.is_ok for result in results] == [True, False, True, True]
+
+    def test_shared_profile_computed_once(self) -> None:
+        """Test that checks sharing a profile compute its section properties only once in a thread pool."""
+        profile = Strip.STRIP160x5
+        cross_section = SteelCrossSection(profile=profile, material=SteelMaterial())
+        checks = [CheckStrengthCompressionClass123(cross_section, n=-float(n)) for n in range(1, 17)]
+
+        thread_results = run_checks(checks, max_workers=8, executor="thread")
+        assert len(profile._section_props_cache) == 1  # noqa: SLF001
+        process_results = run_checks(checks[:2], max_workers=2, executor="process")
+
+        assert [result.unity_check for result in thread_results[:2]] == pytest.approx([result.unity_check for result in process_results])
+
+    def test_picklable_check_result(self) -> None:
+        """Test that the result sent back from worker processes only contains plain floats."""
+        cross_section = SteelCrossSection(profile=Strip.STRIP160x5, material=SteelMaterial())
+        result = _picklable_check_result(CheckStrengthCompressionClass123(cross_section, n=-10))
+        assert type(result.required) is float
+        assert type(result.provided) is float
+
+    def test_unknown_executor(self) -> None:
+        """Test that an unknown executor raises an error."""
+        with pytest.raises(ValueError, match="Unknown executor"):
+            run_checks([UnityCheck(unity_check=0.5)], executor="gpu")  # ty: ignore[invalid-argument-type]
+
+    def test_is_free_threaded(self) -> None:
+        """Test that the free-threaded detection returns a boolean."""
+        assert isinstance(is_free_threaded(), bool)
@@ -1,5 +1,6 @@
 """Tests for Table3Dot1NominalValuesHotRolledStructuralSteel class."""
 
+import numpy as np
 import pytest
 
 from blueprints.codes.eurocode.en_1993_1_1_2005.chapter_3_materials.table_3_1 import (
@@ -178,3 +179,41 @@ class TestTable3Dot1NominalValuesHotRolledStructuralSteel:
         steel = Table3Dot1NominalValuesHotRolledStructuralSteel(SteelStrengthClass.S355, 30)
         expected_str = "S 355, t=30 mm, fy=355 N/mm², fu=490 N/mm²"
         assert str(steel) == expected_str
+
+    def test_lookup_scalar(self) -> None:
+        """Test that the scalar lookup gives the same values as an instance."""
+        for steel_class in SteelStrengthClass:
+            for thickness in (10, 40, 40.01, 80):
+                steel = Table3Dot1NominalValuesHotRolledStructuralSteel(steel_class, thickness)
+                if thickness > 40 and steel_class.standard_group == SteelStandardGroup.EN_10219_1:
+                    continue
+                assert Table3Dot1NominalValuesHotRolledStructuralSteel.fy_lookup(steel_class, thickness) == steel.fy
+                assert Table3Dot1NominalValuesHotRolledStructuralSteel.fu_lookup(steel_class, thickness) == steel.fu
+
+    def test_lookup_array(self) -> None:
+        """Test that an array of thicknesses is mapped to strengths in one call."""
+        thicknesses = np.array([[5, 40], [40.01, 80]])
+        fy = Table3Dot1NominalValuesHotRolledStructuralSteel.fy_lookup(SteelStrengthClass.S355, thicknesses)
+        fu = Table3Dot1NominalValuesHotRolledStructuralSteel.fu_lookup(SteelStrengthClass.S355, thicknesses)
+        np.testing.assert_array_equal(fy, [[355, 355], [335, 335]])
+        np.testing.assert_array_equal(fu, [[490, 490], [470, 470]])
+
+    def test_lookup_zero_dimensional_array(self) -> None:
+        """Test that a 0-d array of thicknesses takes the scalar path."""
+        assert Table3Dot1NominalValuesHotRolledStructuralSteel.fy_lookup(SteelStrengthClass.S355, np.asarray(50.0)) == 335
+        assert Table3Dot1NominalValuesHotRolledStructuralSteel.fu_lookup(SteelStrengthClass.S355, np.asarray(10)) == 490
+
+    @pytest.mark.parametrize(
+        ("steel_class", "thickness", "message"),
+        [
+            (SteelStrengthClass.S355, [10, -1], "must be positive"),
+            (SteelStrengthClass.S355, [10, 81], "exceed maximum supported value of 80 mm"),
+            (SteelStrengthClass.S355_H_10219_1, [10, 50], "not specified for thickness > 40 mm"),
+            (SteelStrengthClass.S355, "30 mm", "must be a positive number"),
+            ("S355", 30, "Invalid steel class"),
+        ],
+    )
+    def test_lookup_invalid(self, steel_class: SteelStrengthClass, thickness: object, message: str) -> None:
+        """Test that the lookup raises the same errors as an instance."""
+        with pytest.raises(ValueError, match=message):
+            Table3Dot1NominalValuesHotRolledStructuralSteel.fy_lookup(steel_class, thickness)  # ty: ignore[no-matching-overload]
@@ -32,10 +32,10 @@ class TestFormEDot10MaxShearStressInLayer2:
     @pytest.mark.parametrize(
         ("params", "expected_result"),
         [
-            (FormE10Params(1, 1, 1, 1, 1, 1, 1, 1, 1, 1), 1.5),
+            (FormE10Params(1, 1, 1, 1, 1, 1, 1, 1, 1, 1), 2.125),
             (FormE10Params(0.767, 4000, 12000, 60000, 0, 70, 80, 1000, 10e03, 6015486104925.15), 0.0695920),
-            (FormE10Params(0.86822, 12000, 12000, 30000, 12.035, 32.96469, 60, 1000, 20e03, 2173632196491.10), 0.1664219),
-            (FormE10Params(0.92946, 12000, 12000, 15000, -10.002, 55.0018, 60, 20, 20000, 814959895024.47), 11.38334),
+            (FormE10Params(0.86822, 12000, 12000, 30000, 12.035, 32.96469, 60, 1000, 20e03, 2173632196491.10), 0.1923514),
+            (FormE10Params(0.92946, 12000, 12000, 15000, -10.002, 55.0018, 60, 20, 20000, 814959895024.47), 11.35018),
         ],
         ids=["test-1", "test-2", "test-3", "test-4"],
     )
@@ -81,13 +81,13 @@ class TestFormEDot10MaxShearStressInLayer2:
         [
             (
                 FormE10Params(1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
-                r"\tau_{2,max} = 1.50",
+                r"\tau_{2,max} = 2.12",
                 (
                     r"\tau_{2,max} = \left[\gamma_3 E_3 A_3 \alpha_3"
-                    r" + 0.5 E_2 b_2 \left(\frac{\alpha_2 + h_2}{2}\right)^2\right] \frac{V_d}{b_{2} EI_{ef}}"
+                    r" + 0.5 E_2 b_2 \left(\frac{h_2}{2} + \alpha_2\right)^2\right] \frac{V_d}{b_{2} EI_{ef}}"
                     r" = \left[1.00 \cdot 1.00 \cdot 1.00 \cdot 1.00"
-                    r" + 0.5 \cdot 1.00 \cdot 1.00 \left(\frac{1.00 + 1.00}{2}\right)^2\right] \frac{1.00}{1.00 \cdot 1.00}"
-                    r" = 1.50"
+                    r" + 0.5 \cdot 1.00 \cdot 1.00 \left(\frac{1.00}{2} + 1.00\right)^2\right] \frac{1.00}{1.00 \cdot 1.00}"
+                    r" = 2.12"
                 ),
             ),
             (
@@ -95,9 +95,9 @@ class TestFormEDot10MaxShearStressInLayer2:
                 r"\tau_{2,max} = 0.07",
                 (
                     r"\tau_{2,max} = \left[\gamma_3 E_3 A_3 \alpha_3"
-                    r" + 0.5 E_2 b_2 \left(\frac{\alpha_2 + h_2}{2}\right)^2\right] \frac{V_d}{b_{2} EI_{ef}}"
+                    r" + 0.5 E_2 b_2 \left(\frac{h_2}{2} + \alpha_2\right)^2\right] \frac{V_d}{b_{2} EI_{ef}}"
                     r" = \left[0.77 \cdot 12000.00 \cdot 60000.00 \cdot 70.00"
-                    r" + 0.5 \cdot 4000.00 \cdot 1000.00 \left(\frac{0.00 + 80.00}{2}\right)^2\right] \frac{10000.00}{1000.00 \cdot 6015486104925.15}"
+                    r" + 0.5 \cdot 4000.00 \cdot 1000.00 \left(\frac{80.00}{2} + 0.00\right)^2\right] \frac{10000.00}{1000.00 \cdot 6015486104925.15}"
                     r" = 0.07"
                 ),
             ),
@@ -14,7 +14,7 @@ class TestFormEDot5DistanceCentroidAlpha3:
 
     @pytest.mark.parametrize(
         ("h_2", "h_3", "alpha_2", "expected_result"),
-        [(10, 10, 0, 10), (10, 20, -10.06, 25.06), (20, 80, 14.686, 35.314), (30, 20, -10, 35.00)],
+        [(10, 10, 0, 10), (10, 20, -10.06, 4.94), (20, 80, 14.686, 64.686), (30, 20, -10, 15.00)],
         ids=["a2=0", "a2<0", "a2>0", "a2<0b"],
     )
     def test_evaluation(self, h_2: float, h_3: float, alpha_2: float, expected_result: float) -> None:
@@ -41,13 +41,13 @@ class TestFormEDot5DistanceCentroidAlpha3:
     @pytest.mark.parametrize(
         ("h_2", "h_3", "alpha_2", "rep_short", "rep_long"),
         [
-            (10, 10, 0, r"\alpha_3 = 10.00", r"\alpha_3 = \frac{h_2 + h_3}{2} - \alpha_2 = \frac{10.00 + 10.00}{2} - \left(0.00\right) = 10.00"),
+            (10, 10, 0, r"\alpha_3 = 10.00", r"\alpha_3 = \frac{h_2 + h_3}{2} + \alpha_2 = \frac{10.00 + 10.00}{2} + \left(0.00\right) = 10.00"),
             (
                 10,
                 20,
                 -10.06,
-                r"\alpha_3 = 25.06",
-                r"\alpha_3 = \frac{h_2 + h_3}{2} - \alpha_2 = \frac{10.00 + 20.00}{2} - \left(-10.06\right) = 25.06",
+                r"\alpha_3 = 4.94",
+                r"\alpha_3 = \frac{h_2 + h_3}{2} + \alpha_2 = \frac{10.00 + 20.00}{2} + \left(-10.06\right) = 4.94",
             ),
         ],
         ids=["latex_a2_pos", "latex_a2_neg"],
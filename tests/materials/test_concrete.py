@@ -1,8 +1,15 @@
 """Test Concrete material from table 3.1 of EN 1992-1-1:2004."""
 
+import numpy as np
 import pytest
 
-from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.concrete import (
+    CONCRETE_STRENGTH_CLASS_PROPERTIES,
+    ConcreteMaterial,
+    ConcreteStrengthClass,
+    ConcreteStrengthClassProperties,
+    concrete_property_array,
+)
 
 
 class TestConcreteMaterial:
@@ -183,3 +190,41 @@ class TestConcreteMaterial:
     def test_inequality_with_different_concrete_class(self, fixture_concrete_material_c30_37: ConcreteMaterial) -> None:
         """Test inequality with different concrete class."""
         assert fixture_concrete_material_c30_37 != ConcreteMaterial(concrete_class=ConcreteStrengthClass.C12_15)
+
+
+class TestConcreteStrengthClassProperties:
+    """Test class for the precomputed properties of the concrete strength classes."""
+
+    def test_high_strength_class(self) -> None:
+        """Tests the properties of a high strength class from table 3.1."""
+        properties = CONCRETE_STRENGTH_CLASS_PROPERTIES[ConcreteStrengthClass.C70_85]
+        assert properties.f_ck == 70
+        assert properties.f_cm_cube == 93
+        assert properties.f_ctm == pytest.approx(4.6, abs=0.05)
+        assert properties.e_cm == pytest.approx(41_000, rel=0.01)
+        assert properties.eps_cu2 == pytest.approx(2.7, abs=0.05)
+        assert properties.n_factor == pytest.approx(1.44, abs=0.01)
+        assert properties.eps_c3 == pytest.approx(2.0, abs=0.05)
+
+    def test_cached_accessor(self) -> None:
+        """Tests that a material reads its properties once from the table."""
+        concrete = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C45_55)
+        assert concrete.strength_class_properties is CONCRETE_STRENGTH_CLASS_PROPERTIES[ConcreteStrengthClass.C45_55]
+        assert concrete.strength_class_properties is concrete.strength_class_properties
+        assert concrete.e_cm == concrete.strength_class_properties.e_cm
+
+    def test_property_array(self) -> None:
+        """Tests the array of a property for an array of concrete strength classes."""
+        classes = [ConcreteStrengthClass.C90_105, ConcreteStrengthClass.C12_15, ConcreteStrengthClass.C90_105]
+        np.testing.assert_array_equal(concrete_property_array(classes, "f_ck"), [90.0, 12.0, 90.0])
+        np.testing.assert_array_equal(concrete_property_array(classes, "e_cm"), [ConcreteMaterial(c).e_cm for c in classes])
+        assert concrete_property_array([], "f_ctm").shape == (0,)
+
+        with pytest.raises(ValueError, match="Unknown concrete property"):
+            concrete_property_array(classes, "f_cd")
+
+    def test_invalid_class(self) -> None:
+        """Tests that an invalid strength class raises a ValueError."""
+        invalid_concrete_strength_class = type("InvalidConcreteStrengthClass", (), {"value": "C30/"})()
+        with pytest.raises(ValueError, match="f_ck_cube"):
+            ConcreteStrengthClassProperties.from_concrete_class(invalid_concrete_strength_class)
@@ -0,0 +1,135 @@
+"""Tests for the time-dependent properties of concrete."""
+
+import numpy as np
+import pytest
+
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_3_materials.formula_3_1 import Form3Dot1EstimationConcreteCompressiveStrength
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_3_materials.formula_3_2 import (
+    Form3Dot2CoefficientDependentOfConcreteAge,
+    SubForm3Dot2CoefficientTypeOfCementS,
+)
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_3_materials.formula_3_4 import (
+    Form3Dot4DevelopmentTensileStrength,
+    SubForm3Dot4CoefficientAgeConcreteAlpha,
+)
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_3_materials.formula_3_5 import Form3Dot5ApproximationVarianceElasticModulusOverTime
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_3_materials.formula_3_6 import Form3Dot6CreepDeformationOfConcrete
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_3_materials.formula_3_7 import Form3Dot7NonLinearCreepCoefficient
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_3_materials.formula_3_8 import Form3Dot8TotalShrinkage
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_3_materials.formula_3_9 import Form3Dot9DryingShrinkage
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_3_materials.formula_3_10 import Form3Dot10CoefficientAgeConcreteDryingShrinkage
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_3_materials.formula_3_11 import Form3Dot11AutogeneShrinkage
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_3_materials.formula_3_12 import Form3Dot12AutogeneShrinkageInfinity
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_3_materials.formula_3_13 import Form3Dot13CoefficientTimeAutogeneShrinkage
+from blueprints.materials.concrete import CementClass, ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.concrete_time_history import ConcreteTimeHistory
+
+AGES = np.array([3.0, 7.0, 27.0, 28.0, 90.0, 365.0, 10_000.0])
+
+
+class TestConcreteTimeHistory:
+    """Tests for the ConcreteTimeHistory class."""
+
+    @pytest.mark.parametrize("cement_class", [CementClass.S, CementClass.N, CementClass.R])
+    def test_strength_and_stiffness(self, cement_class: CementClass) -> None:
+        """Test the development of the strength and stiffness against formulas (3.1), (3.2), (3.4) and (3.5)."""
+        material = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C35_45, cement_class=cement_class)
+        history = material.time_history(h_0=200, relative_humidity=70, t_s=3)
+        s = SubForm3Dot2CoefficientTypeOfCementS(cement_class=cement_class.value)
+        f_cm_t, f_ctm_t, e_cm_t = history.f_cm(AGES), history.f_ctm(AGES), history.e_cm(AGES)
+        for index, t in enumerate(AGES):
+            beta_cc = Form3Dot2CoefficientDependentOfConcreteAge(s=s, t=t)
+            f_cm = Form3Dot1EstimationConcreteCompressiveStrength(beta_cc_t=beta_cc, f_cm=material.f_cm)
+            f_ctm = Form3Dot4DevelopmentTensileStrength(beta_cc_t=beta_cc, alpha=SubForm3Dot4CoefficientAgeConcreteAlpha(t=t), f_ctm=material.f_ctm)
+            assert f_cm_t[index] == pytest.approx(f_cm)
+            assert f_ctm_t[index] == pytest.approx(f_ctm)
+            assert e_cm_t[index] == pytest.approx(
+                Form3Dot5ApproximationVarianceElasticModulusOverTime(f_cm_t=f_cm, f_cm=material.f_cm, e_cm=material.e_cm)
+            )
+        np.testing.assert_allclose(history.f_ck(AGES)[[1, 3, 4]], [f_cm_t[1] - 8, 35.0, 35.0])
+
+    def test_shrinkage(self) -> None:
+        """Test the shrinkage strains against formulas (3.8) - (3.13) and table 3.2 for the nominal drying shrinkage."""
+        history = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C40_50).time_history(h_0=250, relative_humidity=60, t_s=7)
+        assert history.epsilon_cd_0 == pytest.approx(0.38e-3, abs=0.01e-3)
+        assert history.k_h == pytest.approx(0.80)
+
+        drying, autogenous, total = history.drying_shrinkage(AGES), history.autogenous_shrinkage(AGES), history.total_shrinkage(AGES)
+        for index, t in enumerate(AGES[AGES > 7]):
+            beta_ds = Form3Dot10CoefficientAgeConcreteDryingShrinkage(t=t, t_s=7, h_0=250)
+            epsilon_cd = Form3Dot9DryingShrinkage(beta_ds_tt_s=beta_ds, k_h=0.80, epsilon_cd_0=history.epsilon_cd_0)
+            epsilon_ca = Form3Dot11AutogeneShrinkage(
+                beta_as_t=Form3Dot13CoefficientTimeAutogeneShrinkage(t=t), epsilon_ca_inf=Form3Dot12AutogeneShrinkageInfinity(f_ck=40)
+            )
+            assert drying[index + 2] == pytest.approx(epsilon_cd)
+            assert autogenous[index + 2] == pytest.approx(epsilon_ca)
+            assert total[index + 2] == pytest.approx(Form3Dot8TotalShrinkage(epsilon_cd=epsilon_cd, epsilon_ca=epsilon_ca))
+        # no drying shrinkage before the end of curing
+        np.testing.assert_array_equal(drying[:2], 0.0)
+
+    @pytest.mark.parametrize(
+        ("concrete_class", "cement_class"), [(ConcreteStrengthClass.C25_30, CementClass.N), (ConcreteStrengthClass.C50_60, CementClass.R)]
+    )
+    def test_creep_coefficient(self, concrete_class: ConcreteStrengthClass, cement_class: CementClass) -> None:
+        """Test the creep coefficient against a calculation of Annex B, for a mean strength below and above 35 MPa."""
+        material = ConcreteMaterial(concrete_class=concrete_class, cement_class=cement_class)
+        history = material.time_history(h_0=300, relative_humidity=80, t_s=7)
+        t, t_0, f_cm = 1000.0, 14.0, material.f_cm
+
+        alpha_1, alpha_2, alpha_3 = (35 / f_cm) ** 0.7, (35 / f_cm) ** 0.2, (35 / f_cm) ** 0.5
+        if f_cm > 35:
+            phi_rh = (1 + 0.2 / (0.1 * 300 ** (1 / 3)) * alpha_1) * alpha_2
+            beta_h = min(1.5 * (1 + 0.96**18) * 300 + 250 * alpha_3, 1500 * alpha_3)
+            t_0_adjusted = t_0 * (9 / (2 + t_0**1.2) + 1)
+        else:
+            phi_rh = 1 + 0.2 / (0.1 * 300 ** (1 / 3))
+            beta_h = min(1.5 * (1 + 0.96**18) * 300 + 250, 1500)
+            t_0_adjusted = t_0
+        phi_0 = phi_rh * 16.8 / np.sqrt(f_cm) / (0.1 + t_0_adjusted**0.2)
+        expected = phi_0 * ((t - t_0) / (beta_h + t - t_0)) ** 0.3
+
+        assert history.creep_coefficient(t, t_0) == pytest.approx(expected)
+        assert history.notional_creep_coefficient(t_0) == pytest.approx(phi_0)
+
+    def test_creep_arrays(self) -> None:
+        """Test that ages and ages at loading broadcast, without creep before loading, and the adjusted age of at least 0.5 days."""
+        history = ConcreteMaterial(cement_class=CementClass.S).time_history(h_0=150, relative_humidity=50, t_s=1)
+        phi = history.creep_coefficient(AGES[:, np.newaxis], np.array([7.0, 28.0]))
+        assert phi.shape == (len(AGES), 2)
+        np.testing.assert_array_equal(phi[:2, 1], 0.0)
+        assert np.all(np.diff(phi[2:, 0]) > 0)
+        assert phi[-1, 0] > phi[-1, 1]
+        assert history.adjusted_loading_age(0.1) == pytest.approx(0.5)
+
+    def test_creep_strain(self) -> None:
+        """Test the creep strain against formulas (3.6) and (3.7), with non-linear creep above 0.45 f_ck(t0)."""
+        material = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37)
+        history = material.time_history(h_0=200, relative_humidity=50, t_s=3)
+        phi = history.creep_coefficient(36_500, 28)
+        strains = history.creep_strain(36_500, 28, np.array([10.0, 18.0]))
+
+        assert history.nonlinear_creep_coefficient(36_500, 28, 10.0) == pytest.approx(phi)
+        assert strains[0] == pytest.approx(Form3Dot6CreepDeformationOfConcrete(phi_inf_t0=phi, sigma_c=10.0, e_c=1.05 * material.e_cm))
+        phi_nl = Form3Dot7NonLinearCreepCoefficient(phi_inf_t0=phi, k_sigma=0.6)
+        assert strains[1] == pytest.approx(Form3Dot6CreepDeformationOfConcrete(phi_inf_t0=phi_nl, sigma_c=18.0, e_c=1.05 * material.e_cm))
+
+    def test_invalid(self) -> None:
+        """Test that invalid parameters and ages raise errors."""
+        material = ConcreteMaterial()
+        with pytest.raises(ValueError, match="h_0"):
+            material.time_history(h_0=0, relative_humidity=50, t_s=3)
+        with pytest.raises(ValueError, match="relative_humidity"):
+            material.time_history(h_0=100, relative_humidity=120, t_s=3)
+        with pytest.raises(ValueError, match="t_s"):
+            material.time_history(h_0=100, relative_humidity=50, t_s=-1)
+        invalid_cement_class = type("InvalidCementClass", (), {"value": "X"})()
+        with pytest.raises(ValueError, match="cement class"):
+            ConcreteTimeHistory(ConcreteMaterial(cement_class=invalid_cement_class), h_0=100, relative_humidity=50, t_s=3)
+
+        history = material.time_history(h_0=100, relative_humidity=50, t_s=3)
+        with pytest.raises(ValueError, match="t_0"):
+            history.creep_coefficient(100, [0.0, 28.0])
+        with pytest.raises(ValueError, match="sigma_c"):
+            history.creep_strain(100, 28, -5.0)
+        with pytest.raises(ValueError, match="Invalid t"):
+            history.f_cm([0.0])
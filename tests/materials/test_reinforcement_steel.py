@@ -1,8 +1,14 @@
 """Test class for the reinforcement steel material object."""
 
+import numpy as np
 import pytest
 
-from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial, ReinforcementSteelQuality
+from blueprints.materials.reinforcement_steel import (
+    REINFORCEMENT_STEEL_QUALITY_PROPERTIES,
+    ReinforcementSteelMaterial,
+    ReinforcementSteelQuality,
+    reinforcement_steel_property_array,
+)
 
 
 class TestReinforcementSteelMaterial:
@@ -71,9 +77,9 @@ class TestReinforcementSteelMaterial:
     @pytest.mark.parametrize(
         ("steel_quality", "expected"),
         [
-            (ReinforcementSteelQuality.B500A, 250),
-            (ReinforcementSteelQuality.B500B, 500),
-            (ReinforcementSteelQuality.B500C, 750),
+            (ReinforcementSteelQuality.B500A, 25),
+            (ReinforcementSteelQuality.B500B, 50),
+            (ReinforcementSteelQuality.B500C, 75),
         ],
     )
     def test_eps_uk(self, steel_quality: ReinforcementSteelQuality, expected: str) -> None:
@@ -87,3 +93,23 @@ class TestReinforcementSteelMaterial:
         invalid_steel_material = ReinforcementSteelMaterial(steel_quality=invalid_steel_quality)
         with pytest.raises(ValueError):
             invalid_steel_material.eps_uk
+
+
+class TestReinforcementSteelQualityProperties:
+    """Test class for the precomputed properties of the reinforcement steel qualities."""
+
+    def test_cached_accessor(self) -> None:
+        """Tests that a material reads its properties once from the table."""
+        steel = ReinforcementSteelMaterial(steel_quality=ReinforcementSteelQuality.B600C)
+        assert steel.steel_quality_properties is REINFORCEMENT_STEEL_QUALITY_PROPERTIES[ReinforcementSteelQuality.B600C]
+        assert steel.steel_quality_properties is steel.steel_quality_properties
+        assert steel.f_tk == pytest.approx(690.0)
+
+    def test_property_array(self) -> None:
+        """Tests the array of a property for an array of steel qualities."""
+        qualities = [ReinforcementSteelQuality.B500A, ReinforcementSteelQuality.B400C]
+        np.testing.assert_array_equal(reinforcement_steel_property_array(qualities, "f_yk"), [500.0, 400.0])
+        np.testing.assert_array_equal(reinforcement_steel_property_array(qualities, "eps_uk"), [25.0, 75.0])
+
+        with pytest.raises(ValueError, match="Unknown reinforcement steel property"):
+            reinforcement_steel_property_array(qualities, "steel_class")
@@ -1,5 +1,6 @@
 """Test Steel material from NEN-EN standards."""
 
+import numpy as np
 import pytest
 
 from blueprints.materials.steel import DiagramType, SteelMaterial, SteelStrengthClass
@@ -147,3 +148,24 @@ class TestSteelMaterial:
         """Test invalid thickness raises ValueError."""
         with pytest.raises(ValueError):
             SteelMaterial(steel_class=SteelStrengthClass.S355_NH_NLH_10219_1).ultimate_strength(thickness=50.0)
+
+    def test_strength_arrays(self) -> None:
+        """Test the yield and ultimate strength for an array of thicknesses."""
+        steel = SteelMaterial(steel_class=SteelStrengthClass.S275)
+        assert steel.yield_strength_array([10, 50]) == pytest.approx([275, 255])
+        assert steel.ultimate_strength_array([10, 50]) == pytest.approx([430, 410])
+
+    @pytest.mark.parametrize("thickness", [10.0, 10, np.asarray(10.0)])
+    def test_strength_arrays_scalar(self, thickness: float) -> None:
+        """Test that a scalar or 0-d array thickness gives 0-d arrays of strengths."""
+        steel = SteelMaterial(steel_class=SteelStrengthClass.S275)
+        fy, fu = steel.yield_strength_array(thickness), steel.ultimate_strength_array(thickness)
+        assert fy.shape == fu.shape == ()
+        assert fy == 275
+        assert fu == 430
+
+    def test_custom_strength_arrays(self) -> None:
+        """Test that custom strengths are used for every thickness of an array."""
+        steel = SteelMaterial(custom_yield_strength=300.0, custom_ultimate_strength=500.0)
+        assert steel.yield_strength_array([10, 50]) == pytest.approx([300, 300])
+        assert steel.ultimate_strength_array([10, 50]) == pytest.approx([500, 500])
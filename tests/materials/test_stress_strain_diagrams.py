@@ -0,0 +1,100 @@
+"""Tests for the stress-strain diagrams of concrete and reinforcement steel."""
+
+import numpy as np
+import pytest
+
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_3_materials.formula_3_14 import (
+    Form3Dot14StressStrainForShortTermLoading,
+    SubForm3Dot14Eta,
+    SubForm3Dot14K,
+)
+from blueprints.codes.eurocode.en_1992_1_1_2004.chapter_3_materials.formula_3_17 import Form3Dot17CompressiveStressConcrete
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass, DiagramType
+from blueprints.materials.reinforcement_steel import ReinforcementDiagramType, ReinforcementSteelMaterial
+from blueprints.materials.stress_strain_diagrams import (
+    BilinearConcreteDiagram,
+    BilinearSteelDiagram,
+    NonlinearConcreteDiagram,
+    ParabolaRectangleDiagram,
+)
+
+type Diagram = ParabolaRectangleDiagram | BilinearConcreteDiagram | NonlinearConcreteDiagram | BilinearSteelDiagram
+
+STRAINS = np.linspace(-0.004, 0.003, 701)
+
+
+def finite_difference(diagram: Diagram, strain: np.ndarray, step: float = 1e-9) -> np.ndarray:
+    """Central difference of the stresses of a diagram."""
+    return (diagram.stress(strain + step) - diagram.stress(strain - step)) / (2 * step)
+
+
+class TestConcreteDiagrams:
+    """Tests for the concrete stress-strain diagrams."""
+
+    def test_parabola_rectangle(self) -> None:
+        """Test the parabola-rectangle diagram against formula (3.17) for a high strength class."""
+        material = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C70_85, diagram_type=DiagramType.PARABOLIC)
+        diagram = material.design_diagram
+        eps_c2 = material.eps_c2 / 1000
+        expected = Form3Dot17CompressiveStressConcrete(f_cd=material.f_cd, epsilon_c=0.5 * eps_c2, epsilon_c2=eps_c2, n=material.n_factor)
+        assert diagram.stress(-0.5 * eps_c2) == pytest.approx(-expected)
+        np.testing.assert_allclose(diagram.stress([0.001, -0.003]), [0.0, -material.f_cd])
+
+    def test_nonlinear(self) -> None:
+        """Test the diagram for non-linear structural analysis against formula (3.14)."""
+        material = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37)
+        diagram = material.nonlinear_diagram
+        eps_c1 = material.eps_c1 / 1000
+        k = SubForm3Dot14K(e_cm=material.e_cm, epsilon_c1=eps_c1, f_cm=material.f_cm)
+        ratio = Form3Dot14StressStrainForShortTermLoading(k=k, eta=SubForm3Dot14Eta(epsilon_c=0.0015, epsilon_c1=eps_c1))
+        assert diagram.k == pytest.approx(k)
+        assert diagram.stress(-0.0015) == pytest.approx(-ratio * material.f_cm)
+        assert diagram.stress(-eps_c1) == pytest.approx(-material.f_cm)
+        assert diagram.tangent(-eps_c1) == pytest.approx(0.0, abs=1e-6)
+        # the initial tangent is k times the secant stiffness to the peak stress
+        assert diagram.tangent(0.0) == pytest.approx(k * material.f_cm / eps_c1)
+        np.testing.assert_array_equal(diagram.stress([0.001, -0.004]), 0.0)
+
+    @pytest.mark.parametrize(
+        ("name", "kink"), [("parabola_rectangle_diagram", "eps_c2"), ("bilinear_diagram", "eps_c3"), ("nonlinear_diagram", "eps_cu1")]
+    )
+    def test_tangent(self, name: str, kink: str) -> None:
+        """Test the tangent stiffness against the derivative of the stresses, away from the kinks of the diagrams."""
+        diagram = getattr(ConcreteMaterial(concrete_class=ConcreteStrengthClass.C90_105), name)
+        smooth = (np.abs(STRAINS) > 1e-6) & (np.abs(STRAINS + getattr(diagram, kink)) > 1e-6)
+        np.testing.assert_allclose(diagram.tangent(STRAINS[smooth]), finite_difference(diagram, STRAINS[smooth]), rtol=1e-4, atol=1e-3)
+
+    def test_cached(self) -> None:
+        """Test that the diagrams are created once per material and follow the diagram type."""
+        material = ConcreteMaterial()
+        assert material.design_diagram is material.bilinear_diagram
+        assert material.bilinear_diagram is material.bilinear_diagram
+        assert ConcreteMaterial(diagram_type=DiagramType.PARABOLIC).design_diagram == ConcreteMaterial().parabola_rectangle_diagram
+        with pytest.raises(NotImplementedError):
+            _ = ConcreteMaterial(diagram_type=DiagramType.USER).design_diagram
+
+
+class TestSteelDiagrams:
+    """Tests for the reinforcement steel stress-strain diagrams."""
+
+    def test_inclined(self) -> None:
+        """Test that the inclined top branch reaches k times the design yield strength at the characteristic ultimate strain."""
+        material = ReinforcementSteelMaterial(diagram_type=ReinforcementDiagramType.BILINEAR_INCLINED)
+        diagram = material.design_diagram
+        np.testing.assert_allclose(diagram.stress([-0.05, 0.05]), [-1.08 * material.f_yd, 1.08 * material.f_yd])
+        np.testing.assert_allclose(diagram.tangent([0.001, -0.01]), [200_000.0, diagram.hardening_modulus])
+
+    @pytest.mark.parametrize("diagram_type", [ReinforcementDiagramType.BILINEAR_NOT_INCLINED, ReinforcementDiagramType.BILINEAR_INCLINED])
+    def test_tangent(self, diagram_type: ReinforcementDiagramType) -> None:
+        """Test the tangent stiffness against the derivative of the stresses, away from the yield strain."""
+        diagram = ReinforcementSteelMaterial(diagram_type=diagram_type).design_diagram
+        smooth = np.abs(np.abs(STRAINS) - diagram.eps_y) > 1e-6
+        np.testing.assert_allclose(diagram.tangent(STRAINS[smooth]), finite_difference(diagram, STRAINS[smooth]), rtol=1e-4, atol=1e-3)
+
+    def test_cached(self) -> None:
+        """Test that the diagram is created once per material."""
+        material = ReinforcementSteelMaterial()
+        assert material.design_diagram is material.design_diagram
+        assert material.design_diagram == BilinearSteelDiagram(e_s=200_000.0, f_y=material.f_yd)
+        with pytest.raises(NotImplementedError):
+            _ = ReinforcementSteelMaterial(diagram_type=ReinforcementDiagramType.USER).design_diagram
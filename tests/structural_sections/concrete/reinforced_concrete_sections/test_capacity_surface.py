@@ -0,0 +1,121 @@
+"""Tests for the N-Mx-My capacity surface."""
+
+import numpy as np
+import pytest
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.covers import CoversRectangular
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.capacity_surface import CapacitySurface
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.circular import CircularReinforcedCrossSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+
+
+def octahedron() -> CapacitySurface:
+    """Return an octahedron between N = -1000 kN and N = 200 kN, with |Mx| + |My| = 100 kNm at N = -400 kN."""
+    angles = np.linspace(0.0, 2 * np.pi, 4, endpoint=False)
+    n = np.tile([200.0, -400.0, -1000.0], (4, 1))
+    m_x = np.outer(np.cos(angles), [0.0, 100.0, 0.0])
+    m_y = np.outer(np.sin(angles), [0.0, 100.0, 0.0])
+    return CapacitySurface(n=n, m_x=m_x, m_y=m_y)
+
+
+def column() -> RectangularReinforcedCrossSection:
+    """Return a 400x600 column with 3⌀25 at the top and bottom."""
+    cross_section = RectangularReinforcedCrossSection(
+        width=400,
+        height=600,
+        concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37),
+        covers=CoversRectangular(upper=40, right=40, lower=40, left=40),
+    )
+    for edge in ("upper", "lower"):
+        cross_section.add_longitudinal_reinforcement_by_quantity(n=3, diameter=25, material=ReinforcementSteelMaterial(), edge=edge)
+    return cross_section
+
+
+class TestCapacitySurface:
+    """Tests for the CapacitySurface class."""
+
+    def test_resistances(self) -> None:
+        """Test the axial resistances and that the degenerate triangles at the poles are removed."""
+        surface = octahedron()
+        assert surface.n_rd_compression == -1000.0
+        assert surface.n_rd_tension == 200.0
+        assert len(surface.triangles) == 8
+
+    def test_unity_check(self) -> None:
+        """Test the unity checks by ray casting from the origin, through the faces of both pyramids of the octahedron."""
+        unity_checks = octahedron().unity_check(
+            n=[-500.0, 100.0, -400.0, -400.0, 0.0, -400.0],
+            m_x=[0.0, 0.0, 25.0, -100.0, 0.0, 0.0],
+            m_y=[0.0, 0.0, -25.0, 100.0, 0.0, 50.0],
+        )
+        np.testing.assert_allclose(unity_checks, [0.5, 0.5, 0.7, 4.0, 0.0, 0.7])
+
+    def test_contains(self) -> None:
+        """Test the point in surface check, including the boundary."""
+        contains = octahedron().contains(n=[-400.0, -400.0, 300.0], m_x=[50.0, 80.0, 0.0], m_y=[50.0, 80.0, 0.0])
+        np.testing.assert_array_equal(contains, [True, False, False])
+
+    def test_unity_check_shape(self) -> None:
+        """Test that the unity checks keep the (broadcast) shape of the load points, also for more points than one chunk."""
+        surface = octahedron()
+        n = np.full((100, 100), -400.0)
+        unity_checks = surface.unity_check(n=n, m_x=np.linspace(-50.0, 50.0, 100), m_y=0.0)
+        assert unity_checks.shape == (100, 100)
+        assert unity_checks.max() == pytest.approx(0.7)
+
+    def test_against_brute_force(self) -> None:
+        """Test that the bins of ray directions give the same unity checks as intersecting every ray with all triangles."""
+        surface = column().capacity_surface()
+        rng = np.random.default_rng(1)
+        n, m_x, m_y = rng.uniform(-6000.0, 1500.0, 500), rng.uniform(-600.0, 600.0, 500), rng.uniform(-400.0, 400.0, 500)
+        points = np.column_stack([n, m_x, m_y]) / surface._scale  # noqa: SLF001
+        brute_force = 1.0 / surface._ray_parameters(points, np.arange(len(surface.triangles)))  # noqa: SLF001
+        np.testing.assert_allclose(surface.unity_check(n, m_x, m_y), brute_force)
+
+    def test_missed_bins(self) -> None:
+        """Test that rays that miss the triangles of their bin are intersected with all triangles."""
+        surface = octahedron()
+        object.__setattr__(surface, "_bin_offsets", np.zeros_like(surface._bin_offsets))  # noqa: SLF001
+        np.testing.assert_allclose(surface.unity_check(n=[-500.0, -400.0], m_x=[0.0, 25.0], m_y=[0.0, -25.0]), [0.5, 0.7])
+
+
+class TestReinforcedCrossSectionCapacitySurface:
+    """Tests for the capacity surface of reinforced cross-sections."""
+
+    def test_uniaxial(self) -> None:
+        """Test that the surface without moment about the y-axis is the N-M interaction diagram about the x-axis."""
+        cross_section = column()
+        surface = cross_section.capacity_surface()
+        diagram = cross_section.fibre_section().nm_interaction_diagram(axis="x", n_points=20)
+        n, m_x = np.linspace(-5000.0, 1000.0, 25), np.linspace(-400.0, 400.0, 25)
+        np.testing.assert_allclose(surface.unity_check(n, m_x, 0.0), diagram.unity_check(n, m_x), atol=1e-9)
+        assert surface.n_rd_compression == pytest.approx(diagram.n_rd_compression)
+
+    def test_biaxial_reduction(self) -> None:
+        """Test that biaxial bending is more critical than bending about each axis separately, but not more than the sum."""
+        surface = column().capacity_surface()
+        m_rx = 1.0 / surface.unity_check(0.0, 1.0, 0.0)
+        m_ry = 1.0 / surface.unity_check(0.0, 0.0, 1.0)
+        unity_check = surface.unity_check(0.0, 0.5 * m_rx, 0.5 * m_ry)
+        assert 0.5 < unity_check <= 1.0
+
+    def test_circular_symmetry(self) -> None:
+        """Test that a circular column has the same moment resistance in all directions."""
+        cross_section = CircularReinforcedCrossSection(diameter=500, concrete_material=ConcreteMaterial())
+        cross_section.add_longitudinal_reinforcement_by_quantity(n=12, diameter=16, material=ReinforcementSteelMaterial())
+        surface = cross_section.capacity_surface()
+        angles = np.linspace(0.0, 2 * np.pi, 24, endpoint=False)
+        m_rd = 1.0 / surface.unity_check(-500.0 * np.ones(24) / 100.0, np.cos(angles), np.sin(angles))
+        assert m_rd.max() == pytest.approx(m_rd.min(), rel=2e-2)
+
+    def test_cached(self) -> None:
+        """Test that the surface is reused until the reinforcement changes."""
+        cross_section = column()
+        surface = cross_section.capacity_surface()
+        assert cross_section.capacity_surface() is surface
+        assert cross_section.fibre_section().capacity_surface(n_directions=8) is not surface
+
+        cross_section.add_longitudinal_reinforcement_by_quantity(n=2, diameter=16, material=ReinforcementSteelMaterial(), edge="left")
+        assert cross_section.capacity_surface() is not surface
@@ -103,14 +103,15 @@ class TestCircularReinforcedCrossSection:
         assert len(circular_reinforced_cross_section.longitudinal_rebars) == 14
 
     def test_rebar_not_in_cross_section(self, circular_reinforced_cross_section: CircularReinforcedCrossSection) -> None:
-        """Test the add_longitudinal_rebar method with a rebar not in the cross-section."""
-        rebar = Rebar(
-            diameter=12,
-            x=2500,
-            y=1000,
-            material=circular_reinforced_cross_section.get_present_steel_materials()[0],
+        """Test the longitudinal_rebars property with a reinforcement configuration outside the cross-section."""
+        circular_reinforced_cross_section.add_reinforcement_configuration(
+            line=LineString([(2000, 1000), (2500, 1000)]),
+            configuration=ReinforcementByQuantity(
+                diameter=12,
+                n=2,
+                material=circular_reinforced_cross_section.get_present_steel_materials()[0],
+            ),
         )
-        circular_reinforced_cross_section._single_longitudinal_rebars.append(rebar)  # noqa: SLF001
         with pytest.raises(ValueError):
             _ = circular_reinforced_cross_section.longitudinal_rebars
 
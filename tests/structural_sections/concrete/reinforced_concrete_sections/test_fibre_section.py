@@ -0,0 +1,190 @@
+"""Tests for the fibre model of reinforced concrete cross-sections."""
+
+import numpy as np
+import pytest
+from shapely import Point, box
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass, DiagramType
+from blueprints.materials.reinforcement_steel import ReinforcementDiagramType, ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.covers import CoversRectangular
+from blueprints.structural_sections.concrete.rebar_set import RebarSet
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.circular import CircularReinforcedCrossSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.fibre_section import (
+    ConcreteMesh,
+    FibreSection,
+    concrete_design_stress,
+    steel_design_stress,
+)
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+
+# bilinear diagram: alpha_R = 0.75 and k_a = 7/18, parabola-rectangle diagram: alpha_R = 17/21 and k_a = 99/238 (C30/37)
+STRESS_BLOCK_FACTORS = {DiagramType.BILINEAR: (0.75, 7 / 18), DiagramType.PARABOLIC: (17 / 21, 99 / 238)}
+
+
+def beam(diagram_type: DiagramType = DiagramType.BILINEAR) -> RectangularReinforcedCrossSection:
+    """Return a 300x500 beam with 4⌀20 at the bottom."""
+    cross_section = RectangularReinforcedCrossSection(
+        width=300,
+        height=500,
+        concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37, diagram_type=diagram_type),
+        covers=CoversRectangular(upper=40, right=40, lower=40, left=40),
+    )
+    cross_section.add_longitudinal_reinforcement_by_quantity(n=4, diameter=20, material=ReinforcementSteelMaterial(), edge="lower")
+    return cross_section
+
+
+class TestConcreteMesh:
+    """Tests for the ConcreteMesh class."""
+
+    def test_rectangle(self) -> None:
+        """Test that the fibres of a rectangle have the area and centroid of the rectangle."""
+        mesh = ConcreteMesh.from_polygon(box(0, 0, 300, 500), mesh_size=40)
+        assert mesh.x.size == 8 * 13
+        assert mesh.total_area == pytest.approx(150_000)
+        assert mesh.centroid == pytest.approx((150, 250))
+
+    def test_circle(self) -> None:
+        """Test that the clipped fibres of a circle have the area and centroid of the circle."""
+        circle = Point(100, -50).buffer(300)
+        mesh = ConcreteMesh.from_polygon(circle, mesh_size=25)
+        assert mesh.total_area == pytest.approx(circle.area)
+        assert mesh.centroid == pytest.approx((100, -50))
+
+    def test_invalid_mesh_size(self) -> None:
+        """Test that the mesh size must be positive."""
+        with pytest.raises(ValueError):
+            ConcreteMesh.from_polygon(box(0, 0, 300, 500), mesh_size=0)
+
+
+class TestStressStrainDiagrams:
+    """Tests for the design stress-strain diagrams."""
+
+    def test_concrete_bilinear(self) -> None:
+        """Test the bi-linear diagram of concrete (figure 3.4)."""
+        material = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37, diagram_type=DiagramType.BILINEAR)
+        stress = concrete_design_stress(material, [0.001, 0.0, -0.000875, -0.00175, -0.0035])
+        np.testing.assert_allclose(stress, [0.0, 0.0, -10.0, -20.0, -20.0])
+
+    def test_concrete_parabola_rectangle(self) -> None:
+        """Test the parabola-rectangle diagram of concrete (formulas 3.17 and 3.18)."""
+        material = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37, diagram_type=DiagramType.PARABOLIC)
+        stress = concrete_design_stress(material, [0.001, -0.001, -0.002, -0.003])
+        np.testing.assert_allclose(stress, [0.0, -15.0, -20.0, -20.0])
+
+    def test_concrete_user_defined(self) -> None:
+        """Test that a user defined diagram is not implemented."""
+        material = ConcreteMaterial(diagram_type=DiagramType.USER)
+        with pytest.raises(NotImplementedError):
+            concrete_design_stress(material, [-0.001])
+
+    def test_steel_horizontal_branch(self) -> None:
+        """Test the bi-linear diagram of reinforcement steel with horizontal top branch."""
+        material = ReinforcementSteelMaterial(diagram_type=ReinforcementDiagramType.BILINEAR_NOT_INCLINED)
+        stress = steel_design_stress(material, [-0.01, -0.001, 0.001, 0.01])
+        np.testing.assert_allclose(stress, [-material.f_yd, -200.0, 200.0, material.f_yd])
+
+    def test_steel_inclined_branch(self) -> None:
+        """Test the bi-linear diagram of reinforcement steel with inclined top branch, reaching k * f_yd at eps_uk."""
+        material = ReinforcementSteelMaterial(diagram_type=ReinforcementDiagramType.BILINEAR_INCLINED)
+        stress = steel_design_stress(material, [-0.05, 0.001, material.f_yd / material.e_s, 0.05])
+        np.testing.assert_allclose(stress, [-1.08 * material.f_yd, 200.0, material.f_yd, 1.08 * material.f_yd])
+
+    def test_steel_user_defined(self) -> None:
+        """Test that a user defined diagram is not implemented."""
+        material = ReinforcementSteelMaterial(diagram_type=ReinforcementDiagramType.USER)
+        with pytest.raises(NotImplementedError):
+            steel_design_stress(material, [0.001])
+
+
+class TestFibreSection:
+    """Tests for the FibreSection class."""
+
+    def test_pure_compression(self) -> None:
+        """Test the axial force of a uniform compressive strain, with the concrete displaced by the rebars subtracted."""
+        fibre_section = beam().fibre_section()
+        n, m_x, m_y = fibre_section.resultants(eps_0=-0.00175)
+        area_steel = 4 * np.pi * 10**2
+        assert n[0] == pytest.approx(-(20.0 * (150_000 - area_steel) + 350.0 * area_steel) / 1000)
+        assert m_y[0] == pytest.approx(0.0, abs=1e-9)
+        # the rebars are at the bottom, so the resultant lies below the centroid of the concrete
+        assert m_x[0] < 0
+
+    def test_resultants_vectorised(self) -> None:
+        """Test that the resultants of several planes equal the resultants of the planes one by one."""
+        fibre_section = beam().fibre_section()
+        eps_0, kappa_x, kappa_y = fibre_section.ultimate_strain_planes(angle=60.0, n_points=5)
+        n, m_x, m_y = fibre_section.resultants(eps_0, kappa_x, kappa_y)
+        for i in [0, 7, 15]:
+            np.testing.assert_allclose(
+                fibre_section.resultants(eps_0[i], kappa_x[i], kappa_y[i]), [n[i : i + 1], m_x[i : i + 1], m_y[i : i + 1]], atol=1e-9
+            )
+
+    def test_ultimate_strain_planes(self) -> None:
+        """Test that the strain planes respect the strain limits of the concrete and the reinforcement."""
+        fibre_section = beam(DiagramType.PARABOLIC).fibre_section()
+        eps_0, kappa_x, kappa_y = fibre_section.ultimate_strain_planes(angle=90.0, n_points=20)
+        assert np.allclose(kappa_y, 0.0)
+
+        concrete_strains = fibre_section.strains(eps_0, kappa_x, kappa_y, x=np.array([0.0, 0.0]), y=np.array([250.0, -250.0]))
+        rebar_strains = fibre_section.strains(eps_0, kappa_x, kappa_y, x=fibre_section.rebars.x, y=fibre_section.rebars.y)
+        assert concrete_strains.min() == pytest.approx(-0.0035)
+        assert rebar_strains.max() == pytest.approx(0.045)
+        # starts with uniform tension and ends with uniform compression
+        assert concrete_strains[0] == pytest.approx([0.045, 0.045])
+        assert concrete_strains[-1] == pytest.approx([-0.002, -0.002])
+
+    def test_strain_planes_without_rebars(self) -> None:
+        """Test that the strain planes at the ultimate limit state need rebars."""
+        fibre_section = FibreSection(
+            concrete=ConcreteMesh.from_polygon(box(0, 0, 300, 500), mesh_size=50), rebars=RebarSet.empty(), concrete_material=ConcreteMaterial()
+        )
+        n, _, _ = fibre_section.resultants(eps_0=-0.002)
+        assert n[0] == pytest.approx(-0.15 * ConcreteMaterial().f_cd * 1000)
+        with pytest.raises(ValueError):
+            fibre_section.ultimate_strain_planes(angle=90.0)
+
+    @pytest.mark.parametrize("diagram_type", [DiagramType.BILINEAR, DiagramType.PARABOLIC])
+    def test_moment_resistance(self, diagram_type: DiagramType) -> None:
+        """Test the moment resistance without axial force against the stress block of the concrete diagram."""
+        cross_section = beam(diagram_type)
+        alpha_r, k_a = STRESS_BLOCK_FACTORS[diagram_type]
+        force_steel = 4 * np.pi * 10**2 * ReinforcementSteelMaterial().f_yd
+        compression_zone = force_steel / (alpha_r * 300 * cross_section.concrete_material.f_cd)
+        m_rd = force_steel * (450 - k_a * compression_zone) * 1e-6
+
+        diagram = cross_section.nm_interaction_diagram()
+        assert 1 / diagram.unity_check(0.0, 1.0) == pytest.approx(m_rd, rel=1e-3)
+        assert diagram.n_rd_tension == pytest.approx(force_steel / 1000)
+
+    def test_axis_y(self) -> None:
+        """Test that the diagram about the y-axis is symmetric for a symmetric layout."""
+        diagram = beam().nm_interaction_diagram(axis="y")
+        assert diagram.axis == "y"
+        assert diagram.m_rd_max == pytest.approx(-diagram.m_rd_min)
+
+    def test_invalid_axis(self) -> None:
+        """Test that only the x- and y-axis are supported."""
+        with pytest.raises(ValueError):
+            beam().nm_interaction_diagram(axis="z")  # type: ignore[arg-type]
+
+    def test_circular(self) -> None:
+        """Test that the diagram of a circular column is the same for both axes and both directions."""
+        cross_section = CircularReinforcedCrossSection(diameter=500, concrete_material=ConcreteMaterial())
+        cross_section.add_longitudinal_reinforcement_by_quantity(n=12, diameter=16, material=ReinforcementSteelMaterial())
+        diagram_x = cross_section.nm_interaction_diagram(axis="x")
+        diagram_y = cross_section.nm_interaction_diagram(axis="y")
+        assert diagram_x.m_rd_max == pytest.approx(-diagram_x.m_rd_min, rel=1e-2)
+        assert diagram_x.m_rd_max == pytest.approx(diagram_y.m_rd_max, rel=1e-2)
+
+    def test_cached(self) -> None:
+        """Test that the mesh and diagram are reused until the reinforcement changes."""
+        cross_section = beam()
+        fibre_section = cross_section.fibre_section()
+        diagram = cross_section.nm_interaction_diagram()
+        assert cross_section.fibre_section() is fibre_section
+        assert cross_section.nm_interaction_diagram() is diagram
+
+        cross_section.add_longitudinal_reinforcement_by_quantity(n=2, diameter=12, material=ReinforcementSteelMaterial(), edge="upper")
+        assert cross_section.fibre_section() is not fibre_section
+        assert cross_section.fibre_section().concrete is fibre_section.concrete
+        assert cross_section.nm_interaction_diagram().n_rd_compression < diagram.n_rd_compression
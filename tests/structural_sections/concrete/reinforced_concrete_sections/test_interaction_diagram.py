@@ -0,0 +1,39 @@
+"""Tests for the N-M interaction diagram."""
+
+import numpy as np
+import pytest
+
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.interaction_diagram import NMInteractionDiagram
+
+
+class TestNMInteractionDiagram:
+    """Tests for the NMInteractionDiagram class."""
+
+    @pytest.fixture
+    def diagram(self) -> NMInteractionDiagram:
+        """Return a diamond shaped diagram between N = -1000 kN and N = 200 kN, and M = -100 kNm and M = 100 kNm at N = -400 kN."""
+        return NMInteractionDiagram(n=np.array([200.0, -400.0, -1000.0, -400.0]), m=np.array([0.0, 100.0, 0.0, -100.0]), axis="x")
+
+    def test_resistances(self, diagram: NMInteractionDiagram) -> None:
+        """Test the resistances of the diagram."""
+        assert diagram.n_rd_compression == -1000.0
+        assert diagram.n_rd_tension == 200.0
+        assert diagram.m_rd_max == 100.0
+        assert diagram.m_rd_min == -100.0
+
+    def test_contains(self, diagram: NMInteractionDiagram) -> None:
+        """Test the point in polygon check, including the boundary."""
+        np.testing.assert_array_equal(diagram.contains(n=[-400.0, -400.0, 0.0, 300.0], m=[50.0, 100.0, 90.0, 0.0]), [True, True, False, False])
+
+    def test_unity_check(self, diagram: NMInteractionDiagram) -> None:
+        """Test the unity checks by ray casting from the origin."""
+        unity_checks = diagram.unity_check(n=[-500.0, 100.0, -400.0, 0.0, 0.0], m=[0.0, 0.0, -150.0, 0.0, 50.0])
+        np.testing.assert_allclose(unity_checks, [0.5, 0.5, 2.5, 0.0, 1.5])
+
+    def test_unity_check_shape(self, diagram: NMInteractionDiagram) -> None:
+        """Test that the unity checks keep the (broadcast) shape of the load points, also for more points than one chunk."""
+        n = np.linspace(-900.0, 100.0, 10_000).reshape(100, 100)
+        unity_checks = diagram.unity_check(n=n, m=0.0)
+        assert unity_checks.shape == (100, 100)
+        assert np.all(unity_checks < 1.0)
+        assert diagram.unity_check(n=-2000.0, m=0.0) == pytest.approx(2.0)
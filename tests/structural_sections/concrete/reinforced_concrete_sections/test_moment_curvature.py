@@ -0,0 +1,133 @@
+"""Tests for the moment-curvature and cracked-section analysis at the serviceability limit state."""
+
+import numpy as np
+import pytest
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.covers import CoversRectangular
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+
+
+def beam() -> RectangularReinforcedCrossSection:
+    """Return a 300x500 beam with 4⌀20 at the bottom."""
+    cross_section = RectangularReinforcedCrossSection(
+        width=300,
+        height=500,
+        concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37),
+        covers=CoversRectangular(upper=40, right=40, lower=40, left=40),
+    )
+    cross_section.add_longitudinal_reinforcement_by_quantity(n=4, diameter=20, material=ReinforcementSteelMaterial(), edge="lower")
+    return cross_section
+
+
+def cracked_section(moment: float, e_c: float) -> tuple[float, float, float, float]:
+    """Return the compression zone depth, steel stress, concrete stress and curvature of the cracked beam with the transformed section."""
+    alpha_e, area_steel, width, depth = ReinforcementSteelMaterial().e_s / e_c, 4 * np.pi * 10**2, 300, 450
+    x = (-alpha_e * area_steel + np.sqrt((alpha_e * area_steel) ** 2 + 2 * width * alpha_e * area_steel * depth)) / width
+    second_moment_of_area = width * x**3 / 3 + alpha_e * area_steel * (depth - x) ** 2
+    moment_nmm = moment * 1e6
+    return (
+        x,
+        alpha_e * moment_nmm * (depth - x) / second_moment_of_area,
+        -moment_nmm * x / second_moment_of_area,
+        moment_nmm / (e_c * second_moment_of_area),
+    )
+
+
+class TestMomentCurvatureSolver:
+    """Tests for the MomentCurvatureSolver class."""
+
+    @pytest.mark.parametrize("creep_coefficient", [0.0, 2.0])
+    def test_cracked_section(self, creep_coefficient: float) -> None:
+        """Test the stresses and curvature of a cracked beam against the transformed section, with the effective modulus of formula 7.20."""
+        solver = beam().moment_curvature_solver(creep_coefficient=creep_coefficient)
+        assert solver.e_c_eff == pytest.approx(ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37).e_cm / (1 + creep_coefficient))
+
+        state = solver.solve(m_x=100.0)
+        x, sigma_s, sigma_c, curvature = cracked_section(100.0, solver.e_c_eff)
+        assert state.converged.all()
+        assert state.compression_zone_depth[0] == pytest.approx(x, rel=1e-3)
+        assert state.steel_stress[0] == pytest.approx(sigma_s, rel=1e-3)
+        assert state.concrete_stress[0] == pytest.approx(sigma_c, rel=1e-3)
+        assert state.curvature[0] == pytest.approx(curvature, rel=1e-3)
+        np.testing.assert_allclose(state.internal_forces, [[0.0], [100.0], [0.0]], atol=1e-9)
+
+    def test_uncracked_axial_force(self) -> None:
+        """Test the uniform strain of an uncracked cross-section under axial compression at the centroid of the transformed section."""
+        solver = beam().moment_curvature_solver(cracked=False)
+        transformed_area_steel = (ReinforcementSteelMaterial().e_s - solver.e_c_eff) * 4 * np.pi * 10**2
+        axial_stiffness = solver.e_c_eff * 150_000 + transformed_area_steel
+        # the rebars are 200 mm below the centroid of the concrete
+        eccentricity = -200.0 * transformed_area_steel / axial_stiffness
+        state = solver.solve(n=-1000.0, m_x=-1000.0 * -eccentricity * 1e-3)
+        np.testing.assert_allclose(state.rebar_strains[0], -1e6 / axial_stiffness)
+        assert state.curvature[0] == pytest.approx(0.0, abs=1e-15)
+        np.testing.assert_allclose(state.rebar_stresses[0], ReinforcementSteelMaterial().e_s * state.rebar_strains[0])
+
+    def test_vectorised(self) -> None:
+        """Test that an array of combinations gives the same states as the combinations one by one, and keeps the proportionality."""
+        solver = beam().moment_curvature_solver()
+        moments = np.linspace(20.0, 200.0, 10)
+        state = solver.solve(n=0.0, m_x=moments)
+        assert len(state) == 10
+        np.testing.assert_allclose(state.steel_stress / moments, state.steel_stress[0] / moments[0])
+        for index in [0, 5, 9]:
+            single = solver.solve(m_x=moments[index])
+            assert single.steel_stress[0] == pytest.approx(state.steel_stress[index])
+
+    def test_warm_start(self) -> None:
+        """Test that iterations from an equilibrium state stay in that state."""
+        solver = beam().moment_curvature_solver()
+        state = solver.solve(n=-300.0, m_x=[50.0, 150.0], m_y=[0.0, 20.0])
+        warm = solver.solve(n=-300.0, m_x=[50.0, 150.0], m_y=[0.0, 20.0], initial=state)
+        np.testing.assert_allclose(warm.kappa_x, state.kappa_x)
+        np.testing.assert_allclose(warm.kappa_y, state.kappa_y, atol=1e-15)
+
+    def test_no_equilibrium(self) -> None:
+        """Test that combinations without equilibrium are marked as not converged."""
+        solver = beam().moment_curvature_solver()
+        state = solver.solve(m_x=[100.0, -100.0])
+        np.testing.assert_array_equal(state.converged, [True, False])
+
+    def test_moment_curvature(self) -> None:
+        """Test the incremental moment-curvature relation, including the yielding of the reinforcement."""
+        solver = beam().moment_curvature_solver()
+        state = solver.moment_curvature(m_max=250.0, n_steps=25)
+        assert len(state) == 26
+        assert state.converged.all()
+        assert state.curvature[0] == 0.0
+        assert np.isinf(state.compression_zone_depth[0])
+        assert np.all(np.diff(state.curvature) > 0)
+
+        # the rebars are only at the bottom, so bending about the y-axis inclines the neutral axis
+        about_y = solver.moment_curvature(m_max=20.0, axis="y", n_steps=4)
+        np.testing.assert_allclose(about_y.internal_forces, [np.zeros(5), np.zeros(5), np.linspace(0.0, 20.0, 5)], atol=1e-9)
+        assert np.all(about_y.kappa_x[1:] != 0)
+
+    def test_moment_curvature_invalid_axis(self) -> None:
+        """Test that only the x- and y-axis are supported."""
+        with pytest.raises(ValueError):
+            beam().moment_curvature_solver().moment_curvature(m_max=100.0, axis="z")  # type: ignore[arg-type]
+
+
+class TestReinforcedCrossSectionSLS:
+    """Tests for the serviceability limit state analysis of reinforced cross-sections."""
+
+    def test_sls_state(self) -> None:
+        """Test that the states of the cross-section equal the states of its solver."""
+        cross_section = beam()
+        state = cross_section.sls_state(m_x=[80.0, 120.0], creep_coefficient=1.5)
+        expected = cross_section.moment_curvature_solver(creep_coefficient=1.5).solve(m_x=[80.0, 120.0])
+        np.testing.assert_allclose(state.steel_stress, expected.steel_stress)
+
+    def test_cached(self) -> None:
+        """Test that the solver is reused until the reinforcement changes."""
+        cross_section = beam()
+        solver = cross_section.moment_curvature_solver()
+        assert cross_section.moment_curvature_solver() is solver
+        assert cross_section.moment_curvature_solver(cracked=False) is not solver
+        assert solver.fibre_section is cross_section.fibre_section()
+
+        cross_section.add_longitudinal_reinforcement_by_quantity(n=2, diameter=12, material=ReinforcementSteelMaterial(), edge="upper")
+        assert cross_section.moment_curvature_solver() is not solver
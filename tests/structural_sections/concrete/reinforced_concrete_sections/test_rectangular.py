@@ -10,6 +10,7 @@ import pytest
 from matplotlib import pyplot as plt
 from shapely import LineString, Polygon
 
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
 from blueprints.structural_sections.concrete.rebar import Rebar
 from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
 from blueprints.structural_sections.concrete.reinforced_concrete_sections.reinforcement_configurations import ReinforcementByQuantity
@@ -148,14 +149,15 @@ class TestRectangularReinforcedCrossSection:
         assert len(rectangular_reinforced_cross_section.longitudinal_rebars) == 13
 
     def test_rebar_not_in_cross_section(self, rectangular_reinforced_cross_section: RectangularReinforcedCrossSection) -> None:
-        """Test the add_longitudinal_rebar method with a rebar not in the cross-section."""
-        rebar = Rebar(
-            diameter=12,
-            x=2500,
-            y=1000,
-            material=rectangular_reinforced_cross_section.get_present_steel_materials()[0],
+        """Test the longitudinal_rebars property with a reinforcement configuration outside the cross-section."""
+        rectangular_reinforced_cross_section.add_reinforcement_configuration(
+            line=LineString([(2000, 1000), (2500, 1000)]),
+            configuration=ReinforcementByQuantity(
+                diameter=12,
+                n=2,
+                material=rectangular_reinforced_cross_section.get_present_steel_materials()[0],
+            ),
         )
-        rectangular_reinforced_cross_section._single_longitudinal_rebars.append(rebar)  # noqa: SLF001
         with pytest.raises(ValueError):
             _ = rectangular_reinforced_cross_section.longitudinal_rebars
 
@@ -167,3 +169,46 @@ class TestRectangularReinforcedCrossSection:
         # Test that get_present_steel_materials returns empty list
         steel_materials = rectangular_cross_section_no_reinforcement.get_present_steel_materials()
         assert steel_materials == []
+
+    def test_longitudinal_rebars_cached(self, rectangular_reinforced_cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that the rebar layout is resolved once and reused until the cross-section changes."""
+        first = rectangular_reinforced_cross_section.longitudinal_rebars
+        second = rectangular_reinforced_cross_section.longitudinal_rebars
+        assert first == second
+        assert all(a is b for a, b in zip(first, second))
+
+        # the returned list is a copy, changing it does not change the cross-section
+        first.clear()
+        assert len(rectangular_reinforced_cross_section.longitudinal_rebars) == len(second)
+
+    def test_longitudinal_rebars_invalidated_by_add_methods(self, rectangular_reinforced_cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that every add_* method invalidates the cached rebar layout."""
+        material = rectangular_reinforced_cross_section.get_present_steel_materials()[0]
+        n_rebars = len(rectangular_reinforced_cross_section.longitudinal_rebars)
+
+        rectangular_reinforced_cross_section.add_longitudinal_rebar(Rebar(diameter=12, x=0, y=0, material=material))
+        assert len(rectangular_reinforced_cross_section.longitudinal_rebars) == n_rebars + 1
+
+        rectangular_reinforced_cross_section.add_longitudinal_reinforcement_by_quantity(n=3, diameter=16, edge="left", material=material)
+        assert len(rectangular_reinforced_cross_section.longitudinal_rebars) == n_rebars + 4
+
+        # a thicker stirrup moves the rebars placed along the edges inwards
+        upper_y = max(rebar.y for rebar in rectangular_reinforced_cross_section.longitudinal_rebars)
+        rectangular_reinforced_cross_section.add_stirrup_along_edges(diameter=16, distance=150, material=material)
+        assert max(rebar.y for rebar in rectangular_reinforced_cross_section.longitudinal_rebars) == pytest.approx(upper_y - 4)
+
+    def test_rebar_touching_edge_is_inside(self, rectangular_cross_section_no_reinforcement: RectangularReinforcedCrossSection) -> None:
+        """Test that a rebar touching the edge of the cross-section is (fully) inside the cross-section."""
+        _, _, max_x, _ = rectangular_cross_section_no_reinforcement.profile.polygon.bounds
+        rectangular_cross_section_no_reinforcement.add_reinforcement_configuration(
+            line=LineString([(max_x - 10, 0), (max_x - 10, 100)]),
+            configuration=ReinforcementByQuantity(diameter=20, n=2, material=ReinforcementSteelMaterial()),
+        )
+        assert len(rectangular_cross_section_no_reinforcement.longitudinal_rebars) == 2
+
+    def test_longitudinal_rebar_set(self, rectangular_reinforced_cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that the rebar set holds the same rebars as the list of longitudinal rebars."""
+        rebar_set = rectangular_reinforced_cross_section.longitudinal_rebar_set
+        assert rebar_set is rectangular_reinforced_cross_section.longitudinal_rebar_set
+        assert list(rebar_set) == rectangular_reinforced_cross_section.longitudinal_rebars
+        assert rebar_set.area == pytest.approx(rectangular_reinforced_cross_section.reinforcement_area_longitudinal_bars)
@@ -3,7 +3,8 @@
 import pytest
 from shapely import LineString
 
-from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial, ReinforcementSteelQuality
+from blueprints.structural_sections.concrete.rebar_set import RebarSet
 from blueprints.structural_sections.concrete.reinforced_concrete_sections.reinforcement_configurations import (
     ReinforcementByDistance,
     ReinforcementByQuantity,
@@ -41,6 +42,7 @@ class TestReinforcementByDistance:
         """Test the conversion to rebars."""
         line = LineString([(0, 0), (1000, 0)])
         rebars = reinforcement_by_distance.to_rebars(line=line)
+        assert isinstance(rebars, RebarSet)
         assert len(rebars) == 10
         assert all(rebar.diameter == 12 for rebar in rebars)
         assert all(rebar.material == ReinforcementSteelMaterial() for rebar in rebars)
@@ -84,10 +86,18 @@ class TestReinforcementByQuantity:
         """Test the conversion to rebars."""
         line = LineString([(0, 0), (1000, 0)])
         rebars = reinforcement_by_quantity.to_rebars(line=line)
+        assert isinstance(rebars, RebarSet)
         assert len(rebars) == 10
+        assert rebars[-1].x == pytest.approx(1000.0)
         assert all(rebar.diameter == 12 for rebar in rebars)
         assert all(rebar.material == ReinforcementSteelMaterial() for rebar in rebars)
 
+    def test_to_rebars_material(self) -> None:
+        """Test that the rebars get the material of the configuration."""
+        material = ReinforcementSteelMaterial(steel_quality=ReinforcementSteelQuality.B500A)
+        rebars = ReinforcementByQuantity(diameter=12, material=material, n=3).to_rebars(line=LineString([(0, 0), (1000, 0)]))
+        assert rebars.materials == (material,)
+
     def test__repr__(self, reinforcement_by_quantity: ReinforcementByQuantity) -> None:
         """Test the representation of the reinforcement."""
         representation = repr(reinforcement_by_quantity)
@@ -0,0 +1,127 @@
+"""Tests for the optimizer of the longitudinal reinforcement."""
+
+import numpy as np
+import pytest
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.covers import CoversRectangular
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.circular import CircularReinforcedCrossSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.reinforcement_configurations import (
+    ReinforcementByDistance,
+    ReinforcementByQuantity,
+)
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.reinforcement_optimizer import ReinforcementLayout, ReinforcementOptimizer
+
+
+def beam(width: float = 300, height: float = 500) -> RectangularReinforcedCrossSection:
+    """Return a rectangular cross-section without reinforcement."""
+    return RectangularReinforcedCrossSection(
+        width=width,
+        height=height,
+        concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37),
+        covers=CoversRectangular(upper=40, right=40, lower=40, left=40),
+    )
+
+
+N, M_X, M_Y = np.array([0.0, -500.0]), np.array([200.0, 150.0]), np.zeros(2)
+
+
+class TestReinforcementOptimizer:
+    """Tests for the ReinforcementOptimizer class."""
+
+    def test_against_brute_force(self) -> None:
+        """Test that the design is the lightest candidate that resists the load points, and that the bounds never prune such a candidate."""
+        optimizer = ReinforcementOptimizer(beam())
+        design = optimizer.optimize(n=N, m_x=M_X)
+        assert design.unity_check <= 1.0
+        assert design.n_candidates == len(optimizer.candidates())
+        assert design.n_pruned > 0
+
+        lightest = np.inf
+        for layout in optimizer.candidates():
+            rebars = optimizer.rebars(layout)
+            if not optimizer._satisfies_detailing(rebars):  # noqa: SLF001
+                continue
+            resists = optimizer._unity_check(optimizer._fibre_section(rebars), N, M_X, M_Y) <= 1.0  # noqa: SLF001
+            if resists:
+                assert optimizer._satisfies_bounds(rebars, N, M_X, M_Y)  # noqa: SLF001
+                lightest = min(lightest, rebars.weight_per_meter)
+        assert design.weight_per_meter == pytest.approx(lightest)
+
+    def test_serial(self) -> None:
+        """Test that the parallel and serial evaluation give the same design."""
+        parallel = ReinforcementOptimizer(beam(), max_workers=4).optimize(n=N, m_x=M_X)
+        serial = ReinforcementOptimizer(beam(), max_workers=1).optimize(n=N, m_x=M_X)
+        assert serial.layout == parallel.layout
+        assert serial.n_evaluated <= parallel.n_evaluated
+
+    def test_shared_mesh(self) -> None:
+        """Test that the fibre models of the candidates share the concrete mesh of the cross-section, with the present rebars."""
+        cross_section = beam()
+        cross_section.add_longitudinal_reinforcement_by_quantity(n=2, diameter=12, material=ReinforcementSteelMaterial(), edge="upper")
+        design = ReinforcementOptimizer(cross_section, edges=(("lower",),)).optimize(n=N, m_x=M_X)
+        assert design.fibre_section.concrete is cross_section.concrete_mesh()
+        assert len(design.fibre_section.rebars) == len(design.rebars) + 2
+
+    def test_apply(self) -> None:
+        """Test that the applied layout gives the rebars and the capacity of the design."""
+        cross_section = beam()
+        optimizer = ReinforcementOptimizer(cross_section, diameters=(12.0, 16.0), n_rebars=(2, 3, 4))
+        design = optimizer.optimize(n=N, m_x=M_X)
+        assert design.layout.n_layers == 2
+        optimizer.apply(design.layout)
+
+        np.testing.assert_allclose(cross_section.longitudinal_rebar_set.y, design.rebars.y)
+        assert cross_section.reinforcement_weight_longitudinal_bars == pytest.approx(design.weight_per_meter)
+        assert cross_section.nm_interaction_diagram().unity_check(N, M_X).max() == pytest.approx(design.unity_check)
+
+    def test_center_to_center(self) -> None:
+        """Test a slab with reinforcement by center-to-center distance."""
+        slab = beam(width=1000, height=250)
+        optimizer = ReinforcementOptimizer(slab, diameters=(10.0, 12.0), n_rebars=(), center_to_center=(100.0, 150.0, 200.0), n_layers=(1,))
+        design = optimizer.optimize(m_x=[60.0, -20.0])
+        assert isinstance(design.layout.configuration, ReinforcementByDistance)
+        assert design.layout.edges == ("upper", "lower")
+
+    def test_circular(self) -> None:
+        """Test a circular column under biaxial bending and under bending about the y-axis only."""
+        column = CircularReinforcedCrossSection(diameter=500, concrete_material=ConcreteMaterial())
+        optimizer = ReinforcementOptimizer(column, n_rebars=(4, 6, 8))
+        biaxial = optimizer.optimize(n=-1000.0, m_x=200.0, m_y=150.0)
+        assert biaxial.unity_check == pytest.approx(float(biaxial.fibre_section.capacity_surface().unity_check(-1000.0, 200.0, 150.0)))
+        about_y = optimizer.optimize(n=-1000.0, m_y=250.0)
+        assert about_y.unity_check == pytest.approx(float(about_y.fibre_section.nm_interaction_diagram(axis="y").unity_check(-1000.0, 250.0)))
+
+        with pytest.raises(ValueError, match="circular"):
+            ReinforcementOptimizer(column, center_to_center=(150.0,))
+
+    def test_detailing(self) -> None:
+        """Test the minimum clear spacing and that too narrow or shallow cross-sections and too many bars are rejected."""
+        optimizer = ReinforcementOptimizer(beam(width=100), minimum_cover=40.0)
+        np.testing.assert_allclose(optimizer.minimum_clear_spacing(np.array([12.0, 25.0, 32.0])), [21.0, 25.0, 32.0])
+        assert not optimizer._satisfies_detailing(optimizer.rebars(optimizer.candidates()[0]))  # noqa: SLF001
+
+        # the second layer at the bottom of a shallow cross-section is within the cover of the top
+        shallow = ReinforcementOptimizer(beam(height=120))
+        two_layers = ReinforcementLayout(
+            ReinforcementByQuantity(diameter=20, material=shallow.material, n=2), ("lower",), n_layers=2, layer_distance=45.0
+        )
+        assert not shallow._satisfies_detailing(shallow.rebars(two_layers))  # noqa: SLF001
+
+        wide = ReinforcementOptimizer(beam())
+        six_bars, four_bars = (ReinforcementLayout(ReinforcementByQuantity(diameter=25, material=wide.material, n=n), ("lower",)) for n in (6, 4))
+        assert not wide._satisfies_detailing(wide.rebars(six_bars))  # noqa: SLF001
+        assert wide._satisfies_detailing(wide.rebars(four_bars))  # noqa: SLF001
+
+    def test_no_design(self) -> None:
+        """Test that an error is raised if no candidate resists the load points."""
+        with pytest.raises(ValueError, match="None of the"):
+            ReinforcementOptimizer(beam(), diameters=(10.0,)).optimize(m_x=1000.0)
+
+    def test_layout_str(self) -> None:
+        """Test the string representation of the layouts."""
+        configuration = ReinforcementByQuantity(diameter=20, material=ReinforcementSteelMaterial(), n=4)
+        assert str(ReinforcementLayout(configuration, ("upper", "lower"), n_layers=2, layer_distance=45.0)) == "2x 4⌀20 upper, lower"
+        assert str(ReinforcementLayout(configuration)) == "4⌀20"
@@ -0,0 +1,124 @@
+"""Test the rebar set module."""
+
+import numpy as np
+import pytest
+
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial, ReinforcementSteelQuality
+from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.rebar_set import RebarSet
+
+
+class TestRebarSet:
+    """Tests for the RebarSet class."""
+
+    @pytest.fixture
+    def rebars(self) -> list[Rebar]:
+        """Return a list of rebars with two different materials."""
+        b500b = ReinforcementSteelMaterial()
+        b400a = ReinforcementSteelMaterial(steel_quality=ReinforcementSteelQuality.B400A, density=7800.0)
+        return [
+            Rebar(diameter=20.0, x=0.0, y=0.0, material=b500b),
+            Rebar(diameter=16.0, x=100.0, y=0.0, material=b400a, relative_start_position=0.2),
+            Rebar(diameter=20.0, x=100.0, y=200.0, material=b500b, relative_end_position=0.8),
+        ]
+
+    @pytest.fixture
+    def rebar_set(self, rebars: list[Rebar]) -> RebarSet:
+        """Return a set of the rebars."""
+        return RebarSet.from_rebars(rebars)
+
+    def test_from_rebars(self, rebar_set: RebarSet, rebars: list[Rebar]) -> None:
+        """Test that a set created from rebars holds the same rebars."""
+        assert len(rebar_set) == 3
+        assert len(rebar_set.materials) == 2
+        np.testing.assert_array_equal(rebar_set.material_index, [0, 1, 0])
+        assert rebar_set.to_rebars() == rebars
+
+    def test_rebars_created_once(self, rebar_set: RebarSet) -> None:
+        """Test that an individual rebar is created once and reused."""
+        assert rebar_set[1] is rebar_set[1]
+        assert rebar_set[-1] is rebar_set[2]
+
+    def test_index_error(self, rebar_set: RebarSet) -> None:
+        """Test that an index outside the set raises an error."""
+        with pytest.raises(IndexError):
+            _ = rebar_set[3]
+
+    def test_slice(self, rebar_set: RebarSet, rebars: list[Rebar]) -> None:
+        """Test that slicing returns a new set."""
+        subset = rebar_set[1:]
+        assert isinstance(subset, RebarSet)
+        assert list(subset) == rebars[1:]
+
+    def test_scalar_values_are_broadcast(self) -> None:
+        """Test that a single value is applied to all rebars."""
+        rebar_set = RebarSet(x=np.array([0.0, 50.0]), y=np.zeros(2), diameter=np.array(12.0), materials=(ReinforcementSteelMaterial(),))
+        np.testing.assert_array_equal(rebar_set.diameter, [12.0, 12.0])
+        np.testing.assert_array_equal(rebar_set.relative_end_position, [1.0, 1.0])
+
+    def test_areas_and_weights(self, rebar_set: RebarSet, rebars: list[Rebar]) -> None:
+        """Test the areas and weights against the individual rebars."""
+        np.testing.assert_allclose(rebar_set.areas, [0.25 * np.pi * rebar.diameter**2 for rebar in rebars])
+        assert rebar_set.area == pytest.approx(sum(rebar.area for rebar in rebars), rel=1e-2)
+        assert rebar_set.weight_per_meter == pytest.approx(sum(rebar.weight_per_meter for rebar in rebars), rel=1e-2)
+        assert rebar_set.weights_per_meter[1] == pytest.approx(7800.0 * 0.25 * np.pi * 16.0**2 * 1e-6)
+
+    def test_present_materials(self, rebar_set: RebarSet, rebars: list[Rebar]) -> None:
+        """Test that only the materials used by the rebars are present."""
+        assert rebar_set[:1].present_materials == [rebars[0].material]
+        assert rebar_set.present_materials == [rebars[0].material, rebars[1].material]
+
+    def test_static_moments_and_centroid(self, rebar_set: RebarSet) -> None:
+        """Test the static moments and centroid."""
+        a_20 = 0.25 * np.pi * 20.0**2
+        a_16 = 0.25 * np.pi * 16.0**2
+        static_moment_x, static_moment_y = rebar_set.static_moments()
+        assert static_moment_x == pytest.approx(a_20 * 200.0)
+        assert static_moment_y == pytest.approx((a_16 + a_20) * 100.0)
+        assert rebar_set.static_moments(x_ref=100.0, y_ref=200.0) == pytest.approx((-2 * a_20 * 200.0 - a_16 * 200.0 + a_20 * 200.0, -a_20 * 100.0))
+
+        centroid_x, centroid_y = rebar_set.centroid
+        total_area = 2 * a_20 + a_16
+        assert centroid_x == pytest.approx((a_16 + a_20) * 100.0 / total_area)
+        assert centroid_y == pytest.approx(a_20 * 200.0 / total_area)
+
+    def test_centroid_empty(self) -> None:
+        """Test that the centroid of an empty set raises an error."""
+        with pytest.raises(ValueError):
+            _ = RebarSet.empty().centroid
+
+    def test_concatenate(self, rebar_set: RebarSet, rebars: list[Rebar]) -> None:
+        """Test that concatenating sets merges equal materials and keeps the order of the rebars."""
+        combined = RebarSet.concatenate([rebar_set[2:], RebarSet.empty(), rebar_set[:2]])
+        assert len(combined.materials) == 2
+        assert list(combined) == [rebars[2], rebars[0], rebars[1]]
+        assert RebarSet.concatenate([rebar_set]) is rebar_set
+        assert len(RebarSet.concatenate([])) == 0
+
+    def test_from_no_rebars(self) -> None:
+        """Test that a set created from no rebars is empty."""
+        rebar_set = RebarSet.from_rebars([])
+        assert len(rebar_set) == 0
+        assert rebar_set.area == 0.0
+        assert rebar_set.weight_per_meter == 0.0
+        assert rebar_set.present_materials == []
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"diameter": np.array([12.0, 0.0])}, "Diameter"),
+            ({"relative_start_position": np.array([-0.1, 0.0])}, "start position"),
+            ({"relative_end_position": np.array([1.0, 1.1])}, "end position"),
+            ({"material_index": np.array([0, 1])}, "Material index"),
+            ({"y": np.zeros(3)}, "Length of 'y'"),
+        ],
+    )
+    def test_validation(self, kwargs: dict, message: str) -> None:
+        """Test the validation of the given arrays."""
+        values = {"x": np.zeros(2), "y": np.zeros(2), "diameter": np.array([12.0, 12.0]), "materials": (ReinforcementSteelMaterial(),)}
+        with pytest.raises(ValueError, match=message):
+            RebarSet(**(values | kwargs))
+
+    def test_repr(self, rebar_set: RebarSet) -> None:
+        """Test the representation of the set."""
+        assert repr(rebar_set) == f"RebarSet(n=3, area={rebar_set.area:.0f} mm²)"
@@ -0,0 +1,140 @@
+"""Tests for the spatial index of rebars."""
+
+import numpy as np
+import pytest
+from shapely import Polygon
+
+from blueprints.materials.concrete import ConcreteMaterial
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.covers import CoversRectangular
+from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.rebar_set import RebarSet
+from blueprints.structural_sections.concrete.rebar_spatial_index import RebarSpatialIndex, minimum_clear_spacing
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+from blueprints.structural_sections.concrete.stirrups import StirrupConfiguration
+
+
+def random_rebars(n: int, seed: int = 0) -> RebarSet:
+    """Return randomly placed rebars of different diameters."""
+    rng = np.random.default_rng(seed)
+    return RebarSet(
+        x=rng.uniform(0.0, 3000.0, n),
+        y=rng.uniform(0.0, 1000.0, n),
+        diameter=rng.choice([12.0, 16.0, 25.0], n),
+        materials=(ReinforcementSteelMaterial(),),
+    )
+
+
+def brute_force_clear_spacing(rebars: RebarSet) -> np.ndarray:
+    """Return the clear distances between all pairs of rebars, infinite on the diagonal."""
+    distance = np.hypot(rebars.x[:, np.newaxis] - rebars.x, rebars.y[:, np.newaxis] - rebars.y)
+    clear_spacing = distance - rebars.radius[:, np.newaxis] - rebars.radius
+    np.fill_diagonal(clear_spacing, np.inf)
+    return clear_spacing
+
+
+class TestRebarSpatialIndex:
+    """Tests for the RebarSpatialIndex class."""
+
+    def test_minimum_clear_spacing(self) -> None:
+        """Test the minimum clear distance of EN 1992-1-1 8.2(2)."""
+        np.testing.assert_allclose(minimum_clear_spacing(np.array([12.0, 25.0, 32.0])), [21.0, 25.0, 32.0])
+        assert minimum_clear_spacing(10.0, aggregate_size=8.0) == 20.0
+
+    def test_against_brute_force(self) -> None:
+        """Test the violations, nearest clear distances and pairs against the distances between all pairs."""
+        rebars = random_rebars(1500)
+        index = RebarSpatialIndex(rebars)
+        clear_spacing = brute_force_clear_spacing(rebars)
+
+        np.testing.assert_allclose(index.nearest_clear_spacing(), clear_spacing.min(axis=1))
+
+        required = minimum_clear_spacing(np.maximum(rebars.diameter[:, np.newaxis], rebars.diameter))
+        first, second = np.nonzero(np.triu(clear_spacing < required))
+        violations = index.spacing_violations()
+        assert len(violations) == len(first) > 0
+        order = np.lexsort((violations.second, violations.first))
+        np.testing.assert_array_equal(violations.first[order], first)
+        np.testing.assert_array_equal(violations.second[order], second)
+        np.testing.assert_allclose(violations.clear_spacing[order], clear_spacing[first, second])
+
+        pairs = index.pairs_within(50.0)
+        assert len(pairs) == np.triu(clear_spacing < 50.0).sum()
+        assert np.all(pairs.first < pairs.second)
+        np.testing.assert_array_equal(pairs.required, 50.0)
+
+    def test_longitudinal_positions(self) -> None:
+        """Test that bars at different positions along the element do not interact, but are the nearest in the cross-section."""
+        rebars = RebarSet(
+            x=[0.0, 20.0, 100.0],
+            y=0.0,
+            diameter=16.0,
+            materials=(ReinforcementSteelMaterial(),),
+            relative_start_position=[0.0, 0.5, 0.0],
+            relative_end_position=[0.5, 1.0, 1.0],
+        )
+        index = RebarSpatialIndex(rebars)
+        assert len(index.spacing_violations()) == 0
+        np.testing.assert_allclose(index.nearest_clear_spacing(), [4.0, 4.0, 64.0])
+
+    def test_coincident_bars(self) -> None:
+        """Test that bars at the same position are reported with a negative clear distance."""
+        index = RebarSpatialIndex(RebarSet(x=[0.0, 0.0], y=[0.0, 0.0], diameter=12.0, materials=(ReinforcementSteelMaterial(),)))
+        np.testing.assert_allclose(index.nearest_clear_spacing(), [-12.0, -12.0])
+        np.testing.assert_allclose(index.spacing_violations().clear_spacing, [-12.0])
+
+    def test_few_bars(self) -> None:
+        """Test a set with a single rebar and an empty set."""
+        single = RebarSpatialIndex(RebarSet(x=[0.0], y=[0.0], diameter=12.0, materials=(ReinforcementSteelMaterial(),)))
+        np.testing.assert_array_equal(single.nearest_clear_spacing(), [np.inf])
+        assert len(single.spacing_violations()) == 0
+        empty = RebarSpatialIndex(RebarSet.empty())
+        assert len(empty.pairs_within(10.0)) == 0
+        assert len(empty.stirrup_clashes([])) == 0
+
+    def test_stirrup_clashes(self) -> None:
+        """Test that bars overlapping a stirrup are reported, and bars touching it are not."""
+        stirrup = StirrupConfiguration(
+            geometry=Polygon([(-100, -200), (-100, 200), (100, 200), (100, -200)]),
+            diameter=10,
+            distance=150,
+            material=ReinforcementSteelMaterial(),
+            relative_end_position=0.5,
+        )
+        rebars = RebarSet(
+            x=[-87.0, 0.0, 95.0, 95.0],
+            y=[-187.0, 0.0, 0.0, 0.0],
+            diameter=16.0,
+            materials=(ReinforcementSteelMaterial(),),
+            relative_start_position=[0.0, 0.0, 0.0, 0.6],
+        )
+        clashes = RebarSpatialIndex(rebars).stirrup_clashes([stirrup])
+        np.testing.assert_array_equal(clashes.rebar, [2])
+        np.testing.assert_array_equal(clashes.stirrup, [0])
+        np.testing.assert_allclose(clashes.overlap, [8.0])
+
+
+class TestReinforcedCrossSectionSpacing:
+    """Tests for the spacing and clash checks of reinforced cross-sections."""
+
+    def test_cached(self) -> None:
+        """Test that the spatial index is reused until the reinforcement changes, and the checks of the cross-section."""
+        cross_section = RectangularReinforcedCrossSection(
+            width=300, height=500, concrete_material=ConcreteMaterial(), covers=CoversRectangular(upper=30, right=30, lower=30, left=30)
+        )
+        cross_section.add_stirrup_along_edges(diameter=10, distance=150, material=ReinforcementSteelMaterial())
+        cross_section.add_longitudinal_reinforcement_by_quantity(n=4, diameter=25, material=ReinforcementSteelMaterial(), edge="lower")
+        index = cross_section.rebar_spatial_index
+        assert cross_section.rebar_spatial_index is index
+        assert len(cross_section.rebar_spacing_violations()) == 0
+        assert len(cross_section.stirrup_clashes()) == 0
+
+        cross_section.add_longitudinal_rebar(Rebar(diameter=16, x=-105, y=-160, material=ReinforcementSteelMaterial()))
+        assert cross_section.rebar_spatial_index is not index
+        violations = cross_section.rebar_spacing_violations()
+        assert len(violations) == 1
+        # the corner bar is at (-97.5, -197.5) and the center line of the stirrup at x = -115
+        assert violations.clear_spacing[0] == pytest.approx(np.hypot(7.5, 37.5) - 20.5)
+        clashes = cross_section.stirrup_clashes()
+        np.testing.assert_array_equal(clashes.rebar, [0])
+        np.testing.assert_allclose(clashes.overlap, [3.0])
@@ -0,0 +1,44 @@
+"""Tests for the caching behaviour of the Profile base class."""
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from blueprints.structural_sections.geometric_profiles.rectangle import RectangularProfile
+
+
+class TestProfileCaches:
+    """Tests for the thread-safe caches of the Profile base class."""
+
+    def test_concurrent_section_properties_computed_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that concurrent calls on a shared profile run the finite element analysis only once per key."""
+        profile = RectangularProfile(name="Rectangle", width=100.0, height=200.0)
+        calls = []
+        original = RectangularProfile._calculate_section_properties  # noqa: SLF001
+
+        def counting_calculation(self: RectangularProfile, *args, **kwargs):  # noqa: ANN202
+            calls.append(kwargs)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(RectangularProfile, "_calculate_section_properties", counting_calculation)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: profile.section_properties(plastic=i % 2 == 0), range(16)))
+
+        assert len(calls) == 2
+        assert all(result is results[0] for result in results[::2])
+        assert all(result is results[1] for result in results[1::2])
+
+    def test_unit_stress_cached(self) -> None:
+        """Test that the unit stress is only calculated once."""
+        profile = RectangularProfile(name="Rectangle", width=100.0, height=200.0)
+        assert profile.unit_stress() is profile.unit_stress()
+
+    def test_pickle_keeps_cache(self) -> None:
+        """Test that a profile with filled caches can be pickled."""
+        profile = RectangularProfile(name="Rectangle", width=100.0, height=200.0)
+        area = profile.section_properties().area
+        clone = pickle.loads(pickle.dumps(profile))
+        assert clone == profile
+        assert clone.section_properties().area == pytest.approx(area)
@@ -0,0 +1,86 @@
+"""Tests for the thread-safe caching utilities."""
+
+import copy
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from blueprints.utils.cache import ComputeOnceCache
+
+
+class TestComputeOnceCache:
+    """Tests for the ComputeOnceCache class."""
+
+    def test_get_or_compute(self) -> None:
+        """Test that the value is computed once and then returned from the cache."""
+        cache: ComputeOnceCache[str, float] = ComputeOnceCache()
+        calls = []
+
+        def factory() -> float:
+            calls.append(1)
+            return 1.5
+
+        assert cache.get_or_compute("a", factory) == 1.5
+        assert cache.get_or_compute("a", factory) == 1.5
+        assert len(calls) == 1
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_get_and_clear(self) -> None:
+        """Test get without computing and clearing the cache."""
+        cache: ComputeOnceCache[str, float] = ComputeOnceCache()
+        assert cache.get("a") is None
+        assert cache.get("a", 2.0) == 2.0
+        cache.get_or_compute("a", lambda: 1.0)
+        assert cache.get("a") == 1.0
+        cache.clear()
+        assert "a" not in cache
+
+    def test_failed_factory_is_not_cached(self) -> None:
+        """Test that a failing factory does not poison the cache."""
+        cache: ComputeOnceCache[str, float] = ComputeOnceCache()
+
+        def failing_factory() -> float:
+            raise RuntimeError("failed")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute("a", failing_factory)
+        assert "a" not in cache
+        assert cache.get_or_compute("a", lambda: 3.0) == 3.0
+
+    def test_concurrent_compute_once(self) -> None:
+        """Test that concurrent requests for the same key compute the value only once."""
+        cache: ComputeOnceCache[str, float] = ComputeOnceCache()
+        calls = []
+        lock = threading.Lock()
+
+        def slow_factory() -> float:
+            with lock:
+                calls.append(1)
+            time.sleep(0.05)
+            return 42.0
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: cache.get_or_compute("key", slow_factory), range(32)))
+
+        assert results == [42.0] * 32
+        assert len(calls) == 1
+
+    def test_concurrent_different_keys(self) -> None:
+        """Test that different keys are all computed exactly once."""
+        cache: ComputeOnceCache[int, int] = ComputeOnceCache()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: cache.get_or_compute(i % 4, lambda: (i % 4) ** 2), range(64)))
+        assert results == [(i % 4) ** 2 for i in range(64)]
+        assert len(cache) == 4
+
+    def test_pickle_and_copy(self) -> None:
+        """Test that the cache can be pickled and copied with its values."""
+        cache: ComputeOnceCache[str, float] = ComputeOnceCache()
+        cache.get_or_compute("a", lambda: 1.0)
+        for clone in (pickle.loads(pickle.dumps(cache)), copy.deepcopy(cache)):
+            assert clone.get("a") == 1.0
+            assert clone.get_or_compute("b", lambda: 2.0) == 2.0